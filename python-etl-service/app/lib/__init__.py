@@ -8,9 +8,12 @@ Framework components:
 - BaseETLService: Abstract base class for ETL data sources
 - ETLRegistry: Service discovery and registration
 - ETLResult: Standardized result tracking
+- PipelineConfig: Concurrent stage settings for BaseETLService.run
+- BatchUploadConfig: Batched upload settings for BaseETLService.run
 """
 
 from app.lib.database import get_supabase, upload_transaction_to_supabase
+from app.lib.async_db import execute_async, run_db
 from app.lib.parser import (
     ASSET_TYPE_CODES,
     VALUE_PATTERNS,
@@ -23,7 +26,9 @@ from app.lib.parser import (
     sanitize_string,
 )
 from app.lib.pdf_utils import extract_tables_from_pdf, extract_text_from_pdf
-from app.lib.politician import find_or_create_politician
+from app.lib.pdf_extraction import extract_tables, extract_text
+from app.lib.politician import find_or_create_politician, find_or_create_politicians
+from app.lib.politician_index import PoliticianIndex, get_politician_index
 from app.lib.job_logger import (
     log_job_execution,
     cleanup_old_executions,
@@ -31,7 +36,13 @@ from app.lib.job_logger import (
 )
 
 # Framework components
-from app.lib.base_etl import BaseETLService, ETLResult, JobStatus
+from app.lib.base_etl import (
+    BaseETLService,
+    BatchUploadConfig,
+    ETLResult,
+    JobStatus,
+    PipelineConfig,
+)
 from app.lib.registry import ETLRegistry
 
 __all__ = [
@@ -39,10 +50,14 @@ __all__ = [
     "BaseETLService",
     "ETLResult",
     "JobStatus",
+    "PipelineConfig",
+    "BatchUploadConfig",
     "ETLRegistry",
     # Database
     "get_supabase",
     "upload_transaction_to_supabase",
+    "execute_async",
+    "run_db",
     # Parser
     "ASSET_TYPE_CODES",
     "VALUE_PATTERNS",
@@ -56,8 +71,13 @@ __all__ = [
     # PDF Utils
     "extract_tables_from_pdf",
     "extract_text_from_pdf",
+    "extract_tables",
+    "extract_text",
     # Politician
     "find_or_create_politician",
+    "find_or_create_politicians",
+    "PoliticianIndex",
+    "get_politician_index",
     # Job Logger
     "log_job_execution",
     "cleanup_old_executions",
@@ -0,0 +1,138 @@
+"""
+AIMD adaptive concurrency limiter.
+
+Government disclosure sites publish no rate limits; they just start answering
+429/503 when pushed too hard. A fixed delay between requests is safe but
+slow, and a fixed worker count is either too timid or too aggressive.
+
+AdaptiveConcurrencyLimiter bounds the number of in-flight requests with a
+limit that adapts like TCP congestion control:
+
+- Additive increase: every successful response adds 1/limit, so the limit
+  grows by about one per round of ``limit`` successes
+- Multiplicative decrease: a throttling response (429/503/...) multiplies
+  the limit by ``decrease_factor``; further throttles within
+  ``decrease_cooldown`` seconds are treated as the same congestion event
+
+Usage:
+    from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=8)
+
+    async with limiter.slot():
+        response = await client.get(url)
+    if response.status_code in (429, 503):
+        limiter.record_throttle()
+    else:
+        limiter.record_success()
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Bounds in-flight requests with an AIMD-adjusted limit."""
+
+    def __init__(
+        self,
+        initial: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 1.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            min_limit: Floor for the limit
+            max_limit: Ceiling for the limit
+            increase: Limit added per full round of successes
+            decrease_factor: Multiplier applied on throttling (0 < f < 1)
+            decrease_cooldown: Seconds during which further throttles don't
+                shrink the limit again
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("require 1 <= min_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._last_decrease = float("-inf")
+        self._stats = {"successes": 0, "throttles": 0, "decreases": 0, "peak_in_flight": 0}
+
+    @property
+    def limit(self) -> int:
+        """Current whole-number concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit, then take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self._in_flight)
+
+    async def release(self) -> None:
+        """Return a slot taken with acquire()."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+    def record_success(self) -> None:
+        """Additive increase after a successful response."""
+        self._stats["successes"] += 1
+        previous = self.limit
+        self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+        # Waiters re-check the new limit on the next release()
+        if self.limit > previous:
+            logger.debug(f"Concurrency limit increased to {self.limit}")
+
+    def record_throttle(self) -> None:
+        """Multiplicative decrease after a throttling response."""
+        self._stats["throttles"] += 1
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self._last_decrease = now
+        self._stats["decreases"] += 1
+        self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+        logger.warning(f"Server throttling, concurrency limit reduced to {self.limit}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return limiter counters and current state."""
+        return {
+            **self._stats,
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+        }
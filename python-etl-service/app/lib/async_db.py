@@ -0,0 +1,274 @@
+"""
+Non-blocking data access for async code.
+
+supabase-py's client is synchronous: every .execute() does blocking HTTP I/O.
+Calling it directly inside ``async def`` code stalls the single uvicorn event
+loop for the duration of each PostgREST round trip, so /health and /ml/predict
+latency spikes while an ETL job runs in the background.
+
+This module offloads those calls to a bounded thread pool. Pooled Supabase
+clients (app.lib.supabase_pool) are thread-safe, so worker threads share the
+same keep-alive connections.
+
+Usage:
+    from app.lib.async_db import execute_async, run_db, PoliticiansRepository
+
+    # Any query builder: build on the loop, execute in the pool
+    resp = await execute_async(
+        supabase.table("politicians").select("id").eq("party", "D")
+    )
+
+    # Any blocking helper that takes a client
+    politician_id = await run_db(find_or_create_politician, supabase, name="...")
+
+    # Repository for a hot table
+    repo = PoliticiansRepository(supabase)
+    count = await repo.count(chamber="house")
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Maximum number of concurrent blocking database calls
+DB_EXECUTOR_WORKERS = int(os.environ.get("SUPABASE_DB_THREADS", "8"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Get the global thread pool used for blocking database calls."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="supabase-db"
+                )
+    return _executor
+
+
+def shutdown_db_executor() -> None:
+    """Shut down the database thread pool. Used on application shutdown."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = None
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking database callable in the database thread pool.
+
+    Args:
+        fn: Synchronous function (e.g. find_or_create_politician)
+        *args, **kwargs: Passed to fn
+
+    Returns:
+        Whatever fn returns; exceptions propagate to the caller.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_db_executor(), functools.partial(fn, *args, **kwargs)
+    )
+
+
+async def execute_async(query: Any) -> Any:
+    """
+    Execute a supabase-py query builder without blocking the event loop.
+
+    Builder methods (.select(), .eq(), ...) only assemble the request, so
+    the chain is built on the caller's thread and only .execute() runs in
+    the pool.
+    """
+    return await run_db(query.execute)
+
+
+# =============================================================================
+# Repositories for hot tables
+# =============================================================================
+
+
+class AsyncRepository:
+    """
+    Async access to a single Supabase table.
+
+    Subclasses set ``table_name`` and add table-specific helpers. Every
+    method runs its PostgREST call in the database thread pool.
+    """
+
+    table_name: str
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    def query(self) -> Any:
+        """Start a query builder on this table."""
+        return self.client.table(self.table_name)
+
+    async def execute(self, query: Any) -> Any:
+        """Execute a query built from self.query()."""
+        return await execute_async(query)
+
+    async def count(self, **filters: Any) -> int:
+        """Count rows matching equality filters."""
+        query = self.query().select("id", count="exact")
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        resp = await execute_async(query)
+        return resp.count if resp.count is not None else len(resp.data or [])
+
+    async def get_by_id(self, row_id: str, columns: str = "*") -> Optional[Dict[str, Any]]:
+        """Fetch a single row by primary key, or None."""
+        resp = await execute_async(
+            self.query().select(columns).eq("id", row_id).limit(1)
+        )
+        return resp.data[0] if resp.data else None
+
+    async def insert(self, rows: Any) -> List[Dict[str, Any]]:
+        """Insert one row (dict) or many (list of dicts)."""
+        resp = await execute_async(self.query().insert(rows))
+        return resp.data or []
+
+    async def upsert(self, rows: Any, on_conflict: str) -> List[Dict[str, Any]]:
+        """Upsert rows on the given conflict target."""
+        resp = await execute_async(self.query().upsert(rows, on_conflict=on_conflict))
+        return resp.data or []
+
+    async def update(self, values: Dict[str, Any], **filters: Any) -> List[Dict[str, Any]]:
+        """Update rows matching equality filters."""
+        if not filters:
+            raise ValueError("update() requires at least one filter")
+        query = self.query().update(values)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        resp = await execute_async(query)
+        return resp.data or []
+
+    async def fetch_all(
+        self,
+        build: Callable[[Any], Any],
+        page_size: int = 1000,
+        order: str = "id",
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every row of a filtered query, paging with .range().
+
+        Args:
+            build: Function taking self.query() and returning the filtered
+                   select query (without .order() or .range())
+            page_size: Rows per PostgREST request
+            order: Column giving pages a stable order (OFFSET paging without
+                   ORDER BY can skip or repeat rows)
+        """
+        rows: List[Dict[str, Any]] = []
+        offset = 0
+        while True:
+            resp = await execute_async(
+                build(self.query()).order(order).range(offset, offset + page_size - 1)
+            )
+            if not resp.data:
+                break
+            rows.extend(resp.data)
+            offset += len(resp.data)
+            if len(resp.data) < page_size:
+                break
+        return rows
+
+
+class TradingDisclosuresRepository(AsyncRepository):
+    """Async access to trading_disclosures."""
+
+    table_name = "trading_disclosures"
+
+    async def upload_transaction(
+        self,
+        politician_id: str,
+        transaction: Dict[str, Any],
+        disclosure: Dict[str, Any],
+        update_mode: bool = False,
+    ) -> Optional[str]:
+        """Non-blocking upload_transaction_to_supabase()."""
+        from app.lib.database import upload_transaction_to_supabase
+
+        return await run_db(
+            upload_transaction_to_supabase,
+            self.client,
+            politician_id,
+            transaction,
+            disclosure,
+            update_mode=update_mode,
+        )
+
+
+class PoliticiansRepository(AsyncRepository):
+    """Async access to politicians."""
+
+    table_name = "politicians"
+
+    async def find_or_create(self, **kwargs: Any) -> Optional[str]:
+        """Non-blocking find_or_create_politician()."""
+        from app.lib.politician import find_or_create_politician
+
+        return await run_db(find_or_create_politician, self.client, **kwargs)
+
+    async def find_or_create_many(
+        self, descriptors: List[Dict[str, Any]], index: Any = None
+    ) -> Dict[Any, Optional[str]]:
+        """Non-blocking find_or_create_politicians()."""
+        from app.lib.politician import find_or_create_politicians
+
+        return await run_db(find_or_create_politicians, self.client, descriptors, index=index)
+
+
+class MLModelsRepository(AsyncRepository):
+    """Async access to ml_models."""
+
+    table_name = "ml_models"
+
+    async def get_active(self) -> Optional[Dict[str, Any]]:
+        """Most recently trained active model, or None."""
+        resp = await execute_async(
+            self.query()
+            .select("*")
+            .eq("status", "active")
+            .order("training_completed_at", desc=True)
+            .limit(1)
+        )
+        return resp.data[0] if resp.data else None
+
+    async def archive_active(self, keep_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Archive every active model except keep_id."""
+        query = self.query().update({"status": "archived"}).eq("status", "active")
+        if keep_id:
+            query = query.neq("id", keep_id)
+        resp = await execute_async(query)
+        return resp.data or []
+
+
+class JobExecutionsRepository(AsyncRepository):
+    """Async access to job_executions."""
+
+    table_name = "job_executions"
+
+    async def log(self, **kwargs: Any) -> Optional[str]:
+        """Non-blocking log_job_execution()."""
+        from app.lib.job_logger import log_job_execution
+
+        return await run_db(log_job_execution, self.client, **kwargs)
+
+    async def cleanup(self, days: int = 30) -> int:
+        """Non-blocking cleanup_old_executions()."""
+        from app.lib.job_logger import cleanup_old_executions
+
+        return await run_db(cleanup_old_executions, self.client, days=days)
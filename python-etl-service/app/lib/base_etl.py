@@ -6,6 +6,7 @@ Provides a standardized interface for ETL data sources with:
 - Job status management
 - Error handling patterns
 - Lifecycle hooks for customization
+- Optional pipelined execution (concurrent parse/validate/upload stages)
 
 Usage:
     from app.lib.base_etl import BaseETLService, ETLResult
@@ -23,15 +24,32 @@ Usage:
         async def parse_disclosure(self, raw):
             # Parse single disclosure
             return {...}
+
+Pipelined mode:
+    Set ``pipeline_config = PipelineConfig(...)`` on the subclass (or pass
+    ``pipeline=PipelineConfig(...)`` to run()) to process records through
+    bounded queues with separate parse, validate and upload workers.
+    Override stream_disclosures() to yield records as they arrive instead
+    of buffering the full fetch_disclosures() list.
+
+Batched uploads:
+    Set ``batch_upload_config = BatchUploadConfig(...)`` (or pass
+    ``batch_upload=BatchUploadConfig(...)`` to run()) to accumulate validated
+    records and write them through upload_batch() instead of calling
+    upload_disclosure() once per record.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 import logging
 import asyncio
 
+from app.lib.async_db import run_db
+from app.lib.worker_pool import run_stage, run_together
+
 logger = logging.getLogger(__name__)
 
 
@@ -104,6 +122,45 @@ class ETLResult:
         }
 
 
+@dataclass
+class PipelineConfig:
+    """
+    Worker counts and queue bounds for pipelined ETL execution.
+
+    Each stage runs its own pool of worker coroutines. The bounded queues
+    between stages apply backpressure: a slow upload stage pauses parsing,
+    which in turn pauses the fetch stream.
+    """
+    parse_workers: int = 2
+    validate_workers: int = 1
+    upload_workers: int = 4
+    queue_size: int = 100
+
+    def __post_init__(self):
+        for name in ("parse_workers", "validate_workers", "upload_workers", "queue_size"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"PipelineConfig.{name} must be >= 1")
+
+
+@dataclass
+class BatchUploadConfig:
+    """
+    Settings for the batched upload stage.
+
+    Validated records are buffered and written together once ``batch_size``
+    records have accumulated, or once the oldest buffered record has waited
+    ``flush_interval`` seconds, whichever comes first.
+    """
+    batch_size: int = 50
+    flush_interval: float = 5.0
+
+    def __post_init__(self):
+        if self.batch_size < 1:
+            raise ValueError("BatchUploadConfig.batch_size must be >= 1")
+        if self.flush_interval <= 0:
+            raise ValueError("BatchUploadConfig.flush_interval must be > 0")
+
+
 @dataclass
 class JobStatus:
     """
@@ -147,12 +204,20 @@ class BaseETLService(ABC):
     - upload_disclosure(): Custom upload logic
     - on_start(): Hook called before processing
     - on_complete(): Hook called after processing
+    - stream_disclosures(): Yield raw records incrementally (pipelined mode)
+    - upload_batch(): Custom batch upload logic (batched mode)
     """
 
     # Subclasses must define these as class attributes
     source_id: str
     source_name: str
 
+    # Set to a PipelineConfig to run stages concurrently by default
+    pipeline_config: Optional[PipelineConfig] = None
+
+    # Set to a BatchUploadConfig to upload through upload_batch() by default
+    batch_upload_config: Optional[BatchUploadConfig] = None
+
     def __init__(self):
         """Initialize the ETL service."""
         self.logger = logging.getLogger(f"{__name__}.{self.source_id}")
@@ -194,6 +259,23 @@ class BaseETLService(ABC):
     # Optional Hooks - Can be overridden by subclasses
     # =========================================================================
 
+    async def stream_disclosures(self, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield raw disclosures one at a time for pipelined execution.
+
+        The default implementation wraps fetch_disclosures(). Override to
+        yield records as they arrive from the source so that parsing and
+        uploading can start before the fetch has finished.
+
+        Args:
+            **kwargs: Source-specific parameters (same as fetch_disclosures)
+
+        Yields:
+            Raw disclosure dictionaries from the source.
+        """
+        for raw in await self.fetch_disclosures(**kwargs) or []:
+            yield raw
+
     async def validate_disclosure(self, disclosure: Dict[str, Any]) -> bool:
         """
         Validate a parsed disclosure before upload.
@@ -229,6 +311,7 @@ class BaseETLService(ABC):
         # Default implementation uses shared database utilities
         from app.lib.database import get_supabase, upload_transaction_to_supabase
         from app.lib.politician import find_or_create_politician
+        from app.lib.politician_index import get_politician_index
 
         try:
             supabase = get_supabase()
@@ -236,20 +319,23 @@ class BaseETLService(ABC):
                 return None
 
             # Get or create politician
-            politician_id = find_or_create_politician(
+            politician_id = await run_db(
+                find_or_create_politician,
                 supabase,
                 name=disclosure.get("politician_name"),
                 first_name=disclosure.get("first_name"),
                 last_name=disclosure.get("last_name"),
                 chamber=disclosure.get("chamber", "house"),
                 state=disclosure.get("state"),
+                index=get_politician_index(),
             )
 
             if not politician_id:
                 return None
 
             # Upload transaction
-            return upload_transaction_to_supabase(
+            return await run_db(
+                upload_transaction_to_supabase,
                 supabase,
                 politician_id,
                 disclosure,
@@ -261,6 +347,87 @@ class BaseETLService(ABC):
             self.logger.error(f"Upload failed: {e}")
             return None
 
+    async def upload_batch(
+        self,
+        disclosures: List[Dict[str, Any]],
+        update_mode: bool = False,
+    ) -> Tuple[int, int, int]:
+        """
+        Upload a batch of validated disclosures to the database.
+
+        Politicians are resolved once per distinct politician in the batch,
+        then all transactions are written through batch_upload_transactions().
+        Override to customize batch upload behavior.
+
+        Args:
+            disclosures: Validated disclosures to upload
+            update_mode: If True, upsert instead of insert
+
+        Returns:
+            Tuple of (uploaded, skipped, failed) record counts. Rows that
+            already exist are counted as skipped, as in upload_disclosure().
+        """
+        from app.lib.database import (
+            batch_upload_transactions,
+            get_supabase,
+            prepare_transaction_for_batch,
+        )
+
+        supabase = get_supabase()
+        if not supabase:
+            return 0, len(disclosures), 0
+
+        politician_ids = await run_db(self._resolve_politician_ids, supabase, disclosures)
+
+        rows = []
+        skipped = 0
+        for disclosure, politician_id in zip(disclosures, politician_ids):
+            row = (
+                prepare_transaction_for_batch(politician_id, disclosure, disclosure)
+                if politician_id
+                else None
+            )
+            if row is None:
+                skipped += 1
+            else:
+                rows.append(row)
+
+        uploaded, duplicates, failed = await run_db(
+            batch_upload_transactions,
+            supabase,
+            rows,
+            update_mode=update_mode,
+            batch_size=max(len(rows), 1),
+        )
+        return uploaded, skipped + duplicates, failed
+
+    def _resolve_politician_ids(
+        self, supabase: Any, disclosures: List[Dict[str, Any]]
+    ) -> List[Optional[str]]:
+        """Resolve politician IDs for a batch with one find_or_create_politicians() call."""
+        from app.lib.politician import find_or_create_politicians, politician_key
+        from app.lib.politician_index import get_politician_index
+
+        descriptors = [
+            {
+                "name": d.get("politician_name"),
+                "first_name": d.get("first_name"),
+                "last_name": d.get("last_name"),
+                "chamber": d.get("chamber", "house"),
+                "state": d.get("state"),
+                "bioguide_id": d.get("bioguide_id"),
+            }
+            for d in disclosures
+        ]
+        try:
+            resolved = find_or_create_politicians(
+                supabase, descriptors, index=get_politician_index()
+            )
+        except Exception as e:
+            self.logger.error(f"Politician lookup failed for batch: {e}")
+            return [None] * len(disclosures)
+        return [resolved.get(politician_key(d)) for d in descriptors]
+
     async def on_start(self, job_id: str, **kwargs):
         """
         Hook called before processing begins.
@@ -320,6 +487,8 @@ class BaseETLService(ABC):
         job_id: str,
         limit: Optional[int] = None,
         update_mode: bool = False,
+        pipeline: Optional[PipelineConfig] = None,
+        batch_upload: Optional[BatchUploadConfig] = None,
         **kwargs,
     ) -> ETLResult:
         """
@@ -334,16 +503,26 @@ class BaseETLService(ABC):
            c. upload_disclosure()
         4. on_complete() hook
 
+        When a PipelineConfig is given (or set as ``pipeline_config`` on the
+        class), step 2 uses stream_disclosures() and step 3 runs as
+        concurrent stages connected by bounded queues. When a
+        BatchUploadConfig is given (or set as ``batch_upload_config``),
+        step 3c is replaced by buffered upload_batch() calls.
+
         Args:
             job_id: Unique job identifier for status tracking
             limit: Optional limit on records to process (for testing)
             update_mode: If True, upsert instead of insert
+            pipeline: Optional pipelined execution settings
+            batch_upload: Optional batched upload settings
             **kwargs: Passed to fetch_disclosures()
 
         Returns:
             ETLResult with processing statistics and errors.
         """
         result = ETLResult(started_at=datetime.now(timezone.utc))
+        pipeline = pipeline or self.pipeline_config
+        batch_upload = batch_upload or self.batch_upload_config
 
         # Initialize job status
         self._job_status[job_id] = JobStatus(
@@ -358,62 +537,72 @@ class BaseETLService(ABC):
 
             # Fetch raw disclosures
             self.update_job_status(job_id, message="Fetching disclosures...")
-            raw_disclosures = await self.fetch_disclosures(**kwargs)
-
-            if not raw_disclosures:
-                result.add_warning("No disclosures fetched from source")
-                self.update_job_status(
-                    job_id,
-                    status="completed",
-                    message="No disclosures to process",
+
+            if pipeline:
+                await self._run_pipelined(
+                    job_id, result, pipeline, limit, update_mode,
+                    batch_upload=batch_upload, **kwargs
                 )
-                result.completed_at = datetime.now(timezone.utc)
-                return result
-
-            # Apply limit if specified (record-level limiting)
-            to_process = raw_disclosures[:limit] if limit else raw_disclosures
-            total = len(to_process)
-            self.update_job_status(job_id, total=total)
-
-            self.logger.info(f"Processing {total} disclosures")
-
-            # Process each disclosure
-            for i, raw in enumerate(to_process):
-                result.records_processed += 1
-                self.update_job_status(
-                    job_id,
-                    progress=i + 1,
-                    message=f"Processing {i + 1}/{total}...",
+                if result.records_processed == 0:
+                    return self._complete_empty(job_id, result)
+            else:
+                raw_disclosures = await self.fetch_disclosures(**kwargs)
+
+                if not raw_disclosures:
+                    return self._complete_empty(job_id, result)
+
+                # Apply limit if specified (record-level limiting)
+                to_process = raw_disclosures[:limit] if limit else raw_disclosures
+                total = len(to_process)
+                self.update_job_status(job_id, total=total)
+
+                self.logger.info(f"Processing {total} disclosures")
+
+                batcher = (
+                    _UploadBatcher(self, result, batch_upload, update_mode)
+                    if batch_upload
+                    else None
                 )
+                if batcher:
+                    batcher.start()
 
                 try:
-                    # Parse
-                    parsed = await self.parse_disclosure(raw)
-                    if not parsed:
-                        result.records_skipped += 1
-                        continue
-
-                    # Validate
-                    if not await self.validate_disclosure(parsed):
-                        result.records_skipped += 1
-                        continue
-
-                    # Upload
-                    disclosure_id = await self.upload_disclosure(
-                        parsed, update_mode=update_mode
-                    )
-
-                    if disclosure_id:
-                        if update_mode:
-                            result.records_updated += 1
-                        else:
-                            result.records_inserted += 1
-                    else:
-                        result.records_skipped += 1
-
-                except Exception as e:
-                    result.records_failed += 1
-                    result.add_error(f"Failed to process disclosure: {e}")
+                    # Process each disclosure
+                    for i, raw in enumerate(to_process):
+                        result.records_processed += 1
+                        self.update_job_status(
+                            job_id,
+                            progress=i + 1,
+                            message=f"Processing {i + 1}/{total}...",
+                        )
+
+                        try:
+                            # Parse
+                            parsed = await self.parse_disclosure(raw)
+                            if not parsed:
+                                result.records_skipped += 1
+                                continue
+
+                            # Validate
+                            if not await self.validate_disclosure(parsed):
+                                result.records_skipped += 1
+                                continue
+
+                            # Upload
+                            if batcher:
+                                await batcher.add(parsed)
+                                continue
+                            disclosure_id = await self.upload_disclosure(
+                                parsed, update_mode=update_mode
+                            )
+                            self._record_upload(result, disclosure_id, update_mode)
+
+                        except Exception as e:
+                            result.records_failed += 1
+                            result.add_error(f"Failed to process disclosure: {e}")
+                finally:
+                    if batcher:
+                        await batcher.close()
 
             # Complete
             result.completed_at = datetime.now(timezone.utc)
@@ -439,9 +628,245 @@ class BaseETLService(ABC):
 
         return result
 
+    def _complete_empty(self, job_id: str, result: ETLResult) -> ETLResult:
+        """Finish a job whose source returned no disclosures."""
+        result.add_warning("No disclosures fetched from source")
+        self.update_job_status(
+            job_id,
+            status="completed",
+            message="No disclosures to process",
+        )
+        result.completed_at = datetime.now(timezone.utc)
+        return result
+
+    @staticmethod
+    def _record_upload(
+        result: ETLResult, disclosure_id: Optional[str], update_mode: bool
+    ):
+        """Count the outcome of a single upload_disclosure() call."""
+        if disclosure_id:
+            if update_mode:
+                result.records_updated += 1
+            else:
+                result.records_inserted += 1
+        else:
+            result.records_skipped += 1
+
+    # =========================================================================
+    # Pipelined Execution
+    # =========================================================================
+
+    async def _run_pipelined(
+        self,
+        job_id: str,
+        result: ETLResult,
+        config: PipelineConfig,
+        limit: Optional[int],
+        update_mode: bool,
+        batch_upload: Optional[BatchUploadConfig] = None,
+        **kwargs,
+    ):
+        """
+        Process disclosures through concurrent fetch/parse/validate/upload stages.
+
+        Records flow through bounded queues, so at most ``queue_size`` items
+        are buffered between any two stages. Per-record failures are counted
+        exactly as in the serial path; an exception raised by the fetch
+        stream cancels all stages and propagates to run().
+        """
+        parse_q: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        validate_q: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        upload_q: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        completed = 0
+
+        def _mark_done():
+            nonlocal completed
+            completed += 1
+            total = self.get_job_status(job_id).total
+            self.update_job_status(
+                job_id,
+                progress=completed,
+                message=(
+                    f"Processing {completed}/{total}..."
+                    if total
+                    else f"Processing {completed}..."
+                ),
+            )
+
+        def _mark_flushed(count: int):
+            for _ in range(count):
+                _mark_done()
+
+        batcher = (
+            _UploadBatcher(
+                self, result, batch_upload, update_mode, on_flushed=_mark_flushed
+            )
+            if batch_upload
+            else None
+        )
+
+        def _mark_failed(e: Exception):
+            result.records_failed += 1
+            result.add_error(f"Failed to process disclosure: {e}")
+            _mark_done()
+
+        async def produce():
+            # Stop before pulling a record past the limit and close the
+            # stream, so a limited run doesn't keep reading the source
+            async with aclosing(self.stream_disclosures(**kwargs)) as stream:
+                async for raw in stream:
+                    result.records_processed += 1
+                    await parse_q.put(raw)
+                    if limit and result.records_processed >= limit:
+                        break
+            self.update_job_status(job_id, total=result.records_processed)
+            self.logger.info(f"Fetched {result.records_processed} disclosures")
+
+        async def parse(raw):
+            try:
+                parsed = await self.parse_disclosure(raw)
+            except Exception as e:
+                _mark_failed(e)
+                return
+            if not parsed:
+                result.records_skipped += 1
+                _mark_done()
+                return
+            await validate_q.put(parsed)
+
+        async def validate(parsed):
+            try:
+                valid = await self.validate_disclosure(parsed)
+            except Exception as e:
+                _mark_failed(e)
+                return
+            if not valid:
+                result.records_skipped += 1
+                _mark_done()
+                return
+            await upload_q.put(parsed)
+
+        async def upload(parsed):
+            if batcher:
+                await batcher.add(parsed)
+                return
+            try:
+                disclosure_id = await self.upload_disclosure(
+                    parsed, update_mode=update_mode
+                )
+            except Exception as e:
+                _mark_failed(e)
+                return
+            self._record_upload(result, disclosure_id, update_mode)
+            _mark_done()
+
+        if batcher:
+            batcher.start()
+        try:
+            await run_together(
+                run_stage(produce, None, parse_q, config.parse_workers, 1),
+                run_stage(
+                    parse, parse_q, validate_q, config.validate_workers,
+                    config.parse_workers,
+                ),
+                run_stage(
+                    validate, validate_q, upload_q, config.upload_workers,
+                    config.validate_workers,
+                ),
+                run_stage(upload, upload_q, None, 0, config.upload_workers),
+            )
+        finally:
+            if batcher:
+                await batcher.close()
+
     # =========================================================================
     # Utility Methods
     # =========================================================================
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(source_id={self.source_id})>"
+
+
+class _UploadBatcher:
+    """
+    Buffers validated disclosures and flushes them through upload_batch().
+
+    A flush happens when the buffer reaches ``batch_size``, when the oldest
+    buffered record is older than ``flush_interval`` (checked by a background
+    timer), and once more on close(). Concurrent callers may flush distinct
+    batches at the same time; each record is counted exactly once.
+    """
+
+    def __init__(
+        self,
+        service: BaseETLService,
+        result: ETLResult,
+        config: BatchUploadConfig,
+        update_mode: bool,
+        on_flushed: Optional[Callable[[int], None]] = None,
+    ):
+        self.service = service
+        self.result = result
+        self.config = config
+        self.update_mode = update_mode
+        self.on_flushed = on_flushed
+        self._buffer: List[Dict[str, Any]] = []
+        self._oldest: float = 0.0
+        self._closed = asyncio.Event()
+        self._timer: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background flush-interval timer."""
+        self._timer = asyncio.create_task(self._flush_periodically())
+
+    async def add(self, disclosure: Dict[str, Any]):
+        """Buffer a disclosure, flushing if the batch is full."""
+        if not self._buffer:
+            self._oldest = asyncio.get_running_loop().time()
+        self._buffer.append(disclosure)
+        if len(self._buffer) >= self.config.batch_size:
+            await self.flush()
+
+    async def flush(self):
+        """Upload everything currently buffered."""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+
+        try:
+            uploaded, skipped, failed = await self.service.upload_batch(
+                batch, update_mode=self.update_mode
+            )
+        except Exception as e:
+            uploaded, skipped, failed = 0, 0, len(batch)
+            self.result.add_error(
+                f"Failed to upload batch of {len(batch)} disclosures: {e}"
+            )
+
+        if self.update_mode:
+            self.result.records_updated += uploaded
+        else:
+            self.result.records_inserted += uploaded
+        self.result.records_skipped += skipped
+        self.result.records_failed += failed
+
+        if self.on_flushed:
+            self.on_flushed(len(batch))
+
+    async def close(self):
+        """Stop the timer and flush any remaining records."""
+        self._closed.set()
+        if self._timer:
+            await self._timer
+        await self.flush()
+
+    async def _flush_periodically(self):
+        interval = self.config.flush_interval
+        while not self._closed.is_set():
+            try:
+                await asyncio.wait_for(self._closed.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            age = asyncio.get_running_loop().time() - self._oldest
+            if self._buffer and age >= interval and not self._closed.is_set():
+                await self.flush()
@@ -0,0 +1,247 @@
+"""
+Reusable pool of Playwright browser contexts.
+
+Scraping a JS-gated site with one page means one navigation at a time, and
+launching a browser per call (search, then again for processing, then again
+for every backfill year) costs seconds and a lot of memory each time.
+BrowserPool launches Chromium once and hands out pages, each in its own
+browser context:
+
+- Up to ``pages`` contexts navigate concurrently; checkouts beyond that wait
+- Requests for images, stylesheets, fonts and media are aborted through
+  request interception, so pages load only their HTML and scripts
+- A context is closed and replaced after ``recycle_after`` main-frame
+  navigations (bounding Chromium's per-context memory growth), when the
+  ``is_stale`` check says its session is gone, or when its user raised
+- An optional ``setup`` coroutine runs on every new context's page (e.g. to
+  accept a usage agreement), so checked-out pages are ready to use
+
+The browser is launched lazily on the first checkout, so a pool can be
+created up front and passed down to code that may never need it.
+
+Usage:
+    from app.lib.browser_pool import BrowserPool
+
+    async with BrowserPool(pages=3, setup=accept_agreement) as pool:
+        async with pool.page() as page:
+            await page.goto(url)
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page, Route
+
+logger = logging.getLogger(__name__)
+
+PLAYWRIGHT_POOL_PAGES = int(os.environ.get("PLAYWRIGHT_POOL_PAGES", "2"))
+PLAYWRIGHT_RECYCLE_AFTER = int(os.environ.get("PLAYWRIGHT_RECYCLE_AFTER", "50"))
+PLAYWRIGHT_BLOCKED_RESOURCES = frozenset(
+    t.strip()
+    for t in os.environ.get("PLAYWRIGHT_BLOCKED_RESOURCES", "image,stylesheet,font,media").split(",")
+    if t.strip()
+)
+NEW_PAGE_TIMEOUT = 60.0
+
+# Headless Chromium flags that work inside Docker / Fly.io machines
+CHROMIUM_ARGS: List[str] = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--no-first-run",
+    "--no-zygote",
+    "--disable-software-rasterizer",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--mute-audio",
+    "--hide-scrollbars",
+    "--metrics-recording-only",
+]
+
+
+class _PooledPage:
+    """A browser context, its single page and how often it has navigated."""
+
+    def __init__(self, context: "BrowserContext", page: "Page"):
+        self.context = context
+        self.page = page
+        self.navigations = 0
+
+    def on_navigated(self, frame: Any) -> None:
+        if frame == self.page.main_frame:
+            self.navigations += 1
+
+
+class BrowserPool:
+    """Pages in recycled, resource-blocking contexts of one shared browser."""
+
+    def __init__(
+        self,
+        pages: Optional[int] = None,
+        recycle_after: Optional[int] = None,
+        setup: Optional[Callable[["Page"], Awaitable[None]]] = None,
+        is_stale: Optional[Callable[["Page"], bool]] = None,
+        blocked_resources: Iterable[str] = PLAYWRIGHT_BLOCKED_RESOURCES,
+        context_options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the pool. Nothing is launched until the first checkout.
+
+        Args:
+            pages: Contexts (and so concurrent navigations); defaults to
+                PLAYWRIGHT_POOL_PAGES
+            recycle_after: Main-frame navigations after which a context is
+                replaced; defaults to PLAYWRIGHT_RECYCLE_AFTER
+            setup: Coroutine run on each new context's page before first use
+            is_stale: Check run on release; True replaces the context
+            blocked_resources: Playwright resource types to abort
+            context_options: Keyword arguments for browser.new_context()
+        """
+        self.size = max(1, pages or PLAYWRIGHT_POOL_PAGES)
+        self.recycle_after = max(1, recycle_after or PLAYWRIGHT_RECYCLE_AFTER)
+        self._setup = setup
+        self._is_stale = is_stale
+        self._blocked = frozenset(blocked_resources)
+        self._context_options = context_options or {}
+
+        self._playwright = None
+        self._browser: Optional["Browser"] = None
+        self._launch_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.size)
+        self._idle: List[_PooledPage] = []
+        self._closed = False
+        self._stats = {
+            "checkouts": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "requests_blocked": 0,
+        }
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _get_browser(self) -> "Browser":
+        async with self._launch_lock:
+            if self._browser is None:
+                from playwright.async_api import async_playwright
+
+                logger.info("[Playwright] Launching Chromium browser...")
+                self._playwright = await async_playwright().start()
+                try:
+                    self._browser = await self._playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+                except BaseException:
+                    await self._playwright.stop()
+                    self._playwright = None
+                    raise
+                logger.info(f"[Playwright] Browser launched ({self.size} page pool)")
+            return self._browser
+
+    async def _route(self, route: "Route") -> None:
+        if route.request.resource_type in self._blocked:
+            self._stats["requests_blocked"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _new_slot(self) -> _PooledPage:
+        browser = await self._get_browser()
+        context = await browser.new_context(**self._context_options)
+        try:
+            if self._blocked:
+                await context.route("**/*", self._route)
+            try:
+                page = await asyncio.wait_for(context.new_page(), timeout=NEW_PAGE_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise Exception(f"Failed to create new page - timeout after {NEW_PAGE_TIMEOUT:.0f}s")
+            slot = _PooledPage(context, page)
+            page.on("framenavigated", slot.on_navigated)
+            if self._setup:
+                await self._setup(page)
+        except BaseException:
+            await self._close_slot_context(context)
+            raise
+        self._stats["contexts_created"] += 1
+        return slot
+
+    @staticmethod
+    async def _close_slot_context(context: "BrowserContext") -> None:
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"[Playwright] Error closing context: {e}")
+
+    def _should_recycle(self, slot: _PooledPage) -> bool:
+        if slot.navigations >= self.recycle_after:
+            return True
+        if self._is_stale is not None:
+            try:
+                return bool(self._is_stale(slot.page))
+            except Exception:
+                return True
+        return False
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator["Page"]:
+        """
+        Check out a ready page for exclusive use.
+
+        Waits while all ``pages`` are in use. Raises whatever launching the
+        browser or setting up a new context raised.
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+
+        async with self._slots:
+            slot = self._idle.pop() if self._idle else await self._new_slot()
+            self._stats["checkouts"] += 1
+            healthy = False
+            try:
+                yield slot.page
+                healthy = True
+            finally:
+                if healthy and not self._closed and not self._should_recycle(slot):
+                    self._idle.append(slot)
+                else:
+                    if not self._closed:
+                        self._stats["contexts_recycled"] += 1
+                        logger.debug(f"[Playwright] Recycling context after {slot.navigations} navigations")
+                    await self._close_slot_context(slot.context)
+
+    async def close(self) -> None:
+        """Close every idle context, the browser and the Playwright driver."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for slot in idle:
+            await self._close_slot_context(slot.context)
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.debug(f"[Playwright] Error closing browser: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"[Playwright] Error stopping driver: {e}")
+            self._playwright = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            **self._stats,
+            "pages": self.size,
+            "idle": len(self._idle),
+            "launched": self._browser is not None,
+        }
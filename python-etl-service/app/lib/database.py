@@ -2,19 +2,28 @@ import os
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
-from supabase import create_client, Client
+from supabase import create_client, Client  # noqa: F401  # create_client re-exported for patching
 
 from app.lib.parser import sanitize_string, validate_and_sanitize_amounts
 
 logger = logging.getLogger(__name__)
 
+
 def get_supabase() -> Optional[Client]:
-    """Get Supabase client."""
+    """Get Supabase client.
+
+    Clients come from the process-wide pool in app.lib.supabase_pool, so
+    repeated calls reuse the same keep-alive HTTP connections instead of
+    building a new client per call.
+    """
+    from app.lib.supabase_pool import get_client_pool
+
     supabase_url = os.getenv("SUPABASE_URL", "https://uljsqvwkomdrlnofmlad.supabase.co")
     supabase_key = os.getenv("SUPABASE_SERVICE_KEY", "")
     if not supabase_key or not supabase_url:
         return None
-    return create_client(supabase_url, supabase_key)
+    return get_client_pool().get_client(supabase_url, supabase_key)
+
 
 def refresh_materialized_views(supabase_client: Optional[Client] = None) -> bool:
     """Refresh materialized views after ETL data imports.
@@ -235,12 +244,22 @@ def batch_upload_transactions(
     transactions: List[Dict[str, Any]],
     update_mode: bool = False,
     batch_size: int = 50,
-) -> Tuple[int, int]:
+) -> Tuple[int, int, int]:
     """Upload multiple transactions to Supabase in batches.
 
     This is more efficient than uploading one at a time for ETL jobs
     that process many transactions.
 
+    In insert mode rows that already exist are skipped by the database
+    (``ON CONFLICT DO NOTHING``), so a batch containing duplicates is still
+    written in one request and the duplicates are reported separately
+    instead of as failures.
+
+    Rows sharing a conflict key are collapsed to the last one before
+    writing: Postgres rejects a whole ``ON CONFLICT DO UPDATE`` statement
+    that would touch the same row twice. The dropped rows count as
+    duplicates.
+
     Args:
         supabase_client: Supabase client instance
         transactions: List of prepared transaction dicts (from prepare_transaction_for_batch)
@@ -248,72 +267,75 @@ def batch_upload_transactions(
         batch_size: Number of records per batch (default 50)
 
     Returns:
-        Tuple of (successful_count, failed_count)
+        Tuple of (successful_count, duplicate_count, failed_count)
     """
     if not transactions:
-        return 0, 0
+        return 0, 0, 0
+
+    # The unique constraint idx_disclosures_unique is on:
+    # (politician_id, transaction_date, asset_name, transaction_type, disclosure_date)
+    on_conflict = "politician_id,transaction_date,asset_name,transaction_type,disclosure_date"
+    conflict_columns = on_conflict.split(",")
+
+    def _write(rows):
+        return (
+            supabase_client.table("trading_disclosures")
+            .upsert(rows, on_conflict=on_conflict, ignore_duplicates=not update_mode)
+            .execute()
+        )
 
     successful = 0
+    duplicates = 0
     failed = 0
 
+    # Last row per conflict key wins. Rows with a NULL key column never
+    # conflict (NULLs are distinct in unique indexes), so they are all kept.
+    unique: Dict[Any, Dict[str, Any]] = {}
+    for n, txn in enumerate(transactions):
+        key = tuple(txn.get(column) for column in conflict_columns)
+        unique[key if None not in key else n] = txn
+    duplicates += len(transactions) - len(unique)
+    transactions = list(unique.values())
+
     # Process in batches
     for i in range(0, len(transactions), batch_size):
         batch = transactions[i:i + batch_size]
 
         try:
+            response = _write(batch)
+            written = len(response.data or [])
+            successful += written
             if update_mode:
-                response = (
-                    supabase_client.table("trading_disclosures")
-                    .upsert(
-                        batch,
-                        on_conflict="politician_id,transaction_date,asset_name,transaction_type,disclosure_date"
-                    )
-                    .execute()
-                )
+                failed += len(batch) - written
             else:
-                response = (
-                    supabase_client.table("trading_disclosures")
-                    .insert(batch)
-                    .execute()
-                )
-
-            if response.data:
-                successful += len(response.data)
-            else:
-                failed += len(batch)
+                # Rows the database skipped on conflict come back missing
+                duplicates += len(batch) - written
 
         except Exception as e:
             error_str = str(e)
             if "duplicate key" in error_str or "23505" in error_str:
-                # Some duplicates in batch - fall back to individual inserts
-                logger.debug(f"Batch had duplicates, falling back to individual inserts")
+                # Some duplicates in batch - fall back to individual writes
+                logger.debug("Batch had duplicates, falling back to individual inserts")
                 for txn in batch:
                     try:
-                        if update_mode:
-                            resp = (
-                                supabase_client.table("trading_disclosures")
-                                .upsert(
-                                    txn,
-                                    on_conflict="politician_id,transaction_date,asset_name,transaction_type,disclosure_date"
-                                )
-                                .execute()
-                            )
-                        else:
-                            resp = (
-                                supabase_client.table("trading_disclosures")
-                                .insert(txn)
-                                .execute()
-                            )
+                        resp = _write(txn)
                         if resp.data:
                             successful += 1
-                        else:
+                        elif update_mode:
                             failed += 1
+                        else:
+                            duplicates += 1
                     except Exception as txn_error:
-                        failed += 1
+                        txn_error_str = str(txn_error)
                         asset_name = txn.get("asset_name", "unknown")[:50]
-                        logger.debug(f"Individual insert failed for '{asset_name}': {txn_error}")
+                        if "duplicate key" in txn_error_str or "23505" in txn_error_str:
+                            duplicates += 1
+                            logger.debug(f"Duplicate transaction skipped: {asset_name}")
+                        else:
+                            failed += 1
+                            logger.debug(f"Individual insert failed for '{asset_name}': {txn_error}")
             else:
                 logger.error(f"Batch upload failed: {e}")
                 failed += len(batch)
 
-    return successful, failed
\ No newline at end of file
+    return successful, duplicates, failed
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+Pluggable HTML parsing backend.
+
+BeautifulSoup over the pure-Python html.parser builds a tree of Python
+objects for every page, which makes it a visible share of CPU time when a
+backfill parses thousands of Senate PTR pages. lxml parses the same pages
+in C and only creates Python objects for the elements that are touched.
+
+Parsers that support both backends keep their output logic shared and only
+differ in how they pull text out of the page:
+
+    from app.lib.html_backend import parse_document, text_content, use_lxml
+
+    if use_lxml():
+        doc = parse_document(html)
+        titles = [text_content(h1, strip=True) for h1 in doc.iter("h1")]
+    else:
+        soup = BeautifulSoup(html, "html.parser")
+        titles = [h1.get_text(strip=True) for h1 in soup.find_all("h1")]
+
+parse_document() empties <script>, <style> and <template> elements, so
+text_content() matches BeautifulSoup's get_text(), which skips their
+contents and comments.
+
+Select with HTML_PARSER_BACKEND=lxml (default) or bs4; lxml falls back to
+bs4 when it isn't installed.
+"""
+
+import logging
+import os
+from typing import Any, Optional
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is in requirements.txt
+    lxml = None
+    etree = None
+
+logger = logging.getLogger(__name__)
+
+HTML_PARSER_BACKEND = os.environ.get("HTML_PARSER_BACKEND", "lxml").lower()
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = ("script", "style", "template")
+
+if lxml is not None:
+    _UTF8_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def use_lxml() -> bool:
+    """Whether the lxml backend is selected and available."""
+    return HTML_PARSER_BACKEND == "lxml" and lxml is not None
+
+
+def parse_document(html: str) -> Optional[Any]:
+    """
+    Parse an HTML document with lxml.
+
+    Returns the root element with <script>, <style> and <template>
+    elements emptied, or None for an empty document (which BeautifulSoup
+    would parse as a page with no elements).
+    """
+    try:
+        try:
+            doc = lxml.html.document_fromstring(html)
+        except ValueError:
+            # lxml refuses str input carrying an XML encoding declaration
+            doc = lxml.html.document_fromstring(html.encode("utf-8"), parser=_UTF8_PARSER)
+    except etree.ParserError:
+        return None
+    # Empty rather than remove them: removal would merge the text around
+    # them into one node and change what strip=True produces
+    for element in list(doc.iter(*_NON_TEXT_TAGS)):
+        element.text = None
+        del element[:]
+    return doc
+
+
+def text_content(element: Any, strip: bool = False) -> str:
+    """
+    Text of an element from parse_document(), like BeautifulSoup's
+    ``get_text(strip=strip)``.
+
+    With strip=True each text node is stripped and empty ones dropped.
+    Otherwise whitespace-only nodes collapse to one space or newline, as
+    BeautifulSoup does outside <pre>.
+    """
+    if strip:
+        return "".join(t.strip() for t in element.itertext())
+    return "".join(
+        t if not t.isspace() else ("\n" if "\n" in t else " ")
+        for t in element.itertext()
+    )
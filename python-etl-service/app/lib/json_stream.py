@@ -0,0 +1,97 @@
+"""
+Incremental parsing of large JSON array responses.
+
+Bulk endpoints (QuiverQuant's congress-trading archive) return every
+historical record as one JSON array. ``response.json()`` decodes the whole
+body into Python objects before the caller can look at any of them, so
+memory grows with the archive even when only a recent window is wanted.
+
+iter_json_array() instead decodes the array element by element from the
+response body as it arrives, keeping only the undecoded tail of the text in
+memory. Elements are decoded with the standard library's JSONDecoder, so
+values are identical to ``json.loads()``.
+
+Usage:
+    from app.lib.json_stream import iter_json_array
+
+    async with client.stream("GET", url) as response:
+        async for record in iter_json_array(response.aiter_text()):
+            ...
+"""
+
+import json
+from typing import Any, AsyncIterable, AsyncIterator
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r\ufeff"  # A UTF-8 BOM may lead the body
+_DELIMITERS = ",] \t\n\r"
+
+
+class JSONStreamError(ValueError):
+    """The stream is not a well-formed JSON array."""
+
+
+async def iter_json_array(chunks: AsyncIterable[str]) -> AsyncIterator[Any]:
+    """
+    Yield the elements of a JSON array read from an async stream of text.
+
+    Args:
+        chunks: Text fragments of the document, split anywhere
+
+    Raises:
+        JSONStreamError: If the document is not a JSON array, or ends early
+    """
+    buffer = ""
+    pos = 0
+    started = False
+    expect_element = True  # After "[" or ",", before the next element
+
+    async for chunk in chunks:
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+
+            if not started:
+                if buffer[pos] != "[":
+                    raise JSONStreamError(f"Expected a JSON array, got {buffer[pos:pos + 20]!r}")
+                started = True
+                pos += 1
+                continue
+
+            if buffer[pos] == "]":
+                return
+
+            if not expect_element:
+                if buffer[pos] != ",":
+                    raise JSONStreamError(f"Expected ',' or ']' at {buffer[pos:pos + 20]!r}")
+                expect_element = True
+                pos += 1
+                continue
+
+            try:
+                element, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Incomplete element; wait for the next chunk
+                break
+            if not isinstance(element, (dict, list)) and (
+                end == len(buffer) or buffer[end] not in _DELIMITERS
+            ):
+                # A scalar not yet followed by a delimiter may continue in
+                # the next chunk ("-0" + ".5", "12" + "34")
+                break
+            pos = end
+            expect_element = False
+            yield element
+
+    if started and pos < len(buffer):
+        # Whatever is left failed to decode even with the whole body
+        try:
+            _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            raise JSONStreamError(f"Malformed JSON array element: {e}") from e
+    raise JSONStreamError("JSON array ended early" if started else "Empty response body")
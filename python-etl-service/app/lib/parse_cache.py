@@ -0,0 +1,223 @@
+"""
+Parsed-result cache keyed by PDF hash and parser version.
+
+Even with PDFs on local disk (app.lib.pdf_cache), a House update-mode run
+spends most of its time in pdfplumber table extraction and row parsing.
+Both are pure functions of the PDF bytes and the parsing code, so ParseCache
+stores their output keyed by (PDF sha256, version, kind):
+
+- ``tables``: pdf_utils.extract_tables_from_pdf output, versioned by
+  PDF_UTILS_VERSION
+- ``house_transactions``: parsed House PTR rows, versioned by
+  PDF_UTILS_VERSION and PARSER_VERSION
+
+Only bumping a version constant invalidates entries; old versions can be
+purged with ``DELETE /etl/parse-cache/{version}`` or the CLI:
+
+    python -m app.lib.parse_cache stats
+    python -m app.lib.parse_cache purge pdf_utils-1
+
+Disable with PARSE_CACHE_ENABLED=false.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.lib.parser import PARSER_VERSION
+from app.lib.pdf_utils import PDF_UTILS_VERSION
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_ENABLED = os.environ.get("PARSE_CACHE_ENABLED", "true").lower() == "true"
+PARSE_CACHE_DIR = os.environ.get("PARSE_CACHE_DIR", "/tmp/parse_cache")
+
+# Version strings per kind of cached result
+TABLES_VERSION = f"pdf_utils-{PDF_UTILS_VERSION}"
+TRANSACTIONS_VERSION = f"{TABLES_VERSION}+parser-{PARSER_VERSION}"
+KIND_VERSIONS = {
+    "tables": TABLES_VERSION,
+    "house_transactions": TRANSACTIONS_VERSION,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    sha256 TEXT NOT NULL,
+    version TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (sha256, version, kind)
+);
+"""
+
+
+class ParseCache:
+    """sqlite store of extraction/parse output per (sha256, version, kind)."""
+
+    def __init__(self, directory: str = PARSE_CACHE_DIR):
+        """
+        Initialize the cache, creating its directory and database if needed.
+
+        Args:
+            directory: Directory holding results.db
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.directory / "results.db"), check_same_thread=False, isolation_level=None
+        )
+        self._db.executescript(_SCHEMA)
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, kind: str, outcome: str) -> None:
+        counters = self._stats.setdefault(kind, {"hits": 0, "misses": 0, "stores": 0})
+        counters[outcome] += 1
+
+    def get(self, sha256: str, kind: str, version: Optional[str] = None) -> Optional[Any]:
+        """Return the cached result, or None on a miss."""
+        version = version or KIND_VERSIONS[kind]
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload FROM results WHERE sha256 = ? AND version = ? AND kind = ?",
+                (sha256, version, kind),
+            ).fetchone()
+            self._count(kind, "hits" if row else "misses")
+        return json.loads(row[0]) if row else None
+
+    def put(self, sha256: str, kind: str, result: Any, version: Optional[str] = None) -> None:
+        """Store a JSON-serializable result."""
+        version = version or KIND_VERSIONS[kind]
+        payload = json.dumps(result, default=str)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (sha256, version, kind, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (sha256, version, kind, payload, time.time()),
+            )
+            self._count(kind, "stores")
+
+    def purge(self, version: str) -> int:
+        """Delete every result stored under `version`. Returns rows deleted."""
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM results WHERE version = ?", (version,))
+        logger.info(f"Purged {cursor.rowcount} parse cache entries for version {version}")
+        return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return per-kind hit rates and stored entries per version."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT version, kind, COUNT(*) FROM results GROUP BY version, kind"
+            ).fetchall()
+
+        kinds = {}
+        for kind, counters in self._stats.items():
+            lookups = counters["hits"] + counters["misses"]
+            kinds[kind] = {
+                **counters,
+                "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+            }
+
+        entries: Dict[str, Dict[str, int]] = {}
+        for version, kind, count in rows:
+            entries.setdefault(version, {})[kind] = count
+
+        return {
+            "current_versions": dict(KIND_VERSIONS),
+            "kinds": kinds,
+            "entries": entries,
+        }
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+
+# Global cache instance
+_cache: Optional[ParseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """
+    Get the global parse cache, or None if caching is disabled or the cache
+    directory can't be used.
+    """
+    global _cache
+    if not PARSE_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = ParseCache(PARSE_CACHE_DIR)
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Parse cache unavailable at {PARSE_CACHE_DIR}: {e}")
+                    return None
+    return _cache
+
+
+def reset_parse_cache() -> None:
+    """Close and discard the global cache. Stored results are kept."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
+
+
+async def load_parsed(sha256: str, kind: str) -> Optional[Any]:
+    """Look a result up in the global cache off the event loop. Never raises."""
+    cache = get_parse_cache()
+    if cache is None:
+        return None
+    try:
+        return await asyncio.to_thread(cache.get, sha256, kind)
+    except Exception as e:
+        logger.warning(f"Parse cache lookup failed for {sha256[:12]}: {e}")
+        return None
+
+
+async def store_parsed(sha256: str, kind: str, result: Any) -> None:
+    """Add a result to the global cache off the event loop. Never raises."""
+    cache = get_parse_cache()
+    if cache is None:
+        return
+    try:
+        await asyncio.to_thread(cache.put, sha256, kind, result)
+    except Exception as e:
+        logger.warning(f"Failed to cache parse result for {sha256[:12]}: {e}")
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Command-line entry point: report stats or purge a version."""
+    parser = argparse.ArgumentParser(description="Parsed-result cache maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Show stored entries per version")
+    purge = sub.add_parser("purge", help="Delete all results for a version")
+    purge.add_argument("version", help="Version string, e.g. pdf_utils-1")
+    args = parser.parse_args(argv)
+
+    cache = ParseCache(PARSE_CACHE_DIR)
+    try:
+        if args.command == "stats":
+            print(json.dumps(cache.get_stats(), indent=2))
+        else:
+            print(f"Deleted {cache.purge(args.version)} entries")
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 import re
 from typing import Optional, Any, Dict, Tuple
 
+# Bump when parsed transaction output changes (these helpers or the row
+# parsers built on them); invalidates cached parse results (app.lib.parse_cache)
+PARSER_VERSION = 1
+
 # Value range patterns for parsing
 VALUE_PATTERNS = [
     (r"\$1,001\s*-\s*\$15,000", 1001, 15000),
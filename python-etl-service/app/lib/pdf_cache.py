@@ -0,0 +1,261 @@
+"""
+Content-addressed on-disk cache for downloaded disclosure PDFs.
+
+Filed disclosure PDFs never change once published, yet every House update
+run and every EU re-run downloads them again behind a 1 s+ rate-limit delay.
+PDFCache keeps each distinct document once on local disk:
+
+- Objects are stored by sha256 under ``<dir>/objects/ab/abcdef....pdf`` and
+  verified against their hash on every read; a corrupt file is dropped and
+  treated as a miss
+- Source URLs (and optionally source doc_ids) map to object hashes, so the
+  same PDF reached through two URLs is stored once
+- A sqlite index tracks sizes and last access; once the cache exceeds its
+  size cap, least recently used objects are evicted
+
+Disable with PDF_CACHE_ENABLED=false.
+
+Usage:
+    from app.lib.pdf_cache import load_cached_pdf, store_cached_pdf
+
+    pdf_bytes = await load_cached_pdf(url, doc_id=doc_id)
+    if pdf_bytes is None:
+        pdf_bytes = await download(url)
+        await store_cached_pdf(pdf_bytes, url, doc_id=doc_id)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PDF_CACHE_ENABLED = os.environ.get("PDF_CACHE_ENABLED", "true").lower() == "true"
+PDF_CACHE_DIR = os.environ.get("PDF_CACHE_DIR", "/tmp/pdf_cache")
+PDF_CACHE_MAX_MB = int(os.environ.get("PDF_CACHE_MAX_MB", "2048"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    sha256 TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS keys (
+    key TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_objects_last_access ON objects(last_access);
+"""
+
+
+class PDFCache:
+    """sha256-addressed PDF store with URL/doc_id keys and LRU eviction."""
+
+    def __init__(self, directory: str = PDF_CACHE_DIR, max_bytes: int = PDF_CACHE_MAX_MB * 1024 * 1024):
+        """
+        Initialize the cache, creating its directory and index if needed.
+
+        Args:
+            directory: Root directory for objects and the sqlite index
+            max_bytes: Total object size above which LRU objects are evicted
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        (self.directory / "objects").mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.directory / "index.db"), check_same_thread=False, isolation_level=None
+        )
+        self._db.executescript(_SCHEMA)
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "corrupt": 0}
+
+    @staticmethod
+    def _keys(url: Optional[str], doc_id: Optional[str]) -> list:
+        keys = []
+        if url:
+            keys.append(f"url:{url}")
+        if doc_id:
+            keys.append(f"doc:{doc_id}")
+        return keys
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.directory / "objects" / sha256[:2] / f"{sha256}.pdf"
+
+    def _drop_object(self, sha256: str) -> None:
+        """Remove an object and every key pointing at it. Caller holds the lock."""
+        self._db.execute("DELETE FROM objects WHERE sha256 = ?", (sha256,))
+        self._db.execute("DELETE FROM keys WHERE sha256 = ?", (sha256,))
+        self._object_path(sha256).unlink(missing_ok=True)
+
+    def get(self, url: Optional[str] = None, doc_id: Optional[str] = None) -> Optional[bytes]:
+        """
+        Return the cached PDF for a URL or doc_id, or None on a miss.
+
+        The content is checked against its sha256; a mismatch evicts the
+        object and counts as a miss.
+        """
+        with self._lock:
+            for key in self._keys(url, doc_id):
+                row = self._db.execute("SELECT sha256 FROM keys WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    continue
+                sha256 = row[0]
+                try:
+                    content = self._object_path(sha256).read_bytes()
+                except OSError:
+                    content = None
+                if content is None or hashlib.sha256(content).hexdigest() != sha256:
+                    logger.warning(f"Dropping missing or corrupt cached PDF {sha256[:12]}")
+                    self._stats["corrupt"] += 1
+                    self._drop_object(sha256)
+                    continue
+
+                self._db.execute(
+                    "UPDATE objects SET last_access = ? WHERE sha256 = ?", (time.time(), sha256)
+                )
+                # Alias whichever key missed so the next lookup hits directly
+                for other in self._keys(url, doc_id):
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO keys (key, sha256) VALUES (?, ?)", (other, sha256)
+                    )
+                self._stats["hits"] += 1
+                return content
+
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, content: bytes, url: Optional[str] = None, doc_id: Optional[str] = None) -> str:
+        """
+        Store a PDF under its sha256 and map url/doc_id to it.
+
+        Returns:
+            The content's sha256 hex digest
+        """
+        sha256 = hashlib.sha256(content).hexdigest()
+        path = self._object_path(sha256)
+
+        with self._lock:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f".tmp{threading.get_ident()}")
+                tmp.write_bytes(content)
+                os.replace(tmp, path)
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO objects (sha256, size, last_access) VALUES (?, ?, ?)",
+                (sha256, len(content), time.time()),
+            )
+            for key in self._keys(url, doc_id):
+                self._db.execute(
+                    "INSERT OR REPLACE INTO keys (key, sha256) VALUES (?, ?)", (key, sha256)
+                )
+            self._stats["stores"] += 1
+            self._evict(keep=sha256)
+
+        return sha256
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used objects until under max_bytes. Caller holds the lock."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for sha256, size in self._db.execute(
+            "SELECT sha256, size FROM objects ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            if sha256 == keep:
+                continue
+            self._drop_object(sha256)
+            total -= size
+            self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Remove every cached object."""
+        with self._lock:
+            for (sha256,) in self._db.execute("SELECT sha256 FROM objects").fetchall():
+                self._drop_object(sha256)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            count, total = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects"
+            ).fetchone()
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "objects": count,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        """Close the sqlite index."""
+        with self._lock:
+            self._db.close()
+
+
+# Global cache instance
+_cache: Optional[PDFCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_pdf_cache() -> Optional[PDFCache]:
+    """
+    Get the global PDF cache, or None if caching is disabled or the cache
+    directory can't be used.
+    """
+    global _cache
+    if not PDF_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = PDFCache(PDF_CACHE_DIR, PDF_CACHE_MAX_MB * 1024 * 1024)
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"PDF cache unavailable at {PDF_CACHE_DIR}: {e}")
+                    return None
+    return _cache
+
+
+def reset_pdf_cache() -> None:
+    """Close and discard the global cache. Files on disk are kept."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
+
+
+async def load_cached_pdf(url: str, doc_id: Optional[str] = None) -> Optional[bytes]:
+    """Look a PDF up in the global cache off the event loop. Never raises."""
+    cache = get_pdf_cache()
+    if cache is None:
+        return None
+    try:
+        return await asyncio.to_thread(cache.get, url, doc_id)
+    except Exception as e:
+        logger.warning(f"PDF cache lookup failed for {url}: {e}")
+        return None
+
+
+async def store_cached_pdf(content: bytes, url: str, doc_id: Optional[str] = None) -> None:
+    """Add a downloaded PDF to the global cache off the event loop. Never raises."""
+    cache = get_pdf_cache()
+    if cache is None:
+        return
+    try:
+        await asyncio.to_thread(cache.put, content, url, doc_id)
+    except Exception as e:
+        logger.warning(f"Failed to cache PDF from {url}: {e}")
@@ -0,0 +1,220 @@
+"""
+Process-pool PDF extraction engine.
+
+pdfplumber is pure Python: table and text extraction holds the GIL for the
+whole document, so running it in threads gives no parallelism and a single
+malformed PDF can pin a worker for minutes. PDFExtractionService runs the
+extractors from app.lib.pdf_utils in a pool of worker processes instead:
+
+- Per-document timeout: a document that takes longer than ``timeout`` seconds
+  is abandoned and the pool is rebuilt so the hung worker is killed
+- Worker recycling: each process exits after ``max_docs_per_worker``
+  documents, bounding the memory pdfminer leaks on large filings
+- Bounded submission: at most ``max_workers`` documents are in the pool at
+  once, so the timeout measures extraction rather than queueing
+
+Setting PDF_EXTRACT_WORKERS=0 runs extraction in a thread instead (useful
+where subprocesses are unavailable).
+
+Usage:
+    from app.lib.pdf_extraction import extract_tables, extract_text
+
+    tables = await extract_tables(pdf_bytes)
+    text = await extract_text(pdf_bytes)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from app.lib.pdf_utils import extract_tables_from_pdf, extract_text_from_pdf
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Number of extraction processes (0 = extract in a thread, no subprocesses)
+PDF_EXTRACT_WORKERS = int(
+    os.environ.get("PDF_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+# Seconds a single document may take before it is abandoned
+PDF_EXTRACT_TIMEOUT = float(os.environ.get("PDF_EXTRACT_TIMEOUT", "120"))
+# Documents a worker process handles before it is replaced
+PDF_EXTRACT_MAX_DOCS_PER_WORKER = int(os.environ.get("PDF_EXTRACT_MAX_DOCS_PER_WORKER", "50"))
+
+
+class PDFExtractionService:
+    """Runs pdfplumber extraction in recycled worker processes."""
+
+    def __init__(
+        self,
+        max_workers: int = PDF_EXTRACT_WORKERS,
+        timeout: float = PDF_EXTRACT_TIMEOUT,
+        max_docs_per_worker: int = PDF_EXTRACT_MAX_DOCS_PER_WORKER,
+    ):
+        """
+        Initialize the service. Worker processes start on first use.
+
+        Args:
+            max_workers: Number of worker processes (0 extracts in a thread)
+            timeout: Per-document timeout in seconds
+            max_docs_per_worker: Documents per process before it is recycled
+        """
+        self.max_workers = max(0, max_workers)
+        self.timeout = timeout
+        self.max_docs_per_worker = max(1, max_docs_per_worker)
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # asyncio primitives are bound to one event loop; keep a slot
+        # semaphore per loop so the service can be shared across loops
+        self._slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats = {
+            "documents": 0,
+            "timeouts": 0,
+            "failures": 0,
+            "pool_restarts": 0,
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Get the worker pool, starting it if needed."""
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    # spawn: forking a process that runs DB and HTTP threads
+                    # can deadlock the child on a lock held mid-fork
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        max_tasks_per_child=self.max_docs_per_worker,
+                    )
+        return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Kill the workers of `pool` and forget it; the next call starts a new one."""
+        with self._lock:
+            if self._pool is not pool:
+                return  # already replaced by a concurrent failure
+            self._pool = None
+            self._stats["pool_restarts"] += 1
+        # ProcessPoolExecutor can't cancel a running task; terminating the
+        # processes is the only way to reclaim a worker stuck on one document
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(max(1, self.max_workers))
+        return slots
+
+    async def _run(self, fn: Callable[[bytes], T], pdf_bytes: bytes, default: T) -> T:
+        """Run an extractor on one document, returning `default` on timeout or crash."""
+        self._stats["documents"] += 1
+
+        if self.max_workers == 0:
+            try:
+                return await asyncio.wait_for(asyncio.to_thread(fn, pdf_bytes), self.timeout)
+            except asyncio.TimeoutError:
+                self._stats["timeouts"] += 1
+                logger.error(f"PDF extraction timed out after {self.timeout}s")
+                return default
+
+        loop = asyncio.get_running_loop()
+        async with self._get_slots():
+            # One retry: a pool broken by another document's timeout or
+            # crash is replaced, and this document deserves a fresh attempt
+            for attempt in range(2):
+                pool = self._get_pool()
+                try:
+                    return await asyncio.wait_for(
+                        loop.run_in_executor(pool, fn, pdf_bytes), self.timeout
+                    )
+                except asyncio.TimeoutError:
+                    self._stats["timeouts"] += 1
+                    logger.error(
+                        f"PDF extraction timed out after {self.timeout}s; restarting workers"
+                    )
+                    self._discard_pool(pool)
+                    return default
+                except BrokenProcessPool:
+                    self._discard_pool(pool)
+                    if attempt == 0:
+                        continue
+                    self._stats["failures"] += 1
+                    logger.error("PDF extraction worker crashed")
+                    return default
+                except Exception as e:
+                    self._stats["failures"] += 1
+                    logger.error(f"PDF extraction failed: {e}")
+                    return default
+        return default
+
+    async def extract_tables(self, pdf_bytes: bytes) -> List[List[List[str]]]:
+        """Extract all tables from a PDF (see pdf_utils.extract_tables_from_pdf)."""
+        return await self._run(extract_tables_from_pdf, pdf_bytes, [])
+
+    async def extract_text(self, pdf_bytes: bytes) -> Optional[str]:
+        """Extract all text from a PDF (see pdf_utils.extract_text_from_pdf)."""
+        return await self._run(extract_text_from_pdf, pdf_bytes, None)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return extraction counters and pool configuration."""
+        return {
+            **self._stats,
+            "workers": self.max_workers,
+            "timeout": self.timeout,
+            "max_docs_per_worker": self.max_docs_per_worker,
+            "running": self._pool is not None,
+        }
+
+
+# Global service instance
+_service: Optional[PDFExtractionService] = None
+_service_lock = threading.Lock()
+
+
+def get_pdf_extraction_service() -> PDFExtractionService:
+    """Get the global PDF extraction service."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = PDFExtractionService()
+    return _service
+
+
+def shutdown_pdf_extraction_service() -> None:
+    """Stop the global service's workers and discard it. Used on shutdown."""
+    global _service
+    with _service_lock:
+        if _service is not None:
+            _service.shutdown()
+        _service = None
+
+
+async def extract_tables(pdf_bytes: bytes) -> List[List[List[str]]]:
+    """Extract all tables from a PDF in the global worker pool."""
+    return await get_pdf_extraction_service().extract_tables(pdf_bytes)
+
+
+async def extract_text(pdf_bytes: bytes) -> Optional[str]:
+    """Extract all text from a PDF in the global worker pool."""
+    return await get_pdf_extraction_service().extract_text(pdf_bytes)
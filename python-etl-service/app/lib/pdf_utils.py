@@ -12,6 +12,9 @@ import pdfplumber
 
 logger = logging.getLogger(__name__)
 
+# Bump when extraction output changes; invalidates cached tables (app.lib.parse_cache)
+PDF_UTILS_VERSION = 1
+
 
 def extract_text_from_pdf(pdf_bytes: bytes) -> Optional[str]:
     """Extract all text from a PDF file.
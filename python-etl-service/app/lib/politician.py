@@ -5,12 +5,16 @@ Consolidated from house_etl.py and senate_etl.py
 """
 
 import logging
-from typing import Any, Dict, Optional
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from supabase import Client
 
 from app.lib.party_registry import ensure_party_exists
 
+if TYPE_CHECKING:
+    from app.lib.politician_index import PoliticianIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +29,7 @@ def find_or_create_politician(
     bioguide_id: Optional[str] = None,
     disclosure: Optional[Dict[str, Any]] = None,
     party: Optional[str] = None,
+    index: Optional["PoliticianIndex"] = None,
 ) -> Optional[str]:
     """Find existing politician or create a new one.
 
@@ -48,47 +53,61 @@ def find_or_create_politician(
         district: District identifier (e.g., "CA12")
         bioguide_id: Official Congress bioguide ID (e.g., "A000123")
         disclosure: Dict with politician info (legacy support for House ETL)
+        index: Optional PoliticianIndex answering lookups from memory; misses
+            fall through to the database and results are written back to it
 
     Returns:
         Politician UUID if found or created, None on error
     """
-    # Handle legacy disclosure dict format (from house_etl)
-    if disclosure:
-        first_name = disclosure.get("first_name", "").strip()
-        last_name = disclosure.get("last_name", "").strip()
-        name = disclosure.get("politician_name", f"{first_name} {last_name}").strip()
-        state_district = disclosure.get("state_district", "")
-        state = state_district[:2] if len(state_district) >= 2 else None
-        district = state_district
-        chamber = "house"
-        # Check if disclosure has bioguide_id
-        if not bioguide_id:
-            bioguide_id = disclosure.get("bioguide_id")
-        # Use party from disclosure if not already provided
-        if not party:
-            party = disclosure.get("party")
-
-    # Build full name if not provided
-    if not name and (first_name or last_name):
-        name = f"{first_name or ''} {last_name or ''}".strip()
-
-    if not name or name == "Unknown":
+    descriptor = _normalize_descriptor(
+        name=name,
+        first_name=first_name,
+        last_name=last_name,
+        chamber=chamber,
+        state=state,
+        district=district,
+        bioguide_id=bioguide_id,
+        disclosure=disclosure,
+        party=party,
+    )
+    if descriptor is None:
         return None
 
-    # Clean the name - remove common prefixes
-    clean_name = name.strip()
-    for prefix in ["Sen.", "Senator", "Hon.", "Honorable", "Rep.", "Representative"]:
-        clean_name = clean_name.replace(prefix, "").strip()
+    name = descriptor["name"]
+    clean_name = descriptor["clean_name"]
+    first_name = descriptor["first_name"]
+    last_name = descriptor["last_name"]
+    chamber = descriptor["chamber"]
+    role = descriptor["role"]
+    bioguide_id = descriptor["bioguide_id"]
+    party = descriptor["party"]
 
-    # Determine role based on chamber
-    chamber_role_map = {
-        "senate": "Senator",
-        "house": "Representative",
-        "eu_parliament": "MEP",
-        "uk_parliament": "Member of Parliament",
-        "california": "State Legislator",
-    }
-    role = chamber_role_map.get(chamber, "Representative")
+    # Priority 0: answer from the in-memory index without a database round trip
+    if index is not None:
+        existing = index.lookup(
+            supabase,
+            role,
+            bioguide_id=bioguide_id,
+            first_name=first_name,
+            last_name=last_name,
+            name=clean_name,
+            match_first_last=chamber in ("house", "senate"),
+        )
+        if existing:
+            updates = {}
+            if not existing.get("party") and party:
+                updates["party"] = party
+            if bioguide_id and existing.get("bioguide_id") == bioguide_id and not existing.get("name"):
+                updates["name"] = clean_name
+            if updates:
+                try:
+                    supabase.table("politicians").update(updates).eq(
+                        "id", existing["id"]
+                    ).execute()
+                    index.update(existing["id"], updates)
+                except Exception as e:
+                    logger.debug(f"Error enriching politician {existing['id']}: {e}")
+            return existing["id"]
 
     # Priority 1: Try to find by bioguide_id (most reliable)
     if bioguide_id:
@@ -116,6 +135,8 @@ def find_or_create_politician(
                     logger.info(
                         f"Enriched politician {bioguide_id} with {list(updates.keys())}"
                     )
+                if index is not None:
+                    index.add({**existing, **updates, "bioguide_id": bioguide_id, "role": role})
                 return politician_id
         except Exception as e:
             logger.debug(f"Error finding politician by bioguide_id: {e}")
@@ -155,6 +176,15 @@ def find_or_create_politician(
                     "id", existing["id"]
                 ).execute()
             logger.debug(f"Found existing politician: {name}")
+            if index is not None:
+                index.add({
+                    "id": existing["id"],
+                    "name": clean_name,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "role": role,
+                    "party": existing.get("party") or party,
+                })
             return existing["id"]
 
     except Exception as e:
@@ -162,51 +192,415 @@ def find_or_create_politician(
 
     # Create new politician
     try:
-        # Split name into first and last if not provided
-        if not first_name or not last_name:
-            name_parts = clean_name.split()
-            first_name = name_parts[0] if name_parts else clean_name
-            last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else ""
-
         # Register party in parties table (auto-creates if unknown)
         if party:
-            jurisdiction_map = {"eu_parliament": "EU", "uk_parliament": "UK"}
-            jurisdiction = jurisdiction_map.get(chamber, "US")
-            ensure_party_exists(supabase, party, jurisdiction=jurisdiction)
-
-        politician_data = {
-            "name": clean_name,
-            "full_name": clean_name,
-            "first_name": first_name,
-            "last_name": last_name,
-            "chamber": chamber,
-            "role": role,
-            "party": party,
-            "state": state,
-            "is_active": True,
-        }
-
-        # Add bioguide_id if provided
-        if bioguide_id:
-            politician_data["bioguide_id"] = bioguide_id
-
-        # Add state_or_country for UI display
-        if chamber == "house" and district:
-            politician_data["state_or_country"] = state
-            politician_data["district"] = district
-        elif chamber in ("eu_parliament", "uk_parliament") and state:
-            politician_data["state_or_country"] = state
-            if district:
-                politician_data["district"] = district
+            ensure_party_exists(supabase, party, jurisdiction=_party_jurisdiction(chamber))
+
+        politician_data = _build_politician_row(descriptor)
 
         response = supabase.table("politicians").insert(politician_data).execute()
 
         if response.data and len(response.data) > 0:
             logger.info(f"Created new politician: {clean_name} ({role})" +
                        (f" [bioguide: {bioguide_id}]" if bioguide_id else ""))
+            if index is not None:
+                index.add({**politician_data, "id": response.data[0]["id"]})
             return response.data[0]["id"]
 
     except Exception as e:
         logger.error(f"Error creating politician {name}: {e}")
 
     return None
+
+
+def politician_key(descriptor: Dict[str, Any]) -> Tuple:
+    """Hashable key for a politician descriptor, used by find_or_create_politicians()."""
+    disclosure = descriptor.get("disclosure") or {}
+    return (
+        descriptor.get("bioguide_id") or disclosure.get("bioguide_id"),
+        descriptor.get("name") or disclosure.get("politician_name"),
+        descriptor.get("first_name") or disclosure.get("first_name"),
+        descriptor.get("last_name") or disclosure.get("last_name"),
+        "house" if disclosure else descriptor.get("chamber", "house"),
+        descriptor.get("state") or disclosure.get("state_district"),
+    )
+
+
+def find_or_create_politicians(
+    supabase: Client,
+    descriptors: List[Dict[str, Any]],
+    index: Optional["PoliticianIndex"] = None,
+) -> Dict[Tuple, Optional[str]]:
+    """Resolve many politicians at once.
+
+    Batch counterpart of find_or_create_politician() for ETL jobs that know
+    their politicians up front. Each descriptor is a dict of the keyword
+    arguments find_or_create_politician() accepts (name, first_name,
+    last_name, chamber, state, district, bioguide_id, party, disclosure).
+
+    Existing politicians are resolved with a few chunked queries (bioguide
+    IDs with ``in_()``, last names and full names with ``ilike`` filters,
+    matched like the single-record path) and all missing politicians are
+    created with a single bulk insert.
+
+    Args:
+        supabase: Supabase client instance
+        descriptors: Politician descriptors from one ETL batch
+        index: Optional PoliticianIndex consulted first and updated with results
+
+    Returns:
+        Mapping of politician_key(descriptor) to politician UUID (None on error)
+    """
+    results: Dict[Tuple, Optional[str]] = {}
+    pending: Dict[Tuple, Dict[str, Any]] = {}
+    for raw in descriptors:
+        key = politician_key(raw)
+        if key in results or key in pending:
+            continue
+        descriptor = _normalize_descriptor(**raw)
+        if descriptor is None:
+            results[key] = None
+        else:
+            pending[key] = descriptor
+
+    if not pending:
+        return results
+
+    # Pass 1: in-memory index
+    if index is not None:
+        for key, d in list(pending.items()):
+            existing = index.lookup(
+                supabase,
+                d["role"],
+                bioguide_id=d["bioguide_id"],
+                first_name=d["first_name"],
+                last_name=d["last_name"],
+                name=d["clean_name"],
+                match_first_last=d["chamber"] in ("house", "senate"),
+            )
+            if existing:
+                _enrich_party(supabase, existing, d["party"], index)
+                results[key] = existing["id"]
+                del pending[key]
+
+    # Pass 2: bulk lookups of existing rows
+    if pending:
+        try:
+            found = _bulk_lookup(supabase, list(pending.values()))
+        except Exception as e:
+            logger.warning(f"Bulk politician lookup failed: {e}")
+            found = {}
+        for key, d in list(pending.items()):
+            existing = found.get(id(d))
+            if existing:
+                _enrich_party(supabase, existing, d["party"], index)
+                if index is not None:
+                    index.add({**existing, "role": existing.get("role") or d["role"]})
+                results[key] = existing["id"]
+                del pending[key]
+
+    # Pass 3: create everyone still missing in one insert
+    if pending:
+        results.update(_bulk_create(supabase, pending, index))
+
+    return results
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+CHAMBER_ROLE_MAP = {
+    "senate": "Senator",
+    "house": "Representative",
+    "eu_parliament": "MEP",
+    "uk_parliament": "Member of Parliament",
+    "california": "State Legislator",
+}
+
+# Columns fetched by bulk lookups
+_LOOKUP_COLUMNS = "id, name, full_name, first_name, last_name, role, party, bioguide_id"
+
+# Values per in_() filter, keeps request URLs well under PostgREST limits
+_IN_CHUNK_SIZE = 100
+
+# Values per or_() of ilike filters (names are longer than IDs)
+_ILIKE_CHUNK_SIZE = 50
+
+# Characters special to ilike patterns or quoted PostgREST values
+_ILIKE_UNSAFE = re.compile(r'[%_*\\"]')
+
+
+def _normalize_descriptor(
+    name: Optional[str] = None,
+    first_name: Optional[str] = None,
+    last_name: Optional[str] = None,
+    chamber: str = "house",
+    state: Optional[str] = None,
+    district: Optional[str] = None,
+    bioguide_id: Optional[str] = None,
+    disclosure: Optional[Dict[str, Any]] = None,
+    party: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Normalize find_or_create_politician() arguments, or None if there is no usable name."""
+    # Handle legacy disclosure dict format (from house_etl)
+    if disclosure:
+        first_name = disclosure.get("first_name", "").strip()
+        last_name = disclosure.get("last_name", "").strip()
+        name = disclosure.get("politician_name", f"{first_name} {last_name}").strip()
+        state_district = disclosure.get("state_district", "")
+        state = state_district[:2] if len(state_district) >= 2 else None
+        district = state_district
+        chamber = "house"
+        # Check if disclosure has bioguide_id
+        if not bioguide_id:
+            bioguide_id = disclosure.get("bioguide_id")
+        # Use party from disclosure if not already provided
+        if not party:
+            party = disclosure.get("party")
+
+    # Build full name if not provided
+    if not name and (first_name or last_name):
+        name = f"{first_name or ''} {last_name or ''}".strip()
+
+    if not name or name == "Unknown":
+        return None
+
+    # Clean the name - remove common prefixes
+    clean_name = name.strip()
+    for prefix in ["Sen.", "Senator", "Hon.", "Honorable", "Rep.", "Representative"]:
+        clean_name = clean_name.replace(prefix, "").strip()
+
+    return {
+        "name": name,
+        "clean_name": clean_name,
+        "first_name": first_name,
+        "last_name": last_name,
+        "chamber": chamber,
+        "role": CHAMBER_ROLE_MAP.get(chamber, "Representative"),
+        "state": state,
+        "district": district,
+        "bioguide_id": bioguide_id,
+        "party": party,
+    }
+
+
+def _party_jurisdiction(chamber: str) -> str:
+    """Jurisdiction used when registering a politician's party."""
+    return {"eu_parliament": "EU", "uk_parliament": "UK"}.get(chamber, "US")
+
+
+def _build_politician_row(descriptor: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the politicians insert row for a normalized descriptor."""
+    clean_name = descriptor["clean_name"]
+    first_name = descriptor["first_name"]
+    last_name = descriptor["last_name"]
+    chamber = descriptor["chamber"]
+    state = descriptor["state"]
+    district = descriptor["district"]
+
+    # Split name into first and last if not provided
+    if not first_name or not last_name:
+        name_parts = clean_name.split()
+        first_name = name_parts[0] if name_parts else clean_name
+        last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else ""
+
+    politician_data = {
+        "name": clean_name,
+        "full_name": clean_name,
+        "first_name": first_name,
+        "last_name": last_name,
+        "chamber": chamber,
+        "role": descriptor["role"],
+        "party": descriptor["party"],
+        "state": state,
+        "is_active": True,
+    }
+
+    # Add bioguide_id if provided
+    if descriptor["bioguide_id"]:
+        politician_data["bioguide_id"] = descriptor["bioguide_id"]
+
+    # Add state_or_country for UI display
+    if chamber == "house" and district:
+        politician_data["state_or_country"] = state
+        politician_data["district"] = district
+    elif chamber in ("eu_parliament", "uk_parliament") and state:
+        politician_data["state_or_country"] = state
+        if district:
+            politician_data["district"] = district
+
+    return politician_data
+
+
+def _enrich_party(
+    supabase: Client,
+    existing: Dict[str, Any],
+    party: Optional[str],
+    index: Optional["PoliticianIndex"],
+) -> None:
+    """Fill in a missing party on an existing politician."""
+    if existing.get("party") or not party:
+        return
+    try:
+        supabase.table("politicians").update({"party": party}).eq(
+            "id", existing["id"]
+        ).execute()
+        existing["party"] = party
+        if index is not None:
+            index.update(existing["id"], {"party": party})
+    except Exception as e:
+        logger.debug(f"Error enriching politician {existing['id']}: {e}")
+
+
+def _select_in(supabase: Client, column: str, values: List[str]) -> List[Dict[str, Any]]:
+    """Fetch politicians whose column is in values, chunking the in_() filter."""
+    rows: List[Dict[str, Any]] = []
+    unique = sorted(set(values))
+    for i in range(0, len(unique), _IN_CHUNK_SIZE):
+        response = (
+            supabase.table("politicians")
+            .select(_LOOKUP_COLUMNS)
+            .in_(column, unique[i:i + _IN_CHUNK_SIZE])
+            .execute()
+        )
+        rows.extend(response.data or [])
+    return rows
+
+
+def _select_ilike(
+    supabase: Client, columns: Tuple[str, ...], values: List[str], substring: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Fetch politicians whose columns match any of values case-insensitively.
+
+    Mirrors the ilike filters of find_or_create_politician(): an exact
+    (case-insensitive) match, or with substring=True a ``%value%`` match.
+    Characters special to ilike become single-character wildcards, so
+    callers must re-check the returned rows.
+    """
+    rows: List[Dict[str, Any]] = []
+    unique = sorted({v for v in values if v})
+    for i in range(0, len(unique), _ILIKE_CHUNK_SIZE):
+        filters = []
+        for value in unique[i:i + _ILIKE_CHUNK_SIZE]:
+            pattern = _ILIKE_UNSAFE.sub("_", value)
+            if substring:
+                pattern = f"*{pattern}*"
+            filters.extend(f'{column}.ilike."{pattern}"' for column in columns)
+        response = (
+            supabase.table("politicians")
+            .select(_LOOKUP_COLUMNS)
+            .or_(",".join(filters))
+            .execute()
+        )
+        rows.extend(response.data or [])
+    return rows
+
+
+def _bulk_lookup(
+    supabase: Client, descriptors: List[Dict[str, Any]]
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Match descriptors against existing politicians with chunked queries.
+
+    Returns a mapping of id(descriptor) to the matched politician row,
+    using the same priority as find_or_create_politician().
+    """
+    matches: Dict[int, Dict[str, Any]] = {}
+
+    # Priority 1: bioguide_id
+    bioguide_ids = [d["bioguide_id"] for d in descriptors if d["bioguide_id"]]
+    if bioguide_ids:
+        by_bioguide = {r["bioguide_id"]: r for r in _select_in(supabase, "bioguide_id", bioguide_ids)}
+        for d in descriptors:
+            if d["bioguide_id"] in by_bioguide:
+                matches[id(d)] = by_bioguide[d["bioguide_id"]]
+
+    # Priority 2: last name + role, first-name prefix (House/Senate)
+    remaining = [
+        d for d in descriptors
+        if id(d) not in matches and d["first_name"] and d["last_name"]
+        and d["chamber"] in ("house", "senate")
+    ]
+    if remaining:
+        rows = _select_ilike(supabase, ("last_name",), [d["last_name"] for d in remaining])
+        for d in remaining:
+            first_prefix = d["first_name"].split()[0].lower()
+            for row in rows:
+                if (
+                    row.get("role") == d["role"]
+                    and (row.get("last_name") or "").lower() == d["last_name"].lower()
+                    and (row.get("first_name") or "").lower().startswith(first_prefix)
+                ):
+                    matches[id(d)] = row
+                    break
+
+    # Priority 3: name / full_name + role, exact first, then substring
+    remaining = [d for d in descriptors if id(d) not in matches]
+    if remaining:
+        rows = _select_ilike(
+            supabase, ("name", "full_name"), [d["clean_name"] for d in remaining], substring=True
+        )
+        for d in remaining:
+            target = d["clean_name"].lower()
+            candidates = [
+                (row, (row.get("name") or "").lower(), (row.get("full_name") or "").lower())
+                for row in rows if row.get("role") == d["role"]
+            ]
+            row = next((r for r, n, f in candidates if target in (n, f)), None) or next(
+                (r for r, n, f in candidates if target in n or target in f), None
+            )
+            if row:
+                matches[id(d)] = row
+
+    return matches
+
+
+def _bulk_create(
+    supabase: Client,
+    pending: Dict[Tuple, Dict[str, Any]],
+    index: Optional["PoliticianIndex"],
+) -> Dict[Tuple, Optional[str]]:
+    """Insert all pending politicians in one request.
+
+    Falls back to find_or_create_politician() per descriptor if the bulk
+    insert fails (e.g. a concurrent job created one of them first).
+    """
+    results: Dict[Tuple, Optional[str]] = {}
+    keys = list(pending)
+
+    for party, chamber in {(d["party"], d["chamber"]) for d in pending.values() if d["party"]}:
+        ensure_party_exists(supabase, party, jurisdiction=_party_jurisdiction(chamber))
+
+    rows = [_build_politician_row(pending[key]) for key in keys]
+    try:
+        response = supabase.table("politicians").insert(rows).execute()
+        created = response.data or []
+        if len(created) != len(rows):
+            raise ValueError(f"bulk insert returned {len(created)} of {len(rows)} rows")
+    except Exception as e:
+        logger.warning(f"Bulk politician insert failed, falling back to single inserts: {e}")
+        for key in keys:
+            d = pending[key]
+            results[key] = find_or_create_politician(
+                supabase,
+                name=d["clean_name"],
+                first_name=d["first_name"],
+                last_name=d["last_name"],
+                chamber=d["chamber"],
+                state=d["state"],
+                district=d["district"],
+                bioguide_id=d["bioguide_id"],
+                party=d["party"],
+                index=index,
+            )
+        return results
+
+    # PostgREST returns inserted rows in request order
+    for key, row, created_row in zip(keys, rows, created):
+        results[key] = created_row["id"]
+        if index is not None:
+            index.add({**row, "id": created_row["id"]})
+    logger.info(f"Created {len(created)} new politicians in bulk")
+    return results
@@ -0,0 +1,304 @@
+"""
+In-memory politician resolution index.
+
+find_or_create_politician() needs up to four sequential PostgREST round trips
+per call (bioguide lookup, first/last name ilike, fuzzy name ilike, insert).
+ETL jobs call it once per disclosure, so a full backfill spends most of its
+time waiting on lookups for politicians it has already seen.
+
+PoliticianIndex loads the politicians table once and answers the same
+lookups from memory:
+
+- by bioguide_id
+- by normalized (last name, role), filtered on first-name prefix
+- by normalized full name (name / full_name) and role
+
+Creates and enrichment updates made by find_or_create_politician() are
+written through to the index, so later lookups in the same process see them.
+The process-wide index is reloaded after POLITICIAN_INDEX_TTL seconds to pick
+up rows written by other jobs or by the dedup/enrichment tooling.
+
+Usage:
+    from app.lib.politician import find_or_create_politician
+    from app.lib.politician_index import get_politician_index
+
+    politician_id = find_or_create_politician(
+        supabase, name="Nancy Pelosi", chamber="house",
+        index=get_politician_index(),
+    )
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds before the process-wide index is reloaded from the database
+POLITICIAN_INDEX_TTL = float(os.environ.get("POLITICIAN_INDEX_TTL", "900"))
+
+# Rows fetched per PostgREST request when loading
+LOAD_PAGE_SIZE = 1000
+
+INDEX_COLUMNS = "id, name, full_name, first_name, last_name, role, party, bioguide_id"
+
+
+def _norm(value: Optional[str]) -> str:
+    """Case- and whitespace-insensitive form used for index keys."""
+    return " ".join(str(value).lower().split()) if value else ""
+
+
+class PoliticianIndex:
+    """
+    Thread-safe in-memory index over the politicians table.
+
+    Lookups mirror the query order of find_or_create_politician(). A miss is
+    not authoritative: callers fall back to the database, then add() the row
+    they found or created.
+    """
+
+    def __init__(self, ttl: Optional[float] = POLITICIAN_INDEX_TTL):
+        """
+        Initialize an empty index.
+
+        Args:
+            ttl: Seconds before the index is reloaded; None never expires
+                 (use for a per-job index)
+        """
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._by_bioguide: Dict[str, str] = {}
+        self._by_last_role: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        self._by_name_role: Dict[Tuple[str, str], str] = {}
+        self._by_role: Dict[str, List[str]] = defaultdict(list)
+        self._metrics = {"loads": 0, "load_failures": 0, "hits": 0, "misses": 0, "writes": 0}
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def is_stale(self) -> bool:
+        """True if the index has never loaded or its TTL has expired."""
+        if self._loaded_at is None:
+            return True
+        return self.ttl is not None and time.monotonic() - self._loaded_at >= self.ttl
+
+    def ensure_loaded(self, supabase: Any) -> None:
+        """Load the index if it is empty or expired."""
+        with self._lock:
+            if self.is_stale():
+                self.load(supabase)
+
+    def load(self, supabase: Any) -> int:
+        """
+        (Re)load every politician from the database.
+
+        A failed load leaves the index empty but marked loaded, so lookups
+        miss and callers use the database path until the next reload.
+
+        Returns:
+            Number of politicians indexed.
+        """
+        rows: List[Dict[str, Any]] = []
+        try:
+            offset = 0
+            while True:
+                response = (
+                    supabase.table("politicians")
+                    .select(INDEX_COLUMNS)
+                    .range(offset, offset + LOAD_PAGE_SIZE - 1)
+                    .execute()
+                )
+                page = response.data or []
+                rows.extend(row for row in page if isinstance(row, dict) and row.get("id"))
+                if len(page) < LOAD_PAGE_SIZE:
+                    break
+                offset += len(page)
+        except Exception as e:
+            logger.warning(f"Failed to load politician index: {e}")
+            rows = []
+            self._metrics["load_failures"] += 1
+
+        with self._lock:
+            self._clear()
+            for row in rows:
+                self._index(row)
+            self._loaded_at = time.monotonic()
+            self._metrics["loads"] += 1
+
+        logger.info(f"Loaded politician index with {len(rows)} politicians")
+        return len(rows)
+
+    def invalidate(self) -> None:
+        """Force a reload on the next lookup."""
+        with self._lock:
+            self._loaded_at = None
+
+    # -------------------------------------------------------------------------
+    # Lookups and writes
+    # -------------------------------------------------------------------------
+
+    def lookup(
+        self,
+        supabase: Any,
+        role: str,
+        bioguide_id: Optional[str] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        name: Optional[str] = None,
+        match_first_last: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a politician in memory.
+
+        Args:
+            supabase: Client used to (re)load the index when stale
+            role: Role the politician must hold (e.g. "Representative")
+            bioguide_id: Official bioguide ID, checked first
+            first_name: First name; its first word is matched as a prefix
+            last_name: Last name, matched exactly
+            name: Cleaned full name, matched against name/full_name
+            match_first_last: Whether to try the first/last name match
+
+        Returns:
+            A copy of the indexed record, or None on a miss.
+        """
+        with self._lock:
+            self.ensure_loaded(supabase)
+            record = self._find(role, bioguide_id, first_name, last_name, name, match_first_last)
+            if record is None:
+                self._metrics["misses"] += 1
+                return None
+            self._metrics["hits"] += 1
+            return dict(record)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Write a found or newly created politician through to the index."""
+        if not record.get("id"):
+            return
+        with self._lock:
+            existing = self._records.get(record["id"])
+            if existing:
+                self._unindex(existing)
+                record = {**existing, **{k: v for k, v in record.items() if v is not None}}
+            self._index(dict(record))
+            self._metrics["writes"] += 1
+
+    def update(self, politician_id: str, updates: Dict[str, Any]) -> None:
+        """Apply an enrichment update already written to the database."""
+        self.add({"id": politician_id, **updates})
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return lookup counters and index size."""
+        with self._lock:
+            metrics: Dict[str, Any] = dict(self._metrics)
+            metrics["politicians"] = len(self._records)
+        lookups = metrics["hits"] + metrics["misses"]
+        metrics["hit_rate"] = round(metrics["hits"] / lookups, 4) if lookups else 0.0
+        return metrics
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    # -------------------------------------------------------------------------
+    # Internals (callers hold self._lock)
+    # -------------------------------------------------------------------------
+
+    def _find(
+        self,
+        role: str,
+        bioguide_id: Optional[str],
+        first_name: Optional[str],
+        last_name: Optional[str],
+        name: Optional[str],
+        match_first_last: bool,
+    ) -> Optional[Dict[str, Any]]:
+        # Priority 1: bioguide_id (role-independent, like the database query)
+        if bioguide_id and bioguide_id in self._by_bioguide:
+            return self._records[self._by_bioguide[bioguide_id]]
+
+        # Priority 2: last name + role, first-name prefix
+        if match_first_last and first_name and last_name:
+            first_prefix = _norm(first_name.split()[0])
+            for politician_id in self._by_last_role.get((_norm(last_name), role), []):
+                record = self._records[politician_id]
+                if _norm(record.get("first_name")).startswith(first_prefix):
+                    return record
+
+        # Priority 3: full name, exact then substring (the database uses ilike %name%)
+        name_key = _norm(name)
+        if not name_key:
+            return None
+        politician_id = self._by_name_role.get((name_key, role))
+        if politician_id:
+            return self._records[politician_id]
+        for politician_id in self._by_role.get(role, []):
+            record = self._records[politician_id]
+            if name_key in _norm(record.get("name")) or name_key in _norm(record.get("full_name")):
+                return record
+        return None
+
+    def _index(self, record: Dict[str, Any]) -> None:
+        politician_id = record["id"]
+        role = record.get("role") or ""
+        self._records[politician_id] = record
+        if record.get("bioguide_id"):
+            self._by_bioguide[record["bioguide_id"]] = politician_id
+        if record.get("last_name"):
+            self._by_last_role[(_norm(record["last_name"]), role)].append(politician_id)
+        for field in ("name", "full_name"):
+            key = (_norm(record.get(field)), role)
+            if key[0]:
+                self._by_name_role.setdefault(key, politician_id)
+        self._by_role[role].append(politician_id)
+
+    def _unindex(self, record: Dict[str, Any]) -> None:
+        politician_id = record["id"]
+        role = record.get("role") or ""
+        self._records.pop(politician_id, None)
+        if self._by_bioguide.get(record.get("bioguide_id")) == politician_id:
+            del self._by_bioguide[record["bioguide_id"]]
+        if record.get("last_name"):
+            ids = self._by_last_role.get((_norm(record["last_name"]), role), [])
+            if politician_id in ids:
+                ids.remove(politician_id)
+        for field in ("name", "full_name"):
+            key = (_norm(record.get(field)), role)
+            if self._by_name_role.get(key) == politician_id:
+                del self._by_name_role[key]
+        if politician_id in self._by_role.get(role, []):
+            self._by_role[role].remove(politician_id)
+
+    def _clear(self) -> None:
+        self._records.clear()
+        self._by_bioguide.clear()
+        self._by_last_role.clear()
+        self._by_name_role.clear()
+        self._by_role.clear()
+
+
+# Global index instance
+_politician_index: Optional[PoliticianIndex] = None
+_politician_index_lock = threading.Lock()
+
+
+def get_politician_index() -> PoliticianIndex:
+    """Get the process-wide politician index (reloaded every POLITICIAN_INDEX_TTL)."""
+    global _politician_index
+    if _politician_index is None:
+        with _politician_index_lock:
+            if _politician_index is None:
+                _politician_index = PoliticianIndex()
+    return _politician_index
+
+
+def reset_politician_index() -> None:
+    """Discard the process-wide politician index. Useful for testing."""
+    global _politician_index
+    with _politician_index_lock:
+        _politician_index = None
@@ -0,0 +1,370 @@
+"""
+Local store of daily OHLCV prices.
+
+Training and the backtests need daily prices for hundreds of tickers over
+years, and used to download all of them from yfinance on every run.
+PriceStore keeps them on local disk instead, one partition per ticker:
+
+- ``<TICKER>.npy`` holds the rows as a date-sorted NumPy structured array,
+  memory-mapped on read so a lookup only touches the dates it slices
+- ``<TICKER>.json`` records which date ranges have been downloaded, so days
+  without rows (weekends, holidays, before listing) are not asked for again
+- get_prices() downloads only the uncovered parts of the requested range,
+  batching tickers that miss the same range into one request
+
+Prices are split- and dividend-adjusted, so a corporate action re-bases a
+ticker's whole history. Each download re-fetches a few already-stored days
+on either side of the gap and, if their closes moved, the partition is
+discarded and refetched.
+Today's bar is still forming, so ranges are only marked covered up to
+yesterday.
+
+Disable with PRICE_STORE_ENABLED=false (get_prices() then downloads every
+time).
+
+Usage:
+    from app.lib.price_store import get_prices
+
+    prices = get_prices(["AAPL", "SPY"], date(2024, 1, 1), date(2024, 12, 31))
+    closes = prices["AAPL"]["Close"]
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PRICE_STORE_ENABLED = os.environ.get("PRICE_STORE_ENABLED", "true").lower() == "true"
+PRICE_STORE_DIR = os.environ.get("PRICE_STORE_DIR", "/tmp/price_store")
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+DOWNLOAD_BATCH_SIZE = 100
+REBASE_CHECK_DAYS = 7  # Stored calendar days re-fetched to detect re-adjusted history
+REBASE_TOLERANCE = 1e-4  # Relative close difference treated as a re-adjustment
+
+_ROW_DTYPE = np.dtype([("Date", "datetime64[D]")] + [(column, "f8") for column in PRICE_COLUMNS])
+
+Range = Tuple[date, date]
+
+
+def _merge_ranges(ranges: Iterable[Range]) -> List[Range]:
+    """Merge overlapping or adjacent inclusive date ranges."""
+    merged: List[Range] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _frame_to_rows(frame: pd.DataFrame) -> np.ndarray:
+    """Convert a date-indexed OHLCV frame to sorted structured rows."""
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    rows = np.empty(len(frame), dtype=_ROW_DTYPE)
+    rows["Date"] = index.to_numpy().astype("datetime64[D]")
+    for column in PRICE_COLUMNS:
+        rows[column] = (
+            pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=float)
+            if column in frame.columns else np.nan
+        )
+    return rows[np.argsort(rows["Date"], kind="stable")]
+
+
+def _rows_to_frame(rows: np.ndarray) -> pd.DataFrame:
+    """Convert structured rows to a Date-indexed OHLCV frame."""
+    return pd.DataFrame(
+        {column: np.array(rows[column]) for column in PRICE_COLUMNS},
+        index=pd.DatetimeIndex(np.array(rows["Date"]), name="Date"),
+    )
+
+
+def download_prices(tickers: List[str], start: date, end: date) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Download daily adjusted OHLCV for `tickers` from yfinance in one request.
+
+    Args:
+        tickers: Ticker symbols
+        start: First day, inclusive
+        end: Last day, inclusive
+
+    Returns:
+        Frames keyed by ticker, for tickers that returned rows. None if the
+        request failed or yfinance is not installed.
+    """
+    try:
+        import yfinance as yf
+    except ImportError:
+        logger.warning("yfinance not installed - cannot download prices")
+        return None
+
+    try:
+        data = yf.download(
+            list(tickers),
+            start=start.strftime('%Y-%m-%d'),
+            end=(end + timedelta(days=1)).strftime('%Y-%m-%d'),  # yfinance's end is exclusive
+            progress=False,
+            group_by='ticker',
+            auto_adjust=True,
+        )
+    except Exception as e:
+        logger.warning(f"Price download failed for {len(tickers)} tickers from {tickers[0]}: {e}")
+        return None
+
+    frames = {}
+    if data is None or data.empty:
+        return frames
+
+    for ticker in tickers:
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                continue
+            frame = data[ticker]
+        elif len(tickers) == 1:
+            frame = data
+        else:
+            continue
+        frame = frame.reindex(columns=PRICE_COLUMNS).dropna(how="all")
+        if not frame.empty:
+            frames[ticker] = frame
+    return frames
+
+
+class PriceStore:
+    """Daily OHLCV rows per ticker, stored as NumPy arrays with download coverage."""
+
+    def __init__(self, directory: str = PRICE_STORE_DIR):
+        """
+        Initialize the store, creating its directory if needed.
+
+        Args:
+            directory: Directory holding ``<TICKER>.npy`` and ``<TICKER>.json``
+                per ticker
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, ticker: str, suffix: str) -> Path:
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', ticker)}{suffix}"
+
+    def _write(self, path: Path, write) -> None:
+        """Write a file atomically through `write(file)`."""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _rows(self, ticker: str) -> Optional[np.ndarray]:
+        """The ticker's stored rows, memory-mapped, or None."""
+        try:
+            return np.load(self._path(ticker, ".npy"), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+    def coverage(self, ticker: str) -> List[Range]:
+        """Date ranges already downloaded for `ticker`."""
+        try:
+            stored = json.loads(self._path(ticker, ".json").read_text())
+            return [(date.fromisoformat(start), date.fromisoformat(end)) for start, end in stored["ranges"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
+
+    def missing_ranges(self, ticker: str, start: date, end: date) -> List[Range]:
+        """Parts of [start, end] not yet downloaded, ignoring the future."""
+        end = min(end, date.today())
+        missing = []
+        cursor = start
+        for covered_start, covered_end in self.coverage(ticker):
+            if covered_end < cursor:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                missing.append((cursor, covered_start - timedelta(days=1)))
+            cursor = covered_end + timedelta(days=1)
+        if cursor <= end:
+            missing.append((cursor, end))
+        return missing
+
+    def read(self, ticker: str, start: date, end: date) -> Optional[pd.DataFrame]:
+        """Stored rows for `ticker` within [start, end], or None if there are none."""
+        rows = self._rows(ticker)
+        if rows is None:
+            return None
+        lo = np.searchsorted(rows["Date"], np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(rows["Date"], np.datetime64(end, "D"), side="right")
+        if lo >= hi:
+            return None
+        return _rows_to_frame(rows[lo:hi])
+
+    def append(self, ticker: str, frame: Optional[pd.DataFrame], start: date, end: date) -> bool:
+        """
+        Merge downloaded rows for [start, end] and mark the range covered.
+
+        Downloaded rows replace stored rows for the same dates. If they
+        disagree with stored closes, the stored history was adjusted on a
+        different basis and is discarded first.
+
+        Returns:
+            True if the stored history was discarded
+        """
+        new = _frame_to_rows(frame) if frame is not None and len(frame) else np.empty(0, dtype=_ROW_DTYPE)
+
+        with self._lock:
+            stored = self._rows(ticker)
+            ranges = self.coverage(ticker)
+            rebased = False
+
+            if stored is not None and len(new):
+                common, new_at, stored_at = np.intersect1d(new["Date"], stored["Date"], return_indices=True)
+                if len(common) and not np.allclose(
+                    new["Close"][new_at], stored["Close"][stored_at], rtol=REBASE_TOLERANCE, atol=0, equal_nan=True
+                ):
+                    logger.info(f"{ticker}: stored prices were re-adjusted upstream, discarding them")
+                    stored, ranges, rebased = None, [], True
+
+            if len(new):
+                rows = new if stored is None else np.concatenate([new, np.asarray(stored)])
+                # np.unique keeps the first occurrence of each date, the downloaded one
+                _, first = np.unique(rows["Date"], return_index=True)
+                rows = rows[first]
+                self._write(self._path(ticker, ".npy"), lambda f: np.save(f, rows))
+
+            covered_end = min(end, date.today() - timedelta(days=1))
+            if start <= covered_end:
+                ranges.append((start, covered_end))
+            if start <= covered_end or rebased:
+                coverage = json.dumps({"ranges": [[s.isoformat(), e.isoformat()] for s, e in _merge_ranges(ranges)]})
+                self._write(self._path(ticker, ".json"), lambda f: f.write(coverage.encode()))
+
+        return rebased
+
+    def get_prices(self, tickers: Iterable[str], start: date, end: date) -> Dict[str, pd.DataFrame]:
+        """
+        Daily OHLCV for `tickers` over [start, end], downloading what is missing.
+
+        Returns:
+            Date-indexed frames with PRICE_COLUMNS, keyed by ticker, for
+            tickers with at least one row in the range
+        """
+        tickers = list(dict.fromkeys(tickers))
+        pending = tickers
+
+        # A second pass refetches tickers whose history was discarded
+        for _ in range(2):
+            # Tickers missing the same range share download batches
+            wanted: Dict[Range, List[str]] = defaultdict(list)
+            for ticker in pending:
+                rows = self._rows(ticker)
+                for gap_start, gap_end in self.missing_ranges(ticker, start, end):
+                    # Overlap stored rows on both sides so a re-adjusted
+                    # history shows up whichever way the range grows
+                    if rows is not None and len(rows):
+                        if rows["Date"][0] < np.datetime64(gap_start, "D"):
+                            gap_start -= timedelta(days=REBASE_CHECK_DAYS)
+                        if rows["Date"][-1] > np.datetime64(gap_end, "D"):
+                            gap_end += timedelta(days=REBASE_CHECK_DAYS)
+                    wanted[(gap_start, gap_end)].append(ticker)
+
+            rebased = []
+            for (gap_start, gap_end), gap_tickers in wanted.items():
+                for i in range(0, len(gap_tickers), DOWNLOAD_BATCH_SIZE):
+                    batch = gap_tickers[i:i + DOWNLOAD_BATCH_SIZE]
+                    frames = download_prices(batch, gap_start, gap_end)
+                    # Tickers without rows only count as covered if the
+                    # request evidently worked for others
+                    if not frames:
+                        continue
+                    for ticker in batch:
+                        if self.append(ticker, frames.get(ticker), gap_start, gap_end):
+                            rebased.append(ticker)
+
+            pending = rebased
+            if not pending:
+                break
+
+        prices = {}
+        for ticker in tickers:
+            frame = self.read(ticker, start, end)
+            if frame is not None:
+                prices[ticker] = frame
+        return prices
+
+    def clear(self) -> None:
+        """Delete every stored partition."""
+        with self._lock:
+            for path in self.directory.glob("*"):
+                if path.suffix in (".npy", ".json"):
+                    path.unlink(missing_ok=True)
+
+
+# Global store instance
+_store: Optional[PriceStore] = None
+_store_lock = threading.Lock()
+
+
+def get_price_store() -> Optional[PriceStore]:
+    """
+    Get the global price store, or None if disabled or the directory
+    can't be used.
+    """
+    global _store
+    if not PRICE_STORE_ENABLED:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                try:
+                    _store = PriceStore(PRICE_STORE_DIR)
+                except OSError as e:
+                    logger.warning(f"Price store unavailable at {PRICE_STORE_DIR}: {e}")
+                    return None
+    return _store
+
+
+def reset_price_store() -> None:
+    """Discard the global store instance. Stored prices are kept."""
+    global _store
+    with _store_lock:
+        _store = None
+
+
+def get_prices(tickers: Iterable[str], start: date, end: date) -> Dict[str, pd.DataFrame]:
+    """
+    Daily adjusted OHLCV for `tickers` over [start, end] (inclusive).
+
+    Served from the local price store, which downloads only the missing
+    date ranges. Without the store, downloads everything.
+
+    Returns:
+        Date-indexed frames with PRICE_COLUMNS, keyed by ticker, for
+        tickers with at least one row in the range
+    """
+    store = get_price_store()
+    if store is not None:
+        return store.get_prices(tickers, start, end)
+
+    tickers = list(dict.fromkeys(tickers))
+    prices = {}
+    for i in range(0, len(tickers), DOWNLOAD_BATCH_SIZE):
+        frames = download_prices(tickers[i:i + DOWNLOAD_BATCH_SIZE], start, end) or {}
+        prices.update(frames)
+    return prices
@@ -0,0 +1,118 @@
+"""
+On-disk store for established HTTP sessions.
+
+Some sources gate their data behind a login-style handshake (the Senate
+EFD's CSRF + agreement flow). Repeating it for every job adds latency and,
+worse, repeats the requests a WAF is most likely to notice. SessionStore
+keeps each established session's cookies and tokens on local disk, keyed
+by name, until an expiry time:
+
+- One JSON file per key, written atomically with owner-only permissions
+  (the contents are credentials)
+- Expired entries are deleted on read
+- Callers are expected to validate a restored session with a cheap probe
+  and ``discard()`` it if the server no longer accepts it
+
+Disable with SESSION_STORE_ENABLED=false.
+
+Usage:
+    from app.lib.session_store import get_session_store
+
+    store = get_session_store()
+    state = store.load("efd-0") if store else None
+    ...
+    store.save("efd-0", {"cookies": [...], "csrf_token": token}, ttl=1800)
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SESSION_STORE_ENABLED = os.environ.get("SESSION_STORE_ENABLED", "true").lower() == "true"
+SESSION_STORE_DIR = os.environ.get("SESSION_STORE_DIR", "/tmp/session_store")
+
+
+class SessionStore:
+    """Named session states persisted as JSON files with an expiry."""
+
+    def __init__(self, directory: str = SESSION_STORE_DIR):
+        """
+        Initialize the store, creating its directory if needed.
+
+        Args:
+            directory: Directory holding one ``<key>.json`` per session
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}.json"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored state for `key`, or None if absent or expired."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("expires_at", 0) <= time.time():
+            self.discard(key)
+            return None
+        return entry.get("state")
+
+    def save(self, key: str, state: Dict[str, Any], ttl: float) -> None:
+        """Store a JSON-serializable state that expires after `ttl` seconds."""
+        entry = {"state": state, "saved_at": time.time(), "expires_at": time.time() + ttl}
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def discard(self, key: str) -> None:
+        """Delete the stored state for `key`, if any."""
+        self._path(key).unlink(missing_ok=True)
+
+
+# Global store instance
+_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_session_store() -> Optional[SessionStore]:
+    """
+    Get the global session store, or None if disabled or the directory
+    can't be used.
+    """
+    global _store
+    if not SESSION_STORE_ENABLED:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                try:
+                    _store = SessionStore(SESSION_STORE_DIR)
+                except OSError as e:
+                    logger.warning(f"Session store unavailable at {SESSION_STORE_DIR}: {e}")
+                    return None
+    return _store
+
+
+def reset_session_store() -> None:
+    """Discard the global store instance. Stored sessions are kept."""
+    global _store
+    with _store_lock:
+        _store = None
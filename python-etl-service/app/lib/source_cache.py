@@ -0,0 +1,460 @@
+"""
+Conditional-GET cache for source indexes and reference feeds.
+
+Several jobs download the same slowly-changing files: the House Clerk's
+yearly ``{year}FD.ZIP`` index (the House ETL, source validation and the
+source_document_id backfill), the @unitedstates ``legislators-current.json``
+and the Senate.gov senators XML. SourceCache fetches each URL once and
+shares the parsed result:
+
+- Revalidation: requests carry If-None-Match / If-Modified-Since from the
+  last response; a 304 reuses the stored body and parsed result
+- Freshness window: within ``revalidate_after`` seconds of the last
+  validation the network is skipped entirely
+- Disk: raw bodies and parsed results (JSON) survive restarts, so an
+  unchanged body is never re-parsed
+- Memory: the most recently used parsed results are also kept in memory
+  and shared read-only between callers, so the small reference feeds are
+  served from one parsed structure
+- Stale on error: if the source is down, the last good result is served
+- Streaming: with ``stream=True`` the body is written to disk in chunks and
+  the parser gets the file path, so large archives are never held in memory
+- Records: iter_parsed() caches a parser's records as JSON lines, written as
+  they are parsed and read back one at a time, so large indexes are never
+  held as a list
+
+Usage:
+    from app.lib.source_cache import get_source_cache
+
+    records = await get_source_cache().get_parsed(
+        url, parse_index, client=client, parse_key="house-index-2025",
+    )
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SOURCE_CACHE_DIR = os.environ.get("SOURCE_CACHE_DIR", "/tmp/source_cache")
+SOURCE_CACHE_REVALIDATE_SECONDS = float(os.environ.get("SOURCE_CACHE_REVALIDATE_SECONDS", "300"))
+# Parsed results also kept in memory. Large indexes go through iter_parsed()
+# and are never memoized, so this only bounds the small reference feeds
+SOURCE_CACHE_MEMORY_ENTRIES = int(os.environ.get("SOURCE_CACHE_MEMORY_ENTRIES", "2"))
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _header(response: httpx.Response, name: str) -> Optional[str]:
+    value = response.headers.get(name)
+    return value if isinstance(value, str) else None
+
+
+@asynccontextmanager
+async def _http_client(
+    client: Optional[httpx.AsyncClient], timeout: float
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the caller's client, or a short-lived one if none was given."""
+    if client is not None:
+        yield client
+    else:
+        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as own:
+            yield own
+
+
+class SourceCache:
+    """Conditional-GET cache with on-disk bodies and shared parsed results."""
+
+    def __init__(
+        self,
+        directory: str = SOURCE_CACHE_DIR,
+        revalidate_after: float = SOURCE_CACHE_REVALIDATE_SECONDS,
+        memory_entries: int = SOURCE_CACHE_MEMORY_ENTRIES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Where bodies, validators and parsed results are stored
+            revalidate_after: Seconds a validated entry is served without
+                contacting the source
+            memory_entries: Parsed results kept in memory (least recently
+                used are dropped first); 0 reads every result from disk
+        """
+        self.directory = Path(directory)
+        self.revalidate_after = revalidate_after
+        self.memory_entries = memory_entries
+        # (url, parse_key) -> (etag/last-modified fingerprint, parsed result)
+        self._parsed: "OrderedDict[Tuple[str, str], Tuple[str, Any]]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._stats = {"requests": 0, "not_modified": 0, "downloads": 0, "fresh_hits": 0, "stale_served": 0}
+
+    # -- disk helpers (called in worker threads) -----------------------------
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return self.directory / f"{key}.body", self.directory / f"{key}.meta.json"
+
+    def _parsed_path(self, url: str, parse_key: str) -> Path:
+        key = hashlib.sha256(f"{url}|{parse_key}".encode()).hexdigest()[:32]
+        return self.directory / f"{key}.parsed.json"
+
+    def _records_path(self, url: str, parse_key: str) -> Path:
+        key = hashlib.sha256(f"{url}|{parse_key}".encode()).hexdigest()[:32]
+        return self.directory / f"{key}.parsed.jsonl"
+
+    def _load_meta(self, url: str) -> Dict[str, Any]:
+        _, meta_path = self._paths(url)
+        try:
+            return json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, url: str, meta: Dict[str, Any], body: Optional[bytes]) -> None:
+        body_path, meta_path = self._paths(url)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if body is not None:
+                body_path.write_bytes(body)
+            meta_path.write_text(json.dumps(meta))
+        except OSError as e:
+            logger.warning(f"Could not persist cached source {url}: {e}")
+
+    def _load_body(self, url: str, as_path: bool = False) -> Optional[Union[bytes, Path]]:
+        body_path, _ = self._paths(url)
+        if as_path:
+            return body_path if body_path.is_file() else None
+        try:
+            return body_path.read_bytes()
+        except OSError:
+            return None
+
+    def _commit_body(self, url: str, meta: Dict[str, Any], part_path: Path) -> None:
+        """Move a streamed download into place and record its validators."""
+        body_path, _ = self._paths(url)
+        os.replace(part_path, body_path)
+        self._save(url, meta, None)
+
+    def _load_parsed(self, url: str, parse_key: str, fingerprint: str) -> Optional[Any]:
+        try:
+            stored = json.loads(self._parsed_path(url, parse_key).read_text())
+        except (OSError, ValueError):
+            return None
+        return stored["result"] if stored.get("fingerprint") == fingerprint else None
+
+    def _save_parsed(self, url: str, parse_key: str, fingerprint: str, result: Any) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._parsed_path(url, parse_key).write_text(
+                json.dumps({"fingerprint": fingerprint, "result": result}, default=str)
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Parsed result for {url} not persisted: {e}")
+
+    @staticmethod
+    def _records_current(path: Path, fingerprint: str) -> bool:
+        """Whether a JSON-lines records file was parsed from this body."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.loads(f.readline()).get("fingerprint") == fingerprint
+        except (OSError, ValueError, AttributeError):
+            return False
+
+    def _save_records(
+        self,
+        path: Path,
+        fingerprint: str,
+        parse: Callable[[Union[bytes, Path]], Optional[Iterable[Any]]],
+        body: Union[bytes, Path],
+    ) -> bool:
+        """Write a parser's records to disk one JSON line at a time."""
+        records = parse(body)
+        if records is None:
+            return False
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, part = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"fingerprint": fingerprint}) + "\n")
+                for record in records:
+                    f.write(json.dumps(record, default=str) + "\n")
+            os.replace(part, path)
+        except BaseException:
+            os.unlink(part)
+            raise
+        return True
+
+    @staticmethod
+    def _read_records(path: Path) -> Iterator[Any]:
+        with open(path, encoding="utf-8") as f:
+            f.readline()  # fingerprint header
+            for line in f:
+                yield json.loads(line)
+
+    async def _stream_to_disk(
+        self, http: httpx.AsyncClient, url: str, headers: Dict[str, str], timeout: float
+    ) -> Tuple[httpx.Response, Optional[Path], Optional[str]]:
+        """
+        GET a URL, writing a 200 body to a temporary file chunk by chunk.
+
+        Returns:
+            Tuple of (response, temp file path or None, sha256 of the body)
+        """
+        async with http.stream("GET", url, headers=headers, timeout=timeout) as response:
+            if response.status_code != 200:
+                return response, None, None
+
+            await asyncio.to_thread(self.directory.mkdir, parents=True, exist_ok=True)
+            fd, part = tempfile.mkstemp(dir=self.directory, suffix=".part")
+            digest = hashlib.sha256()
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                        digest.update(chunk)
+                        await asyncio.to_thread(f.write, chunk)
+            except BaseException:
+                os.unlink(part)
+                raise
+            return response, Path(part), digest.hexdigest()
+
+    # -- public API ----------------------------------------------------------
+
+    async def fetch(
+        self,
+        url: str,
+        client: Optional[httpx.AsyncClient] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 60.0,
+        stream: bool = False,
+    ) -> Optional[Tuple[Union[bytes, Path], str]]:
+        """
+        Get a URL's body, revalidating a stored copy when there is one.
+
+        Args:
+            stream: Write the download to disk in chunks and return the
+                stored file's path instead of the body bytes
+
+        Returns:
+            Tuple of (body or body path, fingerprint), where fingerprint
+            changes whenever the body does, or None if the source failed and
+            nothing is stored
+        """
+        lock = self._locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            meta = await asyncio.to_thread(self._load_meta, url)
+            fingerprint = meta.get("fingerprint")
+
+            if fingerprint and time.time() - meta.get("validated_at", 0) < self.revalidate_after:
+                body = await asyncio.to_thread(self._load_body, url, stream)
+                if body is not None:
+                    self._stats["fresh_hits"] += 1
+                    return body, fingerprint
+
+            request_headers = dict(headers or {})
+            if fingerprint:
+                if meta.get("etag"):
+                    request_headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    request_headers["If-Modified-Since"] = meta["last_modified"]
+
+            self._stats["requests"] += 1
+            response = body = part = digest = None
+            try:
+                async with _http_client(client, timeout) as http:
+                    if stream:
+                        response, part, digest = await self._stream_to_disk(
+                            http, url, request_headers, timeout
+                        )
+                    else:
+                        response = await http.get(url, headers=request_headers, timeout=timeout)
+                        if response.status_code == 200:
+                            body = response.content
+                            digest = hashlib.sha256(body).hexdigest()
+            except Exception as e:
+                logger.warning(f"Error fetching {url}: {e}")
+                response = None
+
+            if response is not None and response.status_code == 304 and fingerprint:
+                body = await asyncio.to_thread(self._load_body, url, stream)
+                if body is not None:
+                    self._stats["not_modified"] += 1
+                    meta["validated_at"] = time.time()
+                    await asyncio.to_thread(self._save, url, meta, None)
+                    return body, fingerprint
+
+            if response is not None and response.status_code == 200:
+                etag = _header(response, "ETag")
+                last_modified = _header(response, "Last-Modified")
+                meta = {
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "fingerprint": etag or last_modified or digest,
+                    "validated_at": time.time(),
+                }
+                self._stats["downloads"] += 1
+                if part is not None:
+                    try:
+                        await asyncio.to_thread(self._commit_body, url, meta, part)
+                    except OSError as e:
+                        logger.warning(f"Could not persist cached source {url}: {e}")
+                        await asyncio.to_thread(part.unlink, missing_ok=True)
+                        return None
+                    body = self._paths(url)[0]
+                    logger.info(f"Downloaded {url} ({body.stat().st_size:,} bytes, streamed to disk)")
+                else:
+                    await asyncio.to_thread(self._save, url, meta, body)
+                    logger.info(f"Downloaded {url} ({len(body):,} bytes)")
+                return body, meta["fingerprint"]
+
+            if response is not None:
+                logger.warning(f"Failed to fetch {url}: HTTP {response.status_code}")
+
+            # Source unavailable: fall back to the last good copy
+            if fingerprint:
+                body = await asyncio.to_thread(self._load_body, url, stream)
+                if body is not None:
+                    self._stats["stale_served"] += 1
+                    logger.warning(f"Serving stale cached copy of {url}")
+                    return body, fingerprint
+            return None
+
+    async def get_parsed(
+        self,
+        url: str,
+        parse: Callable[[Union[bytes, Path]], Any],
+        client: Optional[httpx.AsyncClient] = None,
+        parse_key: str = "default",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 60.0,
+        stream: bool = False,
+    ) -> Optional[Any]:
+        """
+        Get a URL's parsed contents, re-parsing only when the body changed.
+
+        Args:
+            url: Source URL
+            parse: Function from body bytes (or, with stream=True, the body
+                file's path) to a JSON-serializable result; returning None
+                marks the body as unusable
+            client: Optional shared HTTP client
+            parse_key: Distinguishes different parsers of the same URL
+            headers: Extra request headers (e.g. User-Agent)
+            stream: Stream the download to disk (see fetch())
+
+        Returns:
+            The parsed result, or None if unavailable. A result served from
+            the in-memory memo is shared with other callers and must not be
+            mutated; with memory_entries=0 every call gets its own copy.
+        """
+        fetched = await self.fetch(url, client=client, headers=headers, timeout=timeout, stream=stream)
+        if fetched is None:
+            return None
+        body, fingerprint = fetched
+
+        memo_key = (url, parse_key)
+        memo = self._parsed.get(memo_key)
+        if memo is not None and memo[0] == fingerprint:
+            self._parsed.move_to_end(memo_key)
+            return memo[1]
+
+        result = await asyncio.to_thread(self._load_parsed, url, parse_key, fingerprint)
+        if result is None:
+            try:
+                result = await asyncio.to_thread(parse, body)
+            except Exception as e:
+                logger.error(f"Failed to parse {url}: {e}")
+                return None
+            if result is None:
+                return None
+            await asyncio.to_thread(self._save_parsed, url, parse_key, fingerprint, result)
+
+        if self.memory_entries > 0:
+            self._parsed[memo_key] = (fingerprint, result)
+            self._parsed.move_to_end(memo_key)
+            while len(self._parsed) > self.memory_entries:
+                self._parsed.popitem(last=False)
+        return result
+
+    async def iter_parsed(
+        self,
+        url: str,
+        parse: Callable[[Union[bytes, Path]], Optional[Iterable[Any]]],
+        client: Optional[httpx.AsyncClient] = None,
+        parse_key: str = "default",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 60.0,
+        stream: bool = False,
+    ) -> Optional[Iterator[Any]]:
+        """
+        Get a URL's parsed records lazily, re-parsing only when the body changed.
+
+        Records are cached on disk as JSON lines, written as the parser
+        yields them, and the returned iterator decodes them one at a time, so
+        neither parsing nor consuming holds every record at once. The
+        iterator reads the file synchronously; consume it in a worker thread.
+
+        Args:
+            url: Source URL
+            parse: Function from body bytes (or, with stream=True, the body
+                file's path) to an iterable of JSON-serializable records;
+                returning None marks the body as unusable
+            client: Optional shared HTTP client
+            parse_key: Distinguishes different parsers of the same URL
+            headers: Extra request headers (e.g. User-Agent)
+            stream: Stream the download to disk (see fetch())
+
+        Returns:
+            Iterator of records, or None if unavailable
+        """
+        fetched = await self.fetch(url, client=client, headers=headers, timeout=timeout, stream=stream)
+        if fetched is None:
+            return None
+        body, fingerprint = fetched
+
+        path = self._records_path(url, parse_key)
+        if not await asyncio.to_thread(self._records_current, path, fingerprint):
+            try:
+                if not await asyncio.to_thread(self._save_records, path, fingerprint, parse, body):
+                    return None
+            except Exception as e:
+                logger.error(f"Failed to parse {url}: {e}")
+                return None
+        return self._read_records(path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return request counters."""
+        return {**self._stats, "parsed_in_memory": len(self._parsed)}
+
+
+# Global cache instance
+_cache: Optional[SourceCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_source_cache() -> SourceCache:
+    """Get the global source cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SourceCache(SOURCE_CACHE_DIR)
+    return _cache
+
+
+def reset_source_cache() -> None:
+    """Discard the global cache's in-memory state. Files on disk are kept."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -0,0 +1,96 @@
+"""
+Shared plumbing for small local sqlite stores.
+
+UrlIndex and WatermarkStore each keep their data in one sqlite file per
+name under a configurable directory. This module holds what they share:
+
+- SqliteStore: opens the file (creating its directory), enables WAL and
+  applies the schema; subclasses run queries on ``self._db`` under
+  ``self._lock``
+- NamedStores: the process-wide instances, one per name, opened lazily and
+  reported as unavailable (None) if the file can't be used
+
+Usage:
+    class UrlIndex(SqliteStore):
+        def __init__(self, path: str):
+            super().__init__(path, _SCHEMA)
+
+    _indexes = NamedStores(UrlIndex, "URL index")
+
+    def get_url_index(name):
+        return _indexes.get(URL_INDEX_DIR, name) if URL_INDEX_ENABLED else None
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteStore:
+    """A store kept in one sqlite file, shared across threads behind a lock."""
+
+    def __init__(self, path: str, schema: str):
+        """
+        Open the database, creating it and its directory if needed.
+
+        Args:
+            path: sqlite file holding the store
+            schema: SQL script creating the store's tables if missing
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(schema)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+
+S = TypeVar("S", bound=SqliteStore)
+
+
+class NamedStores(Generic[S]):
+    """Process-wide store instances, one sqlite file per name."""
+
+    def __init__(self, factory: Callable[[str], S], description: str):
+        """
+        Args:
+            factory: Opens a store given its file path
+            description: Used in log messages, e.g. "URL index"
+        """
+        self.factory = factory
+        self.description = description
+        self._stores: Dict[str, S] = {}
+        self._lock = threading.Lock()
+
+    def get(self, directory: str, name: str) -> Optional[S]:
+        """
+        Get the store called `name` under `directory`, or None if its file
+        can't be used.
+        """
+        with self._lock:
+            if name not in self._stores:
+                path = Path(directory) / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}.db"
+                try:
+                    self._stores[name] = self.factory(str(path))
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"{self.description} unavailable at {path}: {e}")
+                    return None
+            return self._stores[name]
+
+    def reset(self) -> None:
+        """Close and discard every instance. Files on disk are kept."""
+        with self._lock:
+            for store in self._stores.values():
+                store.close()
+            self._stores.clear()
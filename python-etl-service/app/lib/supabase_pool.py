@@ -0,0 +1,312 @@
+"""
+Process-wide Supabase client pool.
+
+supabase-py clients are cheap to use but expensive to build: every
+create_client() call sets up a fresh HTTP session, so the first request on
+it pays for a new TCP connection and TLS handshake. This module keeps one
+long-lived client per (url, key) credential, backed by a bounded httpx
+connection pool with keep-alive, and hands the same client to every caller.
+
+Features:
+- Keep-alive connection reuse across all services
+- Configurable connection limits (SUPABASE_POOL_MAX_CONNECTIONS)
+- Periodic health checks; clients failing a probe are rebuilt. Probes due
+  while on the event loop run in the database thread pool, off the loop
+- Metrics for client hits, creations and HTTP requests served
+
+Usage:
+    from app.lib.supabase_pool import get_client_pool
+
+    client = get_client_pool().get_client(url, key)
+    stats = get_client_pool().get_metrics()
+"""
+
+import asyncio
+import dataclasses
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from app.lib.async_db import get_db_executor
+
+logger = logging.getLogger(__name__)
+
+# Pool configuration
+DEFAULT_MAX_CONNECTIONS = int(os.environ.get("SUPABASE_POOL_MAX_CONNECTIONS", "20"))
+DEFAULT_MAX_KEEPALIVE = int(os.environ.get("SUPABASE_POOL_MAX_KEEPALIVE", "10"))
+DEFAULT_KEEPALIVE_EXPIRY = float(os.environ.get("SUPABASE_POOL_KEEPALIVE_EXPIRY", "60"))
+DEFAULT_HEALTH_CHECK_INTERVAL = float(
+    os.environ.get("SUPABASE_POOL_HEALTH_CHECK_INTERVAL", "300")
+)
+DEFAULT_TIMEOUT = 120.0  # seconds, matches supabase-py's postgrest default
+
+# Table probed by health checks (small, always present)
+HEALTH_CHECK_TABLE = "politicians"
+
+
+@dataclasses.dataclass
+class _PooledClient:
+    """A pooled client plus the bookkeeping needed for health checks."""
+    client: Any
+    http_client: Optional[httpx.Client]
+    created_at: float
+    last_checked: float
+    uses: int = 0
+    probing: bool = False
+
+
+class SupabaseClientPool:
+    """
+    Thread-safe registry of long-lived Supabase clients.
+
+    One client is kept per credential. Each client shares a single bounded
+    httpx connection pool, which is safe to use from multiple threads, so
+    callers on the event loop and in worker threads reuse the same
+    keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[..., Any],
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            client_factory: Callable like supabase.create_client(url, key, options)
+            max_connections: Maximum concurrent HTTP connections per client
+            max_keepalive_connections: Idle connections kept open per client
+            keepalive_expiry: Seconds an idle connection is kept open
+            health_check_interval: Seconds between health probes of a client
+        """
+        self.client_factory = client_factory
+        self.max_connections = max_connections
+        self.max_keepalive_connections = min(max_keepalive_connections, max_connections)
+        self.keepalive_expiry = keepalive_expiry
+        self.health_check_interval = health_check_interval
+
+        self._clients: Dict[Tuple[str, str], _PooledClient] = {}
+        self._lock = threading.Lock()
+        self._metrics = {
+            "requests": 0,
+            "hits": 0,
+            "clients_created": 0,
+            "health_checks": 0,
+            "health_check_failures": 0,
+            "clients_recycled": 0,
+            "http_requests": 0,
+        }
+
+    def get_client(self, url: str, key: str) -> Any:
+        """
+        Get the pooled client for a credential, creating it on first use.
+
+        A client whose last health probe is older than health_check_interval
+        is probed and rebuilt if the probe fails. In a worker thread the
+        probe runs before the client is returned; on the event loop it is
+        handed to the database thread pool and the current client is
+        returned straight away, so the loop never waits on the probe.
+        """
+        cache_key = (url, key)
+        with self._lock:
+            self._metrics["requests"] += 1
+            pooled = self._clients.get(cache_key)
+            if pooled is not None:
+                self._metrics["hits"] += 1
+                pooled.uses += 1
+                needs_check = not pooled.probing and (
+                    time.monotonic() - pooled.last_checked >= self.health_check_interval
+                )
+                pooled.probing = pooled.probing or needs_check
+            else:
+                pooled = self._create(url, key)
+                self._clients[cache_key] = pooled
+                needs_check = False
+
+        if needs_check:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pooled = self._recheck(cache_key, pooled)
+            else:
+                get_db_executor().submit(self._recheck, cache_key, pooled)
+
+        return pooled.client
+
+    def check_health(self) -> Dict[str, bool]:
+        """
+        Probe every pooled client and rebuild those that fail.
+
+        Returns:
+            Mapping of Supabase URL to probe result.
+        """
+        with self._lock:
+            entries = list(self._clients.items())
+
+        results: Dict[str, bool] = {}
+        for cache_key, pooled in entries:
+            healthy = self._probe(cache_key, pooled)
+            results[cache_key[0]] = healthy
+            if not healthy:
+                with self._lock:
+                    if self._clients.get(cache_key) is pooled:
+                        self._evict(cache_key)
+        return results
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return pool usage counters and current connection state."""
+        with self._lock:
+            metrics: Dict[str, Any] = dict(self._metrics)
+            metrics["clients"] = len(self._clients)
+            metrics["max_connections"] = self.max_connections
+            metrics["open_connections"] = sum(
+                _count_open_connections(p.http_client) for p in self._clients.values()
+            )
+        requests = metrics["requests"]
+        metrics["hit_rate"] = round(metrics["hits"] / requests, 4) if requests else 0.0
+        return metrics
+
+    def close(self):
+        """Close every pooled client and its HTTP connections."""
+        with self._lock:
+            for cache_key in list(self._clients):
+                self._evict(cache_key)
+
+    # -------------------------------------------------------------------------
+    # Internals (callers hold self._lock for _create/_evict)
+    # -------------------------------------------------------------------------
+
+    def _create(self, url: str, key: str) -> _PooledClient:
+        http_client = self._build_http_client()
+        options = _build_client_options(http_client)
+        if options is not None:
+            client = self.client_factory(url, key, options=options)
+        else:
+            # Older supabase-py without ClientOptions.httpx_client
+            if http_client is not None:
+                http_client.close()
+                http_client = None
+            client = self.client_factory(url, key)
+
+        now = time.monotonic()
+        self._metrics["clients_created"] += 1
+        logger.info(
+            f"Created pooled Supabase client for {url} "
+            f"(max_connections={self.max_connections})"
+        )
+        return _PooledClient(
+            client=client, http_client=http_client, created_at=now, last_checked=now
+        )
+
+    def _evict(self, cache_key: Tuple[str, str]):
+        pooled = self._clients.pop(cache_key, None)
+        if pooled is None:
+            return
+        self._metrics["clients_recycled"] += 1
+        if pooled.http_client is not None:
+            try:
+                pooled.http_client.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled HTTP client: {e}")
+
+    def _build_http_client(self) -> httpx.Client:
+        def _count_request(request: httpx.Request):
+            self._metrics["http_requests"] += 1
+
+        return httpx.Client(
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            event_hooks={"request": [_count_request]},
+        )
+
+    def _recheck(self, cache_key: Tuple[str, str], pooled: _PooledClient) -> _PooledClient:
+        """Probe a client, replacing it if the probe fails; returns the current client."""
+        try:
+            if self._probe(cache_key, pooled):
+                return pooled
+            with self._lock:
+                if self._clients.get(cache_key) is pooled:
+                    self._evict(cache_key)
+                    replacement = self._create(*cache_key)
+                    self._clients[cache_key] = replacement
+                    return replacement
+                return self._clients.get(cache_key) or pooled
+        finally:
+            pooled.probing = False
+
+    def _probe(self, cache_key: Tuple[str, str], pooled: _PooledClient) -> bool:
+        with self._lock:
+            self._metrics["health_checks"] += 1
+        try:
+            pooled.client.table(HEALTH_CHECK_TABLE).select("id").limit(1).execute()
+            pooled.last_checked = time.monotonic()
+            return True
+        except Exception as e:
+            with self._lock:
+                self._metrics["health_check_failures"] += 1
+            logger.warning(f"Supabase client health check failed for {cache_key[0]}: {e}")
+            return False
+
+
+def _build_client_options(http_client: httpx.Client) -> Optional[Any]:
+    """Build ClientOptions that route requests through our HTTP client, if supported."""
+    try:
+        from supabase import ClientOptions
+    except ImportError:
+        return None
+
+    field_names = {f.name for f in dataclasses.fields(ClientOptions)}
+    if "httpx_client" not in field_names:
+        return None
+    return ClientOptions(httpx_client=http_client)
+
+
+def _count_open_connections(http_client: Optional[httpx.Client]) -> int:
+    """Best-effort count of open connections in an httpx client's pool."""
+    if http_client is None:
+        return 0
+    pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    return len(connections) if connections is not None else 0
+
+
+# Global pool instance
+_client_pool: Optional[SupabaseClientPool] = None
+_client_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> SupabaseClientPool:
+    """Get the global Supabase client pool."""
+    global _client_pool
+    if _client_pool is None:
+        with _client_pool_lock:
+            if _client_pool is None:
+                from app.lib import database
+
+                _client_pool = SupabaseClientPool(
+                    client_factory=lambda *args, **kwargs: database.create_client(
+                        *args, **kwargs
+                    )
+                )
+    return _client_pool
+
+
+def reset_client_pool() -> None:
+    """Close and discard the global client pool. Useful for testing."""
+    global _client_pool
+    with _client_pool_lock:
+        if _client_pool is not None:
+            _client_pool.close()
+        _client_pool = None
@@ -0,0 +1,137 @@
+"""
+Persistent index of already-imported source URLs.
+
+Backfills dedup discovered filings against the source URLs already in
+trading_disclosures. Rebuilding that set means paging through every
+matching row, which is slow and repeats on every restart. UrlIndex keeps
+the set in a local sqlite file instead, one file per name:
+
+- Set semantics (``url in index``, ``add``, ``update``, ``len``), so code
+  written against a ``Set[str]`` works unchanged
+- ``synced_at`` records how far the index has been synchronized with the
+  database, so callers only fetch rows created since then
+- Delete the file (or call ``clear()``) to force a full rescan
+
+Disable with URL_INDEX_ENABLED=false.
+
+Usage:
+    from app.lib.url_index import get_url_index
+
+    index = get_url_index("senate_source_urls")
+    if index is not None:
+        index.update(fetch_urls_created_since(index.synced_at))
+        index.synced_at = scan_started.isoformat()
+"""
+
+import logging
+import os
+from collections.abc import MutableSet
+from typing import Iterable, Iterator, Optional
+
+from app.lib.sqlite_store import NamedStores, SqliteStore
+
+logger = logging.getLogger(__name__)
+
+URL_INDEX_ENABLED = os.environ.get("URL_INDEX_ENABLED", "true").lower() == "true"
+URL_INDEX_DIR = os.environ.get("URL_INDEX_DIR", "/tmp/url_index")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class UrlIndex(SqliteStore, MutableSet):
+    """A set of URLs stored in sqlite, with a database sync watermark."""
+
+    def __init__(self, path: str):
+        """
+        Open the index, creating the database if needed.
+
+        Args:
+            path: sqlite file holding the index
+        """
+        super().__init__(path, _SCHEMA)
+
+    def __contains__(self, url: object) -> bool:
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM urls WHERE url = ?", (url,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._db.execute("SELECT url FROM urls ORDER BY url").fetchall()
+        return iter(row[0] for row in rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def add(self, url: str) -> None:
+        """Add one URL."""
+        self.update((url,))
+
+    def discard(self, url: str) -> None:
+        """Remove a URL if present."""
+        with self._lock:
+            self._db.execute("DELETE FROM urls WHERE url = ?", (url,))
+
+    def update(self, urls: Iterable[str]) -> int:
+        """Add many URLs in one transaction. Returns how many were new."""
+        with self._lock:
+            before = self._db.total_changes
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany("INSERT OR IGNORE INTO urls (url) VALUES (?)", ((u,) for u in urls))
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            return self._db.total_changes - before
+
+    def __ior__(self, urls: Iterable[str]) -> "UrlIndex":
+        self.update(urls)
+        return self
+
+    def clear(self) -> None:
+        """Remove every URL and the sync watermark."""
+        with self._lock:
+            self._db.execute("DELETE FROM urls")
+            self._db.execute("DELETE FROM meta WHERE key = 'synced_at'")
+
+    @property
+    def synced_at(self) -> Optional[str]:
+        """ISO timestamp up to which the index reflects the database, if ever synced."""
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'synced_at'").fetchone()
+        return row[0] if row else None
+
+    @synced_at.setter
+    def synced_at(self, value: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_at', ?)", (value,)
+            )
+
+
+# Global index instances, one per name
+_indexes: NamedStores[UrlIndex] = NamedStores(UrlIndex, "URL index")
+
+
+def get_url_index(name: str) -> Optional[UrlIndex]:
+    """
+    Get the global index called `name`, or None if disabled or the index
+    file can't be used.
+    """
+    if not URL_INDEX_ENABLED:
+        return None
+    return _indexes.get(URL_INDEX_DIR, name)
+
+
+def reset_url_indexes() -> None:
+    """Close and discard the global indexes. Stored URLs are kept."""
+    _indexes.reset()
@@ -0,0 +1,111 @@
+"""
+Persistent per-key sync watermarks.
+
+Incremental ETLs need to remember, per entity (an MP, a filer), how far
+they have already synchronized, so the next run only handles what changed
+since. WatermarkStore keeps one small JSON document per key in a local
+sqlite file, one file per name:
+
+- ``get_all()`` loads every watermark in one query at the start of a run
+- ``set()`` records a key's new watermark once its changes are safely
+  uploaded, so an interrupted run resumes from the last completed key
+- Delete the file (or call ``clear()``) to force a full resync
+
+Disable with WATERMARK_STORE_ENABLED=false.
+
+Usage:
+    from app.lib.watermark_store import get_watermark_store
+
+    store = get_watermark_store("uk_interests")
+    watermarks = store.get_all() if store else {}
+    ...
+    store.set("4514", {"max_id": 14466, "latest": "2024-05-01"})
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from app.lib.sqlite_store import NamedStores, SqliteStore
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_STORE_ENABLED = os.environ.get("WATERMARK_STORE_ENABLED", "true").lower() == "true"
+# Must be on persistent storage in production (fly.toml mounts /data)
+WATERMARK_STORE_DIR = os.environ.get("WATERMARK_STORE_DIR", "/tmp/watermarks")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+) WITHOUT ROWID;
+"""
+
+
+class WatermarkStore(SqliteStore):
+    """JSON watermarks keyed by string, stored in sqlite."""
+
+    def __init__(self, path: str):
+        """
+        Open the store, creating the database if needed.
+
+        Args:
+            path: sqlite file holding the watermarks
+        """
+        super().__init__(path, _SCHEMA)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the watermark for `key`, or None if never synced."""
+        with self._lock:
+            row = self._db.execute("SELECT value FROM watermarks WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_all(self) -> Dict[str, Dict[str, Any]]:
+        """Return every watermark, keyed by key."""
+        with self._lock:
+            rows = self._db.execute("SELECT key, value FROM watermarks").fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Record the watermark for `key`, replacing any previous one."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO watermarks (key, value, updated_at) "
+                "VALUES (?, ?, datetime('now'))",
+                (key, json.dumps(value)),
+            )
+
+    def delete(self, key: str) -> None:
+        """Forget the watermark for `key`."""
+        with self._lock:
+            self._db.execute("DELETE FROM watermarks WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Forget every watermark."""
+        with self._lock:
+            self._db.execute("DELETE FROM watermarks")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM watermarks").fetchone()[0]
+
+
+# Global store instances, one per name
+_stores: NamedStores[WatermarkStore] = NamedStores(WatermarkStore, "Watermark store")
+
+
+def get_watermark_store(name: str) -> Optional[WatermarkStore]:
+    """
+    Get the global store called `name`, or None if disabled or the store
+    file can't be used.
+    """
+    if not WATERMARK_STORE_ENABLED:
+        return None
+    return _stores.get(WATERMARK_STORE_DIR, name)
+
+
+def reset_watermark_stores() -> None:
+    """Close and discard the global stores. Stored watermarks are kept."""
+    _stores.reset()
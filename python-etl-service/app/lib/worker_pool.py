@@ -0,0 +1,133 @@
+"""
+Bounded worker pools for per-item ETL work.
+
+Several ETLs walk a list of members (EU MEPs, UK MPs) doing network and
+database work for each one. for_each_concurrently() runs a fixed number of
+workers over such a list:
+
+- Items are started in list order; each handler call gets the item's index
+- At most ``workers`` handlers run at once
+- If a handler raises, the other workers are cancelled before the exception
+  propagates, so a failed job stops fetching and uploading straight away
+
+Staged pipelines (fetch -> parse -> upload) chain run_stage() calls through
+bounded queues and run them with run_together(), which gives the same
+cancel-on-error guarantee.
+
+Usage:
+    from app.lib.worker_pool import for_each_concurrently
+
+    async def process(i, mp):
+        ...
+
+    await for_each_concurrently(mps, process, workers=4)
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Sentinel placed on pipeline queues to tell a stage worker to stop
+STAGE_DONE = object()
+
+
+async def run_together(*coroutines: Awaitable[None]) -> None:
+    """
+    Run coroutines concurrently until all of them finish.
+
+    Raises:
+        Whatever the first failing coroutine raised; the others are cancelled
+        and awaited first, so none is still running when this returns.
+    """
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run_stage(
+    handler: Callable[..., Awaitable[None]],
+    inbox: Optional[asyncio.Queue],
+    outbox: Optional[asyncio.Queue],
+    downstream_workers: int,
+    workers: int,
+    batch_size: Optional[int] = None,
+) -> None:
+    """
+    Run ``workers`` coroutines that feed items from ``inbox`` to ``handler``.
+
+    A stage without an inbox is the source stage and calls ``handler()``
+    once per worker. Each worker stops at the first STAGE_DONE it takes, so
+    the upstream stage puts one on ``inbox`` per worker. When every worker
+    has stopped, one STAGE_DONE is placed on ``outbox`` for each downstream
+    worker.
+
+    Args:
+        batch_size: If set, the handler is called with a list of up to this
+            many items, taking whatever is already waiting after the first
+    """
+
+    async def worker() -> None:
+        if inbox is None:
+            await handler()
+            return
+        while True:
+            item = await inbox.get()
+            if item is STAGE_DONE:
+                return
+            if batch_size is None:
+                await handler(item)
+                continue
+            batch = [item]
+            finished = False
+            while len(batch) < batch_size and not inbox.empty():
+                item = inbox.get_nowait()
+                if item is STAGE_DONE:
+                    finished = True
+                    break
+                batch.append(item)
+            await handler(batch)
+            if finished:
+                return
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    if outbox is not None:
+        for _ in range(downstream_workers):
+            await outbox.put(STAGE_DONE)
+
+
+async def for_each_concurrently(
+    items: Sequence[T],
+    handle: Callable[[int, T], Awaitable[None]],
+    workers: int,
+) -> None:
+    """
+    Call ``handle(i, item)`` for every item from a pool of concurrent workers.
+
+    Args:
+        items: Items to process, started in order
+        handle: Coroutine function called with each item's index and the item
+        workers: Maximum number of handlers running at once
+
+    Raises:
+        Whatever the first failing handler raised; the remaining workers are
+        cancelled first.
+    """
+    pending: asyncio.Queue = asyncio.Queue()
+    for item in enumerate(items):
+        pending.put_nowait(item)
+
+    async def worker() -> None:
+        while True:
+            try:
+                i, item = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await handle(i, item)
+
+    count = max(1, min(workers, len(items)))
+    await run_together(*(worker() for _ in range(count)))
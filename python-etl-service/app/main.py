@@ -17,6 +17,9 @@ from app.routes import health, etl, enrichment, ml, quality, error_reports, dedu
 from app.routes import admin_sections
 from app.routes import llm_pipeline
 from app.lib.logging_config import configure_logging, get_logger
+from app.lib.async_db import shutdown_db_executor
+from app.lib.pdf_extraction import shutdown_pdf_extraction_service
+from app.lib.supabase_pool import reset_client_pool
 from app.middleware.correlation import CorrelationMiddleware
 from app.middleware.auth import AuthMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
@@ -240,6 +243,9 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down ETL Service...")
+    shutdown_db_executor()
+    shutdown_pdf_extraction_service()
+    reset_client_pool()
 
 
 app = FastAPI(
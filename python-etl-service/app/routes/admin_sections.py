@@ -22,6 +22,12 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, R
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
+from app.lib.async_db import (
+    MLModelsRepository,
+    PoliticiansRepository,
+    TradingDisclosuresRepository,
+    execute_async,
+)
 from app.lib.database import get_supabase
 from app.routes.admin import require_admin_for_dashboard, templates
 
@@ -49,21 +55,19 @@ async def admin_overview(
 
     # Trading disclosures count
     try:
-        resp = supabase.table("trading_disclosures").select("id", count="exact").execute()
-        stats["total_disclosures"] = resp.count if resp.count is not None else len(resp.data or [])
+        stats["total_disclosures"] = await TradingDisclosuresRepository(supabase).count()
     except Exception:
         stats["total_disclosures"] = 0
 
     # Politicians count
     try:
-        resp = supabase.table("politicians").select("id", count="exact").execute()
-        stats["total_politicians"] = resp.count if resp.count is not None else len(resp.data or [])
+        stats["total_politicians"] = await PoliticiansRepository(supabase).count()
     except Exception:
         stats["total_politicians"] = 0
 
     # ML models
     try:
-        resp = supabase.table("ml_models").select("id,status").execute()
+        resp = await execute_async(MLModelsRepository(supabase).query().select("id,status"))
         models = resp.data or []
         stats["total_models"] = len(models)
         stats["active_models"] = sum(1 for m in models if m.get("status") == "active")
@@ -73,12 +77,11 @@ async def admin_overview(
 
     # ML training jobs (recent)
     try:
-        resp = (
+        resp = await execute_async(
             supabase.table("ml_training_jobs")
             .select("id,status")
             .order("created_at", desc=True)
             .limit(20)
-            .execute()
         )
         jobs = resp.data or []
         stats["running_jobs"] = sum(1 for j in jobs if j.get("status") in ("running", "pending"))
@@ -89,10 +92,9 @@ async def admin_overview(
 
     # Error reports
     try:
-        resp = (
+        resp = await execute_async(
             supabase.table("user_error_reports")
             .select("id,status")
-            .execute()
         )
         reports = resp.data or []
         stats["total_error_reports"] = len(reports)
@@ -105,9 +107,9 @@ async def admin_overview(
 
     # Validation results
     try:
-        resp = supabase.table("trade_validation_results").select("id", count="exact").execute()
+        resp = await execute_async(supabase.table("trade_validation_results").select("id", count="exact"))
         stats["total_validations"] = resp.count if resp.count is not None else 0
-        resp = supabase.table("trade_validation_results").select("id", count="exact").eq("validation_status", "mismatch").execute()
+        resp = await execute_async(supabase.table("trade_validation_results").select("id", count="exact").eq("validation_status", "mismatch"))
         stats["validation_mismatches"] = resp.count if resp.count is not None else 0
     except Exception:
         stats["total_validations"] = 0
@@ -116,11 +118,10 @@ async def admin_overview(
     # Recent disclosures (last 24h)
     try:
         cutoff = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
-        resp = (
-            supabase.table("trading_disclosures")
+        resp = await execute_async(
+            TradingDisclosuresRepository(supabase).query()
             .select("id", count="exact")
             .gte("created_at", cutoff)
-            .execute()
         )
         stats["disclosures_24h"] = resp.count if resp.count is not None else len(resp.data or [])
     except Exception:
@@ -157,26 +158,23 @@ async def admin_etl(
 
     # Total disclosures
     try:
-        resp = supabase.table("trading_disclosures").select("id", count="exact").execute()
-        stats["total_count"] = resp.count if resp.count is not None else 0
+        stats["total_count"] = await TradingDisclosuresRepository(supabase).count()
     except Exception as e:
         logger.error(f"Failed to get total disclosures count: {e}")
 
     # Chamber breakdown from politicians table (chamber lives there, not on disclosures)
     try:
-        resp = supabase.table("politicians").select("id", count="exact").eq("chamber", "house").execute()
-        stats["house_count"] = resp.count if resp.count is not None else 0
-        resp = supabase.table("politicians").select("id", count="exact").eq("chamber", "senate").execute()
-        stats["senate_count"] = resp.count if resp.count is not None else 0
-        resp = supabase.table("politicians").select("id", count="exact").eq("chamber", "eu_parliament").execute()
-        stats["eu_count"] = resp.count if resp.count is not None else 0
+        politicians = PoliticiansRepository(supabase)
+        stats["house_count"] = await politicians.count(chamber="house")
+        stats["senate_count"] = await politicians.count(chamber="senate")
+        stats["eu_count"] = await politicians.count(chamber="eu_parliament")
     except Exception as e:
         logger.error(f"Failed to get chamber counts: {e}")
 
     # Recent (last 24h)
     try:
         cutoff = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
-        resp = supabase.table("trading_disclosures").select("id", count="exact").gte("created_at", cutoff).execute()
+        resp = await execute_async(TradingDisclosuresRepository(supabase).query().select("id", count="exact").gte("created_at", cutoff))
         stats["recent_24h"] = resp.count if resp.count is not None else 0
     except Exception as e:
         logger.error(f"Failed to get recent disclosures count: {e}")
@@ -275,23 +273,21 @@ async def admin_ml(
     models = []
     jobs = []
     try:
-        resp = (
-            supabase.table("ml_models")
+        resp = await execute_async(
+            MLModelsRepository(supabase).query()
             .select("*")
             .order("created_at", desc=True)
-            .execute()
         )
         models = resp.data or []
     except Exception as e:
         logger.error(f"Failed to fetch ML models: {e}")
 
     try:
-        resp = (
+        resp = await execute_async(
             supabase.table("ml_training_jobs")
             .select("*")
             .order("created_at", desc=True)
             .limit(20)
-            .execute()
         )
         jobs = resp.data or []
     except Exception as e:
@@ -389,12 +385,11 @@ async def admin_ml_detail(
         raise HTTPException(status_code=500, detail="Database not configured")
 
     try:
-        resp = (
-            supabase.table("ml_models")
+        resp = await execute_async(
+            MLModelsRepository(supabase).query()
             .select("*")
             .eq("id", model_id)
             .single()
-            .execute()
         )
         model = resp.data
     except Exception as e:
@@ -407,13 +402,12 @@ async def admin_ml_detail(
     # Get training jobs linked to this model
     jobs = []
     try:
-        resp = (
+        resp = await execute_async(
             supabase.table("ml_training_jobs")
             .select("*")
             .eq("model_id", model_id)
             .order("created_at", desc=True)
             .limit(10)
-            .execute()
         )
         jobs = resp.data or []
     except Exception as e:
@@ -422,11 +416,10 @@ async def admin_ml_detail(
     # Get prediction count from cache
     prediction_count = 0
     try:
-        resp = (
+        resp = await execute_async(
             supabase.table("ml_predictions_cache")
             .select("id", count="exact")
             .eq("model_id", model_id)
-            .execute()
         )
         prediction_count = resp.count if resp.count is not None else 0
     except Exception:
@@ -490,10 +483,11 @@ async def api_update_model(
 
     try:
         # If activating, deactivate others first
+        ml_models = MLModelsRepository(supabase)
         if updates.get("status") == "active":
-            supabase.table("ml_models").update({"status": "archived"}).eq("status", "active").execute()
+            await ml_models.archive_active()
 
-        supabase.table("ml_models").update(updates).eq("id", model_id).execute()
+        await ml_models.update(updates, id=model_id)
         updated_fields = ", ".join(f"{k}={v}" for k, v in updates.items())
         return HTMLResponse(
             f'<div class="bg-green-100 text-green-800 p-3 rounded">'
@@ -533,7 +527,7 @@ async def api_delete_model(
 
     try:
         # Check the model exists and isn't active
-        resp = supabase.table("ml_models").select("id,status").eq("id", model_id).single().execute()
+        resp = await execute_async(MLModelsRepository(supabase).query().select("id,status").eq("id", model_id).single())
         model = resp.data
         if not model:
             return HTMLResponse('<div class="text-red-600 p-3">Model not found</div>', status_code=404)
@@ -544,9 +538,9 @@ async def api_delete_model(
             )
 
         # Delete associated predictions cache
-        supabase.table("ml_predictions_cache").delete().eq("model_id", model_id).execute()
+        await execute_async(supabase.table("ml_predictions_cache").delete().eq("model_id", model_id))
         # Delete the model
-        supabase.table("ml_models").delete().eq("id", model_id).execute()
+        await execute_async(MLModelsRepository(supabase).query().delete().eq("id", model_id))
 
         return HTMLResponse(
             f'<div class="bg-green-100 text-green-800 p-3 rounded">'
@@ -585,9 +579,10 @@ async def api_activate_model(
 
     try:
         # Deactivate current active models
-        supabase.table("ml_models").update({"status": "inactive"}).eq("status", "active").execute()
+        ml_models = MLModelsRepository(supabase)
+        await ml_models.update({"status": "inactive"}, status="active")
         # Activate the selected model
-        supabase.table("ml_models").update({"status": "active"}).eq("id", model_id).execute()
+        await ml_models.update({"status": "active"}, id=model_id)
         return HTMLResponse(
             f'<div class="bg-green-100 text-green-800 p-3 rounded">'
             f'Model activated. <a href="/admin/ml?key={key}" class="underline">Refresh page</a></div>'
@@ -619,20 +614,21 @@ async def admin_quality(
         cutoff_7d = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
         cutoff_24h = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
 
+        disclosures = TradingDisclosuresRepository(supabase)
+
         # Total records
-        resp = supabase.table("trading_disclosures").select("id", count="exact").execute()
-        stats["total_records"] = resp.count if resp.count is not None else 0
+        stats["total_records"] = await disclosures.count()
 
         # Records in last 7 days
-        resp = supabase.table("trading_disclosures").select("id", count="exact").gte("created_at", cutoff_7d).execute()
+        resp = await disclosures.execute(disclosures.query().select("id", count="exact").gte("created_at", cutoff_7d))
         stats["records_7d"] = resp.count if resp.count is not None else 0
 
         # Records in last 24h
-        resp = supabase.table("trading_disclosures").select("id", count="exact").gte("created_at", cutoff_24h).execute()
+        resp = await disclosures.execute(disclosures.query().select("id", count="exact").gte("created_at", cutoff_24h))
         stats["records_24h"] = resp.count if resp.count is not None else 0
 
         # Find most recent record
-        resp = supabase.table("trading_disclosures").select("created_at").order("created_at", desc=True).limit(1).execute()
+        resp = await disclosures.execute(disclosures.query().select("created_at").order("created_at", desc=True).limit(1))
         if resp.data:
             stats["newest_record"] = resp.data[0].get("created_at", "N/A")
         else:
@@ -643,11 +639,11 @@ async def admin_quality(
 
     # Validation results summary using server-side counting
     try:
-        resp = supabase.table("trade_validation_results").select("id", count="exact").execute()
+        resp = await execute_async(supabase.table("trade_validation_results").select("id", count="exact"))
         stats["validation_total"] = resp.count if resp.count is not None else 0
-        resp = supabase.table("trade_validation_results").select("id", count="exact").eq("validation_status", "match").execute()
+        resp = await execute_async(supabase.table("trade_validation_results").select("id", count="exact").eq("validation_status", "match"))
         stats["validation_match"] = resp.count if resp.count is not None else 0
-        resp = supabase.table("trade_validation_results").select("id", count="exact").eq("validation_status", "mismatch").execute()
+        resp = await execute_async(supabase.table("trade_validation_results").select("id", count="exact").eq("validation_status", "mismatch"))
         stats["validation_mismatch"] = resp.count if resp.count is not None else 0
     except Exception:
         stats["validation_total"] = 0
@@ -751,7 +747,7 @@ async def admin_enrichment(
     stats = {}
     try:
         # Politicians with/without party
-        resp = supabase.table("politicians").select("id,party,bioguide_id").execute()
+        resp = await execute_async(PoliticiansRepository(supabase).query().select("id,party,bioguide_id"))
         politicians = resp.data or []
         stats["total_politicians"] = len(politicians)
         stats["with_party"] = sum(1 for p in politicians if p.get("party"))
@@ -847,12 +843,11 @@ async def admin_errors(
     reports = []
     stats = {}
     try:
-        resp = (
+        resp = await execute_async(
             supabase.table("user_error_reports")
             .select("*")
             .order("created_at", desc=True)
             .limit(50)
-            .execute()
         )
         reports = resp.data or []
         stats["total"] = len(reports)
@@ -941,10 +936,12 @@ async def api_resolve_report(
         return HTMLResponse('<div class="text-red-600 p-3">Database error</div>', status_code=500)
 
     try:
-        supabase.table("user_error_reports").update({
-            "status": resolution,
-            "resolved_at": datetime.now(timezone.utc).isoformat(),
-        }).eq("id", report_id).execute()
+        await execute_async(
+            supabase.table("user_error_reports").update({
+                "status": resolution,
+                "resolved_at": datetime.now(timezone.utc).isoformat(),
+            }).eq("id", report_id)
+        )
         return HTMLResponse(
             f'<div class="bg-green-100 text-green-800 p-3 rounded">Report marked as {resolution}.</div>'
         )
@@ -969,12 +966,11 @@ async def admin_audit_log(
 
     fix_log = []
     try:
-        resp = (
+        resp = await execute_async(
             supabase.table("validation_fix_log")
             .select("*")
             .order("performed_at", desc=True)
             .limit(100)
-            .execute()
         )
         fix_log = resp.data or []
     except Exception as e:
@@ -15,13 +15,12 @@ from app.services.house_etl import (
     run_house_etl,
     JOB_STATUS,
     HouseDisclosureScraper,
-    extract_tables_from_pdf,
     parse_transaction_from_row,
     get_supabase,
-    find_or_create_politician,
-    upload_transaction_to_supabase,
     USER_AGENT,
 )
+from app.lib.pdf_utils import extract_tables_from_pdf
+from app.lib.politician import find_or_create_politician
 from app.services.senate_etl import (
     run_senate_etl,
     fetch_senators_from_xml,
@@ -30,11 +29,12 @@ from app.services.senate_etl import (
 from app.services.ticker_backfill import run_ticker_backfill, run_transaction_type_backfill
 from app.services.bioguide_enrichment import run_bioguide_enrichment
 from app.services.senate_backfill import run_senate_backfill
-from app.middleware.auth import require_api_key
+from app.middleware.auth import require_admin_key, require_api_key
 
 # New framework imports
 from app.lib import ETLRegistry
-from app.lib.database import refresh_materialized_views
+from app.lib.database import refresh_materialized_views, upload_transaction_to_supabase
+from app.lib.parse_cache import get_parse_cache
 
 # Register services (import triggers registration)
 import app.services.etl_services  # noqa: F401
@@ -49,6 +49,7 @@ class ETLTriggerRequest(BaseModel):
     lookback_days: int = 30  # For senate, how many days back to search
     limit: Optional[int] = None  # Optional limit for testing; None = process all
     update_mode: bool = False  # If true, upsert instead of insert (re-parse existing records)
+    incremental: bool = False  # If true, skip filings already ingested (House, EU, UK)
 
 
 class ETLTriggerResponse(BaseModel):
@@ -201,6 +202,7 @@ async def trigger_etl(
             year=request.year,
             limit=request.limit,
             update_mode=request.update_mode,
+            incremental=request.incremental,
         )
     elif request.source == "senate":
         background_tasks.add_task(
@@ -217,6 +219,7 @@ async def trigger_etl(
             "lookback_days": request.lookback_days,
             "limit": request.limit,
             "update_mode": request.update_mode,
+            "incremental": request.incremental,
         }
         background_tasks.add_task(
             _run_registry_service,
@@ -417,6 +420,7 @@ class SenateBackfillRequest(BaseModel):
     end_year: Optional[int] = None     # Default: 2026
     limit: Optional[int] = None        # Max disclosures per year (testing)
     skip_completed_years: bool = True   # Resume from where we left off
+    year_concurrency: Optional[int] = None  # Years run at once (default: BACKFILL_YEAR_CONCURRENCY)
 
 
 @router.post("/backfill-senate", response_model=ETLTriggerResponse)
@@ -427,8 +431,8 @@ async def trigger_senate_backfill(
     """
     Trigger Senate PTR historical backfill (2012-2026).
 
-    Iterates year-by-year using Playwright to backfill all historical
-    Periodic Transaction Reports from the Senate EFD system. Resumable:
+    Backfills all historical Periodic Transaction Reports from the Senate
+    EFD system using Playwright, several years at a time. Resumable:
     re-running skips years that already completed successfully.
 
     Only one backfill can run at a time (256MB RAM constraint on Fly.io).
@@ -464,6 +468,7 @@ async def trigger_senate_backfill(
         end_year=request.end_year,
         limit=request.limit,
         skip_completed=request.skip_completed_years,
+        year_concurrency=request.year_concurrency,
     )
 
     year_range = f"{request.start_year or 2012}-{request.end_year or 2026}"
@@ -741,3 +746,41 @@ async def cleanup_job_executions(request: CleanupRequest):
         deleted=deleted,
         message=f"Deleted {deleted} job execution records older than {request.days} days",
     )
+
+
+# =============================================================================
+# Parsed-Result Cache
+# =============================================================================
+
+
+class ParseCachePurgeResponse(BaseModel):
+    """Response from purging a parse cache version."""
+    version: str
+    deleted: int
+
+
+@router.get("/parse-cache")
+async def parse_cache_stats() -> Dict[str, Any]:
+    """
+    Parsed-result cache statistics.
+
+    Returns hit rates per result kind since process start, the version
+    strings new results are stored under, and stored entries per version.
+    """
+    cache = get_parse_cache()
+    if cache is None:
+        raise HTTPException(status_code=503, detail="Parse cache is disabled")
+    return cache.get_stats()
+
+
+@router.delete("/parse-cache/{version}", response_model=ParseCachePurgeResponse)
+async def purge_parse_cache(
+    version: str,
+    _admin_key: str = Depends(require_admin_key),
+):
+    """Delete every cached parse result stored under a version string."""
+    cache = get_parse_cache()
+    if cache is None:
+        raise HTTPException(status_code=503, detail="Parse cache is disabled")
+    deleted = cache.purge(version)
+    return ParseCachePurgeResponse(version=version, deleted=deleted)
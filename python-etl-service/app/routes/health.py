@@ -1,8 +1,12 @@
 """Health check endpoints for service monitoring."""
 
+from typing import Any, Dict
+
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from app.lib.supabase_pool import get_client_pool
+
 router = APIRouter()
 
 
@@ -23,5 +27,18 @@ async def health_check():
     - `GET /ml/health` - ML model status
     - `GET /error-reports/health` - Ollama status
     - `GET /dedup/health` - Database status
+    - `GET /health/supabase-pool` - Supabase client pool metrics
     """
     return {"status": "healthy"}
+
+
+@router.get("/health/supabase-pool")
+async def supabase_pool_metrics() -> Dict[str, Any]:
+    """
+    Supabase client pool metrics.
+
+    Reports client reuse (requests, hits, hit_rate), clients created and
+    recycled, health check results, HTTP requests sent through pooled
+    connections and the number of currently open connections.
+    """
+    return get_client_pool().get_metrics()
@@ -37,6 +37,7 @@ from app.services.feature_pipeline import (
 from app.models.training_config import TrainingConfig, FeatureToggles
 from app.middleware.auth import require_admin_key
 from app.lib.audit_log import log_audit_event, AuditAction, AuditContext
+from app.lib.async_db import run_db
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -188,7 +189,7 @@ async def predict_signal(request: PredictRequest):
     # Check cache first
     if request.use_cache:
         feature_hash = compute_feature_hash(features_dict)
-        cached = get_cached_prediction(ticker, feature_hash)
+        cached = await run_db(get_cached_prediction, ticker, feature_hash)
         if cached:
             return PredictResponse(
                 ticker=ticker,
@@ -202,7 +203,7 @@ async def predict_signal(request: PredictRequest):
     # Get active model
     model = get_active_model()
     if model is None:
-        model = load_active_model()
+        model = await run_db(load_active_model)
         if model is None:
             raise HTTPException(
                 status_code=503,
@@ -217,7 +218,8 @@ async def predict_signal(request: PredictRequest):
         # Cache the result
         if request.use_cache:
             feature_hash = compute_feature_hash(features_dict)
-            cache_prediction(
+            await run_db(
+                cache_prediction,
                 model_id=str(model.model_version),  # Use version as ID for now
                 ticker=ticker,
                 feature_hash=feature_hash,
@@ -250,7 +252,7 @@ async def batch_predict_signals(request: BatchPredictRequest):
     # Get active model once for all predictions
     model = get_active_model()
     if model is None:
-        model = load_active_model()
+        model = await run_db(load_active_model)
         if model is None:
             raise HTTPException(
                 status_code=503,
@@ -17,25 +17,22 @@ import os
 from datetime import datetime, timezone
 from typing import Optional
 import httpx
-from supabase import create_client, Client
+from supabase import Client
+
+from app.lib.supabase_pool import get_client_pool
 
 logger = logging.getLogger(__name__)
 
 CONGRESS_API_BASE = "https://api.congress.gov/v3"
 CONGRESS_API_KEY = os.environ.get("CONGRESS_API_KEY", "")
 
-_supabase_client: Optional[Client] = None
-
 BATCH_SIZE = 500
 
 
 def get_supabase() -> Client:
-    global _supabase_client
-    if _supabase_client is None:
-        url = os.environ["SUPABASE_URL"]
-        key = os.environ["SUPABASE_KEY"]
-        _supabase_client = create_client(url, key)
-    return _supabase_client
+    url = os.environ["SUPABASE_URL"]
+    key = os.environ["SUPABASE_KEY"]
+    return get_client_pool().get_client(url, key)
 
 
 async def run_committee_enrichment_async(
@@ -63,6 +63,7 @@ class HouseETLService(BaseETLService):
         year: int = 2025,
         limit: Optional[int] = None,
         update_mode: bool = False,
+        incremental: bool = False,
         **kwargs,
     ) -> ETLResult:
         """
@@ -76,6 +77,7 @@ class HouseETLService(BaseETLService):
             year: Year to process (default: 2025)
             limit: Optional limit on PDFs to process
             update_mode: If True, upsert instead of insert
+            incremental: If True, skip filings already ingested
         """
         result = ETLResult(started_at=datetime.now(timezone.utc))
 
@@ -89,6 +91,7 @@ class HouseETLService(BaseETLService):
                 year=year,
                 limit=limit,
                 update_mode=update_mode,
+                incremental=incremental,
             )
 
             # Extract results from job status
@@ -22,18 +22,37 @@ Pipeline:
   4. Download + parse PDFs with pdfplumber
   5. Extract financial interests from sections B, C, D
   6. Map to trading_disclosures schema and upload
+
+Steps 3-6 run for several MEPs at once (EU_MEP_WORKERS). The workers share
+one EUParliamentClient whose AdaptiveConcurrencyLimiter bounds the requests
+in flight, and PDF text extraction runs in the PDF worker processes.
+
+Incremental runs (incremental=True) skip declarations already ingested.
+DPI PDFs are immutable, so a persisted index of processed PDF URLs and
+doc_ids, synced from trading_disclosures once per run, is checked before
+anything is downloaded.
 """
 
 import logging
+import os
 import re
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, MutableSet, Optional, Set
 
+from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from app.lib.async_db import run_db
 from app.lib.base_etl import BaseETLService, ETLResult, JobStatus
 from app.lib.database import get_supabase
-from app.lib.pdf_utils import extract_text_from_pdf
-from app.lib.politician import find_or_create_politician
+from app.lib.pdf_extraction import extract_text
+from app.lib.politician import (
+    find_or_create_politician,
+    find_or_create_politicians,
+    politician_key,
+)
+from app.lib.politician_index import get_politician_index
 from app.lib.registry import ETLRegistry
+from app.lib.url_index import get_url_index
+from app.lib.worker_pool import for_each_concurrently
 from app.services.eu_parliament_client import EUParliamentClient
 
 logger = logging.getLogger(__name__)
@@ -184,6 +203,19 @@ SKIP_PATTERNS = [
 # Batch size for MEP processing
 MEP_BATCH_SIZE = 50
 
+# Concurrent MEP processing: MEPs handled at once, and the adaptive bounds on
+# declarations-page/PDF requests in flight to europarl.europa.eu
+MEP_WORKERS = int(os.environ.get("EU_MEP_WORKERS", "4"))
+REQUEST_CONCURRENCY_INITIAL = int(os.environ.get("EU_REQUEST_CONCURRENCY_INITIAL", "2"))
+REQUEST_CONCURRENCY_MAX = int(os.environ.get("EU_REQUEST_CONCURRENCY_MAX", "4"))
+
+# Persisted index of processed declarations (PDF URLs and doc_ids)
+DECLARATION_INDEX = "eu_declarations"
+# Overlap between syncs, covering clock skew between this host and the database
+DECLARATION_INDEX_SYNC_MARGIN = timedelta(hours=1)
+# Page size when loading already-ingested declarations
+INGESTED_PAGE_SIZE = 1000
+
 
 @ETLRegistry.register
 class EUParliamentETLService(BaseETLService):
@@ -206,6 +238,7 @@ class EUParliamentETLService(BaseETLService):
             limit_meps: Max number of MEPs to process (for testing)
             include_former: Include outgoing/former MEPs for historical data (default: True)
             year_start: Earliest year to include declarations from (default: 2015)
+            incremental: Skip declarations already ingested (default: False)
 
         Returns:
             List of parsed financial interest records ready for upload.
@@ -221,19 +254,28 @@ class EUParliamentETLService(BaseETLService):
             self.logger.error("Supabase client not available")
             return []
 
-        async with EUParliamentClient() as client:
+        async with EUParliamentClient(limiter=_request_limiter()) as client:
             meps = await self._prepare_mep_list(client, **kwargs)
             if not meps:
                 return []
 
-            for i, mep in enumerate(meps):
+            politician_ids = await self._resolve_mep_politicians(supabase, meps)
+            known = await self._load_known_declarations(supabase, **kwargs)
+            mep_records: Dict[int, List[Dict[str, Any]]] = {}
+
+            async def fetch(i: int, mep: Dict[str, Any]) -> None:
                 self.logger.info(
                     f"Processing MEP {i + 1}/{len(meps)}: {mep['full_name']}"
                 )
-                records = await self._fetch_mep_records(
-                    client, supabase, mep, year_start
+                mep_records[i] = await self._fetch_mep_records(
+                    client, supabase, mep, year_start,
+                    politician_id=politician_ids.get(mep["mep_id"]),
+                    known=known,
                 )
-                all_records.extend(records)
+
+            await for_each_concurrently(meps, fetch, workers=MEP_WORKERS)
+            for i in range(len(meps)):
+                all_records.extend(mep_records[i])
 
         self.logger.info(
             f"Extracted {len(all_records)} financial interest records "
@@ -273,33 +315,119 @@ class EUParliamentETLService(BaseETLService):
 
         return meps
 
+    async def _resolve_mep_politicians(
+        self, supabase, meps: List[Dict[str, Any]]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Find or create politicians for every MEP in one batch.
+
+        Returns:
+            Mapping of mep_id to politician UUID (None if resolution failed;
+            _fetch_mep_records() then retries that MEP on its own).
+        """
+        descriptors = {mep["mep_id"]: _mep_descriptor(mep) for mep in meps}
+        try:
+            resolved = await run_db(
+                find_or_create_politicians,
+                supabase,
+                list(descriptors.values()),
+                index=get_politician_index(),
+            )
+        except Exception as e:
+            self.logger.warning(f"Batch MEP politician resolution failed: {e}")
+            return {}
+        return {
+            mep_id: resolved.get(politician_key(descriptor))
+            for mep_id, descriptor in descriptors.items()
+        }
+
+    async def _load_known_declarations(
+        self, supabase, update_mode: bool = False, **kwargs
+    ) -> Optional[MutableSet[str]]:
+        """
+        Load the already-ingested declarations for an incremental run.
+
+        Returns:
+            PDF URLs and doc_ids to skip, or None to process everything
+            (not incremental, update mode, or the lookup failed)
+        """
+        if not kwargs.get("incremental") or update_mode:
+            return None
+        try:
+            known = await run_db(load_declaration_index, supabase)
+        except Exception as e:
+            self.logger.warning(f"Could not load ingested EU declarations: {e}")
+            return None
+        self.logger.info(f"Incremental run: {len(known)} known declaration keys")
+        return known
+
+    async def _upload_mep_records(
+        self,
+        records: List[Dict[str, Any]],
+        result: ETLResult,
+        update_mode: bool = False,
+    ) -> None:
+        """Parse, validate and upload one MEP's records, counting into `result`."""
+        for record in records:
+            result.records_processed += 1
+            try:
+                parsed = await self.parse_disclosure(record)
+                if not parsed:
+                    result.records_skipped += 1
+                    continue
+
+                if not await self.validate_disclosure(parsed):
+                    result.records_skipped += 1
+                    continue
+
+                disclosure_id = await self.upload_disclosure(
+                    parsed, update_mode=update_mode
+                )
+
+                if disclosure_id:
+                    if update_mode:
+                        result.records_updated += 1
+                    else:
+                        result.records_inserted += 1
+                else:
+                    result.records_skipped += 1
+
+            except Exception as e:
+                result.records_failed += 1
+                result.add_error(f"Failed to upload: {e}")
+
     async def _fetch_mep_records(
         self,
         client: EUParliamentClient,
         supabase,
         mep: Dict[str, Any],
         year_start: int = 2015,
+        politician_id: Optional[str] = None,
+        known: Optional[MutableSet[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Fetch and parse all financial interest records for a single MEP.
 
         Downloads DPI PDFs, extracts financial interests, and returns
         records ready for upload. Does NOT upload to database.
+
+        Args:
+            politician_id: Politician UUID from _resolve_mep_politicians();
+                resolved here when not provided
+            known: PDF URLs and doc_ids of declarations already ingested;
+                these are skipped before download. Declarations that yield
+                no interests (and so never reach the database) are added.
         """
         records: List[Dict[str, Any]] = []
         mep_id = mep["mep_id"]
         full_name = mep["full_name"]
-
         first_name, last_name = _split_mep_name(full_name)
-        politician_id = find_or_create_politician(
-            supabase,
-            name=full_name,
-            first_name=first_name,
-            last_name=last_name,
-            chamber="eu_parliament",
-            state=mep.get("country"),
-            party=mep.get("political_group") or None,
-        )
+
+        if not politician_id:
+            politician_id = await run_db(
+                find_or_create_politician,
+                supabase, **_mep_descriptor(mep), index=get_politician_index(),
+            )
 
         if not politician_id:
             self.logger.warning(f"Failed to upsert MEP: {full_name}")
@@ -314,8 +442,17 @@ class EUParliamentETLService(BaseETLService):
             f"Found {len(declarations)} declarations for {full_name}"
         )
 
+        skipped_known = 0
         for decl in declarations:
             decl_date = decl.get("date", "")
+            pdf_url = decl["pdf_url"]
+            if known is not None and (
+                pdf_url in known
+                or (decl_date and f"DPI-{mep_id}-{decl_date}" in known)
+            ):
+                skipped_known += 1
+                continue
+
             if decl_date and year_start:
                 try:
                     if int(decl_date[:4]) < year_start:
@@ -326,14 +463,13 @@ class EUParliamentETLService(BaseETLService):
                 except (ValueError, IndexError):
                     pass
 
-            pdf_url = decl["pdf_url"]
             self.logger.info(f"Downloading PDF: {pdf_url}")
             pdf_bytes = await client.download_pdf(pdf_url)
             if not pdf_bytes:
                 self.logger.warning(f"Failed to download PDF: {pdf_url}")
                 continue
 
-            text = extract_text_from_pdf(pdf_bytes)
+            text = await extract_text(pdf_bytes)
             if not text:
                 self.logger.warning(f"No text extracted from PDF: {pdf_url}")
                 continue
@@ -342,6 +478,8 @@ class EUParliamentETLService(BaseETLService):
             self.logger.info(
                 f"Extracted {len(interests)} interests from {pdf_url}"
             )
+            if not interests and known is not None:
+                known.add(pdf_url)
 
             declaration_date = decl.get("date") or datetime.now(
                 timezone.utc
@@ -370,6 +508,10 @@ class EUParliamentETLService(BaseETLService):
                     "section": interest["section"],
                 })
 
+        if skipped_known:
+            self.logger.info(
+                f"Skipped {skipped_known} already-ingested declarations for {full_name}"
+            )
         return records
 
     async def run(
@@ -385,7 +527,11 @@ class EUParliamentETLService(BaseETLService):
         Overrides BaseETLService.run() to upload each MEP's records
         immediately after extraction. This ensures partial progress
         survives process restarts (Fly.io machine cycling) instead of
-        losing ~60 minutes of work when all 736 MEPs are buffered.
+        losing the whole run when all 736+ MEPs are buffered.
+
+        MEP_WORKERS MEPs are processed concurrently; each worker uploads
+        its MEP's records as soon as they are extracted, and progress
+        counts MEPs finished.
         """
         result = ETLResult(started_at=datetime.now(timezone.utc))
         self._job_status[job_id] = JobStatus(
@@ -407,7 +553,8 @@ class EUParliamentETLService(BaseETLService):
                 self._job_status[job_id].message = "Supabase client not available"
                 return result
 
-            async with EUParliamentClient() as client:
+            limiter = _request_limiter()
+            async with EUParliamentClient(limiter=limiter) as client:
                 # Map run(limit=N) to limit_meps for EU ETL
                 if limit and not kwargs.get("limit_meps"):
                     kwargs["limit_meps"] = limit
@@ -426,67 +573,58 @@ class EUParliamentETLService(BaseETLService):
 
                 total_meps = len(meps)
                 self.update_job_status(job_id, total=total_meps)
+
+                self.update_job_status(job_id, message="Resolving MEP politicians...")
+                politician_ids = await self._resolve_mep_politicians(supabase, meps)
+                if kwargs.get("incremental") and not update_mode:
+                    self.update_job_status(job_id, message="Loading already-ingested declarations...")
+                known = await self._load_known_declarations(
+                    supabase, update_mode=update_mode, **kwargs
+                )
                 self.logger.info(
-                    f"Processing {total_meps} MEPs with incremental upload"
+                    f"Processing {total_meps} MEPs with incremental upload "
+                    f"({min(MEP_WORKERS, total_meps)} workers)"
                 )
 
-                for i, mep in enumerate(meps):
-                    mep_name = mep["full_name"]
-                    self.update_job_status(
-                        job_id, progress=i + 1,
-                        message=(
-                            f"MEP {i + 1}/{total_meps}: {mep_name} "
-                            f"({result.records_inserted + result.records_updated} uploaded)"
-                        ),
-                    )
+                completed = 0
 
+                async def process(i: int, mep: Dict[str, Any]) -> None:
+                    nonlocal completed
+                    mep_name = mep["full_name"]
                     try:
                         records = await self._fetch_mep_records(
-                            client, supabase, mep, year_start
+                            client, supabase, mep, year_start,
+                            politician_id=politician_ids.get(mep["mep_id"]),
+                            known=known,
                         )
                     except Exception as e:
+                        records = []
                         result.records_failed += 1
                         result.add_error(
                             f"Failed to fetch MEP {mep_name}: {e}"
                         )
-                        continue
 
                     # Upload this MEP's records immediately
-                    for record in records:
-                        result.records_processed += 1
-                        try:
-                            parsed = await self.parse_disclosure(record)
-                            if not parsed:
-                                result.records_skipped += 1
-                                continue
-
-                            if not await self.validate_disclosure(parsed):
-                                result.records_skipped += 1
-                                continue
-
-                            disclosure_id = await self.upload_disclosure(
-                                parsed, update_mode=update_mode
-                            )
-
-                            if disclosure_id:
-                                if update_mode:
-                                    result.records_updated += 1
-                                else:
-                                    result.records_inserted += 1
-                            else:
-                                result.records_skipped += 1
-
-                        except Exception as e:
-                            result.records_failed += 1
-                            result.add_error(f"Failed to upload: {e}")
+                    await self._upload_mep_records(records, result, update_mode)
 
+                    completed += 1
+                    self.update_job_status(
+                        job_id, progress=completed,
+                        message=(
+                            f"MEP {completed}/{total_meps}: {mep_name} "
+                            f"({result.records_inserted + result.records_updated} uploaded)"
+                        ),
+                    )
                     if records:
                         self.logger.info(
-                            f"MEP {i + 1}/{total_meps} {mep_name}: "
+                            f"MEP {completed}/{total_meps} {mep_name}: "
                             f"uploaded {len(records)} records "
                             f"(total: {result.records_inserted + result.records_updated})"
                         )
 
+                await for_each_concurrently(meps, process, workers=MEP_WORKERS)
+                self.logger.info(f"Request concurrency: {limiter.get_stats()}")
+
             # Complete
             result.completed_at = datetime.now(timezone.utc)
             self._job_status[job_id].status = "completed"
@@ -839,6 +977,86 @@ def _clean_entity_name(entity: str) -> str:
     return cleaned if cleaned else entity
 
 
+def fetch_ingested_declarations(supabase, since: Optional[str] = None) -> Set[str]:
+    """
+    Return the PDF URLs and doc_ids of EU declarations in trading_disclosures.
+
+    Paginates through every EU Parliament row, or only those created at or
+    after `since` (ISO timestamp) when given. Pages are ordered by id so
+    offsets stay stable between requests.
+    """
+    keys: Set[str] = set()
+    offset = 0
+
+    while True:
+        query = (
+            supabase.table("trading_disclosures")
+            .select("source_url, source_document_id")
+            .like("source_url", "%europarl.europa.eu%")
+        )
+        if since:
+            query = query.gte("created_at", since)
+        rows = (
+            query.order("id").range(offset, offset + INGESTED_PAGE_SIZE - 1).execute().data
+            or []
+        )
+
+        for row in rows:
+            keys.update(
+                key for key in (row.get("source_url"), row.get("source_document_id")) if key
+            )
+
+        if len(rows) < INGESTED_PAGE_SIZE:
+            break
+        offset += INGESTED_PAGE_SIZE
+
+    return keys
+
+
+def load_declaration_index(supabase) -> MutableSet[str]:
+    """
+    Return the processed EU declarations (PDF URLs and doc_ids), up to date.
+
+    With the persisted index, only rows created since its last sync are
+    fetched (all rows on first use). Without it (URL_INDEX_ENABLED=false or
+    unusable), falls back to an in-memory set from a full scan.
+    """
+    index = get_url_index(DECLARATION_INDEX)
+    if index is None:
+        return fetch_ingested_declarations(supabase)
+
+    scan_started = datetime.now(timezone.utc)
+    since = index.synced_at
+    added = index.update(fetch_ingested_declarations(supabase, since=since))
+    index.synced_at = (scan_started - DECLARATION_INDEX_SYNC_MARGIN).isoformat()
+
+    logger.info(
+        f"EU declaration index {'synced since ' + since if since else 'built'}: "
+        f"{added} new, {len(index)} total"
+    )
+    return index
+
+
+def _request_limiter() -> AdaptiveConcurrencyLimiter:
+    """Limiter shared by the MEP workers' EU Parliament requests."""
+    return AdaptiveConcurrencyLimiter(
+        initial=REQUEST_CONCURRENCY_INITIAL, max_limit=REQUEST_CONCURRENCY_MAX
+    )
+
+
+def _mep_descriptor(mep: Dict[str, Any]) -> Dict[str, Any]:
+    """Politician descriptor (find_or_create_politician kwargs) for an MEP."""
+    first_name, last_name = _split_mep_name(mep["full_name"])
+    return {
+        "name": mep["full_name"],
+        "first_name": first_name,
+        "last_name": last_name,
+        "chamber": "eu_parliament",
+        "state": mep.get("country"),
+        "party": mep.get("political_group") or None,
+    }
+
+
 def _split_mep_name(full_name: str) -> tuple:
     """
     Split an MEP name into first and last name.
@@ -13,13 +13,16 @@ interest declarations as downloadable PDFs on each MEP's profile page.
 import asyncio
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from xml.etree import ElementTree
 
 import httpx
 from bs4 import BeautifulSoup
 
+from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from app.lib.html_backend import parse_document, text_content, use_lxml
 from app.lib.party_registry import abbreviate_group_name
+from app.lib.pdf_cache import load_cached_pdf, store_cached_pdf
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +39,7 @@ REQUEST_DELAY_SECONDS = 1.5
 PDF_DELAY_SECONDS = 0.5
 MAX_RETRIES = 3
 BACKOFF_MULTIPLIER = 2.0
+THROTTLE_CODES = {429, 502, 503}
 
 
 class EUParliamentClient:
@@ -50,16 +54,22 @@ class EUParliamentClient:
                 decls = await client.fetch_declarations_page(
                     mep["mep_id"], mep["full_name"]
                 )
+
+    The client can be shared by concurrent tasks. Pass an
+    AdaptiveConcurrencyLimiter to cap how many declarations-page and PDF
+    requests are in flight at once; throttling responses shrink the cap.
     """
 
     def __init__(
         self,
         request_delay: float = REQUEST_DELAY_SECONDS,
         pdf_delay: float = PDF_DELAY_SECONDS,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
     ) -> None:
         self._client: Optional[httpx.AsyncClient] = None
         self._request_delay = request_delay
         self._pdf_delay = pdf_delay
+        self.limiter = limiter
 
     async def __aenter__(self) -> "EUParliamentClient":
         self._client = httpx.AsyncClient(
@@ -74,6 +84,19 @@ class EUParliamentClient:
             await self._client.aclose()
             self._client = None
 
+    async def _get(self, url: str) -> httpx.Response:
+        """GET a URL, holding a limiter slot if the client has a limiter."""
+        if self.limiter is None:
+            return await self._client.get(url)
+
+        async with self.limiter.slot():
+            response = await self._client.get(url)
+        if response.status_code in THROTTLE_CODES:
+            self.limiter.record_throttle()
+        elif response.status_code == 200:
+            self.limiter.record_success()
+        return response
+
     async def fetch_mep_list(self) -> List[Dict[str, str]]:
         """
         Fetch the full MEP list from the EU Parliament XML endpoint.
@@ -135,7 +158,7 @@ class EUParliamentClient:
         await asyncio.sleep(self._request_delay)
 
         try:
-            response = await self._client.get(url)
+            response = await self._get(url)
             if response.status_code == 404:
                 logger.debug(f"No declarations page for MEP {mep_name} ({mep_id})")
                 return []
@@ -150,6 +173,9 @@ class EUParliamentClient:
         """
         Download a PDF file with retry and backoff.
 
+        DPI PDFs are immutable once published; the local PDF cache is
+        consulted first so re-runs don't download them again.
+
         Args:
             url: Full URL to the PDF
 
@@ -158,18 +184,23 @@ class EUParliamentClient:
         """
         assert self._client is not None, "Client not initialized (use async with)"
 
+        cached = await load_cached_pdf(url)
+        if cached is not None:
+            return cached
+
         delay = self._pdf_delay
         for attempt in range(MAX_RETRIES):
             await asyncio.sleep(delay)
             try:
-                response = await self._client.get(url)
+                response = await self._get(url)
                 if response.status_code == 200:
                     content = response.content
                     if content and content[:5] == b"%PDF-":
+                        await store_cached_pdf(content, url)
                         return content
                     logger.warning(f"Downloaded content is not a valid PDF: {url}")
                     return None
-                elif response.status_code in {429, 503, 502}:
+                elif response.status_code in THROTTLE_CODES:
                     delay *= BACKOFF_MULTIPLIER
                     logger.warning(
                         f"Rate limited ({response.status_code}), "
@@ -260,6 +291,24 @@ def parse_mep_xml(xml_text: str) -> List[Dict[str, str]]:
     return meps
 
 
+def _extract_links_bs4(html: str) -> List[Tuple[str, str]]:
+    """(href, text) of every <a href> on a page, with BeautifulSoup."""
+    soup = BeautifulSoup(html, "html.parser")
+    return [(link["href"], link.get_text(strip=True)) for link in soup.find_all("a", href=True)]
+
+
+def _extract_links_lxml(html: str) -> List[Tuple[str, str]]:
+    """lxml equivalent of _extract_links_bs4()."""
+    doc = parse_document(html)
+    if doc is None:
+        return []
+    return [
+        (link.get("href"), text_content(link, strip=True))
+        for link in doc.iter("a")
+        if link.get("href") is not None
+    ]
+
+
 def parse_declarations_html(
     html: str, mep_id: str
 ) -> List[Dict[str, Any]]:
@@ -270,14 +319,15 @@ def parse_declarations_html(
     typically found in anchor tags within the declarations section.
     Links look like:
         /erpl-app-public/mep-documents/DPI/10/256810/...pdf
+
+    Uses the lxml backend unless HTML_PARSER_BACKEND=bs4; both give the
+    same output.
     """
     results: List[Dict[str, Any]] = []
-    soup = BeautifulSoup(html, "html.parser")
+    links = _extract_links_lxml(html) if use_lxml() else _extract_links_bs4(html)
 
     # Find all links that point to DPI PDFs
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-
+    for href, text in links:
         # Match DPI document links
         if "/DPI/" not in href and "dpi" not in href.lower():
             continue
@@ -294,7 +344,7 @@ def parse_declarations_html(
             continue
 
         # Extract label text from the link or surrounding context
-        label = link.get_text(strip=True) or "Declaration"
+        label = text or "Declaration"
 
         # Try to extract date from URL or label
         date = _extract_date_from_url(href) or _extract_date_from_text(label)
@@ -3,7 +3,7 @@ Feature Pipeline Service
 
 Extracts features and labels for ML model training from:
 - Trading disclosures (Supabase)
-- Stock price data (yfinance)
+- Stock price data (yfinance, via the local price store)
 - News sentiment (Ollama LLM)
 """
 
@@ -11,12 +11,13 @@ import os
 import asyncio
 import logging
 from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime, timedelta, timezone
-from collections import defaultdict, Counter
+from datetime import date, datetime, timedelta, timezone
 
 import numpy as np
 import pandas as pd
+from app.lib.async_db import MLModelsRepository, TradingDisclosuresRepository, execute_async
 from app.lib.database import get_supabase
+from app.lib.price_store import get_prices
 from app.models.training_config import TrainingConfig, DEFAULT_THRESHOLDS_5CLASS
 from app.services.llm.client import LLMClient
 
@@ -80,6 +81,76 @@ def generate_label(
             return 0
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+# Fields _aggregate_by_week() reads from each disclosure
+_DISCLOSURE_COLUMNS = [
+    'asset_ticker', 'transaction_type', 'amount_range_min', 'amount_range_max',
+    'transaction_date', 'disclosure_date', 'politician_id', 'politician',
+]
+
+
+def _amounts(values: pd.Series) -> np.ndarray:
+    """Amount column as floats, with missing amounts as 0."""
+    return pd.to_numeric(values, errors='coerce').fillna(0).to_numpy(dtype=float)
+
+
+def _map_distinct(values, func, dtype=float) -> np.ndarray:
+    """Apply `func` once per distinct value and broadcast the results back to every position."""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+    return np.array([func(None if pd.isna(u) else u) for u in uniques], dtype=dtype)[codes]
+
+
+def _normalize_ticker(value: Optional[str]) -> Optional[str]:
+    """Upper-case ticker, or None if missing or too long to be real."""
+    ticker = (value or '').upper()
+    return ticker if ticker and len(ticker) <= 10 else None
+
+
+def _trade_direction(value: Optional[str]) -> int:
+    """1 for a purchase, -1 for a sale, 0 for anything else."""
+    tx_type = (value or '').lower()
+    if 'purchase' in tx_type or 'buy' in tx_type:
+        return 1
+    if 'sale' in tx_type or 'sell' in tx_type:
+        return -1
+    return 0
+
+
+def _chamber_key(value: Any) -> int:
+    """1 for the House, 2 for the Senate, 0 otherwise."""
+    chamber = value.lower() if isinstance(value, str) else value
+    return {'house': 1, 'senate': 2}.get(chamber, 0)
+
+
+def _parse_disclosure_date(value: Optional[str]) -> Tuple[float, float, float]:
+    """
+    Parse an ISO date or timestamp into (ordinal of the Monday of its ISO
+    week, microseconds since the epoch, 1 if it has a UTC offset else 0).
+    Weeks follow the value's own calendar date; naive timestamps are taken
+    as UTC. NaNs if unparseable.
+    """
+    if not value:
+        return np.nan, np.nan, np.nan
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return np.nan, np.nan, np.nan
+    day = dt.date()
+    aware = dt.tzinfo is not None
+    if not aware:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return day.toordinal() - day.weekday(), (dt - _EPOCH) // timedelta(microseconds=1), float(aware)
+
+
+def _raise_for_date(values: pd.Series) -> None:
+    """Raise what datetime.fromisoformat() raises for the first of `values`, if any."""
+    if len(values):
+        value = values.iloc[0]
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
 class FeaturePipeline:
     """
     Pipeline for extracting features and labels from trading disclosures.
@@ -279,12 +350,8 @@ class FeaturePipeline:
         end_date = datetime.now(timezone.utc) - timedelta(days=exclude_recent_days)
         start_date = end_date - timedelta(days=lookback_days)
 
-        all_disclosures = []
-        page_size = 1000
-        offset = 0
-
-        while True:
-            result = self.supabase.table('trading_disclosures').select(
+        return await TradingDisclosuresRepository(self.supabase).fetch_all(
+            lambda query: query.select(
                 'id, asset_ticker, transaction_type, amount_range_min, amount_range_max, '
                 'transaction_date, disclosure_date, politician_id, '
                 'politician:politicians(id, full_name, party, state, chamber)'
@@ -292,18 +359,9 @@ class FeaturePipeline:
                 'transaction_date', start_date.date().isoformat()
             ).lte(
                 'transaction_date', end_date.date().isoformat()
-            ).range(offset, offset + page_size - 1).execute()
-
-            if not result.data:
-                break
-
-            all_disclosures.extend(result.data)
-            offset += len(result.data)
-
-            if len(result.data) < page_size:
-                break
-
-        return all_disclosures
+            ),
+            page_size=1000,
+        )
 
     async def _fetch_outcome_data(self, window_days: int = 90) -> list:
         """Fetch closed trade outcomes from signal_outcomes for training labels."""
@@ -312,13 +370,12 @@ class FeaturePipeline:
 
         cutoff = (datetime.now() - timedelta(days=window_days)).strftime("%Y-%m-%d")
 
-        result = (
+        result = await execute_async(
             self.supabase.table("signal_outcomes")
             .select("ticker, signal_type, signal_confidence, outcome, return_pct, "
                     "entry_price, exit_price, holding_days, features, signal_date")
             .in_("outcome", ["win", "loss", "breakeven"])
             .gte("signal_date", cutoff)
-            .execute()
         )
 
         return result.data or []
@@ -328,112 +385,158 @@ class FeaturePipeline:
         disclosures: List[Dict[str, Any]],
         min_politicians: int,
     ) -> List[Dict[str, Any]]:
-        """Aggregate disclosures by ticker per week."""
-        weekly_data = defaultdict(lambda: defaultdict(list))
-
-        for d in disclosures:
-            ticker = d.get('asset_ticker', '').upper()
-            if not ticker or len(ticker) > 10:
-                continue
-
-            tx_date = datetime.fromisoformat(d['transaction_date'].replace('Z', '+00:00'))
-            week_key = tx_date.isocalendar()[:2]
+        """
+        Aggregate disclosures by ticker per ISO week.
+
+        Disclosures are loaded into one DataFrame of integer-coded columns
+        and every statistic is a groupby over it. Tickers, transaction
+        types and dates repeat heavily, so each distinct value is parsed
+        once and broadcast back to its rows. Groups come out in order of
+        first appearance.
+
+        Raises:
+            ValueError, AttributeError: A disclosure with a valid ticker has
+                an unreadable transaction_date, or has both dates and an
+                unreadable disclosure_date
+            TypeError: A disclosure's dates mix naive and offset-aware values
+        """
+        if not disclosures:
+            return []
 
-            weekly_data[(ticker, week_key)]['disclosures'].append(d)
+        raw = pd.DataFrame.from_records(disclosures, columns=_DISCLOSURE_COLUMNS)
+        politicians = [p if isinstance(p, dict) else {} for p in raw['politician'].tolist()]
+
+        ticker, ticker_names = pd.factorize(pd.Series(
+            _map_distinct(raw['asset_ticker'], _normalize_ticker, object), dtype=object
+        ))
+        week, tx_utc, tx_aware = _map_distinct(raw['transaction_date'], _parse_disclosure_date).T
+        disc_utc, disc_aware = _map_distinct(raw['disclosure_date'], _parse_disclosure_date)[:, 1:].T
+
+        # Bad dates fail the run, as they did when rows were parsed one by one
+        kept = ticker >= 0
+        _raise_for_date(raw['transaction_date'][kept & np.isnan(week)])
+        both_dates = (
+            kept
+            & _map_distinct(raw['transaction_date'], bool, bool)
+            & _map_distinct(raw['disclosure_date'], bool, bool)
+        )
+        _raise_for_date(raw['disclosure_date'][both_dates & np.isnan(disc_utc)])
+        if np.any(both_dates & (tx_aware != disc_aware)):
+            raise TypeError("can't subtract offset-naive and offset-aware datetimes")
+
+        direction = _map_distinct(raw['transaction_type'], _trade_direction, int)
+        amount_min = _amounts(raw['amount_range_min'])
+        amount_max = _amounts(raw['amount_range_max'])
+        volume = (amount_min + np.where(amount_max != 0, amount_max, amount_min)) / 2
+        delay = np.floor_divide(disc_utc - tx_utc, 86_400_000_000.0)
+        politician, _ = pd.factorize(raw['politician_id'].where(raw['politician_id'].astype(bool)))
+        party, party_names = pd.factorize(pd.Series([p.get('party') or None for p in politicians], dtype=object))
+        chamber = _map_distinct([p.get('chamber') for p in politicians], _chamber_key, int)
+
+        df = pd.DataFrame({
+            'ticker': ticker,
+            'week': week,
+            'politician': np.where(politician >= 0, politician, np.nan),
+            'party': party,
+            'buy': direction == 1,
+            'sell': direction == -1,
+            'buy_volume': np.where(direction == 1, volume, 0.0),
+            'sell_volume': np.where(direction == -1, volume, 0.0),
+            'delay': np.where(delay >= 0, delay, np.nan),
+            'house': chamber == 1,
+            'senate': chamber == 2,
+        })
+        df = df[(df['ticker'] >= 0) & df['week'].notna()]
+        if df.empty:
+            return []
 
-        aggregations = []
+        keys = ['ticker', 'week']
+        stats = df.groupby(keys, sort=False).agg(
+            disclosure_count=('ticker', 'size'),
+            politician_count=('politician', 'nunique'),
+            buy_count=('buy', 'sum'),
+            sell_count=('sell', 'sum'),
+            buy_volume=('buy_volume', 'sum'),
+            sell_volume=('sell_volume', 'sum'),
+            has_house=('house', 'any'),
+            has_senate=('senate', 'any'),
+            avg_disclosure_delay=('delay', 'mean'),
+        )
+        stats = stats[stats['politician_count'] >= min_politicians]
+        if stats.empty:
+            return []
 
-        for (ticker, week_key), data in weekly_data.items():
-            disclosures_list = data['disclosures']
-            if not disclosures_list:
-                continue
+        # Trades per party for each group
+        party_counts = (
+            df[df['party'] >= 0].groupby(keys + ['party'], sort=False).size()
+            .unstack(fill_value=0)
+            .reindex(index=stats.index, fill_value=0)
+        )
 
-            buys = 0
-            sells = 0
-            buy_volume = 0
-            sell_volume = 0
-            politicians = set()
-            parties = set()
-            party_counts = Counter()
-            chambers = set()
-            disclosure_delays = []
-
-            for d in disclosures_list:
-                tx_type = (d.get('transaction_type') or '').lower()
-                min_val = d.get('amount_range_min') or 0
-                max_val = d.get('amount_range_max') or min_val
-                volume = (min_val + max_val) / 2
-
-                if 'purchase' in tx_type or 'buy' in tx_type:
-                    buys += 1
-                    buy_volume += volume
-                elif 'sale' in tx_type or 'sell' in tx_type:
-                    sells += 1
-                    sell_volume += volume
-
-                if d.get('politician_id'):
-                    politicians.add(d['politician_id'])
-
-                politician_data = d.get('politician') or {}
-                party = politician_data.get('party')
-                if party:
-                    parties.add(party)
-                    party_counts[party] += 1
-
-                chamber = politician_data.get('chamber')
-                if chamber:
-                    chambers.add(chamber.lower() if isinstance(chamber, str) else chamber)
-
-                if d.get('transaction_date') and d.get('disclosure_date'):
-                    tx_dt = datetime.fromisoformat(d['transaction_date'].replace('Z', '+00:00'))
-                    disc_dt = datetime.fromisoformat(d['disclosure_date'].replace('Z', '+00:00'))
-                    delay = (disc_dt - tx_dt).days
-                    if delay >= 0:
-                        disclosure_delays.append(delay)
-
-            if len(politicians) < min_politicians:
-                continue
+        # Party consensus: share of party-attributed trades from the largest party
+        party_totals = party_counts.sum(axis=1)
+        party_alignment = (party_counts.max(axis=1) / party_totals.where(party_totals > 0)).fillna(0.5)
+
+        # Each group's parties, added to a set in order of first appearance so
+        # list(parties) comes out exactly as it did when rows were added one by one
+        party_names = party_names.tolist()
+        first_parties = (
+            df.loc[df['party'] >= 0, keys + ['party']].drop_duplicates()
+            .groupby(keys, sort=False)['party'].agg(list)
+            .reindex(stats.index)
+        )
+        party_sets = [
+            {party_names[code] for code in codes} if isinstance(codes, list) else set()
+            for codes in first_parties.tolist()
+        ]
+
+        # Chamber-based committee_relevance proxy
+        committee_relevance = np.select(
+            [stats['has_house'] & ~stats['has_senate'], stats['has_senate'] & ~stats['has_house']],
+            [0.7, 0.4],
+            0.5,
+        )
 
-            year, week_num = week_key
-            week_start = datetime.fromisocalendar(year, week_num, 1)
+        buys, sells = stats['buy_count'], stats['sell_count']
+        buy_sell_ratio = np.where(sells > 0, buys / sells.where(sells > 0), np.where(buys > 0, 10, 1))
+        weeks = stats.index.get_level_values('week')
 
-            # Real party_alignment: consensus measure (0.5 = split, 1.0 = all same party)
-            total_party_trades = sum(party_counts.values())
-            if total_party_trades > 0:
-                party_alignment = max(party_counts.values()) / total_party_trades
-            else:
-                party_alignment = 0.5
-
-            # Real committee_relevance: chamber-based proxy
-            has_house = 'house' in chambers
-            has_senate = 'senate' in chambers
-            if has_house and not has_senate:
-                committee_relevance = 0.7
-            elif has_senate and not has_house:
-                committee_relevance = 0.4
-            elif has_house and has_senate:
-                committee_relevance = 0.5
-            else:
-                committee_relevance = 0.5
-
-            aggregations.append({
+        aggregations = [
+            {
                 'ticker': ticker,
-                'week_start': week_start.date().isoformat(),
-                'politician_count': len(politicians),
-                'buy_count': buys,
-                'sell_count': sells,
-                'buy_sell_ratio': buys / sells if sells > 0 else (10 if buys > 0 else 1),
+                'week_start': week_start,
+                'politician_count': politician_count,
+                'buy_count': buy_count,
+                'sell_count': sell_count,
+                'buy_sell_ratio': ratio,
                 'buy_volume': buy_volume,
                 'sell_volume': sell_volume,
                 'net_volume': buy_volume - sell_volume,
                 'total_volume': buy_volume + sell_volume,
                 'bipartisan': 'D' in parties and 'R' in parties,
                 'parties': list(parties),
-                'party_alignment': party_alignment,
-                'committee_relevance': committee_relevance,
-                'avg_disclosure_delay': np.mean(disclosure_delays) if disclosure_delays else 30,
-                'disclosure_count': len(disclosures_list),
-            })
+                'party_alignment': alignment,
+                'committee_relevance': relevance,
+                'avg_disclosure_delay': avg_delay,
+                'disclosure_count': disclosure_count,
+            }
+            for ticker, week_start, politician_count, buy_count, sell_count, ratio, buy_volume,
+            sell_volume, parties, alignment, relevance, avg_delay, disclosure_count in zip(
+                ticker_names.take(stats.index.get_level_values('ticker')).tolist(),
+                _map_distinct(weeks, lambda week: date.fromordinal(int(week)).isoformat(), object).tolist(),
+                stats['politician_count'].tolist(),
+                buys.tolist(),
+                sells.tolist(),
+                buy_sell_ratio.tolist(),
+                stats['buy_volume'].tolist(),
+                stats['sell_volume'].tolist(),
+                party_sets,
+                party_alignment.tolist(),
+                committee_relevance.tolist(),
+                stats['avg_disclosure_delay'].fillna(30).tolist(),
+                stats['disclosure_count'].tolist(),
+            )
+        ]
 
         return aggregations
 
@@ -443,12 +546,6 @@ class FeaturePipeline:
         config: Optional[TrainingConfig] = None,
     ) -> List[Dict[str, Any]]:
         """Add forward stock returns and market regime data to aggregations."""
-        try:
-            import yfinance as yf
-        except ImportError:
-            logger.warning("yfinance not installed - skipping stock returns")
-            return aggregations
-
         if config is None:
             config = TrainingConfig()
 
@@ -468,30 +565,10 @@ class FeaturePipeline:
 
         all_tickers = tickers + [t for t in extra_tickers if t not in tickers]
 
-        # Fetch in batches
-        price_data = {}
-        batch_size = 100
-
-        for i in range(0, len(all_tickers), batch_size):
-            batch = all_tickers[i:i + batch_size]
-            try:
-                data = yf.download(
-                    batch,
-                    start=min_date.strftime('%Y-%m-%d'),
-                    end=max_date.strftime('%Y-%m-%d'),
-                    progress=False,
-                    group_by='ticker',
-                )
-
-                if len(batch) == 1:
-                    price_data[batch[0]] = data['Close']
-                else:
-                    for ticker in batch:
-                        if ticker in data.columns.get_level_values(0):
-                            price_data[ticker] = data[ticker]['Close']
-
-            except Exception as e:
-                logger.warning(f"Failed to fetch batch starting at {i}: {e}")
+        # Served from the local price store; only uncovered dates are downloaded.
+        # Disk reads and yfinance downloads block, so run them off the loop.
+        prices = await asyncio.to_thread(get_prices, all_tickers, min_date.date(), max_date.date())
+        price_data = {ticker: frame['Close'].dropna() for ticker, frame in prices.items()}
 
         # Calculate returns for each aggregation
         for agg in aggregations:
@@ -771,22 +848,22 @@ class TrainingJob:
         self.progress = 10
 
         try:
-            supabase = get_supabase()
+            ml_models = MLModelsRepository(get_supabase())
 
             config = self.config
             hyperparams_dict = config.to_hyperparameters_dict()
 
             # Create model record in database
-            model_result = supabase.table('ml_models').insert({
+            created = await ml_models.insert({
                 'model_name': f'congress_signal_{self.job_id}',
                 'model_version': '1.0.0',
                 'model_type': self.model_type,
                 'status': 'training',
                 'training_started_at': self.started_at.isoformat(),
                 'hyperparameters': hyperparams_dict,
-            }).execute()
+            })
 
-            self.model_id = model_result.data[0]['id']
+            self.model_id = created[0]['id']
 
             # Prepare training data with config
             pipeline = FeaturePipeline()
@@ -807,9 +884,10 @@ class TrainingJob:
             self.current_step = "Training model..."
             self.progress = 50
 
-            # Train model with config
+            # Train model with config (CPU-bound, so off the event loop)
             model = CongressSignalModel()
-            training_result = model.train(
+            training_result = await asyncio.to_thread(
+                model.train,
                 features_df,
                 labels,
                 hyperparams=config.hyperparams,
@@ -821,11 +899,11 @@ class TrainingJob:
             self.progress = 80
 
             model_path = f"{MODEL_STORAGE_PATH}/{self.model_id}.pkl"
-            model.save(model_path)
+            await asyncio.to_thread(model.save, model_path)
 
             self.current_step = "Uploading to storage..."
             self.progress = 85
-            storage_path = upload_model_to_storage(self.model_id, model_path)
+            storage_path = await asyncio.to_thread(upload_model_to_storage, self.model_id, model_path)
             if storage_path:
                 logger.info(f"[{self.job_id}] Model uploaded to storage: {storage_path}")
             else:
@@ -835,7 +913,7 @@ class TrainingJob:
             stored_hyperparams = training_result['hyperparameters']
             stored_hyperparams.update(hyperparams_dict)
 
-            supabase.table('ml_models').update({
+            await ml_models.update({
                 'status': 'active',
                 'training_completed_at': datetime.now(timezone.utc).isoformat(),
                 'metrics': training_result['metrics'],
@@ -844,12 +922,10 @@ class TrainingJob:
                 'model_artifact_path': model_path,
                 'training_samples': int(training_result['metrics']['training_samples']),
                 'validation_samples': int(training_result['metrics']['validation_samples']),
-            }).eq('id', self.model_id).execute()
+            }, id=self.model_id)
 
             # Archive previous active models
-            supabase.table('ml_models').update({
-                'status': 'archived',
-            }).eq('status', 'active').neq('id', self.model_id).execute()
+            await ml_models.archive_active(keep_id=self.model_id)
 
             self.status = "completed"
             self.progress = 100
@@ -866,10 +942,10 @@ class TrainingJob:
 
             if self.model_id:
                 try:
-                    supabase.table('ml_models').update({
+                    await ml_models.update({
                         'status': 'failed',
                         'error_message': str(e),
-                    }).eq('id', self.model_id).execute()
+                    }, id=self.model_id)
                 except Exception:
                     pass
 
@@ -6,13 +6,16 @@ Extracts real disclosure data from government PDFs and uploads to Supabase.
 """
 
 import asyncio
+import hashlib
 import io
+import json
 import logging
 import os
 import re
 import zipfile
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import httpx
 from supabase import Client
@@ -25,10 +28,22 @@ from app.lib.parser import (
     clean_asset_name,
     is_header_row,
 )
-from app.lib.database import get_supabase, upload_transaction_to_supabase, refresh_materialized_views
-from app.lib.pdf_utils import extract_text_from_pdf, extract_tables_from_pdf
-from app.lib.politician import find_or_create_politician
-from app.lib.job_logger import log_job_execution, cleanup_old_executions
+from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from app.lib.async_db import (
+    JobExecutionsRepository,
+    PoliticiansRepository,
+    TradingDisclosuresRepository,
+    run_db,
+)
+from app.lib.database import get_supabase, refresh_materialized_views
+from app.lib.pdf_cache import load_cached_pdf, store_cached_pdf
+from app.lib.source_cache import get_source_cache
+from app.lib.parse_cache import load_parsed, store_parsed
+from app.lib.pdf_extraction import extract_tables
+from app.lib.pdf_utils import extract_text_from_pdf
+from app.lib.politician import politician_key
+from app.lib.politician_index import get_politician_index
+from app.lib.worker_pool import STAGE_DONE, run_stage, run_together
 
 # Setup logging
 logging.basicConfig(
@@ -54,49 +69,68 @@ MAX_RETRIES: int = 5  # Maximum retries per request
 BACKOFF_MULTIPLIER: float = 2.0  # Exponential backoff multiplier
 RATE_LIMIT_CODES: Set[int] = {429, 503, 502, 504}  # HTTP codes that trigger backoff
 
+# Page size when loading already-ingested doc_ids for incremental runs
+INGESTED_PAGE_SIZE: int = 1000
+
+# Concurrent PDF pipeline configuration
+PDF_CONCURRENCY_INITIAL: int = int(os.environ.get("HOUSE_PDF_CONCURRENCY_INITIAL", "2"))
+PDF_CONCURRENCY_MAX: int = int(os.environ.get("HOUSE_PDF_CONCURRENCY_MAX", "8"))
+PDF_PARSE_WORKERS: int = int(os.environ.get("HOUSE_PDF_PARSE_WORKERS", "2"))
+PDF_UPLOAD_WORKERS: int = int(os.environ.get("HOUSE_PDF_UPLOAD_WORKERS", "2"))
+PDF_QUEUE_SIZE: int = 50  # Max downloaded/parsed PDFs buffered between stages
+PDF_RESOLVE_BATCH: int = 20  # Max parsed PDFs whose filers are resolved together
+
 # Free legislator dataset (no API key required)
 LEGISLATORS_URL: str = "https://theunitedstates.io/congress-legislators/legislators-current.json"
 
 
+def _build_party_map(body: bytes) -> Dict[str, str]:
+    """Build the party lookup from legislators-current.json content."""
+    legislators = json.loads(body)
+    party_map: Dict[str, str] = {}
+    party_codes = {"Democrat": "D", "Republican": "R", "Independent": "I"}
+
+    for legislator in legislators:
+        name = legislator.get("name", {})
+        last = name.get("last", "").lower().strip()
+        first = name.get("first", "").lower().strip()
+        terms = legislator.get("terms", [])
+        if not terms or not last:
+            continue
+
+        current_term = terms[-1]
+        party_raw = current_term.get("party", "")
+        party_code = party_codes.get(party_raw, "")
+        if not party_code:
+            continue
+
+        state = current_term.get("state", "").upper()
+        # Index by (last, first) and (last, state) for flexible matching
+        party_map[f"{last}|{first}"] = party_code
+        if state:
+            party_map[f"{last}|{state}"] = party_code
+            party_map[f"{last}|{first}|{state}"] = party_code
+
+    logger.info(f"Parsed party data for {len(legislators)} legislators")
+    return party_map
+
+
 async def fetch_member_party_map(client: httpx.AsyncClient) -> Dict[str, str]:
     """Fetch party affiliations from @unitedstates legislators dataset.
 
     Returns a mapping of (last_name_lower, first_name_lower) and
     (last_name_lower, state) to party code ('D', 'R', 'I').
     Used to enrich House disclosures that don't include party info.
+    The file is revalidated with a conditional GET through the source cache.
     """
     try:
-        resp = await client.get(LEGISLATORS_URL, timeout=30.0)
-        if resp.status_code != 200:
-            logger.warning(f"Failed to fetch legislators data: HTTP {resp.status_code}")
+        party_map = await get_source_cache().get_parsed(
+            LEGISLATORS_URL, _build_party_map, client=client,
+            parse_key="party-map", timeout=30.0,
+        )
+        if party_map is None:
+            logger.warning("Failed to fetch legislators data")
             return {}
-
-        legislators = resp.json()
-        party_map: Dict[str, str] = {}
-        party_codes = {"Democrat": "D", "Republican": "R", "Independent": "I"}
-
-        for legislator in legislators:
-            name = legislator.get("name", {})
-            last = name.get("last", "").lower().strip()
-            first = name.get("first", "").lower().strip()
-            terms = legislator.get("terms", [])
-            if not terms or not last:
-                continue
-
-            current_term = terms[-1]
-            party_raw = current_term.get("party", "")
-            party_code = party_codes.get(party_raw, "")
-            if not party_code:
-                continue
-
-            state = current_term.get("state", "").upper()
-            # Index by (last, first) and (last, state) for flexible matching
-            party_map[f"{last}|{first}"] = party_code
-            if state:
-                party_map[f"{last}|{state}"] = party_code
-                party_map[f"{last}|{first}|{state}"] = party_code
-
-        logger.info(f"Fetched party data for {len(legislators)} legislators")
         return party_map
     except Exception as e:
         logger.warning(f"Error fetching party data: {e}")
@@ -167,6 +201,46 @@ def _backfill_null_parties(supabase: Client, party_map: Dict[str, str]) -> int:
         return 0
 
 
+def fetch_ingested_doc_ids(
+    supabase: Client, year: int, page_size: int = INGESTED_PAGE_SIZE
+) -> Optional[Set[str]]:
+    """Return the doc_ids of a year's PTRs already stored in trading_disclosures.
+
+    PTR rows carry their PDF URL (.../ptr-pdfs/{year}/{doc_id}.pdf) and the
+    doc_id in source_document_id, so one paginated query over the year's URL
+    prefix yields every ingested filing.
+
+    Returns:
+        Set of doc_ids, or None if the lookup failed (callers should then
+        process everything rather than skip blindly)
+    """
+    url_pattern = PTR_PDF_URL_TEMPLATE.format(base_url=HOUSE_BASE_URL, year=year, doc_id="%")
+    doc_ids: Set[str] = set()
+    offset = 0
+    try:
+        while True:
+            response = (
+                supabase.table("trading_disclosures")
+                .select("source_document_id")
+                .like("source_url", url_pattern)
+                .not_.is_("source_document_id", "null")
+                .order("id")
+                .range(offset, offset + page_size - 1)
+                .execute()
+            )
+            rows = response.data or []
+            doc_ids.update(str(row["source_document_id"]) for row in rows if row.get("source_document_id"))
+            if len(rows) < page_size:
+                break
+            offset += page_size
+    except Exception as e:
+        logger.warning(f"Could not load ingested House doc_ids for {year}: {e}")
+        return None
+
+    logger.info(f"Found {len(doc_ids)} already-ingested PTRs for {year}")
+    return doc_ids
+
+
 class RateLimiter:
     """Adaptive rate limiter with exponential backoff."""
 
@@ -546,15 +620,36 @@ class HouseDisclosureScraper:
     async def fetch_pdf(
         client: httpx.AsyncClient,
         pdf_url: str,
-        max_retries: int = MAX_RETRIES
+        max_retries: int = MAX_RETRIES,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        doc_id: Optional[str] = None,
     ) -> Optional[bytes]:
-        """Download a PDF document with exponential backoff retry."""
+        """Download a PDF document with exponential backoff retry.
+
+        Filed PDFs are immutable, so the local PDF cache is consulted first
+        and a cache hit skips the network (and the rate limiter) entirely.
+
+        Without a limiter, every request waits rate_limiter.current_delay.
+        With one, the request instead waits for a slot under the limiter's
+        adaptive concurrency limit, and its outcome adjusts that limit.
+        """
+        cached = await load_cached_pdf(pdf_url, doc_id=doc_id)
+        if cached is not None:
+            return cached
+
         for attempt in range(max_retries):
             try:
-                # Wait according to rate limiter before making request
-                await rate_limiter.wait()
-
-                response = await client.get(pdf_url)
+                if limiter is None:
+                    # Wait according to rate limiter before making request
+                    await rate_limiter.wait()
+                    response = await client.get(pdf_url)
+                else:
+                    async with limiter.slot():
+                        response = await client.get(pdf_url)
+                        if response.status_code in RATE_LIMIT_CODES:
+                            limiter.record_throttle()
+                        elif response.status_code == 200:
+                            limiter.record_success()
 
                 if response.status_code == 200:
                     content = response.content
@@ -564,6 +659,7 @@ class HouseDisclosureScraper:
                         return None
 
                     rate_limiter.record_success()
+                    await store_cached_pdf(content, pdf_url, doc_id=doc_id)
                     return content
 
                 elif response.status_code in RATE_LIMIT_CODES:
@@ -577,6 +673,11 @@ class HouseDisclosureScraper:
                             await asyncio.sleep(wait_time)
                         except ValueError:
                             pass
+                    elif limiter is not None:
+                        # No fixed inter-request delay in concurrent mode; back off this retry
+                        await asyncio.sleep(
+                            min(REQUEST_DELAY_MAX, REQUEST_DELAY_BASE * BACKOFF_MULTIPLIER ** attempt)
+                        )
                     if attempt < max_retries - 1:
                         logger.warning(f"Retry {attempt + 1}/{max_retries} for {pdf_url}")
                         continue
@@ -626,6 +727,27 @@ class HouseDisclosureScraper:
             with z.open(txt_filename) as f:
                 return f.read().decode("utf-8", errors="ignore")
 
+    @staticmethod
+    def iter_index_lines(zip_file: Union[str, Path, BinaryIO], year: int) -> Iterator[str]:
+        """
+        Yield the disclosure index's lines straight out of the ZIP.
+
+        The index is decompressed incrementally, so neither the archive nor
+        the decoded TSV is ever held in memory as a whole.
+
+        Args:
+            zip_file: Path to, or seekable binary file of, the {year}FD.ZIP
+
+        Raises:
+            KeyError: If the archive has no {year}FD.txt
+            zipfile.BadZipFile: If the archive is corrupt
+        """
+        with zipfile.ZipFile(zip_file) as z:
+            with z.open(f"{year}FD.txt") as raw:
+                # newline="\n" splits exactly where str.split("\n") did
+                with io.TextIOWrapper(raw, encoding="utf-8", errors="ignore", newline="\n") as f:
+                    yield from f
+
     @staticmethod
     def parse_filing_date(date_str: str) -> Optional[str]:
         """Parse a filing date string to ISO format."""
@@ -676,24 +798,282 @@ class HouseDisclosureScraper:
             "source": "us_house",
         }
 
+    @staticmethod
+    def iter_disclosure_index(lines: Iterable[str], year: int) -> Iterator[Dict[str, Any]]:
+        """Lazily parse disclosure records from index lines, skipping the header."""
+        count = 0
+        header_seen = False
+        for line in lines:
+            if not header_seen:
+                header_seen = bool(line.strip())
+                continue
+            record = HouseDisclosureScraper.parse_disclosure_record(line, year)
+            if record:
+                count += 1
+                yield record
+        logger.info(f"Found {count} records in {year} index")
+
     @staticmethod
     def parse_disclosure_index(content: str, year: int) -> List[Dict[str, Any]]:
         """Parse all disclosure records from index file content."""
-        lines = content.strip().split("\n")
-        logger.info(f"Found {len(lines)} records in index")
+        return list(HouseDisclosureScraper.iter_disclosure_index(content.split("\n"), year))
 
-        disclosures = []
-        for line in lines[1:]:  # Skip header
-            record = HouseDisclosureScraper.parse_disclosure_record(line, year)
-            if record:
-                disclosures.append(record)
 
-        return disclosures
+async def iter_house_index(
+    year: int, client: Optional[httpx.AsyncClient] = None
+) -> Optional[Iterator[Dict[str, Any]]]:
+    """Get a year's disclosure records lazily, shared by every House index consumer.
+
+    The {year}FD.ZIP is revalidated with a conditional GET through the
+    source cache and downloads stream to disk. Records are parsed out of
+    the archive line by line and cached as JSON lines as they are parsed,
+    so unchanged indexes are neither downloaded nor re-parsed and the
+    year's index is never held as a list. The iterator reads the cache
+    file synchronously; consume it in a worker thread.
+
+    Returns:
+        Iterator of disclosure records (see
+        HouseDisclosureScraper.parse_disclosure_record), or None if the
+        index could not be fetched or read
+    """
+    def parse(zip_path: Path) -> Optional[Iterator[Dict[str, Any]]]:
+        try:
+            with zipfile.ZipFile(zip_path) as z:
+                z.getinfo(f"{year}FD.txt")
+        except KeyError:
+            logger.error(f"Index file {year}FD.txt not found in ZIP")
+            return None
+        except zipfile.BadZipFile as e:
+            logger.error(f"Invalid House index ZIP for {year}: {e}")
+            return None
+        lines = HouseDisclosureScraper.iter_index_lines(zip_path, year)
+        return HouseDisclosureScraper.iter_disclosure_index(lines, year)
+
+    return await get_source_cache().iter_parsed(
+        HouseDisclosureScraper.get_zip_url(year),
+        parse,
+        client=client,
+        parse_key="house-index",
+        headers={"User-Agent": USER_AGENT},
+        stream=True,
+    )
+
+
+async def fetch_house_index(
+    year: int, client: Optional[httpx.AsyncClient] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """Get a year's disclosure index as a list, for consumers that need one.
+
+    Reads the records cached by iter_house_index(); one-pass consumers
+    should iterate that instead.
+
+    Returns:
+        Disclosure records, or None if the index could not be fetched or read
+    """
+    records = await iter_house_index(year, client)
+    if records is None:
+        return None
+    return await asyncio.to_thread(list, records)
 
 
 # Note: find_or_create_politician moved to app.lib.politician
 
 
+# =============================================================================
+# CONCURRENT PDF PIPELINE
+# =============================================================================
+
+# Transaction fields copied from the disclosure rather than parsed from the PDF
+_DISCLOSURE_FIELDS = ("politician_name", "doc_id", "filing_type", "filing_date")
+
+
+async def parse_ptr_pdf(pdf_bytes: bytes, disclosure: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract transactions from a PTR PDF.
+
+    Tables and parsed transactions are cached by PDF hash and parser version,
+    so re-runs over unchanged documents skip extraction. Cache misses run
+    table extraction in the PDF worker pool.
+    """
+    sha256 = hashlib.sha256(pdf_bytes).hexdigest()
+    stamp = {field: disclosure.get(field) for field in _DISCLOSURE_FIELDS}
+
+    cached = await load_parsed(sha256, "house_transactions")
+    if cached is not None:
+        return [{**txn, **stamp} for txn in cached]
+
+    tables = await load_parsed(sha256, "tables")
+    if tables is None:
+        tables = await extract_tables(pdf_bytes)
+        # An empty result may be a timeout or crash; don't pin it in the cache
+        if tables:
+            await store_parsed(sha256, "tables", tables)
+
+    transactions = []
+    for table in tables:
+        for row in table:
+            txn = parse_transaction_from_row(row, disclosure)
+            if txn:
+                transactions.append(txn)
+                logger.debug(
+                    f"Parsed transaction: {txn.get('asset_name', 'N/A')[:50]} | "
+                    f"type={txn.get('transaction_type')}"
+                )
+
+    if tables:
+        await store_parsed(sha256, "house_transactions", transactions)
+    return transactions
+
+
+async def process_ptr_pdfs(
+    job_id: str,
+    client: httpx.AsyncClient,
+    supabase_client: Client,
+    to_process: List[Dict[str, Any]],
+    update_mode: bool = False,
+) -> Tuple[int, Set[str], Dict[str, Any]]:
+    """
+    Download, parse and upload PTR PDFs through a three-stage pipeline.
+
+    Download workers share an AdaptiveConcurrencyLimiter, so the number of
+    in-flight PDF requests grows while the Clerk's server answers 200 and
+    halves on 429/503. Parsing runs in the PDF worker processes and uploads
+    run in the database thread pool, so neither stalls downloads. JOB_STATUS progress
+    counts PDFs that have left the pipeline, whatever the outcome. The stages
+    are worker_pool.run_stage() workers, so an unexpected error cancels and
+    awaits every stage before it propagates.
+
+    Politicians are only resolved for PDFs that yielded transactions: each
+    upload worker takes up to PDF_RESOLVE_BATCH parsed PDFs at a time and
+    resolves their not-yet-seen filers with one find_or_create_politicians()
+    call, so failed downloads and empty filings never create a politician.
+
+    Returns:
+        Tuple of (transactions_uploaded, politician IDs with uploads,
+        concurrency limiter stats)
+    """
+    total = len(to_process)
+    limiter = AdaptiveConcurrencyLimiter(
+        initial=PDF_CONCURRENCY_INITIAL, max_limit=PDF_CONCURRENCY_MAX
+    )
+    download_workers = min(PDF_CONCURRENCY_MAX, max(total, 1))
+    pending: asyncio.Queue = asyncio.Queue()
+    for disclosure in to_process:
+        pending.put_nowait(disclosure)
+    for _ in range(download_workers):
+        pending.put_nowait(STAGE_DONE)
+    parse_queue: asyncio.Queue = asyncio.Queue(maxsize=PDF_QUEUE_SIZE)
+    upload_queue: asyncio.Queue = asyncio.Queue(maxsize=PDF_QUEUE_SIZE)
+
+    completed = 0
+    transactions_uploaded = 0
+    politicians_seen: Set[str] = set()
+    politician_ids: Dict[Tuple, Optional[str]] = {}
+    resolve_lock = asyncio.Lock()
+    politicians = PoliticiansRepository(supabase_client)
+    trading_disclosures = TradingDisclosuresRepository(supabase_client)
+
+    def mark_done(disclosure: Dict[str, Any]) -> None:
+        nonlocal completed
+        completed += 1
+        JOB_STATUS[job_id]["progress"] = completed
+        JOB_STATUS[job_id]["message"] = (
+            f"Processing {disclosure['politician_name']} ({completed}/{total})"
+        )
+        if completed % 50 == 0:
+            stats = limiter.get_stats()
+            logger.info(
+                f"Progress: {completed}/{total} PDFs | "
+                f"Concurrency: {stats['limit']} | "
+                f"Throttles: {stats['throttles']}"
+            )
+
+    async def download(disclosure: Dict[str, Any]) -> None:
+        try:
+            pdf_bytes = await HouseDisclosureScraper.fetch_pdf(
+                client, disclosure["pdf_url"], limiter=limiter, doc_id=disclosure["doc_id"]
+            )
+        except Exception as e:
+            logger.error(f"Error downloading PDF for {disclosure['doc_id']}: {e}")
+            pdf_bytes = None
+
+        if not pdf_bytes:
+            logger.warning(f"Failed to download PDF for {disclosure['doc_id']}")
+            mark_done(disclosure)
+            return
+        await parse_queue.put((disclosure, pdf_bytes))
+
+    async def parse(item: Tuple[Dict[str, Any], bytes]) -> None:
+        disclosure, pdf_bytes = item
+        try:
+            transactions = await parse_ptr_pdf(pdf_bytes, disclosure)
+        except Exception as e:
+            logger.error(f"Error parsing PDF {disclosure['doc_id']}: {e}")
+            transactions = []
+
+        logger.info(f"Found {len(transactions)} transactions in {disclosure['doc_id']}")
+        if not transactions:
+            mark_done(disclosure)
+            return
+        await upload_queue.put((disclosure, transactions))
+
+    async def resolve_politicians(batch: List[Tuple[Dict[str, Any], List]]) -> None:
+        # One lock so two workers never create the same new politician
+        async with resolve_lock:
+            missing = [
+                {"disclosure": disclosure}
+                for disclosure, _ in batch
+                if politician_key({"disclosure": disclosure}) not in politician_ids
+            ]
+            if not missing:
+                return
+            try:
+                politician_ids.update(
+                    await politicians.find_or_create_many(missing, index=get_politician_index())
+                )
+            except Exception as e:
+                logger.error(f"Politician lookup failed for {len(missing)} filers: {e}")
+
+    async def upload_transactions(disclosure: Dict[str, Any], transactions: List) -> None:
+        nonlocal transactions_uploaded
+        politician_id = politician_ids.get(politician_key({"disclosure": disclosure}))
+        if not politician_id:
+            logger.error(f"Failed to create politician: {disclosure['politician_name']}")
+            return
+        politicians_seen.add(politician_id)
+
+        for txn in transactions:
+            try:
+                disclosure_id = await trading_disclosures.upload_transaction(
+                    politician_id, txn, disclosure, update_mode=update_mode
+                )
+            except Exception as e:
+                logger.error(f"Error uploading transaction for {disclosure['doc_id']}: {e}")
+                continue
+            if disclosure_id:
+                transactions_uploaded += 1
+                action = "Updated" if update_mode else "Uploaded"
+                logger.info(
+                    f"{action}: {txn.get('asset_ticker', txn.get('asset_name', 'N/A')[:30])}"
+                )
+
+    async def upload(batch: List[Tuple[Dict[str, Any], List]]) -> None:
+        await resolve_politicians(batch)
+        for disclosure, transactions in batch:
+            await upload_transactions(disclosure, transactions)
+            mark_done(disclosure)
+
+    # Upload workers take whatever parsed PDFs are ready, up to PDF_RESOLVE_BATCH
+    await run_together(
+        run_stage(download, pending, parse_queue, PDF_PARSE_WORKERS, download_workers),
+        run_stage(parse, parse_queue, upload_queue, PDF_UPLOAD_WORKERS, PDF_PARSE_WORKERS),
+        run_stage(
+            upload, upload_queue, None, 0, PDF_UPLOAD_WORKERS, batch_size=PDF_RESOLVE_BATCH
+        ),
+    )
+
+    return transactions_uploaded, politicians_seen, limiter.get_stats()
+
+
 # =============================================================================
 # MAIN ETL FUNCTION
 # =============================================================================
@@ -704,6 +1084,7 @@ async def run_house_etl(
     year: int = 2025,
     limit: Optional[int] = None,
     update_mode: bool = False,
+    incremental: bool = False,
 ) -> None:
     """
     Run the complete House disclosure ETL pipeline.
@@ -719,6 +1100,9 @@ async def run_house_etl(
         year: Year to process (default: 2025)
         limit: Optional limit on number of PDFs (for testing). If None, processes all.
         update_mode: If True, upsert to update existing records with new parsing.
+        incremental: If True, skip PTRs whose doc_id is already in
+            trading_disclosures. Ignored in update mode, which re-parses
+            everything by definition.
     """
     JOB_STATUS[job_id]["status"] = "running"
     mode_str = " (UPDATE MODE)" if update_mode else ""
@@ -748,122 +1132,56 @@ async def run_house_etl(
             JOB_STATUS[job_id]["message"] = "Fetching party affiliations..."
             party_map = await fetch_member_party_map(client)
 
-            # Step 1: Download ZIP index
-            JOB_STATUS[job_id]["message"] = f"Downloading {year} disclosure index..."
-            zip_url = HouseDisclosureScraper.get_zip_url(year)
-            zip_content = await HouseDisclosureScraper.fetch_zip_content(client, zip_url)
+            # Steps 1-2: Fetch (or revalidate) and parse the ZIP index
+            JOB_STATUS[job_id]["message"] = f"Fetching {year} disclosure index..."
+            disclosures = await iter_house_index(year, client)
 
-            if not zip_content:
+            if disclosures is None:
                 JOB_STATUS[job_id]["status"] = "failed"
-                JOB_STATUS[job_id]["message"] = "Failed to download ZIP index"
+                JOB_STATUS[job_id]["message"] = f"Failed to fetch or extract {year} ZIP index"
                 return
 
-            # Step 2: Extract and parse index
-            JOB_STATUS[job_id]["message"] = "Parsing disclosure index..."
-            index_content = HouseDisclosureScraper.extract_index_file(zip_content, year)
-
-            if not index_content:
-                JOB_STATUS[job_id]["status"] = "failed"
-                JOB_STATUS[job_id]["message"] = "Failed to extract index file"
-                return
-
-            disclosures = HouseDisclosureScraper.parse_disclosure_index(
-                index_content, year
+            # Step 3: Filter to PTR filings (stock trades), keeping only those
+            ptr_disclosures = await asyncio.to_thread(
+                lambda: [d for d in disclosures if d.get("filing_type") == "P"]
             )
-            logger.info(f"Parsed {len(disclosures)} disclosure records")
-
-            # Step 3: Filter to PTR filings (stock trades)
-            ptr_disclosures = [d for d in disclosures if d.get("filing_type") == "P"]
             logger.info(f"Found {len(ptr_disclosures)} PTR filings")
 
+            # Incremental runs only fetch filings not yet ingested; House
+            # doc_ids are immutable (amendments are filed under new ones)
+            skipped_existing = 0
+            if incremental and not update_mode:
+                JOB_STATUS[job_id]["message"] = "Loading already-ingested filings..."
+                ingested = await run_db(fetch_ingested_doc_ids, supabase_client, year)
+                if ingested is not None:
+                    new_disclosures = [d for d in ptr_disclosures if d["doc_id"] not in ingested]
+                    skipped_existing = len(ptr_disclosures) - len(new_disclosures)
+                    ptr_disclosures = new_disclosures
+                    logger.info(
+                        f"Incremental run: {len(ptr_disclosures)} new PTRs, "
+                        f"{skipped_existing} already ingested"
+                    )
+            JOB_STATUS[job_id]["skipped_existing"] = skipped_existing
+
             # Process all PTR filings, or limit if specified (for testing)
             to_process = ptr_disclosures[:limit] if limit else ptr_disclosures
             JOB_STATUS[job_id]["total"] = len(to_process)
 
-            # Step 4: Process each PDF
-            politicians_created = 0
-            transactions_uploaded = 0
-            politician_cache: Dict[str, str] = {}
-
-            for i, disclosure in enumerate(to_process):
-                JOB_STATUS[job_id]["progress"] = i + 1
-                JOB_STATUS[job_id][
-                    "message"
-                ] = f"Processing {disclosure['politician_name']} ({i+1}/{len(to_process)})"
-
-                # Resolve party from pre-fetched mapping
+            # Resolve party from pre-fetched mapping
+            for disclosure in to_process:
                 if "party" not in disclosure:
                     resolved_party = resolve_party(party_map, disclosure)
                     if resolved_party:
                         disclosure["party"] = resolved_party
 
-                # Fetch PDF
-                pdf_bytes = await HouseDisclosureScraper.fetch_pdf(
-                    client, disclosure["pdf_url"]
-                )
-
-                if not pdf_bytes:
-                    logger.warning(f"Failed to download PDF for {disclosure['doc_id']}")
-                    continue
-
-                # Parse PDF
-                tables = extract_tables_from_pdf(pdf_bytes)
-
-                transactions = []
-                for table in tables:
-                    for row in table:
-                        txn = parse_transaction_from_row(row, disclosure)
-                        if txn:
-                            transactions.append(txn)
-                            logger.debug(
-                                f"Parsed transaction: {txn.get('asset_name', 'N/A')[:50]} | "
-                                f"type={txn.get('transaction_type')}"
-                            )
-
-                logger.info(f"Found {len(transactions)} transactions in {disclosure['doc_id']}")
-
-                if not transactions:
-                    logger.debug(f"No transactions found in {disclosure['doc_id']}")
-                    continue
-
-                # Get or create politician
-                cache_key = f"{disclosure['first_name']}_{disclosure['last_name']}"
-
-                if cache_key in politician_cache:
-                    politician_id = politician_cache[cache_key]
-                else:
-                    politician_id = find_or_create_politician(supabase_client, disclosure=disclosure)
-                    if politician_id:
-                        politician_cache[cache_key] = politician_id
-                        politicians_created += 1
-                    else:
-                        logger.error(
-                            f"Failed to create politician: {disclosure['politician_name']}"
-                        )
-                        continue
-
-                # Upload transactions
-                for txn in transactions:
-                    disclosure_id = upload_transaction_to_supabase(
-                        supabase_client, politician_id, txn, disclosure,
-                        update_mode=update_mode,
-                    )
-                    if disclosure_id:
-                        transactions_uploaded += 1
-                        action = "Updated" if update_mode else "Uploaded"
-                        logger.info(
-                            f"{action}: {txn.get('asset_ticker', txn.get('asset_name', 'N/A')[:30])}"
-                        )
-
-                # Rate limiting is now handled in fetch_pdf via RateLimiter
-                # Log progress periodically
-                if (i + 1) % 50 == 0:
-                    stats = rate_limiter.get_stats()
-                    logger.info(
-                        f"Progress: {i + 1}/{len(to_process)} PDFs | "
-                        f"Delay: {stats['current_delay']:.1f}s | "
-                        f"Errors: {stats['total_errors']}"
-                    )
+            # Step 4: Download, parse and upload PDFs concurrently
+            transactions_uploaded, politicians_seen, concurrency_stats = await process_ptr_pdfs(
+                job_id,
+                client,
+                supabase_client,
+                to_process,
+                update_mode=update_mode,
+            )
 
             # Complete
             stats = rate_limiter.get_stats()
@@ -871,20 +1189,22 @@ async def run_house_etl(
             JOB_STATUS[job_id]["status"] = "completed"
             JOB_STATUS[job_id]["completed_at"] = completed_at.isoformat()
             JOB_STATUS[job_id]["rate_limiter_stats"] = stats
+            JOB_STATUS[job_id]["concurrency_stats"] = concurrency_stats
             JOB_STATUS[job_id][
                 "message"
             ] = f"Completed: {transactions_uploaded} transactions from {len(to_process)} PDFs"
+            if skipped_existing:
+                JOB_STATUS[job_id]["message"] += f" ({skipped_existing} already ingested)"
 
             logger.info(
-                f"ETL Complete - Politicians: {politicians_created}, "
+                f"ETL Complete - Politicians resolved: {len(politicians_seen)}, "
                 f"Transactions: {transactions_uploaded}, "
                 f"Rate limit errors: {stats['total_errors']}, "
                 f"Final delay: {stats['current_delay']:.1f}s"
             )
 
             # Log job execution to database
-            log_job_execution(
-                supabase_client,
+            await JobExecutionsRepository(supabase_client).log(
                 job_id="politician-trading-house",
                 status="success",
                 started_at=datetime.fromisoformat(JOB_STATUS[job_id]["started_at"]),
@@ -893,25 +1213,28 @@ async def run_house_etl(
                     "etl_job_id": job_id,
                     "year": year,
                     "pdfs_processed": len(to_process),
+                    "pdfs_skipped_existing": skipped_existing,
                     "transactions_uploaded": transactions_uploaded,
-                    "politicians_created": politicians_created,
+                    "politicians_resolved": len(politicians_seen),
                     "rate_limiter_stats": stats,
                 },
             )
 
             # Refresh materialized views with new data
-            refresh_materialized_views(supabase_client)
+            await run_db(refresh_materialized_views, supabase_client)
 
             # Backfill party for existing politicians with NULL party
             if party_map:
-                backfill_count = _backfill_null_parties(supabase_client, party_map)
+                backfill_count = await run_db(
+                    _backfill_null_parties, supabase_client, party_map
+                )
                 if backfill_count > 0:
                     logger.info(f"Backfilled party for {backfill_count} politicians")
 
             # Cleanup old records (1% chance per run)
             import random
             if random.random() < 0.01:
-                cleanup_old_executions(supabase_client, days=30)
+                await JobExecutionsRepository(supabase_client).cleanup(days=30)
 
     except Exception as e:
         logger.exception(f"ETL failed: {e}")
@@ -923,8 +1246,7 @@ async def run_house_etl(
         # Log failed execution to database
         try:
             sb = get_supabase()
-            log_job_execution(
-                sb,
+            await JobExecutionsRepository(sb).log(
                 job_id="politician-trading-house",
                 status="failed",
                 started_at=datetime.fromisoformat(JOB_STATUS[job_id]["started_at"]),
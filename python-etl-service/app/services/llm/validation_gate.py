@@ -22,6 +22,7 @@ import os
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from app.lib.async_db import TradingDisclosuresRepository, execute_async
 from app.prompts import load_template, render_template
 from app.services.llm.audit_logger import LLMAuditLogger
 from app.services.llm.client import LLMClient
@@ -38,6 +39,7 @@ class ValidationGateService:
     def __init__(self, llm_client: LLMClient, supabase: object):
         self.llm_client = llm_client
         self.supabase = supabase
+        self.disclosures = TradingDisclosuresRepository(supabase)
         self.model = os.getenv("LLM_VALIDATION_MODEL", "qwen3:8b")
         self.audit_logger = LLMAuditLogger()
 
@@ -92,14 +94,13 @@ class ValidationGateService:
             cutoff = datetime.now(timezone.utc) - timedelta(hours=self.LOOKBACK_HOURS)
             cutoff_iso = cutoff.isoformat()
 
-            response = (
-                self.supabase.table("trading_disclosures")
+            response = await self.disclosures.execute(
+                self.disclosures.query()
                 .select("*")
                 .eq("llm_validation_status", "pending")
                 .gte("created_at", cutoff_iso)
                 .order("created_at", desc=True)
                 .limit(500)
-                .execute()
             )
 
             records = response.data or []
@@ -287,12 +288,13 @@ class ValidationGateService:
 
     async def _apply_pass(self, record_id: str, now_iso: str) -> None:
         """Apply pass verdict: update status and set validated timestamp."""
-        self.supabase.table("trading_disclosures").update(
+        await self.disclosures.update(
             {
                 "llm_validation_status": "pass",
                 "llm_validated_at": now_iso,
-            }
-        ).eq("id", record_id).execute()
+            },
+            id=record_id,
+        )
 
     async def _apply_flag(
         self,
@@ -304,30 +306,33 @@ class ValidationGateService:
     ) -> None:
         """Apply flag verdict: update status and insert data_quality_issues."""
         # Update disclosure status
-        self.supabase.table("trading_disclosures").update(
+        await self.disclosures.update(
             {
                 "llm_validation_status": "flag",
                 "llm_validated_at": now_iso,
-            }
-        ).eq("id", record_id).execute()
+            },
+            id=record_id,
+        )
 
         # Insert one data_quality_issues record per flag
         for flag in flags:
             try:
-                self.supabase.table("data_quality_issues").insert(
-                    {
-                        "disclosure_id": record_id,
-                        "severity": flag.get("severity", "warning"),
-                        "source": "llm_validation",
-                        "field_name": flag.get("field", ""),
-                        "description": flag.get("description", ""),
-                        "reasoning": flag.get("reasoning", ""),
-                        "suggested_action": flag.get("suggested_action", "review"),
-                        "validation_step": flag.get("step", ""),
-                        "confidence": confidence,
-                        "created_at": now_iso,
-                    }
-                ).execute()
+                await execute_async(
+                    self.supabase.table("data_quality_issues").insert(
+                        {
+                            "disclosure_id": record_id,
+                            "severity": flag.get("severity", "warning"),
+                            "source": "llm_validation",
+                            "field_name": flag.get("field", ""),
+                            "description": flag.get("description", ""),
+                            "reasoning": flag.get("reasoning", ""),
+                            "suggested_action": flag.get("suggested_action", "review"),
+                            "validation_step": flag.get("step", ""),
+                            "confidence": confidence,
+                            "created_at": now_iso,
+                        }
+                    )
+                )
             except Exception as e:
                 logger.error(
                     f"Failed to insert data_quality_issues for record {record_id}: {e}"
@@ -343,12 +348,13 @@ class ValidationGateService:
     ) -> None:
         """Apply reject verdict: update status and insert into quarantine."""
         # Update disclosure status
-        self.supabase.table("trading_disclosures").update(
+        await self.disclosures.update(
             {
                 "llm_validation_status": "reject",
                 "llm_validated_at": now_iso,
-            }
-        ).eq("id", record_id).execute()
+            },
+            id=record_id,
+        )
 
         # Build suggested corrections from flags
         suggested_corrections = [
@@ -362,17 +368,19 @@ class ValidationGateService:
 
         # Insert into quarantine
         try:
-            self.supabase.table("data_quality_quarantine").insert(
-                {
-                    "disclosure_id": record_id,
-                    "original_data": original,
-                    "suggested_corrections": suggested_corrections,
-                    "rejection_reasons": [f.get("description", "") for f in flags],
-                    "confidence": confidence,
-                    "source": "llm_validation",
-                    "created_at": now_iso,
-                }
-            ).execute()
+            await execute_async(
+                self.supabase.table("data_quality_quarantine").insert(
+                    {
+                        "disclosure_id": record_id,
+                        "original_data": original,
+                        "suggested_corrections": suggested_corrections,
+                        "rejection_reasons": [f.get("description", "") for f in flags],
+                        "confidence": confidence,
+                        "source": "llm_validation",
+                        "created_at": now_iso,
+                    }
+                )
+            )
         except Exception as e:
             logger.error(
                 f"Failed to insert quarantine record for {record_id}: {e}"
@@ -22,16 +22,27 @@ Fields from API (bulk/congresstrading endpoint):
 - Party: Political party ("R", "D")
 - State: State abbreviation (often null)
 - excess_return: Calculated excess return (informational)
+
+The bulk endpoint returns the whole archive as one JSON array. The
+pipelined run streams it: stream_disclosures() decodes records one at a
+time as the body arrives and drops those outside the lookback window
+immediately, so memory tracks the window rather than the archive.
 """
 
 import logging
 import os
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
-from app.lib.base_etl import BaseETLService, ETLResult
+from app.lib.base_etl import (
+    BaseETLService,
+    BatchUploadConfig,
+    ETLResult,
+    PipelineConfig,
+)
+from app.lib.json_stream import JSONStreamError, iter_json_array
 from app.lib.registry import ETLRegistry
 from app.lib.parser import (
     extract_ticker_from_text,
@@ -147,6 +158,11 @@ class QuiverQuantETLService(BaseETLService):
     source_id = "quiverquant"
     source_name = "QuiverQuant Congress Trading"
 
+    # Upload round trips dominate, so overlap them across several workers
+    pipeline_config = PipelineConfig(parse_workers=2, upload_workers=4)
+    # Write trades in batches; upload_batch() resolves politicians by bioguide_id
+    batch_upload_config = BatchUploadConfig(batch_size=100)
+
     def __init__(self):
         super().__init__()
         self.api_key = os.environ.get("QUIVERQUANT_API_KEY", "")
@@ -160,10 +176,94 @@ class QuiverQuantETLService(BaseETLService):
                 "Cannot fetch data from QuiverQuant API."
             )
 
+    def _request_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+        }
+
+    @staticmethod
+    def _check_response(response: httpx.Response) -> None:
+        """Raise for auth failures and other HTTP errors."""
+        if response.status_code == 401:
+            raise ValueError("QuiverQuant API key is invalid or expired")
+        elif response.status_code == 403:
+            raise ValueError("QuiverQuant API key lacks permission for this endpoint")
+        response.raise_for_status()
+
+    @staticmethod
+    def _cutoff_date(lookback_days: int) -> str:
+        """Earliest Traded date (YYYY-MM-DD) inside the lookback window."""
+        return (
+            datetime.now(timezone.utc) - timedelta(days=lookback_days)
+        ).strftime("%Y-%m-%d")
+
+    async def stream_disclosures(self, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream congress trading records from the QuiverQuant bulk API.
+
+        The JSON array is decoded incrementally from the response body and
+        each record's Traded date is checked as soon as it is decoded;
+        records outside the window are dropped without being buffered.
+
+        Args:
+            lookback_days: How many days back to fetch (default: 30)
+
+        Yields:
+            Raw QuiverQuant trade records within the lookback window.
+
+        Raises:
+            JSONStreamError: If the body is not a complete JSON array
+        """
+        lookback_days = kwargs.get("lookback_days", 30)
+        cutoff_date = self._cutoff_date(lookback_days)
+
+        self.logger.info(
+            f"Streaming QuiverQuant data (lookback_days={lookback_days})"
+        )
+
+        total = 0
+        kept = 0
+        try:
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                async with client.stream(
+                    "GET", QUIVERQUANT_BULK_ENDPOINT, headers=self._request_headers()
+                ) as response:
+                    self._check_response(response)
+                    try:
+                        async for record in iter_json_array(response.aiter_text()):
+                            total += 1
+                            if not isinstance(record, dict):
+                                continue
+                            if (record.get("Traded") or "")[:10] < cutoff_date:
+                                continue
+                            kept += 1
+                            yield record
+                    except JSONStreamError as e:
+                        # A truncated or non-array body must fail the job, not
+                        # complete it with whatever was decoded so far
+                        self.logger.error(f"Unexpected API response: {e}")
+                        raise
+
+        except httpx.HTTPStatusError as e:
+            self.logger.error(f"QuiverQuant API error: {e.response.status_code}")
+            raise
+        except httpx.RequestError as e:
+            self.logger.error(f"QuiverQuant request failed: {e}")
+            raise
+
+        self.logger.info(
+            f"Streamed {total} total records, "
+            f"{kept} within {lookback_days}-day window"
+        )
+
     async def fetch_disclosures(self, **kwargs) -> List[Dict[str, Any]]:
         """
         Fetch congress trading data from QuiverQuant bulk API.
 
+        Buffers the whole response; pipelined runs use
+        stream_disclosures() instead.
+
         Args:
             lookback_days: How many days back to fetch (default: 30)
             limit: Maximum number of records (applied after date filter)
@@ -181,18 +281,9 @@ class QuiverQuantETLService(BaseETLService):
             async with httpx.AsyncClient(timeout=60.0) as client:
                 response = await client.get(
                     QUIVERQUANT_BULK_ENDPOINT,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Accept": "application/json",
-                    },
+                    headers=self._request_headers(),
                 )
-
-                if response.status_code == 401:
-                    raise ValueError("QuiverQuant API key is invalid or expired")
-                elif response.status_code == 403:
-                    raise ValueError("QuiverQuant API key lacks permission for this endpoint")
-
-                response.raise_for_status()
+                self._check_response(response)
                 data = response.json()
 
         except httpx.HTTPStatusError as e:
@@ -207,9 +298,7 @@ class QuiverQuantETLService(BaseETLService):
             return []
 
         # Filter by lookback window
-        cutoff_date = (
-            datetime.now(timezone.utc) - timedelta(days=lookback_days)
-        ).strftime("%Y-%m-%d")
+        cutoff_date = self._cutoff_date(lookback_days)
 
         filtered = [
             record
@@ -343,51 +432,3 @@ class QuiverQuantETLService(BaseETLService):
             return False
 
         return True
-
-    async def upload_disclosure(
-        self,
-        disclosure: Dict[str, Any],
-        update_mode: bool = False,
-    ) -> Optional[str]:
-        """
-        Upload a QuiverQuant disclosure to the database.
-
-        Uses bioguide_id for politician matching when available,
-        falling back to name-based matching.
-        """
-        from app.lib.database import get_supabase, upload_transaction_to_supabase
-        from app.lib.politician import find_or_create_politician
-
-        try:
-            supabase = get_supabase()
-            if not supabase:
-                return None
-
-            # Find or create politician with bioguide_id priority
-            politician_id = find_or_create_politician(
-                supabase,
-                name=disclosure.get("politician_name"),
-                first_name=disclosure.get("first_name"),
-                last_name=disclosure.get("last_name"),
-                chamber=disclosure.get("chamber", "house"),
-                state=disclosure.get("state"),
-                bioguide_id=disclosure.get("bioguide_id"),
-            )
-
-            if not politician_id:
-                self.logger.warning(
-                    f"Could not find/create politician: {disclosure.get('politician_name')}"
-                )
-                return None
-
-            return upload_transaction_to_supabase(
-                supabase,
-                politician_id,
-                disclosure,
-                disclosure,
-                update_mode=update_mode,
-            )
-
-        except Exception as e:
-            self.logger.error(f"Upload failed for {disclosure.get('politician_name')}: {e}")
-            return None
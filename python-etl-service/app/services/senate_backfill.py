@@ -7,28 +7,37 @@ WAF blocks HTTP requests to the DataTables API.
 
 Design:
 - Dedup by source_url (always populated, unlike source_document_id)
+- Imported URLs live in a persisted local index (app.lib.url_index) that is
+  synced with trading_disclosures incrementally, so a restart only fetches
+  rows created since the last sync instead of rescanning the table
 - Per-year log_job_execution() for resumability
-- Mutable existing_urls set grows as each year completes
-- Reuses process_disclosures_playwright() for browser lifecycle
-- 5s cooldown between years for GC on 256MB Fly.io
+- BACKFILL_YEAR_CONCURRENCY years run at once; all of them share one
+  browser pool, whose page count is the global navigation budget
+  (contexts recycled, heavy resources blocked)
+- 5s cooldown after each year for GC on 256MB Fly.io
 """
 
 import asyncio
 import gc
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, MutableSet, Optional, Set
 
 from supabase import Client
 
+from app.lib.async_db import run_db
+from app.lib.browser_pool import BrowserPool
 from app.lib.database import get_supabase
 from app.lib.job_logger import log_job_execution
+from app.lib.url_index import get_url_index
 from app.services.house_etl import JOB_STATUS
 from app.services.senate_etl import (
     _match_disclosures_to_senators,
     fetch_senators_from_xml,
     process_disclosures_playwright,
     search_all_ptr_disclosures_playwright,
+    senate_browser_pool,
     upsert_senator_to_db,
 )
 
@@ -39,13 +48,18 @@ BACKFILL_START_YEAR = 2012  # STOCK Act enacted
 BACKFILL_END_YEAR = 2026
 BACKFILL_JOB_ID = "politician-trading-senate-backfill"
 YEAR_COOLDOWN_SECONDS = 5
+BACKFILL_YEAR_CONCURRENCY = int(os.environ.get("BACKFILL_YEAR_CONCURRENCY", "2"))
+SENATE_URL_INDEX = "senate_source_urls"
+# Overlap between syncs, covering clock skew between this host and the database
+URL_INDEX_SYNC_MARGIN = timedelta(hours=1)
 
 
-def get_existing_senate_source_urls(supabase: Client) -> Set[str]:
+def get_existing_senate_source_urls(supabase: Client, since: Optional[str] = None) -> Set[str]:
     """
     Fetch all source_urls matching efdsearch.senate.gov to skip at discovery.
 
-    Paginates through all records since there could be thousands.
+    Paginates through all records since there could be thousands, or only
+    those created at or after `since` (ISO timestamp) when given.
     Returns a set for O(1) lookup during dedup.
     """
     urls: Set[str] = set()
@@ -53,13 +67,14 @@ def get_existing_senate_source_urls(supabase: Client) -> Set[str]:
     offset = 0
 
     while True:
-        response = (
+        query = (
             supabase.table("trading_disclosures")
             .select("source_url")
             .like("source_url", "%efdsearch.senate%")
-            .range(offset, offset + batch_size - 1)
-            .execute()
         )
+        if since:
+            query = query.gte("created_at", since)
+        response = query.range(offset, offset + batch_size - 1).execute()
 
         if not response.data:
             break
@@ -78,6 +93,30 @@ def get_existing_senate_source_urls(supabase: Client) -> Set[str]:
     return urls
 
 
+def load_senate_url_index(supabase: Client) -> MutableSet[str]:
+    """
+    Return the imported Senate source URLs, brought up to date.
+
+    With the persisted index, only rows created since its last sync are
+    fetched (all rows on first use). Without it (URL_INDEX_ENABLED=false or
+    unusable), falls back to an in-memory set from a full scan.
+    """
+    index = get_url_index(SENATE_URL_INDEX)
+    if index is None:
+        return get_existing_senate_source_urls(supabase)
+
+    scan_started = datetime.now(timezone.utc)
+    since = index.synced_at
+    added = index.update(get_existing_senate_source_urls(supabase, since=since))
+    index.synced_at = (scan_started - URL_INDEX_SYNC_MARGIN).isoformat()
+
+    logger.info(
+        f"[Backfill] URL index {'synced since ' + since if since else 'built'}: "
+        f"{added} new, {len(index)} total"
+    )
+    return index
+
+
 def get_completed_backfill_years(supabase: Client) -> Set[int]:
     """
     Check job_executions for successfully completed backfill years.
@@ -115,21 +154,25 @@ async def backfill_year(
     year: int,
     senators: List[Dict[str, Any]],
     supabase: Client,
-    existing_urls: Set[str],
+    existing_urls: MutableSet[str],
     job_id: str,
     idx: int,
     total: int,
+    pool: Optional[BrowserPool] = None,
 ) -> Dict[str, Any]:
     """
     Backfill one year of Senate PTR disclosures.
 
+    Searching and processing run on `pool` when given (so a multi-year run
+    launches one browser), otherwise on pools created for this year.
+
     Steps:
     1. Search EFD via Playwright with date range for the year
     2. Filter out already-imported disclosures (by source_url)
     3. Match disclosures to senators
     4. Filter paper filings
     5. Process electronic disclosures via Playwright
-    6. Update existing_urls set with newly imported URLs
+    6. Add the URLs the database now has for this year to existing_urls
     """
     start_date = f"01/01/{year}"
     end_date = f"12/31/{year}"
@@ -155,6 +198,7 @@ async def backfill_year(
     raw_disclosures = await search_all_ptr_disclosures_playwright(
         start_date=start_date,
         end_date=end_date,
+        pool=pool,
     )
     stats["discovered"] = len(raw_disclosures)
 
@@ -197,15 +241,17 @@ async def backfill_year(
     )
 
     # Step 5: Process disclosures
-    transactions, errors = await process_disclosures_playwright(electronic, supabase)
+    transactions, errors = await process_disclosures_playwright(electronic, supabase, pool=pool)
     stats["transactions"] = transactions
     stats["errors"] = errors
 
-    # Step 6: Update existing_urls with newly imported
-    for d in electronic:
-        url = d.get("source_url")
-        if url:
-            existing_urls.add(url)
+    # Step 6: Add the URLs this year actually imported to existing_urls
+    imported = await run_db(
+        get_existing_senate_source_urls,
+        supabase,
+        since=(year_started - URL_INDEX_SYNC_MARGIN).isoformat(),
+    )
+    existing_urls |= imported
 
     # Log per-year execution
     year_completed = datetime.now(timezone.utc)
@@ -236,13 +282,14 @@ async def run_senate_backfill(
     end_year: Optional[int] = None,
     limit: Optional[int] = None,
     skip_completed: bool = True,
+    year_concurrency: Optional[int] = None,
 ) -> None:
     """
     Main entry point for Senate PTR historical backfill.
 
-    Iterates year-by-year from start_year to end_year, backfilling
-    PTR disclosures via Playwright. Resumable: skips years that
-    already completed successfully.
+    Backfills PTR disclosures via Playwright for each year from start_year
+    to end_year, several years at a time (started in order). Resumable:
+    skips years that already completed successfully.
 
     Args:
         job_id: Unique job identifier for status tracking
@@ -250,6 +297,7 @@ async def run_senate_backfill(
         end_year: Last year to backfill (default: 2026)
         limit: Max disclosures to process per year (for testing)
         skip_completed: If True, skip years already completed
+        year_concurrency: Years run at once (default: BACKFILL_YEAR_CONCURRENCY)
     """
     start_yr = start_year or BACKFILL_START_YEAR
     end_yr = end_year or BACKFILL_END_YEAR
@@ -286,7 +334,7 @@ async def run_senate_backfill(
 
         # Step 2: Get existing source_urls for dedup
         JOB_STATUS[job_id]["message"] = "Loading existing URLs for dedup..."
-        existing_urls = get_existing_senate_source_urls(supabase)
+        existing_urls = load_senate_url_index(supabase)
 
         # Step 3: Get completed years for resumability
         completed_years: Set[int] = set()
@@ -299,51 +347,65 @@ async def run_senate_backfill(
 
         JOB_STATUS[job_id]["total"] = total_years
 
-        # Step 4: Loop years
-        for idx, year in enumerate(years, 1):
+        # Step 4: Run years concurrently on one shared browser pool. The
+        # pool's pages bound navigations across all years.
+        year_slots = asyncio.Semaphore(max(1, year_concurrency or BACKFILL_YEAR_CONCURRENCY))
+        to_run = [(idx, year) for idx, year in enumerate(years, 1) if year not in completed_years]
+        started = 0
+        finished = total_years - len(to_run)
+
+        for year in years:
             if year in completed_years:
                 logger.info(f"[Backfill] Skipping year {year} (already completed)")
                 total_stats["years_skipped"] += 1
-                JOB_STATUS[job_id]["progress"] = idx
-                continue
-
-            try:
-                stats = await backfill_year(
-                    year=year,
-                    senators=senators,
-                    supabase=supabase,
-                    existing_urls=existing_urls,
-                    job_id=job_id,
-                    idx=idx,
-                    total=total_years,
-                )
-
-                total_stats["years_processed"] += 1
-                total_stats["total_discovered"] += stats["discovered"]
-                total_stats["total_transactions"] += stats["transactions"]
-                total_stats["total_errors"] += stats["errors"]
-
-            except Exception as e:
-                logger.error(f"[Backfill] Year {year} failed: {e}", exc_info=True)
-                total_stats["years_failed"] += 1
-
-                # Log failed year
-                log_job_execution(
-                    supabase,
-                    job_id=BACKFILL_JOB_ID,
-                    status="failed",
-                    started_at=datetime.now(timezone.utc),
-                    completed_at=datetime.now(timezone.utc),
-                    error_message=str(e),
-                    metadata={"year": year, "etl_job_id": job_id},
-                )
-
-            JOB_STATUS[job_id]["progress"] = idx
-
-            # Step 5: Cooldown between years for GC
-            if idx < total_years:
-                gc.collect()
-                await asyncio.sleep(YEAR_COOLDOWN_SECONDS)
+        JOB_STATUS[job_id]["progress"] = finished
+
+        async def run_year(idx: int, year: int, browser_pool: BrowserPool) -> None:
+            nonlocal started, finished
+            async with year_slots:
+                started += 1
+                try:
+                    stats = await backfill_year(
+                        year=year,
+                        senators=senators,
+                        supabase=supabase,
+                        existing_urls=existing_urls,
+                        job_id=job_id,
+                        idx=idx,
+                        total=total_years,
+                        pool=browser_pool,
+                    )
+
+                    total_stats["years_processed"] += 1
+                    total_stats["total_discovered"] += stats["discovered"]
+                    total_stats["total_transactions"] += stats["transactions"]
+                    total_stats["total_errors"] += stats["errors"]
+
+                except Exception as e:
+                    logger.error(f"[Backfill] Year {year} failed: {e}", exc_info=True)
+                    total_stats["years_failed"] += 1
+
+                    # Log failed year
+                    log_job_execution(
+                        supabase,
+                        job_id=BACKFILL_JOB_ID,
+                        status="failed",
+                        started_at=datetime.now(timezone.utc),
+                        completed_at=datetime.now(timezone.utc),
+                        error_message=str(e),
+                        metadata={"year": year, "etl_job_id": job_id},
+                    )
+
+                finished += 1
+                JOB_STATUS[job_id]["progress"] = finished
+
+                # Step 5: Cooldown for GC before this slot takes another year
+                if started < len(to_run):
+                    gc.collect()
+                    await asyncio.sleep(YEAR_COOLDOWN_SECONDS)
+
+        async with senate_browser_pool() as browser_pool:
+            await asyncio.gather(*(run_year(idx, year, browser_pool) for idx, year in to_run))
 
         # Final status
         completed_at = datetime.now(timezone.utc)
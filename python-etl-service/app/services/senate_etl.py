@@ -20,11 +20,13 @@ import os
 import re
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta, timezone
+from contextlib import AsyncExitStack
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 from urllib.parse import quote
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
+    from app.services.senate_http_client import EFDSessionPool
 
 import httpx
 from bs4 import BeautifulSoup
@@ -38,9 +40,15 @@ from app.lib.parser import (
     clean_asset_name,
     is_header_row,
 )
+from app.lib.async_db import run_db
+from app.lib.browser_pool import BrowserPool
+from app.lib.html_backend import parse_document, text_content, use_lxml
 from app.lib.database import get_supabase, upload_transaction_to_supabase, refresh_materialized_views
+from app.lib.pdf_cache import load_cached_pdf, store_cached_pdf
+from app.lib.source_cache import get_source_cache
 from app.lib.pdf_utils import extract_text_from_pdf, extract_tables_from_pdf
 from app.lib.politician import find_or_create_politician
+from app.lib.politician_index import get_politician_index
 from app.lib.job_logger import log_job_execution, cleanup_old_executions
 
 # Setup logging
@@ -70,10 +78,37 @@ rate_limiter = RateLimiter()
 # =============================================================================
 
 
+def _parse_senators_xml(body: bytes) -> List[Dict[str, Any]]:
+    """Parse the Senate.gov senators XML feed."""
+    senators = []
+    root = ET.fromstring(body)
+
+    for member in root.findall("member"):
+        first_name = member.findtext("first_name", "").strip()
+        last_name = member.findtext("last_name", "").strip()
+        party = member.findtext("party", "").strip()
+        state = member.findtext("state", "").strip()
+        bioguide_id = member.findtext("bioguide_id", "").strip()
+
+        if first_name and last_name:
+            senators.append({
+                "first_name": first_name,
+                "last_name": last_name,
+                "party": party,  # D, R, or I
+                "state": state,
+                "bioguide_id": bioguide_id,
+                "full_name": f"{first_name} {last_name}",
+            })
+
+    return senators
+
+
 async def fetch_senators_from_xml() -> List[Dict[str, Any]]:
     """
     Fetch current senators from the official Senate.gov XML feed.
 
+    The feed is revalidated with a conditional GET through the source cache.
+
     Returns a list of senator dictionaries with:
     - first_name, last_name, party, state, bioguide_id
     """
@@ -81,37 +116,23 @@ async def fetch_senators_from_xml() -> List[Dict[str, Any]]:
 
     try:
         async with httpx.AsyncClient() as client:
-            response = await client.get(
+            senators = await get_source_cache().get_parsed(
                 SENATORS_XML_URL,
+                _parse_senators_xml,
+                client=client,
+                parse_key="senators",
                 headers={"User-Agent": USER_AGENT},
                 timeout=30.0,
             )
 
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch senators XML: {response.status_code}")
-                return []
-
-            # Parse XML
-            root = ET.fromstring(response.text)
-
-            for member in root.findall("member"):
-                first_name = member.findtext("first_name", "").strip()
-                last_name = member.findtext("last_name", "").strip()
-                party = member.findtext("party", "").strip()
-                state = member.findtext("state", "").strip()
-                bioguide_id = member.findtext("bioguide_id", "").strip()
-
-                if first_name and last_name:
-                    senators.append({
-                        "first_name": first_name,
-                        "last_name": last_name,
-                        "party": party,  # D, R, or I
-                        "state": state,
-                        "bioguide_id": bioguide_id,
-                        "full_name": f"{first_name} {last_name}",
-                    })
+        if senators is None:
+            logger.error("Failed to fetch senators XML")
+            return []
+        # The parsed feed is shared through the source cache; callers annotate
+        # their senators (politician_id), so each gets its own dicts
+        senators = [dict(senator) for senator in senators]
 
-            logger.info(f"Fetched {len(senators)} senators from Senate.gov XML")
+        logger.info(f"Fetched {len(senators)} senators from Senate.gov XML")
 
     except Exception as e:
         logger.error(f"Error fetching senators XML: {e}")
@@ -346,11 +367,40 @@ def parse_transaction_from_row(row: List[str], disclosure: Dict[str, Any]) -> Op
 # =============================================================================
 
 
+def _efd_session_expired(page: "Page") -> bool:
+    """Whether EFD bounced a pooled page back to the agreement page."""
+    return "/home/" in page.url
+
+
+async def _accept_efd_agreement(page: "Page") -> None:
+    """Accept the EFD usage agreement in a new browser context."""
+    await page.goto(f"{SENATE_BASE_URL}/search/home/", wait_until="domcontentloaded", timeout=60000)
+    checkbox = page.locator("input[name='prohibition_agreement']")
+    if await checkbox.count() > 0:
+        await checkbox.click()
+        logger.info("[Playwright] Accepted usage agreement")
+        await page.wait_for_url("**/search/", timeout=10000)
+
+
+def senate_browser_pool(pages: Optional[int] = None) -> BrowserPool:
+    """
+    Create a browser pool for EFD whose contexts have accepted the usage
+    agreement. Contexts bounced back to the agreement page are replaced.
+    """
+    return BrowserPool(
+        pages=pages,
+        setup=_accept_efd_agreement,
+        is_stale=_efd_session_expired,
+        context_options={"user_agent": USER_AGENT, "viewport": {"width": 1280, "height": 720}},
+    )
+
+
 async def search_all_ptr_disclosures_playwright(
     lookback_days: int = 30,
     limit: Optional[int] = None,
     start_date: Optional[str] = None,  # MM/DD/YYYY format
     end_date: Optional[str] = None,    # MM/DD/YYYY format
+    pool: Optional[BrowserPool] = None,
 ) -> List[Dict[str, Any]]:
     """
     Search for all PTR disclosures using Playwright browser automation.
@@ -358,175 +408,135 @@ async def search_all_ptr_disclosures_playwright(
     The Senate EFD site has anti-bot protection that blocks programmatic AJAX requests.
     Using a real browser (Playwright) bypasses this protection.
 
+    Uses a page from `pool` when given, otherwise a one-page pool that is
+    closed on return.
+
     Returns list of disclosure metadata (source_url, filing_date, politician_name, etc.)
     """
-    from playwright.async_api import async_playwright
-
     disclosures = []
 
     try:
         logger.info("[Playwright] Starting browser automation for EFD search...")
-        async with async_playwright() as p:
-            # Launch headless browser with Docker-compatible flags
-            logger.info("[Playwright] Launching Chromium browser...")
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                    "--disable-extensions",
-                    "--no-first-run",
-                    "--no-zygote",
-                    "--disable-software-rasterizer",
-                    "--disable-background-networking",
-                    "--disable-default-apps",
-                    "--disable-sync",
-                    "--disable-translate",
-                    "--mute-audio",
-                    "--hide-scrollbars",
-                    "--metrics-recording-only",
-                ],
-            )
-            logger.info("[Playwright] Browser launched successfully")
-            context = await browser.new_context(
-                user_agent=USER_AGENT,
-                viewport={"width": 1280, "height": 720},
-            )
-            logger.info("[Playwright] Created browser context")
-            logger.info("[Playwright] Creating new page (with 60s timeout)...")
-            try:
-                page = await asyncio.wait_for(context.new_page(), timeout=60.0)
-            except asyncio.TimeoutError:
-                logger.error("[Playwright] TIMEOUT: new_page() took longer than 60s")
-                raise Exception("Failed to create new page - timeout after 60s")
-            logger.info("[Playwright] Created new page successfully")
-
-            # Step 1: Navigate to home page and accept agreement
-            logger.info("[Playwright] Navigating to Senate EFD home page...")
-            await page.goto(f"{SENATE_BASE_URL}/search/home/", wait_until="domcontentloaded", timeout=60000)
-            logger.info("[Playwright] Page loaded, checking for agreement")
-
-            # Accept agreement by clicking checkbox
-            checkbox = page.locator("input[name='prohibition_agreement']")
-            if await checkbox.count() > 0:
-                await checkbox.click()
-                logger.info("[Playwright] Accepted usage agreement")
-                await page.wait_for_url("**/search/", timeout=10000)
-
-            # Step 2: Fill search form
-            logger.info("[Playwright] Filling search form for PTRs")
-
-            # Check "Senator" checkbox
-            await page.locator("text=Senator").first.click()
-
-            # Check "Periodic Transactions" checkbox
-            await page.locator("text=Periodic Transactions").click()
-
-            # Fill date range filters if provided
-            if start_date:
-                await page.fill("input[name='submitted_start_date']", start_date)
-            if end_date:
-                await page.fill("input[name='submitted_end_date']", end_date)
-
-            # Click Search button
-            await page.locator("button:has-text('Search Reports')").click()
-
-            # Wait for results to load
-            await page.wait_for_selector("table#filedReports tbody tr", timeout=30000)
-
-            # Step 3: Parse ALL pages of results (handle pagination)
-            page_num = 1
-            total_pages = None
-
-            while True:
-                logger.info(f"[Playwright] Parsing results page {page_num}")
-
-                # Wait for table to be populated
-                await page.wait_for_selector("table#filedReports tbody tr", timeout=10000)
-
-                # Get the status text to know total records
-                status_text = await page.locator(".dataTables_info").text_content()
-                logger.debug(f"[Playwright] Status: {status_text}")
-
-                # Parse the table rows
-                rows = await page.locator("table#filedReports tbody tr").all()
-
-                for row in rows:
-                    cells = await row.locator("td").all()
-                    if len(cells) >= 5:
-                        first_name = await cells[0].text_content()
-                        last_name = await cells[1].text_content()
-                        office = await cells[2].text_content()
-                        report_cell = cells[3]
-                        date_filed = await cells[4].text_content()
-
-                        # Get the link from report cell
-                        link = report_cell.locator("a")
-                        if await link.count() > 0:
-                            href = await link.get_attribute("href")
-                            report_text = await link.text_content()
-
-                            # Only include PTRs
-                            if "Periodic" in (report_text or ""):
-                                full_name = f"{first_name.strip()} {last_name.strip()}"
-
-                                # Parse filing date
-                                filing_date = None
-                                if date_filed:
-                                    try:
-                                        filing_date = datetime.strptime(
-                                            date_filed.strip(), "%m/%d/%Y"
-                                        ).isoformat()
-                                    except ValueError:
-                                        pass
-
-                                # Build full URL
-                                if href and not href.startswith("http"):
-                                    href = f"{SENATE_BASE_URL}{href}"
-
-                                # Extract doc_id from URL
-                                doc_id = None
-                                uuid_match = re.search(r'/(?:ptr|paper)/([a-f0-9-]+)/', href or "")
-                                if uuid_match:
-                                    doc_id = uuid_match.group(1)
-
-                                disclosures.append({
-                                    "politician_name": full_name,
-                                    "first_name": first_name.strip() if first_name else "",
-                                    "last_name": last_name.strip() if last_name else "",
-                                    "report_type": "PTR",
-                                    "filing_date": filing_date,
-                                    "source_url": href,
-                                    "doc_id": doc_id,
-                                    "is_paper": "/paper/" in (href or ""),
-                                    "source": "us_senate",
-                                })
-
-                # Check limit
-                if limit and len(disclosures) >= limit:
-                    logger.info(f"[Playwright] Reached limit of {limit} disclosures")
-                    break
-
-                # Check if there's a next page (pagination)
-                next_button = page.locator(".paginate_button.next:not(.disabled)")
-                if await next_button.count() > 0:
-                    await next_button.click()
-                    # Wait for table to update (AJAX reload)
-                    await page.wait_for_timeout(500)
-                    await page.wait_for_load_state("networkidle")
-                    page_num += 1
-
-                    # Safety limit to avoid infinite loops
-                    if page_num > 100:
-                        logger.warning("[Playwright] Reached max page limit (100)")
+        async with AsyncExitStack() as stack:
+            if pool is None:
+                pool = await stack.enter_async_context(senate_browser_pool(pages=1))
+
+            async with pool.page() as page:
+                # Step 1: Open the search form (the pool accepted the agreement)
+                await page.goto(SENATE_SEARCH_URL, wait_until="domcontentloaded", timeout=60000)
+                if _efd_session_expired(page):
+                    await _accept_efd_agreement(page)
+
+                # Step 2: Fill search form
+                logger.info("[Playwright] Filling search form for PTRs")
+
+                # Check "Senator" checkbox
+                await page.locator("text=Senator").first.click()
+
+                # Check "Periodic Transactions" checkbox
+                await page.locator("text=Periodic Transactions").click()
+
+                # Fill date range filters if provided
+                if start_date:
+                    await page.fill("input[name='submitted_start_date']", start_date)
+                if end_date:
+                    await page.fill("input[name='submitted_end_date']", end_date)
+
+                # Click Search button
+                await page.locator("button:has-text('Search Reports')").click()
+
+                # Wait for results to load
+                await page.wait_for_selector("table#filedReports tbody tr", timeout=30000)
+
+                # Step 3: Parse ALL pages of results (handle pagination)
+                page_num = 1
+                total_pages = None
+
+                while True:
+                    logger.info(f"[Playwright] Parsing results page {page_num}")
+
+                    # Wait for table to be populated
+                    await page.wait_for_selector("table#filedReports tbody tr", timeout=10000)
+
+                    # Get the status text to know total records
+                    status_text = await page.locator(".dataTables_info").text_content()
+                    logger.debug(f"[Playwright] Status: {status_text}")
+
+                    # Parse the table rows
+                    rows = await page.locator("table#filedReports tbody tr").all()
+
+                    for row in rows:
+                        cells = await row.locator("td").all()
+                        if len(cells) >= 5:
+                            first_name = await cells[0].text_content()
+                            last_name = await cells[1].text_content()
+                            office = await cells[2].text_content()
+                            report_cell = cells[3]
+                            date_filed = await cells[4].text_content()
+
+                            # Get the link from report cell
+                            link = report_cell.locator("a")
+                            if await link.count() > 0:
+                                href = await link.get_attribute("href")
+                                report_text = await link.text_content()
+
+                                # Only include PTRs
+                                if "Periodic" in (report_text or ""):
+                                    full_name = f"{first_name.strip()} {last_name.strip()}"
+
+                                    # Parse filing date
+                                    filing_date = None
+                                    if date_filed:
+                                        try:
+                                            filing_date = datetime.strptime(
+                                                date_filed.strip(), "%m/%d/%Y"
+                                            ).isoformat()
+                                        except ValueError:
+                                            pass
+
+                                    # Build full URL
+                                    if href and not href.startswith("http"):
+                                        href = f"{SENATE_BASE_URL}{href}"
+
+                                    # Extract doc_id from URL
+                                    doc_id = None
+                                    uuid_match = re.search(r'/(?:ptr|paper)/([a-f0-9-]+)/', href or "")
+                                    if uuid_match:
+                                        doc_id = uuid_match.group(1)
+
+                                    disclosures.append({
+                                        "politician_name": full_name,
+                                        "first_name": first_name.strip() if first_name else "",
+                                        "last_name": last_name.strip() if last_name else "",
+                                        "report_type": "PTR",
+                                        "filing_date": filing_date,
+                                        "source_url": href,
+                                        "doc_id": doc_id,
+                                        "is_paper": "/paper/" in (href or ""),
+                                        "source": "us_senate",
+                                    })
+
+                    # Check limit
+                    if limit and len(disclosures) >= limit:
+                        logger.info(f"[Playwright] Reached limit of {limit} disclosures")
                         break
-                else:
-                    logger.info(f"[Playwright] No more pages (processed {page_num} pages)")
-                    break
 
-            await browser.close()
+                    # Check if there's a next page (pagination)
+                    next_button = page.locator(".paginate_button.next:not(.disabled)")
+                    if await next_button.count() > 0:
+                        await next_button.click()
+                        # Wait for table to update (AJAX reload)
+                        await page.wait_for_timeout(500)
+                        await page.wait_for_load_state("networkidle")
+                        page_num += 1
+
+                        # Safety limit to avoid infinite loops
+                        if page_num > 100:
+                            logger.warning("[Playwright] Reached max page limit (100)")
+                            break
+                    else:
+                        logger.info(f"[Playwright] No more pages (processed {page_num} pages)")
+                        break
 
     except Exception as e:
         logger.error(f"[Playwright] Error during search: {e}", exc_info=True)
@@ -653,106 +663,69 @@ async def parse_ptr_page_playwright(
     return transactions
 
 
+async def _process_disclosure_playwright(
+    pool: BrowserPool,
+    supabase: Client,
+    disclosure: Dict[str, Any],
+) -> int:
+    """Parse one PTR page on a pooled browser page and upload its transactions."""
+    # Skip paper filings (images, can't parse)
+    if disclosure.get("is_paper"):
+        logger.debug(f"Skipping paper filing: {disclosure.get('source_url')}")
+        return 0
+
+    source_url = disclosure.get("source_url")
+    if not source_url:
+        return 0
+
+    # A context whose agreement lapsed is replaced on release; retry once on a fresh one
+    for _ in range(2):
+        async with pool.page() as page:
+            transactions = await parse_ptr_page_playwright(page, source_url)
+            expired = _efd_session_expired(page)
+            # Rate limit
+            await page.wait_for_timeout(500)
+        if not expired:
+            break
+
+    return await _upload_ptr_transactions(supabase, disclosure, transactions)
+
+
 async def process_disclosures_playwright(
     disclosures: List[Dict[str, Any]],
     supabase: Client,
+    pool: Optional[BrowserPool] = None,
 ) -> Tuple[int, int]:
     """
-    Process disclosures using a single Playwright browser session.
+    Process disclosures on a pool of Playwright pages.
+
+    PTR pages are navigated concurrently, one worker per pooled page. Uses
+    `pool` when given, otherwise a pool that is closed on return.
 
     Returns (transactions_uploaded, errors)
     """
-    from playwright.async_api import async_playwright
-
     total_transactions = 0
     errors = 0
+    pending = iter(enumerate(disclosures))
 
     try:
-        logger.info("[Playwright] Starting browser for disclosure processing...")
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                    "--disable-extensions",
-                    "--no-first-run",
-                    "--no-zygote",
-                    "--disable-software-rasterizer",
-                    "--disable-background-networking",
-                    "--disable-default-apps",
-                    "--disable-sync",
-                    "--disable-translate",
-                    "--mute-audio",
-                    "--hide-scrollbars",
-                    "--metrics-recording-only",
-                ],
-            )
-            logger.info("[Playwright] Browser launched for disclosure processing")
-            context = await browser.new_context(user_agent=USER_AGENT)
-            logger.info("[Playwright] Creating page for disclosure processing...")
-            try:
-                page = await asyncio.wait_for(context.new_page(), timeout=60.0)
-            except asyncio.TimeoutError:
-                logger.error("[Playwright] TIMEOUT: new_page() took longer than 60s")
-                raise Exception("Failed to create new page - timeout after 60s")
-            logger.info("[Playwright] Page created for disclosure processing")
-
-            # Accept agreement first
-            await page.goto(f"{SENATE_BASE_URL}/search/home/", wait_until="domcontentloaded", timeout=60000)
-            checkbox = page.locator("input[name='prohibition_agreement']")
-            if await checkbox.count() > 0:
-                await checkbox.click()
-                await page.wait_for_url("**/search/", timeout=10000)
-            logger.info("[Playwright] Session established for processing")
-
-            # Process each disclosure
-            for i, disclosure in enumerate(disclosures):
-                try:
-                    # Skip paper filings (images, can't parse)
-                    if disclosure.get("is_paper"):
-                        logger.debug(f"Skipping paper filing: {disclosure.get('source_url')}")
-                        continue
-
-                    source_url = disclosure.get("source_url")
-                    if not source_url:
-                        continue
-
-                    # Parse PTR page
-                    transactions = await parse_ptr_page_playwright(page, source_url)
-
-                    if not transactions:
-                        continue
-
-                    politician_id = disclosure.get("politician_id")
-                    if not politician_id:
-                        politician_id = find_or_create_politician(
-                            supabase, name=disclosure.get("politician_name"), chamber="senate",
-                            party=disclosure.get("party"),
-                        )
-
-                    if not politician_id:
-                        logger.warning(f"Could not find politician: {disclosure.get('politician_name')}")
-                        continue
-
-                    # Upload transactions
-                    for transaction in transactions:
-                        result = upload_transaction_to_supabase(
-                            supabase, politician_id, transaction, disclosure
-                        )
-                        if result:
-                            total_transactions += 1
-
-                    # Rate limit
-                    await page.wait_for_timeout(500)
-
-                except Exception as e:
-                    errors += 1
-                    logger.error(f"Error processing disclosure {i}: {e}")
-
-            await browser.close()
+        logger.info("[Playwright] Starting browser pool for disclosure processing...")
+        async with AsyncExitStack() as stack:
+            if pool is None:
+                pool = await stack.enter_async_context(senate_browser_pool())
+
+            async def worker() -> None:
+                nonlocal total_transactions, errors
+                for i, disclosure in pending:
+                    try:
+                        uploaded = await _process_disclosure_playwright(pool, supabase, disclosure)
+                        total_transactions += uploaded
+                    except Exception as e:
+                        errors += 1
+                        logger.error(f"Error processing disclosure {i}: {e}")
+
+            await asyncio.gather(*(worker() for _ in range(pool.size)))
+            logger.info(f"[Playwright] Browser pool stats: {pool.get_stats()}")
 
     except Exception as e:
         logger.error(f"[Playwright] Error in process_disclosures: {e}", exc_info=True)
@@ -902,11 +875,66 @@ async def fetch_senate_ptr_list_playwright(
     return _match_disclosures_to_senators(all_disclosures, senators)
 
 
+def _extract_ptr_page_bs4(html: str) -> Optional[Tuple[str, List[str], List[List[str]]]]:
+    """Pull the h1 text, header cells and row cells out of a PTR page with BeautifulSoup."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    h1 = soup.find("h1")
+    table = soup.find("table", class_="table-striped")
+    if not table:
+        table = soup.find("table")
+    if not table:
+        return None
+
+    thead = table.find("thead")
+    headers = [th.get_text(strip=True) for th in thead.find_all("th")] if thead else []
+
+    tbody = table.find("tbody")
+    rows = tbody.find_all("tr") if tbody else table.find_all("tr")[1:]
+
+    return (
+        h1.get_text() if h1 else "",
+        headers,
+        [[td.get_text(strip=True) for td in row.find_all("td")] for row in rows],
+    )
+
+
+def _extract_ptr_page_lxml(html: str) -> Optional[Tuple[str, List[str], List[List[str]]]]:
+    """lxml equivalent of _extract_ptr_page_bs4()."""
+    doc = parse_document(html)
+    if doc is None:
+        return None
+
+    h1 = doc.find(".//h1")
+    table = next(
+        (t for t in doc.iter("table") if "table-striped" in (t.get("class") or "").split()),
+        None,
+    )
+    if table is None:
+        table = doc.find(".//table")
+    if table is None:
+        return None
+
+    thead = table.find(".//thead")
+    headers = [text_content(th, strip=True) for th in thead.iter("th")] if thead is not None else []
+
+    tbody = table.find(".//tbody")
+    rows = list(tbody.iter("tr")) if tbody is not None else list(table.iter("tr"))[1:]
+
+    return (
+        text_content(h1) if h1 is not None else "",
+        headers,
+        [[text_content(td, strip=True) for td in row.iter("td")] for row in rows],
+    )
+
+
 def parse_ptr_page_html(html: str, url: str = "") -> List[Dict[str, Any]]:
     """
     Parse PTR page HTML to extract transactions.
 
-    Reusable by both the HTTP client path and the legacy httpx path.
+    Reusable by both the HTTP client path and the legacy httpx path. Uses
+    the lxml backend unless HTML_PARSER_BACKEND=bs4; both give the same
+    output.
 
     PTR pages have a table with columns:
     #, Transaction Date, Owner, Ticker, Asset Name, Asset Type, Type, Amount, Comment
@@ -914,33 +942,23 @@ def parse_ptr_page_html(html: str, url: str = "") -> List[Dict[str, Any]]:
     transactions = []
 
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        extracted = _extract_ptr_page_lxml(html) if use_lxml() else _extract_ptr_page_bs4(html)
+        if extracted is None:
+            logger.debug(f"No table found on PTR page {url}")
+            return []
+        h1_text, header_cells, rows = extracted
 
         # Get filing date from h1
-        h1 = soup.find("h1")
         filing_date = None
-        if h1:
-            date_match = re.search(r"for\s+(\d{1,2}/\d{1,2}/\d{4})", h1.get_text())
-            if date_match:
-                try:
-                    filing_date = datetime.strptime(date_match.group(1), "%m/%d/%Y").isoformat()
-                except ValueError:
-                    pass
-
-        # Find the transaction table
-        table = soup.find("table", class_="table-striped")
-        if not table:
-            table = soup.find("table")
-
-        if not table:
-            logger.debug(f"No table found on PTR page {url}")
-            return []
+        date_match = re.search(r"for\s+(\d{1,2}/\d{1,2}/\d{4})", h1_text)
+        if date_match:
+            try:
+                filing_date = datetime.strptime(date_match.group(1), "%m/%d/%Y").isoformat()
+            except ValueError:
+                pass
 
         # Get header row to understand column order
-        thead = table.find("thead")
-        headers = []
-        if thead:
-            headers = [th.get_text(strip=True).lower() for th in thead.find_all("th")]
+        headers = [h.lower() for h in header_cells]
 
         # Default column mapping if headers not found
         col_map = {
@@ -972,18 +990,14 @@ def parse_ptr_page_html(html: str, url: str = "") -> List[Dict[str, Any]]:
                 col_map["amount"] = i
 
         # Parse table rows
-        tbody = table.find("tbody")
-        rows = tbody.find_all("tr") if tbody else table.find_all("tr")[1:]
-
-        for row in rows:
-            cells = row.find_all("td")
+        for cells in rows:
             if len(cells) < 6:
                 continue
 
             def get_cell(key: str, _cells=cells) -> str:
                 idx = col_map.get(key, -1)
                 if 0 <= idx < len(_cells):
-                    return _cells[idx].get_text(strip=True)
+                    return _cells[idx]
                 return ""
 
             # Extract transaction data
@@ -1073,7 +1087,11 @@ async def download_senate_pdf(
     client: httpx.AsyncClient,
     url: str,
 ) -> Optional[bytes]:
-    """Download a Senate disclosure PDF."""
+    """Download a Senate disclosure PDF, serving it from the local PDF cache when possible."""
+    cached = await load_cached_pdf(url)
+    if cached is not None:
+        return cached
+
     try:
         await rate_limiter.wait()
 
@@ -1088,6 +1106,7 @@ async def download_senate_pdf(
             content = response.content
             if content.startswith(b"%PDF"):
                 rate_limiter.record_success()
+                await store_cached_pdf(content, url)
                 return content
             else:
                 logger.warning(f"Downloaded content is not a PDF from {url}")
@@ -1138,7 +1157,7 @@ async def process_senate_disclosure(
     if not politician_id:
         politician_id = find_or_create_politician(
             supabase, name=disclosure.get("politician_name"), chamber="senate",
-            party=disclosure.get("party"),
+            party=disclosure.get("party"), index=get_politician_index(),
         )
 
     if not politician_id:
@@ -1167,10 +1186,13 @@ async def search_ptrs_with_fallback(
     limit: Optional[int] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    pool: Optional[BrowserPool] = None,
 ) -> Tuple[List[Dict[str, Any]], str]:
     """
     Search for PTR disclosures, trying HTTP first with Playwright fallback.
 
+    The Playwright fallback runs on `pool` when given.
+
     Returns (disclosures, tier) where tier is "http" or "playwright".
     """
     from app.services.senate_http_client import (
@@ -1204,6 +1226,7 @@ async def search_ptrs_with_fallback(
         limit=limit,
         start_date=start_date,
         end_date=end_date,
+        pool=pool,
     )
     return disclosures, "playwright"
 
@@ -1212,20 +1235,67 @@ async def process_disclosures_with_fallback(
     disclosures: List[Dict[str, Any]],
     supabase: Client,
     tier: str,
+    pool: Optional[BrowserPool] = None,
 ) -> Tuple[int, int]:
     """
     Process disclosures using the same tier that discovered them.
 
-    If HTTP fails mid-processing, falls back to Playwright for remaining.
+    If HTTP fails mid-processing, falls back to Playwright (on `pool` when
+    given) for remaining.
     """
     if tier == "http":
         try:
             return await process_disclosures_http(disclosures, supabase)
         except Exception as e:
             logger.warning(f"[Tier 1 HTTP] Processing failed, falling back to Playwright: {e}")
-            return await process_disclosures_playwright(disclosures, supabase)
+            return await process_disclosures_playwright(disclosures, supabase, pool=pool)
     else:
-        return await process_disclosures_playwright(disclosures, supabase)
+        return await process_disclosures_playwright(disclosures, supabase, pool=pool)
+
+
+async def _process_disclosure_http(
+    pool: "EFDSessionPool",
+    supabase: Client,
+    disclosure: Dict[str, Any],
+) -> int:
+    """Fetch one PTR page through the session pool and upload its transactions."""
+    if disclosure.get("is_paper"):
+        return 0
+
+    source_url = disclosure.get("source_url")
+    if not source_url:
+        return 0
+
+    transactions = await pool.fetch_ptr_page(source_url)
+    return await _upload_ptr_transactions(supabase, disclosure, transactions)
+
+
+async def _upload_ptr_transactions(
+    supabase: Client,
+    disclosure: Dict[str, Any],
+    transactions: List[Dict[str, Any]],
+) -> int:
+    """Upload a disclosure's parsed transactions, returning how many were stored."""
+    if not transactions:
+        return 0
+
+    politician_id = disclosure.get("politician_id")
+    if not politician_id:
+        politician_id = await run_db(
+            find_or_create_politician,
+            supabase, name=disclosure.get("politician_name"), chamber="senate",
+            party=disclosure.get("party"), index=get_politician_index(),
+        )
+
+    if not politician_id:
+        logger.warning(f"Could not find politician: {disclosure.get('politician_name')}")
+        return 0
+
+    results = await asyncio.gather(*(
+        run_db(upload_transaction_to_supabase, supabase, politician_id, transaction, disclosure)
+        for transaction in transactions
+    ))
+    return sum(1 for result in results if result)
 
 
 async def process_disclosures_http(
@@ -1233,58 +1303,52 @@ async def process_disclosures_http(
     supabase: Client,
 ) -> Tuple[int, int]:
     """
-    Process disclosures via the HTTP client with session cookies.
+    Process disclosures via a pool of HTTP sessions.
 
-    Uses SenateEFDClient to fetch PTR pages and parse_ptr_page_html() to parse.
+    PTR pages are fetched concurrently through EFDSessionPool (one worker
+    per session, paced by the pool's adaptive limiter) and parsed with
+    parse_ptr_page_html(). Raises EFDBlockedError once every session is
+    blocked so the caller can fall back to Playwright.
     """
-    from app.services.senate_http_client import SenateEFDClient, EFDBlockedError
+    from app.services.senate_http_client import (
+        EFDSessionPool,
+        EFDBlockedError,
+        EFDPageError,
+    )
 
     total_transactions = 0
     errors = 0
+    blocked: Optional[Exception] = None
+    pending = iter(enumerate(disclosures))
+
+    async with EFDSessionPool() as pool:
+        async def worker() -> None:
+            nonlocal total_transactions, errors, blocked
+            while blocked is None:
+                item = next(pending, None)
+                if item is None:
+                    return
+                i, disclosure = item
+                try:
+                    uploaded = await _process_disclosure_http(pool, supabase, disclosure)
+                    total_transactions += uploaded
+                except EFDBlockedError as e:
+                    # WAF blocked every session — stop and let the caller fall back
+                    logger.warning(f"[HTTP] WAF block during processing at disclosure {i}, falling back")
+                    blocked = e
+                except EFDPageError as e:
+                    # One page kept failing; the other sessions carry on
+                    errors += 1
+                    logger.warning(f"[HTTP] Skipping disclosure {i}: {e}")
+                except Exception as e:
+                    errors += 1
+                    logger.error(f"Error processing disclosure {i} via HTTP: {e}")
 
-    async with SenateEFDClient() as client:
-        for i, disclosure in enumerate(disclosures):
-            try:
-                if disclosure.get("is_paper"):
-                    continue
-
-                source_url = disclosure.get("source_url")
-                if not source_url:
-                    continue
-
-                transactions = await client.fetch_ptr_page(source_url)
-
-                if not transactions:
-                    continue
-
-                politician_id = disclosure.get("politician_id")
-                if not politician_id:
-                    politician_id = find_or_create_politician(
-                        supabase, name=disclosure.get("politician_name"), chamber="senate",
-                        party=disclosure.get("party"),
-                    )
-
-                if not politician_id:
-                    logger.warning(f"Could not find politician: {disclosure.get('politician_name')}")
-                    continue
-
-                for transaction in transactions:
-                    result = upload_transaction_to_supabase(
-                        supabase, politician_id, transaction, disclosure
-                    )
-                    if result:
-                        total_transactions += 1
-
-                # Brief delay to avoid hammering the server
-                await asyncio.sleep(0.3)
-
-            except EFDBlockedError:
-                # WAF blocked us mid-processing — re-raise to trigger Playwright fallback
-                logger.warning(f"[HTTP] WAF block during processing at disclosure {i}, falling back")
-                raise
-            except Exception as e:
-                errors += 1
-                logger.error(f"Error processing disclosure {i} via HTTP: {e}")
+        await asyncio.gather(*(worker() for _ in range(pool.size)))
+        logger.info(f"[HTTP] Session pool stats: {pool.get_stats()}")
+
+    if blocked is not None:
+        raise blocked
 
     return total_transactions, errors
 
@@ -1348,38 +1412,42 @@ async def run_senate_etl(
 
         logger.info(f"[Senate ETL] Upserted {len(senator_ids)} senators")
 
-        # Step 3: Search for disclosures (HTTP first, Playwright fallback)
-        JOB_STATUS[job_id]["message"] = "Searching EFD for disclosures..."
+        # One browser pool for search and processing; only launched if HTTP falls back
+        async with senate_browser_pool() as browser_pool:
+            # Step 3: Search for disclosures (HTTP first, Playwright fallback)
+            JOB_STATUS[job_id]["message"] = "Searching EFD for disclosures..."
 
-        raw_disclosures, discovery_tier = await search_ptrs_with_fallback(
-            lookback_days=lookback_days,
-            limit=limit,
-        )
+            raw_disclosures, discovery_tier = await search_ptrs_with_fallback(
+                lookback_days=lookback_days,
+                limit=limit,
+                pool=browser_pool,
+            )
 
-        logger.info(f"[Senate ETL] Discovery via [{discovery_tier}]: {len(raw_disclosures)} raw disclosures")
+            logger.info(f"[Senate ETL] Discovery via [{discovery_tier}]: {len(raw_disclosures)} raw disclosures")
 
-        # Step 4: Match disclosures to senators
-        disclosures = _match_disclosures_to_senators(raw_disclosures, senators)
+            # Step 4: Match disclosures to senators
+            disclosures = _match_disclosures_to_senators(raw_disclosures, senators)
 
-        # Filter to electronic PTRs only (paper filings are images)
-        electronic_disclosures = [d for d in disclosures if not d.get("is_paper")]
-        paper_count = len(disclosures) - len(electronic_disclosures)
+            # Filter to electronic PTRs only (paper filings are images)
+            electronic_disclosures = [d for d in disclosures if not d.get("is_paper")]
+            paper_count = len(disclosures) - len(electronic_disclosures)
 
-        JOB_STATUS[job_id]["total"] = len(electronic_disclosures)
-        JOB_STATUS[job_id]["message"] = (
-            f"Processing {len(electronic_disclosures)} electronic disclosures "
-            f"({paper_count} paper skipped) via [{discovery_tier}]..."
-        )
+            JOB_STATUS[job_id]["total"] = len(electronic_disclosures)
+            JOB_STATUS[job_id]["message"] = (
+                f"Processing {len(electronic_disclosures)} electronic disclosures "
+                f"({paper_count} paper skipped) via [{discovery_tier}]..."
+            )
 
-        logger.info(
-            f"[Senate ETL] Processing {len(electronic_disclosures)} electronic disclosures "
-            f"({paper_count} paper skipped) via [{discovery_tier}]"
-        )
+            logger.info(
+                f"[Senate ETL] Processing {len(electronic_disclosures)} electronic disclosures "
+                f"({paper_count} paper skipped) via [{discovery_tier}]"
+            )
+
+            # Step 5: Process disclosures using same tier as discovery
+            total_transactions, errors = await process_disclosures_with_fallback(
+                electronic_disclosures, supabase, discovery_tier, pool=browser_pool
+            )
 
-        # Step 5: Process disclosures using same tier as discovery
-        total_transactions, errors = await process_disclosures_with_fallback(
-            electronic_disclosures, supabase, discovery_tier
-        )
         disclosures_processed = len(electronic_disclosures) - errors
 
         # Update final status
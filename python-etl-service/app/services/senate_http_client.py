@@ -9,15 +9,28 @@ The CSRF flow:
 1. GET /search/           -> obtain csrftoken cookie
 2. POST /search/home/     -> accept agreement, get sessionid cookie
 3. POST /search/report/data/ -> search PTRs via DataTables JSON API
+
+EFDSessionPool holds several established sessions so PTR pages can be
+fetched concurrently under one adaptive concurrency limit.
+
+Established sessions (cookies + CSRF token) are persisted in the local
+session store; the next client with the same session key reuses them after
+a single GET /search/ probe instead of repeating the agreement POST.
 """
 
+import asyncio
 import logging
+import os
 import re
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import httpx
 
+from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from app.lib.session_store import get_session_store
+
 from app.services.senate_etl import (
     SENATE_BASE_URL,
     USER_AGENT,
@@ -27,6 +40,16 @@ from app.services.senate_etl import (
 
 logger = logging.getLogger(__name__)
 
+# Session pool configuration
+EFD_POOL_SIZE: int = int(os.environ.get("SENATE_EFD_SESSIONS", "4"))
+EFD_THROTTLE_CODES: Set[int] = {429, 502, 503, 504}
+EFD_FETCH_ATTEMPTS: int = 4  # Attempts per PTR page across sessions
+EFD_THROTTLE_BACKOFF: float = 2.0  # Seconds slept after a throttling response
+
+# Persisted session reuse
+EFD_SESSION_KEY: str = "efd-0"
+EFD_SESSION_TTL: float = float(os.environ.get("SENATE_EFD_SESSION_TTL", "1800"))
+
 
 class EFDSessionError(Exception):
     """Raised when the CSRF/session establishment flow fails."""
@@ -38,6 +61,26 @@ class EFDBlockedError(Exception):
     pass
 
 
+class EFDSessionExpiredError(EFDSessionError, EFDBlockedError):
+    """
+    Raised when a request is bounced to the agreement page.
+
+    The session has expired; establishing a new one usually recovers. Also
+    an EFDBlockedError so existing callers keep treating it as a block.
+    """
+    pass
+
+
+class EFDThrottledError(Exception):
+    """Raised when EFD answers with a throttling status (429/503/...)."""
+    pass
+
+
+class EFDPageError(Exception):
+    """Raised when one PTR page keeps failing while other sessions are still live."""
+    pass
+
+
 class SenateEFDClient:
     """
     Async HTTP client for the Senate EFD search system.
@@ -50,7 +93,13 @@ class SenateEFDClient:
                 txns = await client.fetch_ptr_page(d["source_url"])
     """
 
-    def __init__(self) -> None:
+    def __init__(self, session_key: Optional[str] = EFD_SESSION_KEY) -> None:
+        """
+        Args:
+            session_key: Name the established session is persisted under in
+                the session store, or None to always handshake afresh
+        """
+        self.session_key = session_key
         self._client: Optional[httpx.AsyncClient] = None
         self._csrf_token: Optional[str] = None
         self._session_established: bool = False
@@ -61,7 +110,8 @@ class SenateEFDClient:
             follow_redirects=True,
             timeout=30.0,
         )
-        await self.establish_session()
+        if not await self.restore_session():
+            await self.establish_session()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
@@ -126,6 +176,87 @@ class SenateEFDClient:
 
         self._session_established = True
         logger.info("[HTTP] Session established successfully")
+        await self._save_session()
+
+    async def restore_session(self) -> bool:
+        """
+        Adopt the persisted session for this client's key, if still valid.
+
+        The stored cookies are validated with one GET /search/: a live
+        session gets the search page, an expired one is redirected to the
+        agreement page. Never raises.
+
+        Returns:
+            True if the stored session was adopted
+        """
+        assert self._client is not None
+
+        store = get_session_store()
+        if store is None or self.session_key is None:
+            return False
+        try:
+            state = await asyncio.to_thread(store.load, self.session_key)
+        except Exception as e:
+            logger.warning(f"[HTTP] Could not read stored EFD session: {e}")
+            return False
+        if not state:
+            return False
+
+        for cookie in state.get("cookies", []):
+            self._client.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"]
+            )
+
+        try:
+            resp = await self._client.get(f"{SENATE_BASE_URL}/search/")
+            self._check_for_waf_block(resp, "GET /search/ (session probe)")
+            valid = "/home/" not in str(resp.url)
+        except Exception as e:
+            logger.info(f"[HTTP] Stored session probe failed: {e}")
+            valid = False
+
+        if not valid:
+            logger.info("[HTTP] Stored EFD session expired, establishing a new one")
+            self._client.cookies.clear()
+            await self.forget_session()
+            return False
+
+        self._csrf_token = self._client.cookies.get("csrftoken") or state.get("csrf_token")
+        self._session_established = True
+        logger.info("[HTTP] Reusing stored EFD session")
+        return True
+
+    async def _save_session(self) -> None:
+        """Persist the cookie jar and CSRF token under this client's key. Never raises."""
+        store = get_session_store()
+        if store is None or self.session_key is None or self._client is None:
+            return
+        try:
+            cookies = [
+                {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path, "expires": c.expires}
+                for c in self._client.cookies.jar
+            ]
+            # Don't outlive the server's own session cookie
+            ttl = EFD_SESSION_TTL
+            expiries = [c["expires"] for c in cookies if c["name"] == "sessionid" and c["expires"]]
+            if expiries:
+                ttl = min(ttl, min(expiries) - time.time())
+            if ttl <= 0:
+                return
+            state = {"cookies": cookies, "csrf_token": self._csrf_token}
+            await asyncio.to_thread(store.save, self.session_key, state, ttl)
+        except Exception as e:
+            logger.warning(f"[HTTP] Could not persist EFD session: {e}")
+
+    async def forget_session(self) -> None:
+        """Delete this client's persisted session. Never raises."""
+        store = get_session_store()
+        if store is None or self.session_key is None:
+            return
+        try:
+            await asyncio.to_thread(store.discard, self.session_key)
+        except Exception as e:
+            logger.warning(f"[HTTP] Could not discard stored EFD session: {e}")
 
     async def search_ptrs(
         self,
@@ -228,11 +359,14 @@ class SenateEFDClient:
         except Exception as e:
             raise EFDBlockedError(f"Failed to GET PTR page {url}: {e}") from e
 
+        if resp.status_code in EFD_THROTTLE_CODES:
+            raise EFDThrottledError(f"HTTP {resp.status_code} from GET {url}")
+
         self._check_for_waf_block(resp, f"GET {url}")
 
         # Check for redirect to agreement page (session expired)
         if "/home/" in str(resp.url) and "/home/" not in url:
-            raise EFDBlockedError(f"Redirected to agreement page when fetching {url}")
+            raise EFDSessionExpiredError(f"Redirected to agreement page when fetching {url}")
 
         return parse_ptr_page_html(resp.text, url)
 
@@ -250,3 +384,149 @@ class SenateEFDClient:
 
         if response.status_code == 200 and len(response.text.strip()) == 0:
             raise EFDBlockedError(f"Empty response body from {context}")
+
+
+class EFDSessionPool:
+    """
+    A pool of established EFD sessions for concurrent PTR page fetches.
+
+    Each session has its own cookies (csrftoken/sessionid) and serves one
+    request at a time; a shared AdaptiveConcurrencyLimiter caps how many
+    are in flight. An expired session is re-established in place, a
+    blocked one is retired, and throttling shrinks the limit. Sessions are
+    persisted under the keys ``efd-0`` .. ``efd-{size-1}``, so the next
+    job's pool starts from them.
+
+    Usage::
+
+        async with EFDSessionPool(size=4) as pool:
+            txns = await pool.fetch_ptr_page(url)
+    """
+
+    def __init__(
+        self,
+        size: int = EFD_POOL_SIZE,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ) -> None:
+        self.size = max(1, size)
+        self.limiter = limiter or AdaptiveConcurrencyLimiter(
+            initial=min(2, self.size), max_limit=self.size
+        )
+        self._idle: "asyncio.Queue[Optional[SenateEFDClient]]" = asyncio.Queue()
+        self._sessions: List[SenateEFDClient] = []
+        self._stats = {"fetches": 0, "reestablished": 0, "retired": 0, "throttled": 0}
+
+    @property
+    def live_sessions(self) -> int:
+        """Sessions still in service."""
+        return len(self._sessions)
+
+    async def __aenter__(self) -> "EFDSessionPool":
+        clients = [SenateEFDClient(session_key=f"efd-{i}") for i in range(self.size)]
+        results = await asyncio.gather(
+            *(client.__aenter__() for client in clients), return_exceptions=True
+        )
+        errors: List[BaseException] = []
+        for client, result in zip(clients, results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+                await client.__aexit__()
+            else:
+                self._sessions.append(client)
+                self._idle.put_nowait(client)
+
+        if not self._sessions:
+            raise errors[0]
+        if errors:
+            logger.warning(
+                f"[HTTP] Established {len(self._sessions)}/{self.size} EFD sessions: {errors[0]}"
+            )
+        else:
+            logger.info(f"[HTTP] Established {self.size} EFD sessions")
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        for session in self._sessions:
+            await session.__aexit__()
+        self._sessions = []
+
+    async def _checkout(self) -> SenateEFDClient:
+        session = await self._idle.get()
+        if session is None:
+            # Every session was retired; wake the next waiter too
+            self._idle.put_nowait(None)
+            raise EFDBlockedError("All EFD sessions blocked")
+        return session
+
+    async def _retire(self, session: SenateEFDClient, reason: Exception) -> None:
+        self._sessions.remove(session)
+        self._stats["retired"] += 1
+        await session.forget_session()
+        await session.__aexit__()
+        logger.warning(f"[HTTP] Retired EFD session ({self.live_sessions} left): {reason}")
+        if not self._sessions:
+            self._idle.put_nowait(None)
+
+    async def _reestablish(self, session: SenateEFDClient) -> bool:
+        """Re-run the CSRF flow on an expired session, retiring it on failure."""
+        try:
+            await session.establish_session()
+        except (EFDSessionError, EFDBlockedError) as e:
+            await self._retire(session, e)
+            return False
+        self._stats["reestablished"] += 1
+        return True
+
+    async def fetch_ptr_page(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Fetch and parse a PTR page on whichever session is free.
+
+        Raises:
+            EFDBlockedError: If every session has been blocked
+            EFDPageError: If the page could not be fetched in
+                EFD_FETCH_ATTEMPTS attempts but sessions remain in service
+        """
+        last_error: Optional[Exception] = None
+        for _ in range(EFD_FETCH_ATTEMPTS):
+            session = await self._checkout()
+            try:
+                async with self.limiter.slot():
+                    transactions = await session.fetch_ptr_page(url)
+            except EFDSessionError as e:
+                last_error = e
+                if not await self._reestablish(session):
+                    continue
+            except EFDThrottledError as e:
+                last_error = e
+                self._stats["throttled"] += 1
+                self.limiter.record_throttle()
+                self._idle.put_nowait(session)
+                await asyncio.sleep(EFD_THROTTLE_BACKOFF)
+                continue
+            except EFDBlockedError as e:
+                last_error = e
+                self.limiter.record_throttle()
+                await self._retire(session, e)
+                continue
+            except BaseException:
+                self._idle.put_nowait(session)
+                raise
+            else:
+                self._stats["fetches"] += 1
+                self.limiter.record_success()
+                self._idle.put_nowait(session)
+                return transactions
+
+            self._idle.put_nowait(session)
+
+        if not self.live_sessions:
+            raise EFDBlockedError(f"All EFD sessions blocked, giving up on {url}: {last_error}")
+        raise EFDPageError(f"Giving up on {url}: {last_error}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool counters and the limiter's state."""
+        return {
+            **self._stats,
+            "live_sessions": self.live_sessions,
+            "limiter": self.limiter.get_stats(),
+        }
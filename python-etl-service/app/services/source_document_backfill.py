@@ -13,25 +13,18 @@ Matching strategy:
 """
 
 import asyncio
-import io
 import logging
 import re
-import zipfile
 from collections import defaultdict
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-import httpx
-
 from app.lib.database import get_supabase
+from app.services.house_etl import HouseDisclosureScraper, fetch_house_index
 
 logger = logging.getLogger(__name__)
 
-# House Clerk URLs
-HOUSE_BASE_URL = "https://disclosures-clerk.house.gov"
-HOUSE_ZIP_URL_TEMPLATE = "{base_url}/public_disc/financial-pdfs/{year}FD.ZIP"
-
 # Filing types
 FILING_TYPE_PTR = "P"  # Periodic Transaction Report (trades)
 
@@ -236,77 +229,12 @@ class SourceDocumentBackfillService:
         }
 
     async def _fetch_house_index(self, year: int) -> List[Dict[str, Any]]:
-        """Fetch and parse the House disclosure index for a year."""
-        url = HOUSE_ZIP_URL_TEMPLATE.format(base_url=HOUSE_BASE_URL, year=year)
-
-        try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; BackfillBot/1.0)"},
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"Failed to download House ZIP: {response.status_code}")
-                    return []
-
-                zip_content = response.content
-
-                # Extract index file
-                txt_filename = f"{year}FD.txt"
-                with zipfile.ZipFile(io.BytesIO(zip_content)) as z:
-                    if txt_filename not in z.namelist():
-                        return []
-
-                    with z.open(txt_filename) as f:
-                        content = f.read().decode("utf-8", errors="ignore")
-
-                return self._parse_house_index(content, year)
-
-        except Exception as e:
-            logger.error(f"Error fetching House index: {e}")
-            return []
+        """Fetch and parse the House disclosure index for a year (shared, cached)."""
+        return await fetch_house_index(year) or []
 
     def _parse_house_index(self, content: str, year: int) -> List[Dict[str, Any]]:
         """Parse House disclosure index content."""
-        lines = content.strip().split("\n")
-        filings = []
-
-        for line in lines[1:]:  # Skip header
-            fields = line.split("\t")
-            if len(fields) < 9:
-                continue
-
-            prefix, last_name, first_name, suffix = fields[0:4]
-            filing_type, state_district, file_year = fields[4:7]
-            filing_date_str, doc_id = fields[7:9]
-
-            doc_id = doc_id.strip()
-            if not doc_id or doc_id == "DocID":
-                continue
-
-            # Parse filing date
-            filing_date = None
-            if filing_date_str:
-                try:
-                    filing_date = datetime.strptime(filing_date_str.strip(), "%m/%d/%Y").isoformat()
-                except ValueError:
-                    pass
-
-            # Build full name
-            name_parts = [p.strip() for p in [prefix, first_name, last_name, suffix] if p.strip()]
-            full_name = " ".join(name_parts)
-
-            filings.append({
-                "doc_id": doc_id,
-                "politician_name": full_name,
-                "filing_type": filing_type.strip(),
-                "filing_date": filing_date,
-                "state_district": state_district.strip(),
-                "year": year,
-            })
-
-        return filings
+        return HouseDisclosureScraper.parse_disclosure_index(content, year)
 
     async def _fetch_records_without_source_id(self, year: int) -> List[Dict[str, Any]]:
         """Fetch trading disclosures without source_document_id for a year, with politician names."""
@@ -12,25 +12,18 @@ Validates:
 """
 
 import asyncio
-import io
 import logging
 import os
 import re
-import zipfile
 from collections import defaultdict
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-import httpx
-
 from app.lib.database import get_supabase
+from app.services.house_etl import fetch_house_index, iter_house_index
 
 logger = logging.getLogger(__name__)
 
-# House Clerk URLs
-HOUSE_BASE_URL = "https://disclosures-clerk.house.gov"
-HOUSE_ZIP_URL_TEMPLATE = "{base_url}/public_disc/financial-pdfs/{year}FD.ZIP"
-
 # Filing types
 FILING_TYPE_PTR = "P"  # Periodic Transaction Report (trades)
 FILING_TYPE_FD = "FD"  # Financial Disclosure (annual)
@@ -250,80 +243,20 @@ class SourceValidationService:
         }
 
     async def _fetch_house_index(self, year: int) -> List[Dict[str, Any]]:
-        """Fetch and parse the House disclosure index for a year."""
-        url = HOUSE_ZIP_URL_TEMPLATE.format(base_url=HOUSE_BASE_URL, year=year)
-
-        try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; ValidationBot/1.0)"},
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"Failed to download House ZIP: {response.status_code}")
-                    return []
-
-                zip_content = response.content
-                logger.info(f"Downloaded House ZIP: {len(zip_content):,} bytes")
-
-                # Extract index file
-                txt_filename = f"{year}FD.txt"
-                with zipfile.ZipFile(io.BytesIO(zip_content)) as z:
-                    if txt_filename not in z.namelist():
-                        logger.error(f"Index file {txt_filename} not found in ZIP")
-                        return []
-
-                    with z.open(txt_filename) as f:
-                        content = f.read().decode("utf-8", errors="ignore")
-
-                # Parse index
-                return self._parse_house_index(content, year)
-
-        except Exception as e:
-            logger.error(f"Error fetching House index: {e}")
-            return []
-
-    def _parse_house_index(self, content: str, year: int) -> List[Dict[str, Any]]:
-        """Parse House disclosure index content."""
-        lines = content.strip().split("\n")
-        filings = []
-
-        for line in lines[1:]:  # Skip header
-            fields = line.split("\t")
-            if len(fields) < 9:
-                continue
-
-            prefix, last_name, first_name, suffix = fields[0:4]
-            filing_type, state_district, file_year = fields[4:7]
-            filing_date_str, doc_id = fields[7:9]
-
-            doc_id = doc_id.strip()
-            if not doc_id or doc_id == "DocID":
-                continue
-
-            # Parse filing date
-            filing_date = None
-            if filing_date_str:
-                try:
-                    filing_date = datetime.strptime(filing_date_str.strip(), "%m/%d/%Y").isoformat()
-                except ValueError:
-                    pass
-
-            # Build full name
-            name_parts = [p.strip() for p in [prefix, first_name, last_name, suffix] if p.strip()]
-            full_name = " ".join(name_parts)
-
-            filings.append({
-                "doc_id": doc_id,
-                "politician_name": full_name,
-                "filing_type": filing_type.strip(),
-                "filing_date": filing_date,
-                "state_district": state_district.strip(),
-                "year": year,
-            })
+        """Fetch and parse the House disclosure index for a year (shared, cached)."""
+        return await fetch_house_index(year) or []
 
-        return filings
+    async def _fetch_ptr_doc_ids(self, year: int) -> Optional[set]:
+        """Collect a year's PTR doc_ids, streaming the index rather than loading it."""
+        filings = await iter_house_index(year)
+        if filings is None:
+            return None
+        return await asyncio.to_thread(
+            lambda: {
+                f["doc_id"] for f in filings
+                if f.get("filing_type") == FILING_TYPE_PTR and f.get("doc_id")
+            }
+        )
 
     def _aggregate_filings_by_month(self, filings: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Aggregate official filings by month."""
@@ -540,9 +473,9 @@ class SourceValidationService:
         for year in range(from_year, to_year + 1):
             logger.info(f"Validating year {year}...")
 
-            # Fetch official index for this year
-            official_index = await self._fetch_house_index(year)
-            if not official_index:
+            # Fetch official PTR filings for this year
+            official_ptr_doc_ids = await self._fetch_ptr_doc_ids(year)
+            if official_ptr_doc_ids is None:
                 yearly_results.append({
                     "year": year,
                     "status": "error",
@@ -550,10 +483,6 @@ class SourceValidationService:
                 })
                 continue
 
-            # Filter to PTR filings only
-            ptr_filings = [f for f in official_index if f.get("filing_type") == FILING_TYPE_PTR]
-            official_ptr_doc_ids = {f["doc_id"] for f in ptr_filings if f.get("doc_id")}
-
             # Calculate matches
             matched_docs = official_ptr_doc_ids & all_app_doc_ids
             missing_docs = official_ptr_doc_ids - all_app_doc_ids
@@ -824,36 +753,12 @@ class CountBasedValidationService:
     async def _get_official_ptr_count(self, year: int) -> int:
         """Get count of PTR filings from official House index."""
         try:
-            url = HOUSE_ZIP_URL_TEMPLATE.format(base_url=HOUSE_BASE_URL, year=year)
-
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; ValidationBot/1.0)"},
-                )
-
-                if response.status_code != 200:
-                    return 0
-
-                zip_content = response.content
-                txt_filename = f"{year}FD.txt"
-
-                with zipfile.ZipFile(io.BytesIO(zip_content)) as z:
-                    if txt_filename not in z.namelist():
-                        return 0
-
-                    with z.open(txt_filename) as f:
-                        content = f.read().decode("utf-8", errors="ignore")
-
-                # Count PTR filings (filing_type = "P")
-                count = 0
-                for line in content.strip().split("\n")[1:]:
-                    fields = line.split("\t")
-                    if len(fields) >= 5 and fields[4].strip() == "P":
-                        count += 1
-
-                return count
-
+            filings = await iter_house_index(year)
+            if filings is None:
+                return 0
+            return await asyncio.to_thread(
+                lambda: sum(1 for f in filings if f.get("filing_type") == FILING_TYPE_PTR)
+            )
         except Exception as e:
             logger.error(f"Error getting official PTR count: {e}")
             return 0
@@ -920,38 +825,17 @@ class CountBasedValidationService:
     async def _get_official_politicians_count(self, year: int) -> int:
         """Get count of unique politicians in official index for a year."""
         try:
-            url = HOUSE_ZIP_URL_TEMPLATE.format(base_url=HOUSE_BASE_URL, year=year)
-
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; ValidationBot/1.0)"},
-                )
-
-                if response.status_code != 200:
-                    return 0
-
-                zip_content = response.content
-                txt_filename = f"{year}FD.txt"
-
-                with zipfile.ZipFile(io.BytesIO(zip_content)) as z:
-                    if txt_filename not in z.namelist():
-                        return 0
-
-                    with z.open(txt_filename) as f:
-                        content = f.read().decode("utf-8", errors="ignore")
-
-                # Get unique politicians from PTR filings
-                politicians = set()
-                for line in content.strip().split("\n")[1:]:
-                    fields = line.split("\t")
-                    if len(fields) >= 5 and fields[4].strip() == "P":
-                        # fields[1] is last name, fields[2] is first name
-                        name = f"{fields[2].strip()} {fields[1].strip()}"
-                        politicians.add(name.lower())
-
-                return len(politicians)
-
+            filings = await iter_house_index(year)
+            if filings is None:
+                return 0
+            politicians = await asyncio.to_thread(
+                lambda: {
+                    f"{f['first_name']} {f['last_name']}".lower()
+                    for f in filings
+                    if f.get("filing_type") == FILING_TYPE_PTR
+                }
+            )
+            return len(politicians)
         except Exception as e:
             logger.error(f"Error getting official politicians count: {e}")
             return 0
@@ -8,24 +8,61 @@ trading_disclosures with per-MP incremental upload.
 Data sources:
 - Members API: https://members-api.parliament.uk/api/Members/Search
 - Interests API: https://interests-api.parliament.uk/api/v1/Interests
+
+Both APIs are reached through one pooled UKParliamentAPI client. MPs are
+processed by UK_MP_WORKERS concurrent workers, and an
+AdaptiveConcurrencyLimiter keeps the number of API requests in flight
+within UK_API_CONCURRENCY_MAX.
+
+Each MP's high-water mark (highest interest ID, latest registration/
+published/updated date) is kept in a persistent WatermarkStore once the
+MP's interests are uploaded. Incremental runs (incremental=True) upload
+only interests past the mark and skip MPs with no changes.
 """
 
+import asyncio
 import logging
+import os
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 
+from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from app.lib.async_db import run_db
 from app.lib.base_etl import BaseETLService, ETLResult, JobStatus
 from app.lib.database import get_supabase, upload_transaction_to_supabase
 from app.lib.politician import find_or_create_politician
+from app.lib.politician_index import get_politician_index
 from app.lib.registry import ETLRegistry
+from app.lib.watermark_store import WatermarkStore, get_watermark_store
+from app.lib.worker_pool import for_each_concurrently
 
 logger = logging.getLogger(__name__)
 
 MEMBERS_API_BASE = "https://members-api.parliament.uk/api"
 INTERESTS_API_BASE = "https://interests-api.parliament.uk/api/v1"
 
+# Page size requested from both APIs. Pagination follows the number of items
+# actually returned, so an API that caps `take` lower still pages correctly;
+# one that rejects the size (400) is retried at DEFAULT_PAGE_SIZE.
+PAGE_SIZE = int(os.environ.get("UK_API_PAGE_SIZE", "100"))
+DEFAULT_PAGE_SIZE = 20
+
+# Concurrency: MPs processed at once, and the adaptive bounds on API
+# requests in flight
+MP_WORKERS = int(os.environ.get("UK_MP_WORKERS", "4"))
+API_CONCURRENCY_INITIAL = int(os.environ.get("UK_API_CONCURRENCY_INITIAL", "2"))
+API_CONCURRENCY_MAX = int(os.environ.get("UK_API_CONCURRENCY_MAX", "6"))
+
+# Retries for throttled requests
+THROTTLE_CODES = {429, 502, 503, 504}
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 2.0
+
+# Per-MP sync watermarks
+WATERMARK_STORE_NAME = "uk_interests"
+
 # UK Parliament interest category ID -> transaction_type
 CATEGORY_MAP: Dict[int, str] = {
     # Income categories
@@ -47,6 +84,88 @@ CATEGORY_MAP: Dict[int, str] = {
 }
 
 
+class UKParliamentAPI:
+    """
+    Pooled async client for the Members and Interests APIs.
+
+    One keep-alive connection pool is shared by every request, and a shared
+    AdaptiveConcurrencyLimiter caps how many are in flight; throttling
+    responses shrink the cap and are retried with backoff.
+
+    Usage::
+
+        async with UKParliamentAPI() as api:
+            async for items in api.paginate(url, {"MemberId": 4514}):
+                ...
+    """
+
+    def __init__(
+        self,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        page_size: int = PAGE_SIZE,
+    ) -> None:
+        self.limiter = limiter or AdaptiveConcurrencyLimiter(
+            initial=API_CONCURRENCY_INITIAL, max_limit=API_CONCURRENCY_MAX
+        )
+        self.page_size = max(1, page_size)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "UKParliamentAPI":
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=self.limiter.max_limit,
+                max_keepalive_connections=self.limiter.max_limit,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def get(self, url: str, params: Dict[str, Any]) -> httpx.Response:
+        """GET under the limiter, retrying throttled responses with backoff."""
+        assert self._client is not None, "Client not initialized (use async with)"
+
+        for attempt in range(MAX_RETRIES):
+            async with self.limiter.slot():
+                resp = await self._client.get(url, params=params)
+            if resp.status_code not in THROTTLE_CODES:
+                self.limiter.record_success()
+                return resp
+            self.limiter.record_throttle()
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(BACKOFF_BASE_SECONDS * 2 ** attempt)
+        return resp
+
+    async def paginate(
+        self, url: str, params: Dict[str, Any]
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield each page of `items` from a skip/take paginated endpoint."""
+        skip = 0
+        while True:
+            resp = await self.get(url, {**params, "skip": skip, "take": self.page_size})
+            if resp.status_code == 400 and self.page_size > DEFAULT_PAGE_SIZE:
+                logger.warning(
+                    f"Page size {self.page_size} rejected by {url}, "
+                    f"falling back to {DEFAULT_PAGE_SIZE}"
+                )
+                self.page_size = DEFAULT_PAGE_SIZE
+                continue
+            resp.raise_for_status()
+            data = resp.json()
+
+            items = data.get("items", [])
+            yield items
+
+            total = data.get("totalResults", 0)
+            skip += len(items)
+            if skip >= total or not items:
+                return
+
+
 @ETLRegistry.register
 class UKParliamentETLService(BaseETLService):
     """
@@ -86,7 +205,8 @@ class UKParliamentETLService(BaseETLService):
             politician_id = disclosure.get("politician_id")
             if not politician_id:
                 # Fallback: resolve politician (shouldn't happen in normal flow)
-                politician_id = find_or_create_politician(
+                politician_id = await run_db(
+                    find_or_create_politician,
                     supabase,
                     name=disclosure.get("politician_name"),
                     first_name=disclosure.get("first_name"),
@@ -95,12 +215,14 @@ class UKParliamentETLService(BaseETLService):
                     state=disclosure.get("state"),
                     bioguide_id=disclosure.get("bioguide_id"),
                     party=disclosure.get("party"),
+                    index=get_politician_index(),
                 )
 
             if not politician_id:
                 return None
 
-            return upload_transaction_to_supabase(
+            return await run_db(
+                upload_transaction_to_supabase,
                 supabase, politician_id, disclosure, disclosure,
                 update_mode=update_mode,
             )
@@ -114,105 +236,76 @@ class UKParliamentETLService(BaseETLService):
     # =========================================================================
 
     async def _fetch_mp_list(
-        self, limit: Optional[int] = None
+        self,
+        limit: Optional[int] = None,
+        api: Optional[UKParliamentAPI] = None,
     ) -> List[Dict[str, Any]]:
         """Fetch current House of Commons MPs from the Members API.
 
         Args:
             limit: Max MPs to return (for testing).
+            api: Shared client; a temporary one is opened when not given.
 
         Returns:
             List of dicts with id, name, first_name, last_name, party, constituency.
         """
+        if api is None:
+            async with UKParliamentAPI() as api:
+                return await self._fetch_mp_list(limit=limit, api=api)
+
         mps: List[Dict[str, Any]] = []
-        skip = 0
-        take = 20
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            while True:
-                resp = await client.get(
-                    f"{MEMBERS_API_BASE}/Members/Search",
-                    params={
-                        "House": 1,  # Commons
-                        "IsCurrentMember": True,
-                        "skip": skip,
-                        "take": take,
-                    },
+        params = {"House": 1, "IsCurrentMember": True}  # Commons
+
+        async for items in api.paginate(f"{MEMBERS_API_BASE}/Members/Search", params):
+            for item in items:
+                member = item.get("value", {})
+                name = member.get("nameDisplayAs", "")
+                name_parts = member.get("nameListAs", "").split(", ", 1)
+                last_name = name_parts[0].strip() if name_parts else ""
+                first_name = (
+                    name_parts[1].strip() if len(name_parts) > 1 else ""
                 )
-                resp.raise_for_status()
-                data = resp.json()
-
-                items = data.get("items", [])
-                for item in items:
-                    member = item.get("value", {})
-                    name = member.get("nameDisplayAs", "")
-                    name_parts = member.get("nameListAs", "").split(", ", 1)
-                    last_name = name_parts[0].strip() if name_parts else ""
-                    first_name = (
-                        name_parts[1].strip() if len(name_parts) > 1 else ""
-                    )
-
-                    party_info = member.get("latestParty", {})
-                    house_info = member.get("latestHouseMembership", {})
 
-                    mps.append({
-                        "id": member.get("id"),
-                        "name": name,
-                        "first_name": first_name,
-                        "last_name": last_name,
-                        "party": party_info.get("name", ""),
-                        "constituency": house_info.get("membershipFrom", ""),
-                    })
+                party_info = member.get("latestParty", {})
+                house_info = member.get("latestHouseMembership", {})
 
-                    if limit and len(mps) >= limit:
-                        return mps
+                mps.append({
+                    "id": member.get("id"),
+                    "name": name,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "party": party_info.get("name", ""),
+                    "constituency": house_info.get("membershipFrom", ""),
+                })
 
-                total = data.get("totalResults", 0)
-                skip += len(items)
-                if skip >= total or not items:
-                    break
+                if limit and len(mps) >= limit:
+                    return mps
 
         self.logger.info(f"Fetched {len(mps)} MPs from Members API")
         return mps
 
     async def _fetch_mp_interests(
-        self, mp_id: int
+        self, mp_id: int, api: Optional[UKParliamentAPI] = None
     ) -> List[Dict[str, Any]]:
         """Fetch all interests for a single MP from the Interests API.
 
         Args:
             mp_id: The Parliament Members API ID for the MP.
+            api: Shared client; a temporary one is opened when not given.
 
         Returns:
             List of raw interest dicts from the API, with child interests expanded.
         """
-        interests: List[Dict[str, Any]] = []
-        skip = 0
-        take = 20
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            while True:
-                resp = await client.get(
-                    f"{INTERESTS_API_BASE}/Interests",
-                    params={
-                        "MemberId": mp_id,
-                        "ExpandChildInterests": True,
-                        "skip": skip,
-                        "take": take,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+        if api is None:
+            async with UKParliamentAPI() as api:
+                return await self._fetch_mp_interests(mp_id, api=api)
 
-                items = data.get("items", [])
-                for item in items:
-                    # Interests API returns items directly (no "value" wrapper)
-                    interests.append(item)
+        interests: List[Dict[str, Any]] = []
+        params = {"MemberId": mp_id, "ExpandChildInterests": True}
 
-                total = data.get("totalResults", 0)
-                skip += len(items)
-                if skip >= total or not items:
-                    break
+        async for items in api.paginate(f"{INTERESTS_API_BASE}/Interests", params):
+            # Interests API returns items directly (no "value" wrapper)
+            interests.extend(items)
 
         return interests
 
@@ -336,6 +429,118 @@ class UKParliamentETLService(BaseETLService):
     # Main Execution — Incremental Per-MP Upload
     # =========================================================================
 
+    async def _process_mp(
+        self,
+        mp: Dict[str, Any],
+        api: UKParliamentAPI,
+        supabase,
+        result: ETLResult,
+        update_mode: bool = False,
+        incremental: bool = False,
+        watermark: Optional[Dict[str, Any]] = None,
+        store: Optional[WatermarkStore] = None,
+    ) -> str:
+        """Fetch one MP's interests and upload them, counting into `result`.
+
+        Args:
+            incremental: Upload only interests past `watermark`, and skip
+                the MP entirely when there are none.
+            watermark: The MP's stored watermark, if any.
+            store: Where the MP's new watermark is recorded once all of
+                its uploads succeed.
+
+        Returns:
+            "changed", "skipped" (incremental, nothing new) or "failed".
+        """
+        mp_name = mp["name"]
+        try:
+            interests = await self._fetch_mp_interests(mp["id"], api=api)
+        except Exception as e:
+            result.records_failed += 1
+            result.add_error(
+                f"Failed to fetch interests for {mp_name}: {e}"
+            )
+            return "failed"
+
+        to_upload = interests
+        if incremental:
+            to_upload = [
+                changed for changed in (_changed_since(i, watermark) for i in interests)
+                if changed is not None
+            ]
+            if not to_upload:
+                return "skipped"
+
+        # Resolve politician once per MP
+        politician_id = await run_db(
+            find_or_create_politician,
+            supabase,
+            name=mp["name"],
+            first_name=mp["first_name"],
+            last_name=mp["last_name"],
+            chamber="uk_parliament",
+            state="United Kingdom",
+            district=mp["constituency"],
+            bioguide_id=str(mp["id"]),
+            party=mp["party"],
+            index=get_politician_index(),
+        )
+
+        if not politician_id:
+            result.records_failed += 1
+            result.add_error(
+                f"Failed to create politician for {mp_name}"
+            )
+            return "failed"
+
+        # Parse and upload each interest immediately
+        failed = 0
+        for interest in to_upload:
+            records = self._parse_interest(interest, mp)
+            for record in records:
+                result.records_processed += 1
+                try:
+                    parsed = await self.parse_disclosure(record)
+                    if not parsed:
+                        result.records_skipped += 1
+                        continue
+
+                    if not await self.validate_disclosure(parsed):
+                        result.records_skipped += 1
+                        continue
+
+                    # Inject pre-resolved politician_id
+                    parsed["politician_id"] = politician_id
+
+                    disclosure_id = await self.upload_disclosure(
+                        parsed, update_mode=update_mode
+                    )
+
+                    if disclosure_id:
+                        if update_mode:
+                            result.records_updated += 1
+                        else:
+                            result.records_inserted += 1
+                    else:
+                        result.records_skipped += 1
+
+                except Exception as e:
+                    failed += 1
+                    result.records_failed += 1
+                    result.add_error(f"Failed to upload: {e}")
+
+        if to_upload:
+            uploaded = result.records_inserted + result.records_updated
+            self.logger.info(
+                f"{mp_name}: uploaded {len(to_upload)} interests "
+                f"(total: {uploaded})"
+            )
+
+        # Advance the watermark only when nothing needs retrying
+        if store is not None and not failed:
+            await run_db(store.set, str(mp["id"]), _merge_watermarks(watermark, _watermark_for(interests)))
+        return "changed"
+
     async def run(
         self,
         job_id: str,
@@ -343,7 +548,15 @@ class UKParliamentETLService(BaseETLService):
         update_mode: bool = False,
         **kwargs,
     ) -> ETLResult:
-        """Execute UK Parliament ETL with incremental per-MP uploads."""
+        """Execute UK Parliament ETL with incremental per-MP uploads.
+
+        Kwargs:
+            incremental: Upload only interests newer than each MP's stored
+                watermark and skip unchanged MPs (ignored in update mode).
+
+        Changed, skipped and failed MP counts are reported in
+        result.metadata.
+        """
         result = ETLResult(started_at=datetime.now(timezone.utc))
         self._job_status[job_id] = JobStatus(
             status="running",
@@ -361,106 +574,71 @@ class UKParliamentETLService(BaseETLService):
                 self._job_status[job_id].message = "Supabase unavailable"
                 return result
 
-            self.update_job_status(job_id, message="Fetching MP list...")
-            mps = await self._fetch_mp_list(limit=limit)
+            async with UKParliamentAPI() as api:
+                self.update_job_status(job_id, message="Fetching MP list...")
+                mps = await self._fetch_mp_list(limit=limit, api=api)
 
-            if not mps:
-                result.add_warning("No MPs fetched from Members API")
-                self.update_job_status(
-                    job_id, status="completed",
-                    message="No MPs to process",
-                )
-                result.completed_at = datetime.now(timezone.utc)
-                return result
-
-            total_mps = len(mps)
-            self.update_job_status(job_id, total=total_mps)
-            self.logger.info(
-                f"Processing {total_mps} MPs with incremental upload"
-            )
-
-            for i, mp in enumerate(mps):
-                mp_name = mp["name"]
-                uploaded = result.records_inserted + result.records_updated
-                self.update_job_status(
-                    job_id, progress=i + 1,
-                    message=(
-                        f"MP {i + 1}/{total_mps}: {mp_name} "
-                        f"({uploaded} uploaded)"
-                    ),
-                )
-
-                try:
-                    interests = await self._fetch_mp_interests(mp["id"])
-                except Exception as e:
-                    result.records_failed += 1
-                    result.add_error(
-                        f"Failed to fetch interests for {mp_name}: {e}"
+                if not mps:
+                    result.add_warning("No MPs fetched from Members API")
+                    self.update_job_status(
+                        job_id, status="completed",
+                        message="No MPs to process",
                     )
-                    continue
-
-                # Resolve politician once per MP
-                politician_id = find_or_create_politician(
-                    supabase,
-                    name=mp["name"],
-                    first_name=mp["first_name"],
-                    last_name=mp["last_name"],
-                    chamber="uk_parliament",
-                    state="United Kingdom",
-                    district=mp["constituency"],
-                    bioguide_id=str(mp["id"]),
-                    party=mp["party"],
+                    result.completed_at = datetime.now(timezone.utc)
+                    return result
+
+                incremental = bool(kwargs.get("incremental")) and not update_mode
+                store = get_watermark_store(WATERMARK_STORE_NAME)
+                watermarks: Dict[str, Dict[str, Any]] = {}
+                if incremental:
+                    if store is None:
+                        self.logger.warning("Watermark store unavailable; processing every MP")
+                    else:
+                        watermarks = await run_db(store.get_all)
+
+                total_mps = len(mps)
+                self.update_job_status(job_id, total=total_mps)
+                self.logger.info(
+                    f"Processing {total_mps} MPs with incremental upload "
+                    f"({min(MP_WORKERS, total_mps)} workers)"
                 )
 
-                if not politician_id:
-                    result.records_failed += 1
-                    result.add_error(
-                        f"Failed to create politician for {mp_name}"
+                completed = 0
+                outcomes = {"changed": 0, "skipped": 0, "failed": 0}
+
+                async def process(i: int, mp: Dict[str, Any]) -> None:
+                    nonlocal completed
+                    outcome = await self._process_mp(
+                        mp, api, supabase, result, update_mode,
+                        incremental=incremental,
+                        watermark=watermarks.get(str(mp["id"])),
+                        store=store,
                     )
-                    continue
-
-                # Parse and upload each interest immediately
-                for interest in interests:
-                    records = self._parse_interest(interest, mp)
-                    for record in records:
-                        result.records_processed += 1
-                        try:
-                            parsed = await self.parse_disclosure(record)
-                            if not parsed:
-                                result.records_skipped += 1
-                                continue
-
-                            if not await self.validate_disclosure(parsed):
-                                result.records_skipped += 1
-                                continue
-
-                            # Inject pre-resolved politician_id
-                            parsed["politician_id"] = politician_id
-
-                            disclosure_id = await self.upload_disclosure(
-                                parsed, update_mode=update_mode
-                            )
-
-                            if disclosure_id:
-                                if update_mode:
-                                    result.records_updated += 1
-                                else:
-                                    result.records_inserted += 1
-                            else:
-                                result.records_skipped += 1
-
-                        except Exception as e:
-                            result.records_failed += 1
-                            result.add_error(f"Failed to upload: {e}")
-
-                if interests:
+                    outcomes[outcome] += 1
+                    completed += 1
                     uploaded = result.records_inserted + result.records_updated
-                    self.logger.info(
-                        f"MP {i + 1}/{total_mps} {mp_name}: "
-                        f"uploaded {len(interests)} interests "
-                        f"(total: {uploaded})"
+                    self.update_job_status(
+                        job_id, progress=completed,
+                        message=(
+                            f"MP {completed}/{total_mps}: {mp['name']} "
+                            f"({uploaded} uploaded)"
+                        ),
                     )
 
+                await for_each_concurrently(mps, process, workers=MP_WORKERS)
+                self.logger.info(f"API concurrency: {api.limiter.get_stats()}")
+
+                result.metadata.update({
+                    "incremental": incremental,
+                    "mps_changed": outcomes["changed"],
+                    "mps_skipped": outcomes["skipped"],
+                    "mps_failed": outcomes["failed"],
+                })
+                self.logger.info(
+                    f"MPs: {outcomes['changed']} changed, {outcomes['skipped']} skipped "
+                    f"(unchanged), {outcomes['failed']} failed"
+                )
+
             # Complete
             result.completed_at = datetime.now(timezone.utc)
             self._job_status[job_id].status = "completed"
@@ -486,3 +664,71 @@ class UKParliamentETLService(BaseETLService):
             self.logger.exception(f"UK Parliament ETL failed: {e}")
 
         return result
+
+
+# =============================================================================
+# Incremental Sync Helpers
+# =============================================================================
+
+
+def _interest_stamp(interest: Dict[str, Any]) -> Tuple[int, str]:
+    """An interest's own ID and its latest registration/published/updated date."""
+    try:
+        interest_id = int(interest.get("id") or 0)
+    except (TypeError, ValueError):
+        interest_id = 0
+    dates = [
+        interest.get("registrationDate"),
+        interest.get("publishedDate"),
+        *(interest.get("updatedDates") or []),
+    ]
+    return interest_id, max((d for d in dates if isinstance(d, str)), default="")
+
+
+def _changed_since(
+    interest: Dict[str, Any], watermark: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Return the part of `interest` newer than `watermark`, or None.
+
+    A new or updated parent is returned whole. Otherwise only its new
+    child interests (e.g. further payments under an existing employment)
+    are kept.
+    """
+    if not watermark:
+        return interest
+
+    def is_new(item: Dict[str, Any]) -> bool:
+        item_id, latest = _interest_stamp(item)
+        return item_id > watermark.get("max_id", 0) or latest > watermark.get("latest", "")
+
+    if is_new(interest):
+        return interest
+    children = [c for c in interest.get("childInterests") or [] if is_new(c)]
+    if children:
+        return {**interest, "childInterests": children}
+    return None
+
+
+def _watermark_for(interests: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """High-water mark covering every interest and child interest."""
+    stamps = [
+        _interest_stamp(item)
+        for interest in interests
+        for item in (interest, *(interest.get("childInterests") or []))
+    ]
+    return {
+        "max_id": max((stamp[0] for stamp in stamps), default=0),
+        "latest": max((stamp[1] for stamp in stamps), default=""),
+    }
+
+
+def _merge_watermarks(
+    old: Optional[Dict[str, Any]], new: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Never move a watermark backwards (e.g. after an interest is withdrawn)."""
+    if not old:
+        return new
+    return {
+        "max_id": max(old.get("max_id", 0), new["max_id"]),
+        "latest": max(old.get("latest", ""), new["latest"]),
+    }
@@ -293,27 +293,17 @@ def fetch_disclosures(supabase, year_filter: Optional[int] = None, limit: Option
 
 
 def download_ticker_prices(ticker: str, start: date, end: date) -> Optional[pd.DataFrame]:
-    """Download OHLCV for one ticker. Returns None on failure."""
-    import yfinance as yf
+    """OHLC for one ticker from the local price store. Returns None if unavailable."""
+    from app.lib.price_store import get_prices
 
-    try:
-        df = yf.download(
-            ticker,
-            start=start,
-            end=end + timedelta(days=1),  # end is exclusive in yfinance
-            progress=False,
-            auto_adjust=True,
-        )
-        if df.empty:
-            return None
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
-        df = df[["Open", "High", "Low", "Close"]].dropna()
-        df.index = pd.to_datetime(df.index).date
-        return df
-    except Exception as exc:
-        logger.debug("yfinance error for %s: %s", ticker, exc)
+    frame = get_prices([ticker], start, end).get(ticker)
+    if frame is None:
+        return None
+    df = frame[["Open", "High", "Low", "Close"]].dropna()
+    if df.empty:
         return None
+    df.index = df.index.date
+    return df
 
 
 def build_price_cache(disclosures: list[dict]) -> dict[str, Optional[pd.DataFrame]]:
@@ -329,7 +319,7 @@ def build_price_cache(disclosures: list[dict]) -> dict[str, Optional[pd.DataFram
         by_ticker[row["asset_ticker"]].append(row["_entry_date"])
 
     tickers = list(by_ticker.keys())
-    logger.info("Downloading price history for %d unique tickers...", len(tickers))
+    logger.info("Loading price history for %d unique tickers (downloading only uncached dates)...", len(tickers))
 
     cache: dict[str, Optional[pd.DataFrame]] = {}
     for i, ticker in enumerate(tickers):
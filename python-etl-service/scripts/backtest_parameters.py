@@ -272,9 +272,10 @@ def _parse_entry_date(entry_date_str: str) -> Optional[date]:
 
 
 def fetch_price_history(ticker: str, entry_date_str: str) -> Optional[pd.DataFrame]:
-    """Download OHLC price history for ATR calculation and simulation.
+    """Load OHLC price history for ATR calculation and simulation.
 
-    Downloads:
+    Prices come from the local price store, which downloads only dates it
+    does not already hold. Loads:
       - 30 calendar days BEFORE entry_date → used for ATR calculation
       - 65 calendar days AFTER  entry_date → used for simulation (covers max_days=60)
 
@@ -286,7 +287,7 @@ def fetch_price_history(ticker: str, entry_date_str: str) -> Optional[pd.DataFra
     Returns:
         DataFrame with columns [Open, High, Low, Close] indexed by Date, or None on error.
     """
-    import yfinance as yf
+    from app.lib.price_store import get_prices
 
     entry_date = _parse_entry_date(entry_date_str)
     if entry_date is None:
@@ -297,17 +298,13 @@ def fetch_price_history(ticker: str, entry_date_str: str) -> Optional[pd.DataFra
     end = entry_date + timedelta(days=70)      # extra buffer for weekends/holidays
 
     try:
-        df = yf.download(ticker, start=start, end=end, progress=False, auto_adjust=True)
-        if df.empty:
+        frame = get_prices([ticker], start, end).get(ticker)
+        if frame is None:
             logger.warning("No price data for %s", ticker)
             return None
 
-        # yfinance may return multi-index columns for single ticker in some versions
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
-
-        df = df[["Open", "High", "Low", "Close"]].dropna()
-        df.index = pd.to_datetime(df.index).date
+        df = frame[["Open", "High", "Low", "Close"]].dropna()
+        df.index = df.index.date
         return df
 
     except Exception as exc:
@@ -0,0 +1,147 @@
+"""
+Benchmark: peak memory of reading a House {year}FD.ZIP disclosure index.
+
+Compares the old buffered path (whole ZIP body in memory -> decoded TSV
+string -> list of lines) with the streaming path used by
+fetch_house_index() (body written to disk in chunks, index read line by
+line out of the ZIP). "streaming-count" consumes the generator without
+keeping the records, as iter_house_index() consumers such as the
+all-years validation do, which isolates the reader's own footprint from
+that of the record dicts. Each mode runs in a fresh subprocess and reports its peak
+RSS above the post-import baseline.
+
+Run from python-etl-service/:
+    python scripts/benchmark_house_index.py --year 2024
+    python scripts/benchmark_house_index.py --synthetic-rows 500000
+
+--year downloads the real index; --synthetic-rows builds a ZIP with that
+many rows locally (useful offline or to model a large year).
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+
+# ---------------------------------------------------------------------------
+# Make `app` importable when running as a standalone script
+# ---------------------------------------------------------------------------
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_ETL_ROOT = os.path.dirname(_SCRIPT_DIR)
+if _ETL_ROOT not in sys.path:
+    sys.path.insert(0, _ETL_ROOT)
+
+HEADER = "Prefix\tLast\tFirst\tSuffix\tFilingType\tStateDst\tYear\tFilingDate\tDocID\r\n"
+CHUNK_SIZE = 64 * 1024
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def build_synthetic_zip(path: str, year: int, rows: int) -> None:
+    """Write a {year}FD.ZIP with `rows` PTR records."""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zf.open(f"{year}FD.txt", "w") as f:
+            f.write(HEADER.encode())
+            for i in range(rows):
+                line = f"Hon.\tMember{i}\tJane\t\tP\tCA{i % 53:02d}\t{year}\t1/15/{year}\t{20000000 + i}\r\n"
+                f.write(line.encode())
+
+
+def download_zip(path: str, year: int) -> None:
+    """Download the real {year}FD.ZIP."""
+    import httpx
+    from app.services.house_etl import USER_AGENT, HouseDisclosureScraper
+
+    url = HouseDisclosureScraper.get_zip_url(year)
+    with httpx.stream("GET", url, headers={"User-Agent": USER_AGENT}, timeout=120, follow_redirects=True) as r:
+        r.raise_for_status()
+        with open(path, "wb") as f:
+            for chunk in r.iter_bytes(CHUNK_SIZE):
+                f.write(chunk)
+
+
+def run_mode(mode: str, zip_path: str, year: int) -> dict:
+    """Parse the index one way and report timing and peak RSS."""
+    from app.services.house_etl import HouseDisclosureScraper
+
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+
+    if mode == "buffered":
+        # Stand-in for response.content: the whole body in memory
+        with open(zip_path, "rb") as f:
+            body = f.read()
+        content = HouseDisclosureScraper.extract_index_file(body, year)
+        count = len(HouseDisclosureScraper.parse_disclosure_index(content, year))
+    else:
+        # Stand-in for the chunked download into the source cache
+        with tempfile.NamedTemporaryFile(suffix=".ZIP") as spool:
+            with open(zip_path, "rb") as src:
+                shutil.copyfileobj(src, spool, CHUNK_SIZE)
+            spool.flush()
+            lines = HouseDisclosureScraper.iter_index_lines(spool.name, year)
+            records = HouseDisclosureScraper.iter_disclosure_index(lines, year)
+            if mode == "streaming":
+                count = len(list(records))
+            else:
+                count = sum(1 for _ in records)
+
+    return {
+        "mode": mode,
+        "records": count,
+        "seconds": round(time.perf_counter() - start, 2),
+        "peak_rss_above_baseline_mb": round(_peak_rss_mb() - baseline, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="House index memory benchmark")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--year", type=int, help="Download and measure this year's real index")
+    source.add_argument("--synthetic-rows", type=int, help="Measure a generated index with this many rows")
+    parser.add_argument("--mode", choices=["buffered", "streaming", "streaming-count"], help=argparse.SUPPRESS)
+    parser.add_argument("--zip", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    year = args.year or 2024
+
+    if args.mode:
+        # Child process: measure one mode
+        import logging
+
+        logging.disable(logging.INFO)
+        print(json.dumps(run_mode(args.mode, args.zip, year)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        zip_path = os.path.join(tmp, f"{year}FD.ZIP")
+        if args.year:
+            download_zip(zip_path, year)
+        else:
+            build_synthetic_zip(zip_path, year, args.synthetic_rows)
+        print(f"Index ZIP: {os.path.getsize(zip_path) / 1e6:.1f} MB")
+
+        for mode in ("buffered", "streaming", "streaming-count"):
+            source_arg = ["--year", str(args.year)] if args.year else ["--synthetic-rows", str(args.synthetic_rows)]
+            out = subprocess.run(
+                [sys.executable, __file__, *source_arg, "--mode", mode, "--zip", zip_path],
+                capture_output=True, text=True, check=True,
+            )
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            print(
+                f"{mode:>15}: {result['records']:,} records in {result['seconds']}s, "
+                f"peak RSS +{result['peak_rss_above_baseline_mb']} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
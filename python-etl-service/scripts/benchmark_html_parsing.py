@@ -0,0 +1,116 @@
+"""
+Benchmark: HTML parsing backends for Senate PTR and EU declarations pages.
+
+Parses every page of a corpus with parse_ptr_page_html() /
+parse_declarations_html() under both HTML_PARSER_BACKEND values and
+reports, per page and backend:
+
+- median parse time over --repeat runs
+- peak Python heap allocated during one parse (tracemalloc; lxml's own
+  C-side buffers are not visible to tracemalloc)
+
+It also checks that both backends return identical output for every page.
+
+Run from python-etl-service/:
+    python scripts/benchmark_html_parsing.py
+    python scripts/benchmark_html_parsing.py --corpus /path/to/saved/pages --repeat 50
+
+The corpus is a directory of saved pages; files with "ptr" in the name are
+parsed as Senate PTR pages and files with "declarations" in the name as EU
+MEP declarations pages. The default corpus is tests/fixtures/html.
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from unittest.mock import patch
+
+# ---------------------------------------------------------------------------
+# Make `app` importable when running as a standalone script
+# ---------------------------------------------------------------------------
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_ETL_ROOT = os.path.dirname(_SCRIPT_DIR)
+if _ETL_ROOT not in sys.path:
+    sys.path.insert(0, _ETL_ROOT)
+
+DEFAULT_CORPUS = os.path.join(_ETL_ROOT, "tests", "fixtures", "html")
+BACKENDS = ("bs4", "lxml")
+
+
+def _parser_for(filename: str):
+    """Pick the page parser for a corpus file by its name."""
+    from app.services.eu_parliament_client import parse_declarations_html
+    from app.services.senate_etl import parse_ptr_page_html
+
+    if "ptr" in filename:
+        return lambda html: parse_ptr_page_html(html, filename)
+    if "declarations" in filename:
+        return lambda html: parse_declarations_html(html, "0")
+    return None
+
+
+def measure(parse, html: str, backend: str, repeat: int) -> dict:
+    """Time `repeat` parses and trace the allocations of one."""
+    with patch("app.lib.html_backend.HTML_PARSER_BACKEND", backend):
+        result = parse(html)
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parse(html)
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        parse(html)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {"result": result, "ms": statistics.median(timings) * 1000, "peak_kb": peak / 1024}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTML parsing backend benchmark")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Directory of saved pages")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed parses per page and backend")
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+
+    totals = {backend: 0.0 for backend in BACKENDS}
+    mismatches = []
+
+    print(f"{'page':<32}{'KB':>7}{'rows':>6}  " + "".join(f"{b + ' ms':>10}{b + ' peak KB':>14}" for b in BACKENDS) + f"{'speedup':>9}")
+    for filename in sorted(os.listdir(args.corpus)):
+        parse = _parser_for(filename)
+        if parse is None:
+            continue
+        with open(os.path.join(args.corpus, filename), encoding="utf-8") as f:
+            html = f.read()
+
+        runs = {backend: measure(parse, html, backend, args.repeat) for backend in BACKENDS}
+        if runs["bs4"]["result"] != runs["lxml"]["result"]:
+            mismatches.append(filename)
+        for backend in BACKENDS:
+            totals[backend] += runs[backend]["ms"]
+
+        print(
+            f"{filename:<32}{len(html) / 1024:>7.1f}{len(runs['lxml']['result']):>6}  "
+            + "".join(f"{runs[b]['ms']:>10.2f}{runs[b]['peak_kb']:>14.0f}" for b in BACKENDS)
+            + f"{runs['bs4']['ms'] / runs['lxml']['ms']:>8.1f}x"
+        )
+
+    if totals["lxml"]:
+        print(f"\nTotal: bs4 {totals['bs4']:.1f} ms, lxml {totals['lxml']:.1f} ms "
+              f"({totals['bs4'] / totals['lxml']:.1f}x)")
+    if mismatches:
+        print(f"Output differs between backends for: {', '.join(mismatches)}")
+        sys.exit(1)
+    print("Both backends returned identical output for every page")
+
+
+if __name__ == "__main__":
+    main()
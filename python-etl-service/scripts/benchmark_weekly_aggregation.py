@@ -0,0 +1,211 @@
+"""
+Benchmark: weekly ticker aggregation in the feature pipeline.
+
+Times FeaturePipeline._aggregate_by_week() (one DataFrame, groupby
+statistics) against the per-row Python loop it replaced, on synthetic
+disclosures shaped like the rows _fetch_disclosures() returns, and checks
+that both produce the same aggregations.
+
+Run from python-etl-service/:
+    python scripts/benchmark_weekly_aggregation.py
+    python scripts/benchmark_weekly_aggregation.py --rows 100000 1000000 --repeat 3
+
+The synthetic corpus spreads --rows disclosures over ~2 years, 3,000
+tickers and 535 politicians, with mixed date formats (plain dates and
+ISO timestamps with and without offsets) and missing fields.
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# ---------------------------------------------------------------------------
+# Make `app` importable when running as a standalone script
+# ---------------------------------------------------------------------------
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_ETL_ROOT = os.path.dirname(_SCRIPT_DIR)
+if _ETL_ROOT not in sys.path:
+    sys.path.insert(0, _ETL_ROOT)
+
+TRANSACTION_TYPES = ["purchase", "sale", "Sale (Partial)", "exchange", "Buy", None]
+PARTIES = ["D", "R", "I", None]
+CHAMBERS = ["House", "Senate", "house", None]
+
+
+def synthetic_disclosures(rows: int, seed: int = 0) -> list:
+    """Build `rows` disclosure dicts shaped like the trading_disclosures query."""
+    rng = random.Random(seed)
+    tickers = [f"T{i:04d}" for i in range(3000)]
+    politicians = [
+        {
+            "id": f"pol-{i}",
+            "full_name": f"Politician {i}",
+            "party": rng.choice(PARTIES),
+            "state": "CA",
+            "chamber": rng.choice(CHAMBERS),
+        }
+        for i in range(535)
+    ]
+    start = date(2023, 1, 1)
+
+    disclosures = []
+    for i in range(rows):
+        politician = rng.choice(politicians)
+        tx_date = start + timedelta(days=rng.randrange(730))
+        disc_date = tx_date + timedelta(days=rng.randrange(-2, 60))
+        amount_min = rng.choice([1001, 15001, 50001, None])
+        fmt = i % 3
+        if fmt == 0:
+            tx, disc = tx_date.isoformat(), disc_date.isoformat()
+        elif fmt == 1:
+            tx, disc = f"{tx_date}T00:00:00Z", f"{disc_date}T12:00:00Z"
+        else:
+            tx, disc = f"{tx_date}T23:30:00-05:00", f"{disc_date}T00:00:00+00:00"
+        disclosures.append({
+            "id": f"d-{i}",
+            "asset_ticker": rng.choice(tickers).lower() if i % 50 else "",
+            "transaction_type": rng.choice(TRANSACTION_TYPES),
+            "amount_range_min": amount_min,
+            "amount_range_max": amount_min * 3 - 3 if amount_min and i % 4 else None,
+            "transaction_date": tx,
+            "disclosure_date": disc if i % 10 else None,
+            "politician_id": politician["id"],
+            "politician": politician,
+        })
+    return disclosures
+
+
+def loop_aggregate_by_week(disclosures: list, min_politicians: int) -> list:
+    """The per-row implementation _aggregate_by_week() replaced."""
+    weekly_data = defaultdict(lambda: defaultdict(list))
+
+    for d in disclosures:
+        ticker = d.get('asset_ticker', '').upper()
+        if not ticker or len(ticker) > 10:
+            continue
+        tx_date = datetime.fromisoformat(d['transaction_date'].replace('Z', '+00:00'))
+        weekly_data[(ticker, tx_date.isocalendar()[:2])]['disclosures'].append(d)
+
+    aggregations = []
+    for (ticker, week_key), data in weekly_data.items():
+        disclosures_list = data['disclosures']
+        buys = sells = 0
+        buy_volume = sell_volume = 0
+        politicians, parties, chambers = set(), set(), set()
+        party_counts = Counter()
+        disclosure_delays = []
+
+        for d in disclosures_list:
+            tx_type = (d.get('transaction_type') or '').lower()
+            min_val = d.get('amount_range_min') or 0
+            max_val = d.get('amount_range_max') or min_val
+            volume = (min_val + max_val) / 2
+            if 'purchase' in tx_type or 'buy' in tx_type:
+                buys += 1
+                buy_volume += volume
+            elif 'sale' in tx_type or 'sell' in tx_type:
+                sells += 1
+                sell_volume += volume
+            if d.get('politician_id'):
+                politicians.add(d['politician_id'])
+            politician_data = d.get('politician') or {}
+            party = politician_data.get('party')
+            if party:
+                parties.add(party)
+                party_counts[party] += 1
+            chamber = politician_data.get('chamber')
+            if chamber:
+                chambers.add(chamber.lower() if isinstance(chamber, str) else chamber)
+            if d.get('transaction_date') and d.get('disclosure_date'):
+                tx_dt = datetime.fromisoformat(d['transaction_date'].replace('Z', '+00:00'))
+                disc_dt = datetime.fromisoformat(d['disclosure_date'].replace('Z', '+00:00'))
+                delay = (disc_dt - tx_dt).days
+                if delay >= 0:
+                    disclosure_delays.append(delay)
+
+        if len(politicians) < min_politicians:
+            continue
+
+        total_party_trades = sum(party_counts.values())
+        has_house, has_senate = 'house' in chambers, 'senate' in chambers
+        if has_house and not has_senate:
+            committee_relevance = 0.7
+        elif has_senate and not has_house:
+            committee_relevance = 0.4
+        else:
+            committee_relevance = 0.5
+
+        aggregations.append({
+            'ticker': ticker,
+            'week_start': datetime.fromisocalendar(*week_key, 1).date().isoformat(),
+            'politician_count': len(politicians),
+            'buy_count': buys,
+            'sell_count': sells,
+            'buy_sell_ratio': buys / sells if sells > 0 else (10 if buys > 0 else 1),
+            'buy_volume': buy_volume,
+            'sell_volume': sell_volume,
+            'net_volume': buy_volume - sell_volume,
+            'total_volume': buy_volume + sell_volume,
+            'bipartisan': 'D' in parties and 'R' in parties,
+            'parties': list(parties),
+            'party_alignment': max(party_counts.values()) / total_party_trades if total_party_trades else 0.5,
+            'committee_relevance': committee_relevance,
+            'avg_disclosure_delay': np.mean(disclosure_delays) if disclosure_delays else 30,
+            'disclosure_count': len(disclosures_list),
+        })
+
+    return aggregations
+
+
+def comparable(aggregations: list) -> list:
+    """Aggregations with the (unordered) party lists normalized."""
+    return [{**a, 'parties': sorted(a['parties'])} for a in aggregations]
+
+
+def timed(func, disclosures: list, repeat: int) -> tuple:
+    """Median wall time of `repeat` calls, with the last result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(disclosures, 2)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Weekly aggregation benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000],
+                        help="Corpus sizes to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per size and implementation")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    from app.services.feature_pipeline import FeaturePipeline
+
+    with patch("app.services.feature_pipeline.get_supabase", return_value=MagicMock()):
+        pipeline = FeaturePipeline()
+
+    print(f"{'rows':>10} {'groups':>8} {'loop (s)':>10} {'groupby (s)':>12} {'speedup':>8}  identical")
+    for rows in args.rows:
+        disclosures = synthetic_disclosures(rows)
+        loop_s, expected = timed(loop_aggregate_by_week, disclosures, args.repeat)
+        frame_s, actual = timed(pipeline._aggregate_by_week, disclosures, args.repeat)
+        identical = comparable(actual) == comparable(expected)
+        print(
+            f"{rows:>10,} {len(actual):>8,} {loop_s:>10.2f} {frame_s:>12.2f} "
+            f"{loop_s / frame_s:>7.1f}x  {'yes' if identical else 'NO'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
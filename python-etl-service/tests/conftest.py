@@ -4,6 +4,7 @@ Pytest fixtures for Python ETL service tests.
 Provides mock Supabase clients, sample data, and common test utilities.
 """
 
+import importlib
 import os
 import pytest
 from unittest.mock import Mock, MagicMock, patch
@@ -71,6 +72,63 @@ def disable_auth_and_rate_limit_for_tests():
     rate_limit.RATE_LIMIT_ENABLED = original_rate_limit_enabled
 
 
+@pytest.fixture(autouse=True)
+def reset_supabase_client_pool():
+    """Give every test a fresh Supabase client pool."""
+    from app.lib.supabase_pool import reset_client_pool
+
+    reset_client_pool()
+    yield
+    reset_client_pool()
+
+
+@pytest.fixture(autouse=True)
+def reset_politician_index():
+    """Give every test an empty process-wide politician index."""
+    from app.lib.politician_index import reset_politician_index
+
+    reset_politician_index()
+    yield
+    reset_politician_index()
+
+
+# On-disk caches and stores: (module in app.lib, directory setting, reset function)
+LOCAL_STORES = [
+    ("pdf_cache", "PDF_CACHE_DIR", "reset_pdf_cache"),
+    ("parse_cache", "PARSE_CACHE_DIR", "reset_parse_cache"),
+    ("session_store", "SESSION_STORE_DIR", "reset_session_store"),
+    ("source_cache", "SOURCE_CACHE_DIR", "reset_source_cache"),
+    ("url_index", "URL_INDEX_DIR", "reset_url_indexes"),
+    ("watermark_store", "WATERMARK_STORE_DIR", "reset_watermark_stores"),
+    ("price_store", "PRICE_STORE_DIR", "reset_price_store"),
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated_local_stores(tmp_path, monkeypatch):
+    """Point every on-disk cache and store at a per-test directory."""
+    resets = []
+    for name, dir_setting, reset in LOCAL_STORES:
+        module = importlib.import_module(f"app.lib.{name}")
+        monkeypatch.setattr(module, dir_setting, str(tmp_path / name))
+        resets.append(getattr(module, reset))
+
+    for reset in resets:
+        reset()
+    yield
+    for reset in resets:
+        reset()
+
+
+@pytest.fixture(autouse=True)
+def shutdown_pdf_extraction_workers():
+    """Stop any PDF extraction worker processes a test started."""
+    from app.lib.pdf_extraction import shutdown_pdf_extraction_service
+
+    yield
+    shutdown_pdf_extraction_service()
+
+
 @pytest.fixture
 def enable_auth():
     """
@@ -0,0 +1,84 @@
+"""
+Tests for the AIMD concurrency limiter (app/lib/adaptive_concurrency.py).
+
+Tests:
+- AdaptiveConcurrencyLimiter - Slot limiting, additive increase, multiplicative decrease
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AdaptiveConcurrencyLimiter."""
+
+    def test_rejects_invalid_bounds(self):
+        """Invalid limits and decrease factors raise ValueError."""
+        from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(min_limit=0)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(min_limit=4, max_limit=2)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(decrease_factor=1.0)
+
+    def test_additive_increase(self):
+        """The limit grows by about one per round of `limit` successes, up to max."""
+        from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=4)
+
+        for _ in range(3):
+            limiter.record_success()
+        assert limiter.limit == 3
+
+        for _ in range(100):
+            limiter.record_success()
+        assert limiter.limit == 4
+
+    def test_multiplicative_decrease_with_cooldown(self):
+        """Throttles halve the limit once per cooldown window, never below min."""
+        from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8, decrease_cooldown=1.0)
+
+        with patch("app.lib.adaptive_concurrency.time.monotonic", return_value=100.0):
+            limiter.record_throttle()
+            limiter.record_throttle()  # same congestion event
+        assert limiter.limit == 4
+
+        with patch("app.lib.adaptive_concurrency.time.monotonic", return_value=102.0):
+            limiter.record_throttle()
+        assert limiter.limit == 2
+
+        for t in (104.0, 106.0, 108.0):
+            with patch("app.lib.adaptive_concurrency.time.monotonic", return_value=t):
+                limiter.record_throttle()
+        assert limiter.limit == 1
+        assert limiter.get_stats()["throttles"] == 6
+
+    @pytest.mark.asyncio
+    async def test_slots_bound_in_flight(self):
+        """No more than `limit` holders run inside slot() at once."""
+        from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter(initial=3, max_limit=3)
+        active = 0
+        peak = 0
+
+        async def work():
+            nonlocal active, peak
+            async with limiter.slot():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(work() for _ in range(10)))
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+        assert limiter.get_stats()["peak_in_flight"] == 3
@@ -0,0 +1,279 @@
+"""
+Tests for the non-blocking data access layer (app/lib/async_db.py).
+
+Tests:
+- run_db() / execute_async() - Thread-pool offload of blocking calls
+- AsyncRepository and hot-table repositories
+- run_house_etl keeps the event loop responsive while the DB is slow
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+def _mock_client(data=None, count=None):
+    """Supabase client whose query builders chain and return one response."""
+    client = MagicMock()
+    query = MagicMock()
+    for method in ("select", "eq", "neq", "order", "limit", "range", "insert", "upsert", "update"):
+        getattr(query, method).return_value = query
+    query.execute.return_value = MagicMock(data=data, count=count)
+    client.table.return_value = query
+    return client, query
+
+
+# =============================================================================
+# run_db / execute_async Tests
+# =============================================================================
+
+class TestRunDb:
+    """Tests for run_db() and execute_async()."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_thread(self):
+        """run_db() calls the function off the event loop thread."""
+        from app.lib.async_db import run_db
+
+        def whoami(a, b=None):
+            return threading.current_thread().name, a, b
+
+        name, a, b = await run_db(whoami, 1, b=2)
+
+        assert name.startswith("supabase-db")
+        assert (a, b) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_propagates_exceptions(self):
+        """run_db() re-raises exceptions from the worker thread."""
+        from app.lib.async_db import run_db
+
+        def boom():
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await run_db(boom)
+
+    @pytest.mark.asyncio
+    async def test_execute_async_executes_query(self):
+        """execute_async() returns the query's execute() result."""
+        from app.lib.async_db import execute_async
+
+        query = MagicMock()
+        query.execute.return_value = "response"
+
+        assert await execute_async(query) == "response"
+        query.execute.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_recreates_executor(self):
+        """shutdown_db_executor() discards the pool; next use builds a new one."""
+        from app.lib.async_db import get_db_executor, run_db, shutdown_db_executor
+
+        first = get_db_executor()
+        shutdown_db_executor()
+
+        assert await run_db(lambda: 42) == 42
+        assert get_db_executor() is not first
+
+
+# =============================================================================
+# Repository Tests
+# =============================================================================
+
+class TestAsyncRepository:
+    """Tests for AsyncRepository and its subclasses."""
+
+    @pytest.mark.asyncio
+    async def test_count_applies_filters(self):
+        """count() filters with eq() and returns the exact count."""
+        from app.lib.async_db import PoliticiansRepository
+
+        client, query = _mock_client(data=[], count=7)
+        repo = PoliticiansRepository(client)
+
+        assert await repo.count(chamber="house") == 7
+        client.table.assert_called_with("politicians")
+        query.select.assert_called_with("id", count="exact")
+        query.eq.assert_called_with("chamber", "house")
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_returns_none_when_missing(self):
+        """get_by_id() returns None for an empty result."""
+        from app.lib.async_db import TradingDisclosuresRepository
+
+        client, _ = _mock_client(data=[])
+        repo = TradingDisclosuresRepository(client)
+
+        assert await repo.get_by_id("abc") is None
+
+    @pytest.mark.asyncio
+    async def test_update_requires_filters(self):
+        """update() refuses to run without a filter."""
+        from app.lib.async_db import TradingDisclosuresRepository
+
+        client, query = _mock_client(data=[])
+        repo = TradingDisclosuresRepository(client)
+
+        with pytest.raises(ValueError):
+            await repo.update({"status": "inactive"})
+        query.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_until_short_page(self):
+        """fetch_all() keeps requesting pages until one comes back short."""
+        from app.lib.async_db import TradingDisclosuresRepository
+
+        client, query = _mock_client()
+        query.execute.side_effect = [
+            MagicMock(data=[{"id": 1}, {"id": 2}]),
+            MagicMock(data=[{"id": 3}]),
+        ]
+        repo = TradingDisclosuresRepository(client)
+
+        rows = await repo.fetch_all(lambda q: q.select("id"), page_size=2)
+
+        assert [r["id"] for r in rows] == [1, 2, 3]
+        query.order.assert_called_with("id")
+        query.range.assert_any_call(0, 1)
+        query.range.assert_any_call(2, 3)
+
+    @pytest.mark.asyncio
+    async def test_ml_models_get_active(self):
+        """MLModelsRepository.get_active() returns the newest active model."""
+        from app.lib.async_db import MLModelsRepository
+
+        client, query = _mock_client(data=[{"id": "m1"}])
+        repo = MLModelsRepository(client)
+
+        assert await repo.get_active() == {"id": "m1"}
+        query.eq.assert_called_with("status", "active")
+
+    @pytest.mark.asyncio
+    async def test_ml_models_archive_active_keeps_one(self):
+        """archive_active() archives active models other than keep_id."""
+        from app.lib.async_db import MLModelsRepository
+
+        client, query = _mock_client(data=[])
+
+        await MLModelsRepository(client).archive_active(keep_id="m1")
+
+        query.update.assert_called_once_with({"status": "archived"})
+        query.eq.assert_called_with("status", "active")
+        query.neq.assert_called_with("id", "m1")
+
+    @pytest.mark.asyncio
+    async def test_find_or_create_many_offloads_bulk_helper(self):
+        """PoliticiansRepository.find_or_create_many() wraps find_or_create_politicians."""
+        from app.lib.async_db import PoliticiansRepository
+
+        client = MagicMock()
+        index = MagicMock()
+        with patch("app.lib.politician.find_or_create_politicians", return_value={("a",): "pol-1"}) as mock_find:
+            result = await PoliticiansRepository(client).find_or_create_many([{"name": "A"}], index=index)
+
+        assert result == {("a",): "pol-1"}
+        mock_find.assert_called_once_with(client, [{"name": "A"}], index=index)
+
+    @pytest.mark.asyncio
+    async def test_find_or_create_offloads_helper(self):
+        """PoliticiansRepository.find_or_create() wraps find_or_create_politician."""
+        from app.lib.async_db import PoliticiansRepository
+
+        client = MagicMock()
+        with patch("app.lib.politician.find_or_create_politician", return_value="pol-1") as mock_find:
+            result = await PoliticiansRepository(client).find_or_create(name="Jane Doe")
+
+        assert result == "pol-1"
+        mock_find.assert_called_once_with(client, name="Jane Doe")
+
+
+# =============================================================================
+# Event Loop Responsiveness
+# =============================================================================
+
+class TestEventLoopNotBlocked:
+    """run_house_etl must not stall the event loop on slow database calls."""
+
+    DB_LATENCY = 0.05  # seconds each blocking DB call takes
+    MAX_LOOP_LAG_MS = 30  # well under DB_LATENCY
+
+    @pytest.fixture
+    def job_id(self):
+        from app.services.house_etl import JOB_STATUS
+
+        job_id = "test-loop-lag"
+        JOB_STATUS[job_id] = {
+            "status": "pending",
+            "message": "",
+            "progress": 0,
+            "total": 0,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "completed_at": None,
+        }
+        yield job_id
+        JOB_STATUS.pop(job_id, None)
+
+    @pytest.mark.asyncio
+    async def test_house_etl_loop_lag_bounded(self, job_id):
+        """Blocking Supabase calls during a House ETL run never block the loop > N ms."""
+        from app.services.house_etl import run_house_etl, JOB_STATUS
+
+        def slow(result):
+            def call(*args, **kwargs):
+                time.sleep(self.DB_LATENCY)
+                return result
+            return call
+
+        disclosures = [
+            {
+                "filing_type": "P",
+                "doc_id": f"doc-{i}",
+                "pdf_url": f"https://example.com/{i}.pdf",
+                "politician_name": f"Member {i}",
+                "first_name": "Member",
+                "last_name": str(i),
+                "party": "D",
+            }
+            for i in range(3)
+        ]
+
+        from app.lib.politician import politician_key
+
+        politician_ids = {politician_key({"disclosure": d}): f"pol-{d['doc_id']}" for d in disclosures}
+
+        max_lag = 0.0
+        stop = asyncio.Event()
+
+        async def monitor():
+            nonlocal max_lag
+            interval = 0.005
+            while not stop.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(interval)
+                max_lag = max(max_lag, time.perf_counter() - start - interval)
+
+        scraper = "app.services.house_etl.HouseDisclosureScraper"
+        with patch("app.services.house_etl.get_supabase", return_value=MagicMock()), \
+             patch("app.services.house_etl.fetch_member_party_map", new=AsyncMock(return_value={})), \
+             patch("app.services.house_etl.iter_house_index", new=AsyncMock(return_value=iter(disclosures))), \
+             patch(f"{scraper}.fetch_pdf", new=AsyncMock(return_value=b"%PDF")), \
+             patch("app.services.house_etl.extract_tables", new=AsyncMock(return_value=[[["row"], ["row"]]])), \
+             patch("app.services.house_etl.parse_transaction_from_row", return_value={"asset_name": "Apple"}), \
+             patch("app.lib.politician.find_or_create_politicians", side_effect=slow(politician_ids)), \
+             patch("app.lib.database.upload_transaction_to_supabase", side_effect=slow("txn-1")), \
+             patch("app.lib.job_logger.log_job_execution", side_effect=slow("log-1")), \
+             patch("app.services.house_etl.refresh_materialized_views", side_effect=slow(True)), \
+             patch("app.services.house_etl._backfill_null_parties", side_effect=slow(0)), \
+             patch("app.lib.job_logger.cleanup_old_executions", side_effect=slow(0)):
+            monitor_task = asyncio.create_task(monitor())
+            await run_house_etl(job_id, year=2024)
+            stop.set()
+            await monitor_task
+
+        assert JOB_STATUS[job_id]["status"] == "completed"
+        assert max_lag * 1000 < self.MAX_LOOP_LAG_MS
@@ -7,6 +7,8 @@ Tests:
 - BaseETLService - Abstract base class
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime, timedelta
@@ -596,3 +598,413 @@ class TestBaseETLService:
 
         assert len(on_complete_called) == 1
         assert on_complete_called[0][0] == "job-1"
+
+
+# =============================================================================
+# Pipelined Execution Tests
+# =============================================================================
+
+class TestPipelinedRun:
+    """Tests for BaseETLService pipelined execution mode."""
+
+    @pytest.fixture
+    def streaming_service(self):
+        """Create a service that yields disclosures from an async stream."""
+        from app.lib.base_etl import BaseETLService
+
+        class StreamingService(BaseETLService):
+            source_id = "stream"
+            source_name = "Streaming Source"
+
+            def __init__(self):
+                super().__init__()
+                self.records = []
+                self.uploaded = []
+
+            async def fetch_disclosures(self, **kwargs):
+                raise AssertionError("stream_disclosures should be used")
+
+            async def stream_disclosures(self, **kwargs):
+                for record in self.records:
+                    yield record
+
+            async def parse_disclosure(self, raw):
+                if raw.get("raise_parse"):
+                    raise ValueError("bad record")
+                return raw
+
+            async def upload_disclosure(self, disclosure, update_mode=False):
+                await asyncio.sleep(0)
+                self.uploaded.append(disclosure["asset_name"])
+                return None if disclosure.get("dup") else "uuid"
+
+        return StreamingService()
+
+    def test_pipeline_config_rejects_zero_workers(self):
+        """PipelineConfig requires at least one worker per stage."""
+        from app.lib.base_etl import PipelineConfig
+
+        with pytest.raises(ValueError):
+            PipelineConfig(upload_workers=0)
+
+    @pytest.mark.asyncio
+    async def test_pipelined_counts_match_serial_semantics(self, streaming_service):
+        """Pipelined run counts inserted/skipped/failed like the serial loop."""
+        from app.lib.base_etl import PipelineConfig
+
+        streaming_service.records = [
+            {"asset_name": "A"},
+            {"asset_name": "B", "dup": True},
+            {"no_asset_name": "C"},
+            {"asset_name": "D", "raise_parse": True},
+            {"asset_name": "E"},
+        ]
+
+        result = await streaming_service.run(
+            "job-1", pipeline=PipelineConfig(parse_workers=2, upload_workers=3)
+        )
+
+        assert result.records_processed == 5
+        assert result.records_inserted == 2
+        assert result.records_skipped == 2
+        assert result.records_failed == 1
+        assert sorted(streaming_service.uploaded) == ["A", "B", "E"]
+
+        status = streaming_service.get_job_status("job-1")
+        assert status.status == "completed"
+        assert status.total == 5
+        assert status.progress == 5
+
+    @pytest.mark.asyncio
+    async def test_pipelined_respects_limit(self, streaming_service):
+        """Pipelined run stops pulling from the stream at the limit."""
+        from app.lib.base_etl import PipelineConfig
+
+        streaming_service.records = [{"asset_name": f"A{i}"} for i in range(10)]
+
+        result = await streaming_service.run(
+            "job-1", limit=3, pipeline=PipelineConfig()
+        )
+
+        assert result.records_processed == 3
+        assert len(streaming_service.uploaded) == 3
+
+    @pytest.mark.asyncio
+    async def test_pipelined_limit_stops_stream_early(self, streaming_service):
+        """A limited run never pulls past the limit and closes the stream."""
+        from app.lib.base_etl import PipelineConfig
+
+        pulled = []
+        closed = []
+
+        async def stream(**kwargs):
+            try:
+                for i in range(10):
+                    pulled.append(i)
+                    yield {"asset_name": f"A{i}"}
+            finally:
+                closed.append(True)
+
+        streaming_service.stream_disclosures = stream
+
+        result = await streaming_service.run(
+            "job-1", limit=3, pipeline=PipelineConfig()
+        )
+
+        assert result.records_processed == 3
+        assert pulled == [0, 1, 2]
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_pipelined_update_mode(self, streaming_service):
+        """Pipelined run counts updates in update_mode."""
+        from app.lib.base_etl import PipelineConfig
+
+        streaming_service.records = [{"asset_name": "A"}]
+
+        result = await streaming_service.run(
+            "job-1", update_mode=True, pipeline=PipelineConfig()
+        )
+
+        assert result.records_updated == 1
+        assert result.records_inserted == 0
+
+    @pytest.mark.asyncio
+    async def test_pipelined_empty_stream_warns(self, streaming_service):
+        """Pipelined run with an empty stream completes with a warning."""
+        from app.lib.base_etl import PipelineConfig
+
+        result = await streaming_service.run("job-1", pipeline=PipelineConfig())
+
+        assert result.records_processed == 0
+        assert "No disclosures" in result.warnings[0]
+
+    @pytest.mark.asyncio
+    async def test_pipelined_uploads_run_concurrently(self, streaming_service):
+        """Upload workers overlap their awaits instead of running serially."""
+        from app.lib.base_etl import PipelineConfig
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_upload(disclosure, update_mode=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "uuid"
+
+        streaming_service.upload_disclosure = slow_upload
+        streaming_service.records = [{"asset_name": f"A{i}"} for i in range(12)]
+
+        result = await streaming_service.run(
+            "job-1", pipeline=PipelineConfig(upload_workers=4, queue_size=2)
+        )
+
+        assert result.records_inserted == 12
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_pipelined_stream_failure_fails_job(self):
+        """An exception from the fetch stream fails the whole job."""
+        from app.lib.base_etl import BaseETLService, PipelineConfig
+
+        class BrokenStreamService(BaseETLService):
+            source_id = "broken"
+            source_name = "Broken Stream"
+
+            async def fetch_disclosures(self, **kwargs):
+                return []
+
+            async def stream_disclosures(self, **kwargs):
+                yield {"asset_name": "A"}
+                raise RuntimeError("connection reset")
+
+            async def parse_disclosure(self, raw):
+                return raw
+
+            async def upload_disclosure(self, disclosure, update_mode=False):
+                return "uuid"
+
+        service = BrokenStreamService()
+        result = await service.run("job-1", pipeline=PipelineConfig())
+
+        assert result.is_success is False
+        assert "connection reset" in result.errors[0]
+        assert service.get_job_status("job-1").status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_class_level_pipeline_config_uses_fetch(self):
+        """pipeline_config on the class enables pipelining via fetch_disclosures."""
+        from app.lib.base_etl import BaseETLService, PipelineConfig
+
+        class ConfiguredService(BaseETLService):
+            source_id = "configured"
+            source_name = "Configured"
+            pipeline_config = PipelineConfig(upload_workers=2)
+
+            async def fetch_disclosures(self, **kwargs):
+                return [{"asset_name": "A"}, {"asset_name": "B"}]
+
+            async def parse_disclosure(self, raw):
+                return raw
+
+            async def upload_disclosure(self, disclosure, update_mode=False):
+                return "uuid"
+
+        result = await ConfiguredService().run("job-1")
+
+        assert result.records_processed == 2
+        assert result.records_inserted == 2
+
+
+# =============================================================================
+# Batched Upload Tests
+# =============================================================================
+
+class TestBatchedUpload:
+    """Tests for the BaseETLService batched upload stage."""
+
+    @pytest.fixture
+    def batching_service(self):
+        """Create a service that records upload_batch() calls."""
+        from app.lib.base_etl import BaseETLService
+
+        class BatchingService(BaseETLService):
+            source_id = "batching"
+            source_name = "Batching Source"
+
+            def __init__(self):
+                super().__init__()
+                self.records = []
+                self.batches = []
+
+            async def fetch_disclosures(self, **kwargs):
+                return self.records
+
+            async def parse_disclosure(self, raw):
+                return raw
+
+            async def upload_disclosure(self, disclosure, update_mode=False):
+                raise AssertionError("upload_disclosure should not be called")
+
+            async def upload_batch(self, disclosures, update_mode=False):
+                self.batches.append([d["asset_name"] for d in disclosures])
+                failed = sum(1 for d in disclosures if d.get("fail"))
+                skipped = sum(1 for d in disclosures if d.get("skip"))
+                return len(disclosures) - failed - skipped, skipped, failed
+
+        return BatchingService()
+
+    def test_batch_config_rejects_invalid_values(self):
+        """BatchUploadConfig validates its settings."""
+        from app.lib.base_etl import BatchUploadConfig
+
+        with pytest.raises(ValueError):
+            BatchUploadConfig(batch_size=0)
+        with pytest.raises(ValueError):
+            BatchUploadConfig(flush_interval=0)
+
+    @pytest.mark.asyncio
+    async def test_serial_run_flushes_by_batch_size(self, batching_service):
+        """Serial run groups validated records into batches of batch_size."""
+        from app.lib.base_etl import BatchUploadConfig
+
+        batching_service.records = [{"asset_name": f"A{i}"} for i in range(5)]
+
+        result = await batching_service.run(
+            "job-1", batch_upload=BatchUploadConfig(batch_size=2)
+        )
+
+        assert batching_service.batches == [["A0", "A1"], ["A2", "A3"], ["A4"]]
+        assert result.records_processed == 5
+        assert result.records_inserted == 5
+
+    @pytest.mark.asyncio
+    async def test_batch_counts_inserted_skipped_failed(self, batching_service):
+        """Counts reported by upload_batch() land in the ETLResult."""
+        from app.lib.base_etl import BatchUploadConfig
+
+        batching_service.records = [
+            {"asset_name": "A"},
+            {"asset_name": "B", "fail": True},
+            {"asset_name": "C", "skip": True},
+            {"no_asset_name": "D"},
+        ]
+
+        result = await batching_service.run(
+            "job-1", batch_upload=BatchUploadConfig(batch_size=10)
+        )
+
+        assert result.records_processed == 4
+        assert result.records_inserted == 1
+        assert result.records_failed == 1
+        assert result.records_skipped == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_counts_updates_in_update_mode(self, batching_service):
+        """Batched uploads count as updates in update_mode."""
+        from app.lib.base_etl import BatchUploadConfig
+
+        batching_service.records = [{"asset_name": "A"}, {"asset_name": "B"}]
+
+        result = await batching_service.run(
+            "job-1", update_mode=True, batch_upload=BatchUploadConfig()
+        )
+
+        assert result.records_updated == 2
+        assert result.records_inserted == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_exception_fails_whole_batch(self, batching_service):
+        """An exception from upload_batch() fails every record in the batch."""
+        from app.lib.base_etl import BatchUploadConfig
+
+        batching_service.records = [{"asset_name": "A"}, {"asset_name": "B"}]
+        batching_service.upload_batch = AsyncMock(side_effect=Exception("timeout"))
+
+        result = await batching_service.run(
+            "job-1", batch_upload=BatchUploadConfig()
+        )
+
+        assert result.records_failed == 2
+        assert "timeout" in result.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_pipelined_run_with_batches(self, batching_service):
+        """Pipelined run feeds the upload stage into the batcher."""
+        from app.lib.base_etl import BatchUploadConfig, PipelineConfig
+
+        batching_service.records = [{"asset_name": f"A{i}"} for i in range(7)]
+
+        result = await batching_service.run(
+            "job-1",
+            pipeline=PipelineConfig(upload_workers=3),
+            batch_upload=BatchUploadConfig(batch_size=3),
+        )
+
+        flushed = sorted(name for batch in batching_service.batches for name in batch)
+        assert flushed == sorted(f"A{i}" for i in range(7))
+        assert result.records_inserted == 7
+        assert batching_service.get_job_status("job-1").progress == 7
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_flushes_partial_batch(self, batching_service):
+        """A partial batch is flushed once the flush interval elapses."""
+        from app.lib.base_etl import BatchUploadConfig, PipelineConfig
+
+        async def slow_stream(**kwargs):
+            yield {"asset_name": "A"}
+            await asyncio.sleep(0.1)
+            yield {"asset_name": "B"}
+
+        batching_service.stream_disclosures = slow_stream
+
+        await batching_service.run(
+            "job-1",
+            pipeline=PipelineConfig(),
+            batch_upload=BatchUploadConfig(batch_size=100, flush_interval=0.02),
+        )
+
+        assert batching_service.batches == [["A"], ["B"]]
+
+    @pytest.mark.asyncio
+    async def test_default_upload_batch_resolves_each_politician_once(self):
+        """Default upload_batch() resolves all politicians with one batch call."""
+        from app.lib.base_etl import BaseETLService
+        from app.lib.politician import politician_key
+
+        class DefaultBatchService(BaseETLService):
+            source_id = "default_batch"
+            source_name = "Default Batch"
+
+            async def fetch_disclosures(self, **kwargs):
+                return []
+
+            async def parse_disclosure(self, raw):
+                return raw
+
+        disclosures = [
+            {"politician_name": "Jane Doe", "asset_name": "A", "bioguide_id": "D1"},
+            {"politician_name": "Jane Doe", "asset_name": "B", "bioguide_id": "D1"},
+            {"politician_name": "John Roe", "asset_name": "C"},
+            {"politician_name": "Unknown", "asset_name": "D"},
+        ]
+
+        def fake_resolve(supabase, descriptors, index=None):
+            ids = {"Jane Doe": "pol-1", "John Roe": "pol-2"}
+            return {politician_key(d): ids.get(d["name"]) for d in descriptors}
+
+        with patch("app.lib.database.get_supabase", return_value=MagicMock()), \
+             patch("app.lib.politician.find_or_create_politicians",
+                   side_effect=fake_resolve) as mock_resolve, \
+             patch("app.lib.database.batch_upload_transactions",
+                   return_value=(1, 1, 1)) as mock_batch:
+            counts = await DefaultBatchService().upload_batch(disclosures)
+
+        mock_resolve.assert_called_once()
+        rows = mock_batch.call_args[0][1]
+        assert [r["politician_id"] for r in rows] == ["pol-1", "pol-1", "pol-2"]
+        # The unresolved politician and the duplicate row are both skipped
+        assert counts == (1, 2, 1)
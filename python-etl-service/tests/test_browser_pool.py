@@ -0,0 +1,276 @@
+"""
+Tests for the Playwright browser pool (app/lib/browser_pool.py).
+
+Tests:
+- Lazy launch and one shared browser
+- Concurrent checkouts bounded by the page count
+- Resource blocking through request interception
+- Context recycling (navigation budget, stale sessions, errors)
+- close()
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+class FakePage:
+    """Page that records navigations and fires framenavigated like Playwright."""
+
+    def __init__(self):
+        self.url = "about:blank"
+        self.main_frame = object()
+        self._handlers = {}
+
+    def on(self, event, handler):
+        self._handlers[event] = handler
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+        self._handlers["framenavigated"](self.main_frame)
+
+
+class FakeContext:
+    def __init__(self):
+        self.page = FakePage()
+        self.route_handler = None
+        self.close = AsyncMock()
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    async def new_page(self):
+        return self.page
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.close = AsyncMock()
+
+    async def new_context(self, **kwargs):
+        self.contexts.append(FakeContext())
+        return self.contexts[-1]
+
+
+@pytest.fixture
+def fake_playwright():
+    """Patch async_playwright() to drive a FakeBrowser."""
+    browser = FakeBrowser()
+    driver = MagicMock()
+    driver.chromium.launch = AsyncMock(return_value=browser)
+    driver.stop = AsyncMock()
+    with patch("playwright.async_api.async_playwright") as mock_async_playwright:
+        mock_async_playwright.return_value.start = AsyncMock(return_value=driver)
+        yield driver, browser
+
+
+def _route(resource_type):
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+
+# =============================================================================
+# Checkout Tests
+# =============================================================================
+
+class TestCheckout:
+    """Tests for BrowserPool.page()."""
+
+    @pytest.mark.asyncio
+    async def test_browser_launched_lazily_once(self, fake_playwright):
+        """Nothing launches until a page is needed, then one browser serves all pages."""
+        from app.lib.browser_pool import BrowserPool
+
+        driver, browser = fake_playwright
+        async with BrowserPool(pages=2) as pool:
+            assert driver.chromium.launch.await_count == 0
+            async with pool.page():
+                pass
+            async with pool.page():
+                pass
+
+        assert driver.chromium.launch.await_count == 1
+        # A returned page is reused rather than opening a second context
+        assert len(browser.contexts) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_pages(self, fake_playwright):
+        """At most `pages` checkouts run at once, each on its own context."""
+        from app.lib.browser_pool import BrowserPool
+
+        _, browser = fake_playwright
+        active = 0
+        peak = 0
+
+        async def navigate(pool):
+            nonlocal active, peak
+            async with pool.page():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async with BrowserPool(pages=3) as pool:
+            await asyncio.gather(*(navigate(pool) for _ in range(10)))
+
+        assert peak == 3
+        assert len(browser.contexts) == 3
+
+    @pytest.mark.asyncio
+    async def test_setup_runs_on_each_new_context(self, fake_playwright):
+        """The setup coroutine prepares every new context's page once."""
+        from app.lib.browser_pool import BrowserPool
+
+        setup = AsyncMock()
+        async with BrowserPool(pages=2, setup=setup) as pool:
+            async def use():
+                async with pool.page():
+                    await asyncio.sleep(0)
+
+            await asyncio.gather(use(), use(), use())
+
+        assert setup.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_closed_pool_rejects_checkout(self, fake_playwright):
+        """page() on a closed pool raises."""
+        from app.lib.browser_pool import BrowserPool
+
+        pool = BrowserPool(pages=1)
+        await pool.close()
+
+        with pytest.raises(RuntimeError):
+            async with pool.page():
+                pass
+
+
+# =============================================================================
+# Resource Blocking Tests
+# =============================================================================
+
+class TestResourceBlocking:
+    """Tests for request interception."""
+
+    @pytest.mark.asyncio
+    async def test_heavy_resources_aborted(self, fake_playwright):
+        """Images, stylesheets and fonts are aborted; documents and scripts continue."""
+        from app.lib.browser_pool import BrowserPool
+
+        _, browser = fake_playwright
+        async with BrowserPool(pages=1) as pool:
+            async with pool.page():
+                pass
+            handler = browser.contexts[0].route_handler
+
+            routes = {t: _route(t) for t in ("image", "stylesheet", "font", "document", "script", "xhr")}
+            for route in routes.values():
+                await handler(route)
+
+            assert pool.get_stats()["requests_blocked"] == 3
+
+        for blocked in ("image", "stylesheet", "font"):
+            routes[blocked].abort.assert_awaited_once()
+            routes[blocked].continue_.assert_not_awaited()
+        for allowed in ("document", "script", "xhr"):
+            routes[allowed].continue_.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_blocking_disabled(self, fake_playwright):
+        """An empty blocked_resources installs no route."""
+        from app.lib.browser_pool import BrowserPool
+
+        _, browser = fake_playwright
+        async with BrowserPool(pages=1, blocked_resources=()) as pool:
+            async with pool.page():
+                pass
+
+        assert browser.contexts[0].route_handler is None
+
+
+# =============================================================================
+# Recycling Tests
+# =============================================================================
+
+class TestRecycling:
+    """Tests for context recycling."""
+
+    @pytest.mark.asyncio
+    async def test_recycled_after_navigation_budget(self, fake_playwright):
+        """A context is replaced once it has made recycle_after navigations."""
+        from app.lib.browser_pool import BrowserPool
+
+        _, browser = fake_playwright
+        async with BrowserPool(pages=1, recycle_after=3) as pool:
+            for i in range(7):
+                async with pool.page() as page:
+                    await page.goto(f"https://example.com/{i}")
+
+            assert pool.get_stats()["contexts_recycled"] == 2
+
+        assert len(browser.contexts) == 3
+        browser.contexts[0].close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_context_replaced(self, fake_playwright):
+        """A page the is_stale check rejects gets a fresh context next time."""
+        from app.lib.browser_pool import BrowserPool
+
+        _, browser = fake_playwright
+        async with BrowserPool(pages=1, is_stale=lambda page: "/home/" in page.url) as pool:
+            async with pool.page() as page:
+                await page.goto("https://example.com/home/")
+            async with pool.page() as page:
+                assert page is browser.contexts[1].page
+
+    @pytest.mark.asyncio
+    async def test_context_replaced_after_error(self, fake_playwright):
+        """A checkout that raised doesn't hand its context to the next user."""
+        from app.lib.browser_pool import BrowserPool
+
+        _, browser = fake_playwright
+        async with BrowserPool(pages=1) as pool:
+            with pytest.raises(ValueError):
+                async with pool.page():
+                    raise ValueError("navigation failed")
+            async with pool.page():
+                pass
+
+        assert len(browser.contexts) == 2
+        browser.contexts[0].close.assert_awaited_once()
+
+
+# =============================================================================
+# close() Tests
+# =============================================================================
+
+class TestClose:
+    """Tests for BrowserPool.close()."""
+
+    @pytest.mark.asyncio
+    async def test_close_releases_everything(self, fake_playwright):
+        """Idle contexts, the browser and the driver are all closed."""
+        from app.lib.browser_pool import BrowserPool
+
+        driver, browser = fake_playwright
+        async with BrowserPool(pages=1) as pool:
+            async with pool.page():
+                pass
+
+        browser.contexts[0].close.assert_awaited_once()
+        browser.close.assert_awaited_once()
+        driver.stop.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_without_launch(self):
+        """Closing a pool that never launched does nothing."""
+        from app.lib.browser_pool import BrowserPool
+
+        pool = BrowserPool(pages=1)
+        await pool.close()
+
+        assert pool.get_stats()["launched"] is False
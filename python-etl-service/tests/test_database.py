@@ -30,12 +30,28 @@ class TestGetSupabase:
             from app.lib.database import get_supabase
             result = get_supabase()
 
-            mock_create.assert_called_once_with(
+            mock_create.assert_called_once()
+            assert mock_create.call_args[0] == (
                 "https://test.supabase.co",
-                "test-key"
+                "test-key",
             )
             assert result == mock_client
 
+    def test_reuses_pooled_client(self, monkeypatch):
+        """get_supabase() returns the same pooled client on repeated calls."""
+        monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+        monkeypatch.setenv("SUPABASE_SERVICE_KEY", "test-key")
+
+        with patch("app.lib.database.create_client") as mock_create:
+            mock_create.return_value = MagicMock()
+
+            from app.lib.database import get_supabase
+            first = get_supabase()
+            second = get_supabase()
+
+            assert first is second
+            mock_create.assert_called_once()
+
     def test_returns_none_when_key_empty(self, monkeypatch):
         """get_supabase() returns None when SUPABASE_SERVICE_KEY is empty."""
         monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
@@ -524,42 +540,46 @@ class TestBatchUploadTransactions:
         """batch_upload_transactions() inserts batch successfully."""
         from app.lib.database import batch_upload_transactions
 
-        successful, failed = batch_upload_transactions(
+        successful, duplicates, failed = batch_upload_transactions(
             mock_supabase_client,
             sample_transactions,
             update_mode=False,
         )
 
         assert successful == 3
+        assert duplicates == 0
         assert failed == 0
         mock_supabase_client.table.assert_called_with("trading_disclosures")
+        table_mock = mock_supabase_client.table.return_value
+        assert table_mock.upsert.call_args.kwargs["ignore_duplicates"] is True
 
     def test_batch_upsert_in_update_mode(self, mock_supabase_client, sample_transactions):
         """batch_upload_transactions() uses upsert when update_mode=True."""
         from app.lib.database import batch_upload_transactions
 
-        successful, failed = batch_upload_transactions(
+        successful, duplicates, failed = batch_upload_transactions(
             mock_supabase_client,
             sample_transactions,
             update_mode=True,
         )
 
         assert successful == 3
+        assert duplicates == 0
         assert failed == 0
         table_mock = mock_supabase_client.table.return_value
         table_mock.upsert.assert_called_once()
+        assert table_mock.upsert.call_args.kwargs["ignore_duplicates"] is False
 
     def test_returns_zeros_for_empty_list(self, mock_supabase_client):
-        """batch_upload_transactions() returns (0, 0) for empty list."""
+        """batch_upload_transactions() returns (0, 0, 0) for empty list."""
         from app.lib.database import batch_upload_transactions
 
-        successful, failed = batch_upload_transactions(
+        counts = batch_upload_transactions(
             mock_supabase_client,
             [],
         )
 
-        assert successful == 0
-        assert failed == 0
+        assert counts == (0, 0, 0)
 
     def test_handles_batch_with_custom_size(self, mock_supabase_client):
         """batch_upload_transactions() respects custom batch_size."""
@@ -573,7 +593,7 @@ class TestBatchUploadTransactions:
 
         # Set mock to return correct number of records
         table_mock = mock_supabase_client.table.return_value
-        table_mock.insert.return_value.execute.return_value = MagicMock(
+        table_mock.upsert.return_value.execute.return_value = MagicMock(
             data=[{"id": f"id-{i}"} for i in range(2)]
         )
 
@@ -584,15 +604,61 @@ class TestBatchUploadTransactions:
         )
 
         # Should be called 3 times: 2 + 2 + 1
-        assert table_mock.insert.call_count == 3
+        assert table_mock.upsert.call_count == 3
+
+    def test_existing_rows_counted_as_duplicates(self, mock_supabase_client, sample_transactions):
+        """Rows skipped on conflict are duplicates, not failures, and stay batched."""
+        from app.lib.database import batch_upload_transactions
+
+        table_mock = mock_supabase_client.table.return_value
+        table_mock.upsert.return_value.execute.return_value = MagicMock(
+            data=[{"id": "id-1"}]
+        )
+
+        successful, duplicates, failed = batch_upload_transactions(
+            mock_supabase_client,
+            sample_transactions,
+        )
+
+        assert (successful, duplicates, failed) == (1, 2, 0)
+        table_mock.upsert.assert_called_once()
+
+    def test_dedupes_conflict_keys_before_upsert(self, mock_supabase_client, sample_transactions):
+        """Rows sharing a conflict key collapse to the last one, so the upsert is not rejected."""
+        from app.lib.database import batch_upload_transactions
+
+        table_mock = mock_supabase_client.table.return_value
+        table_mock.upsert.return_value.execute.side_effect = lambda: MagicMock(
+            data=[{"id": f"id-{i}"} for i, _ in enumerate(table_mock.upsert.call_args[0][0])]
+        )
+        amended = {**sample_transactions[0], "asset_ticker": "AAPL.NEW"}
+        undated = [
+            {**sample_transactions[1], "transaction_date": None},
+            {**sample_transactions[1], "transaction_date": None},
+        ]
+
+        successful, duplicates, failed = batch_upload_transactions(
+            mock_supabase_client,
+            sample_transactions + [amended] + undated,
+            update_mode=True,
+        )
+
+        rows = table_mock.upsert.call_args[0][0]
+        table_mock.upsert.assert_called_once()
+        assert len(rows) == 5
+        assert [r["asset_ticker"] for r in rows].count("AAPL.NEW") == 1
+        assert "AAPL" not in [r["asset_ticker"] for r in rows]
+        # NULL key columns never conflict, so both undated rows are kept
+        assert sum(r["transaction_date"] is None for r in rows) == 2
+        assert (successful, duplicates, failed) == (5, 1, 0)
 
     def test_handles_duplicate_key_with_fallback(self, mock_supabase_client, sample_transactions):
-        """batch_upload_transactions() falls back to individual inserts on duplicate."""
+        """batch_upload_transactions() falls back to individual writes on duplicate."""
         from app.lib.database import batch_upload_transactions
 
         table_mock = mock_supabase_client.table.return_value
 
-        # First call fails with duplicate key, then individual inserts succeed
+        # First call fails with duplicate key, then individual writes succeed
         call_count = [0]
         def side_effect():
             call_count[0] += 1
@@ -600,30 +666,51 @@ class TestBatchUploadTransactions:
                 raise Exception("duplicate key value violates unique constraint")
             return MagicMock(data=[{"id": "id-1"}])
 
-        table_mock.insert.return_value.execute.side_effect = side_effect
+        table_mock.upsert.return_value.execute.side_effect = side_effect
 
-        successful, failed = batch_upload_transactions(
+        successful, duplicates, failed = batch_upload_transactions(
             mock_supabase_client,
             sample_transactions,
         )
 
-        # All 3 should succeed via fallback individual inserts
+        # All 3 should succeed via fallback individual writes
         assert successful == 3
+        assert duplicates == 0
         assert failed == 0
 
+    def test_fallback_counts_duplicates_as_skipped(self, mock_supabase_client, sample_transactions):
+        """A duplicate-key error on a single row is a duplicate, not a failure."""
+        from app.lib.database import batch_upload_transactions
+
+        table_mock = mock_supabase_client.table.return_value
+        table_mock.upsert.return_value.execute.side_effect = [
+            Exception("duplicate key value violates unique constraint"),
+            MagicMock(data=[{"id": "id-1"}]),
+            Exception('{"code": "23505"}'),
+            Exception("Network error"),
+        ]
+
+        counts = batch_upload_transactions(
+            mock_supabase_client,
+            sample_transactions,
+        )
+
+        assert counts == (1, 1, 1)
+
     def test_counts_failures_correctly(self, mock_supabase_client, sample_transactions):
         """batch_upload_transactions() counts failures correctly."""
         from app.lib.database import batch_upload_transactions
 
         table_mock = mock_supabase_client.table.return_value
-        table_mock.insert.return_value.execute.side_effect = Exception("Network error")
+        table_mock.upsert.return_value.execute.side_effect = Exception("Network error")
 
-        successful, failed = batch_upload_transactions(
+        successful, duplicates, failed = batch_upload_transactions(
             mock_supabase_client,
             sample_transactions,
         )
 
         assert successful == 0
+        assert duplicates == 0
         assert failed == 3
 
 
@@ -9,8 +9,12 @@ Covers:
 - Schema mapping (parse_disclosure)
 - Registry integration
 - End-to-end run() with mocked HTTP + DB
+- Concurrent MEP workers
+- Incremental runs over the declaration index
 """
 
+import asyncio
+
 import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -808,7 +812,8 @@ class TestRunIntegration:
         with patch("app.services.eu_etl.get_supabase", return_value=mock_supabase), \
              patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
              patch("app.services.eu_etl.find_or_create_politician", return_value="pol-uuid-123"), \
-             patch("app.services.eu_etl.extract_text_from_pdf", return_value=SAMPLE_DPI_TEXT):
+             patch("app.services.eu_etl.find_or_create_politicians", return_value={}), \
+             patch("app.services.eu_etl.extract_text", new_callable=AsyncMock, return_value=SAMPLE_DPI_TEXT):
             result = await service.run(job_id="test-full")
 
         # Should have processed records from sections B, C, D
@@ -837,6 +842,7 @@ class TestRunIntegration:
 
         with patch("app.services.eu_etl.get_supabase", return_value=mock_supabase), \
              patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
+             patch("app.services.eu_etl.find_or_create_politicians", return_value={}), \
              patch("app.services.eu_etl.find_or_create_politician", return_value=None):
             result = await service.run(job_id="test-no-pol")
 
@@ -864,7 +870,8 @@ class TestRunIntegration:
         with patch("app.services.eu_etl.get_supabase", return_value=mock_supabase), \
              patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
              patch("app.services.eu_etl.find_or_create_politician", return_value="pol-1"), \
-             patch("app.services.eu_etl.extract_text_from_pdf", return_value=None):
+             patch("app.services.eu_etl.find_or_create_politicians", return_value={}), \
+             patch("app.services.eu_etl.extract_text", new_callable=AsyncMock, return_value=None):
             result = await service.run(job_id="test-no-text")
 
         assert result.records_processed == 0
@@ -905,7 +912,8 @@ class TestRunIntegration:
         with patch("app.services.eu_etl.get_supabase", return_value=mock_supabase), \
              patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
              patch("app.services.eu_etl.find_or_create_politician", return_value="pol-uuid"), \
-             patch("app.services.eu_etl.extract_text_from_pdf", return_value=SAMPLE_DPI_TEXT):
+             patch("app.services.eu_etl.find_or_create_politicians", return_value={}), \
+             patch("app.services.eu_etl.extract_text", new_callable=AsyncMock, return_value=SAMPLE_DPI_TEXT):
             service.upload_disclosure = mock_upload
             result = await service.run(job_id="test-incremental", update_mode=True)
 
@@ -940,13 +948,306 @@ class TestRunIntegration:
         with patch("app.services.eu_etl.get_supabase", return_value=mock_supabase), \
              patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
              patch("app.services.eu_etl.find_or_create_politician", return_value="pol-uuid"), \
-             patch("app.services.eu_etl.extract_text_from_pdf", return_value=SAMPLE_DPI_TEXT):
+             patch("app.services.eu_etl.find_or_create_politicians", return_value={}), \
+             patch("app.services.eu_etl.extract_text", new_callable=AsyncMock, return_value=SAMPLE_DPI_TEXT):
             service.upload_disclosure = mock_upload
             result = await service.run(job_id="test-update", update_mode=True)
 
         assert result.records_updated > 0
         assert result.records_inserted == 0
 
+    @pytest.mark.asyncio
+    async def test_run_resolves_politicians_in_one_batch(self):
+        """run() resolves all MEP politicians with one batch call."""
+        from app.lib.politician import politician_key
+        from app.services.eu_etl import _mep_descriptor
+
+        service = EUParliamentETLService()
+        meps = [
+            {"mep_id": "1", "full_name": "Alice TEST", "country": "DE",
+             "political_group": "EPP", "national_party": "CDU"},
+            {"mep_id": "2", "full_name": "Bob TEST", "country": "FR",
+             "political_group": "S&D", "national_party": "PS"},
+        ]
+        resolved = {politician_key(_mep_descriptor(m)): f"pol-{m['mep_id']}" for m in meps}
+
+        mock_client = AsyncMock(spec=EUParliamentClient)
+        mock_client.fetch_mep_list = AsyncMock(return_value=meps)
+        mock_client.fetch_declarations_page = AsyncMock(return_value=[])
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("app.services.eu_etl.get_supabase", return_value=MagicMock()), \
+             patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
+             patch("app.services.eu_etl.find_or_create_politicians", return_value=resolved) as mock_batch, \
+             patch("app.services.eu_etl.find_or_create_politician") as mock_single:
+            result = await service.run(job_id="test-batch-politicians")
+
+        assert result.is_success
+        mock_batch.assert_called_once()
+        assert len(mock_batch.call_args[0][1]) == 2
+        mock_single.assert_not_called()
+        assert mock_client.fetch_declarations_page.call_count == 2
+
+
+class TestConcurrentMEPs:
+    """run() processes MEPs in a bounded worker pool."""
+
+    @staticmethod
+    def _meps(n):
+        return [{"mep_id": str(i), "full_name": f"Member{i} TEST", "country": "DE",
+                 "political_group": "EPP", "national_party": "CDU"} for i in range(n)]
+
+    @staticmethod
+    def _client(meps, fetch_declarations):
+        mock_client = AsyncMock(spec=EUParliamentClient)
+        mock_client.fetch_mep_list = AsyncMock(return_value=meps)
+        mock_client.fetch_declarations_page = AsyncMock(side_effect=fetch_declarations)
+        mock_client.download_pdf = AsyncMock(return_value=b"pdf bytes")
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        return mock_client
+
+    @pytest.mark.asyncio
+    async def test_workers_bounded(self):
+        """At most MEP_WORKERS MEPs are in flight, and every MEP is processed."""
+        active = 0
+        peak = 0
+
+        async def fetch_declarations(mep_id, name):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return []
+
+        service = EUParliamentETLService()
+        mock_client = self._client(self._meps(10), fetch_declarations)
+
+        with patch("app.services.eu_etl.MEP_WORKERS", 3), \
+             patch("app.services.eu_etl.get_supabase", return_value=MagicMock()), \
+             patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
+             patch("app.services.eu_etl.find_or_create_politicians", return_value={}), \
+             patch("app.services.eu_etl.find_or_create_politician", return_value="pol-uuid"):
+            result = await service.run(job_id="test-workers")
+
+        assert result.is_success
+        assert mock_client.fetch_declarations_page.call_count == 10
+        assert peak == 3
+        assert service.get_job_status("test-workers").progress == 10
+
+    @pytest.mark.asyncio
+    async def test_uploads_before_slow_mep_finishes(self):
+        """A finished MEP is uploaded while another MEP is still being fetched."""
+        release_slow = asyncio.Event()
+        upload_calls = []
+
+        async def fetch_declarations(mep_id, name):
+            if mep_id == "0":
+                await release_slow.wait()
+                return []
+            return [{"pdf_url": f"https://example.com/{mep_id}.pdf", "label": "Original",
+                     "date": "2024-07-16", "revision": 0, "mep_id": mep_id}]
+
+        async def mock_upload(disclosure, update_mode=False):
+            upload_calls.append(disclosure["source_url"])
+            release_slow.set()
+            return "disc-uuid"
+
+        service = EUParliamentETLService()
+        service.upload_disclosure = mock_upload
+        mock_client = self._client(self._meps(2), fetch_declarations)
+
+        with patch("app.services.eu_etl.MEP_WORKERS", 2), \
+             patch("app.services.eu_etl.get_supabase", return_value=MagicMock()), \
+             patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
+             patch("app.services.eu_etl.find_or_create_politicians", return_value={}), \
+             patch("app.services.eu_etl.find_or_create_politician", return_value="pol-uuid"), \
+             patch("app.services.eu_etl.extract_text", new_callable=AsyncMock, return_value=SAMPLE_DPI_TEXT):
+            result = await asyncio.wait_for(service.run(job_id="test-incremental-workers"), 5)
+
+        assert result.records_inserted == len(upload_calls) > 0
+        assert set(upload_calls) == {"https://example.com/1.pdf"}
+
+    @pytest.mark.asyncio
+    async def test_failed_mep_does_not_stop_others(self):
+        """An exception for one MEP is recorded and the other workers carry on."""
+        async def fetch_declarations(mep_id, name):
+            if mep_id == "1":
+                raise RuntimeError("boom")
+            return []
+
+        service = EUParliamentETLService()
+        mock_client = self._client(self._meps(4), fetch_declarations)
+
+        with patch("app.services.eu_etl.MEP_WORKERS", 2), \
+             patch("app.services.eu_etl.get_supabase", return_value=MagicMock()), \
+             patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
+             patch("app.services.eu_etl.find_or_create_politicians", return_value={}), \
+             patch("app.services.eu_etl.find_or_create_politician", return_value="pol-uuid"):
+            result = await service.run(job_id="test-mep-failure")
+
+        assert result.records_failed == 1
+        assert mock_client.fetch_declarations_page.call_count == 4
+        assert service.get_job_status("test-mep-failure").status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_fetch_disclosures_keeps_mep_order(self):
+        """fetch_disclosures() returns records in MEP order whatever finishes first."""
+        async def fetch_declarations(mep_id, name):
+            await asyncio.sleep(0.02 if mep_id == "0" else 0)
+            return [{"pdf_url": f"https://example.com/{mep_id}.pdf", "label": "Original",
+                     "date": "2024-07-16", "revision": 0, "mep_id": mep_id}]
+
+        service = EUParliamentETLService()
+        mock_client = self._client(self._meps(3), fetch_declarations)
+
+        with patch("app.services.eu_etl.MEP_WORKERS", 3), \
+             patch("app.services.eu_etl.get_supabase", return_value=MagicMock()), \
+             patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
+             patch("app.services.eu_etl.find_or_create_politicians", return_value={}), \
+             patch("app.services.eu_etl.find_or_create_politician", return_value="pol-uuid"), \
+             patch("app.services.eu_etl.extract_text", new_callable=AsyncMock, return_value=SAMPLE_DPI_TEXT):
+            records = await service.fetch_disclosures()
+
+        urls = [r["source_url"] for r in records]
+        assert urls == sorted(urls)
+        assert len(set(urls)) == 3
+
+
+# ===========================================================================
+# Incremental Runs
+# ===========================================================================
+
+
+class TestIncrementalDeclarations:
+    """Incremental runs skip declarations already ingested."""
+
+    MEP = {"mep_id": "1", "full_name": "Test MEP", "country": "DE",
+           "political_group": "EPP", "national_party": "CDU"}
+
+    @staticmethod
+    def _declaration(name, date):
+        return {"pdf_url": f"https://www.europarl.europa.eu/{name}.pdf", "label": "Original",
+                "date": date, "revision": 0, "mep_id": "1"}
+
+    def test_fetch_ingested_declarations(self):
+        """URLs and doc_ids are collected, filtered by created_at when since is given."""
+        from app.services.eu_etl import fetch_ingested_declarations
+
+        mock_supabase = MagicMock()
+        like = mock_supabase.table.return_value.select.return_value.like.return_value
+        page = like.gte.return_value.order.return_value.range.return_value
+        page.execute.return_value = MagicMock(data=[
+            {"source_url": "https://www.europarl.europa.eu/a.pdf",
+             "source_document_id": "DPI-1-2024-07-16"},
+            {"source_url": "https://www.europarl.europa.eu/a.pdf", "source_document_id": None},
+        ])
+
+        keys = fetch_ingested_declarations(mock_supabase, since="2026-01-01T00:00:00+00:00")
+
+        like.gte.assert_called_once_with("created_at", "2026-01-01T00:00:00+00:00")
+        like.gte.return_value.order.assert_called_once_with("id")
+        assert keys == {"https://www.europarl.europa.eu/a.pdf", "DPI-1-2024-07-16"}
+
+    def test_index_synced_incrementally(self):
+        """The persisted index is built once, then only fetches rows since its last sync."""
+        from app.lib.url_index import reset_url_indexes
+        from app.services.eu_etl import load_declaration_index
+
+        with patch("app.services.eu_etl.fetch_ingested_declarations",
+                   return_value={"DPI-1-2024-07-16"}) as mock_scan:
+            synced_at = load_declaration_index(MagicMock()).synced_at
+        assert mock_scan.call_args.kwargs["since"] is None
+
+        reset_url_indexes()
+
+        with patch("app.services.eu_etl.fetch_ingested_declarations",
+                   return_value={"DPI-2-2025-01-10"}) as mock_scan:
+            index = load_declaration_index(MagicMock())
+
+        assert mock_scan.call_args.kwargs["since"] == synced_at
+        assert {"DPI-1-2024-07-16", "DPI-2-2025-01-10"} <= set(index)
+
+    def test_index_disabled_falls_back_to_set(self):
+        """Without the persisted index a full scan is returned as a set."""
+        from app.services.eu_etl import load_declaration_index
+
+        with patch("app.lib.url_index.URL_INDEX_ENABLED", False), \
+             patch("app.services.eu_etl.fetch_ingested_declarations",
+                   return_value={"DPI-1-2024-07-16"}) as mock_scan:
+            known = load_declaration_index(MagicMock())
+
+        assert known == {"DPI-1-2024-07-16"}
+        assert mock_scan.call_args.kwargs == {}
+
+    @pytest.mark.asyncio
+    async def test_known_declarations_not_downloaded(self):
+        """Declarations known by URL or doc_id are skipped before download."""
+        service = EUParliamentETLService()
+        mock_client = AsyncMock(spec=EUParliamentClient)
+        mock_client.fetch_declarations_page = AsyncMock(return_value=[
+            self._declaration("by-url", "2023-01-01"),
+            self._declaration("by-doc-id", "2024-07-16"),
+            self._declaration("new", "2025-02-01"),
+        ])
+        mock_client.download_pdf = AsyncMock(return_value=b"pdf bytes")
+        known = {"https://www.europarl.europa.eu/by-url.pdf", "DPI-1-2024-07-16"}
+
+        with patch("app.services.eu_etl.extract_text", new_callable=AsyncMock, return_value=SAMPLE_DPI_TEXT):
+            records = await service._fetch_mep_records(
+                mock_client, MagicMock(), self.MEP, politician_id="pol-1", known=known,
+            )
+
+        mock_client.download_pdf.assert_awaited_once_with("https://www.europarl.europa.eu/new.pdf")
+        assert records and {r["doc_id"] for r in records} == {"DPI-1-2025-02-01"}
+
+    @pytest.mark.asyncio
+    async def test_declaration_without_interests_remembered(self):
+        """A declaration with no interests is added to the index; one without text is not."""
+        service = EUParliamentETLService()
+        mock_client = AsyncMock(spec=EUParliamentClient)
+        mock_client.fetch_declarations_page = AsyncMock(return_value=[
+            self._declaration("empty", "2024-01-01"),
+            self._declaration("unreadable", "2024-02-01"),
+        ])
+        mock_client.download_pdf = AsyncMock(return_value=b"pdf bytes")
+        known = set()
+
+        with patch("app.services.eu_etl.extract_text", new_callable=AsyncMock,
+                   side_effect=["(A) Nothing to declare", None]):
+            await service._fetch_mep_records(
+                mock_client, MagicMock(), self.MEP, politician_id="pol-1", known=known,
+            )
+
+        assert known == {"https://www.europarl.europa.eu/empty.pdf"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("kwargs,loaded", [
+        ({"incremental": True}, True),
+        ({"incremental": True, "update_mode": True}, False),
+        ({}, False),
+    ])
+    async def test_run_loads_index_only_when_incremental(self, kwargs, loaded):
+        """run() consults the index for incremental runs outside update mode."""
+        service = EUParliamentETLService()
+        mock_client = AsyncMock(spec=EUParliamentClient)
+        mock_client.fetch_mep_list = AsyncMock(return_value=[self.MEP])
+        mock_client.fetch_declarations_page = AsyncMock(return_value=[])
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("app.services.eu_etl.get_supabase", return_value=MagicMock()), \
+             patch("app.services.eu_etl.EUParliamentClient", return_value=mock_client), \
+             patch("app.services.eu_etl.find_or_create_politicians", return_value={}), \
+             patch("app.services.eu_etl.find_or_create_politician", return_value="pol-1"), \
+             patch("app.services.eu_etl.load_declaration_index", return_value=set()) as mock_load:
+            result = await service.run(job_id="test-incremental-index", **kwargs)
+
+        assert result.is_success
+        assert mock_load.called is loaded
+
 
 # ===========================================================================
 # Client Class Tests
@@ -1025,6 +1326,25 @@ class TestEUParliamentClient:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_limiter_records_throttle_and_success(self):
+        """Requests hold a limiter slot, and 429/200 responses adjust the limit."""
+        from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+        throttled = MagicMock(status_code=429)
+        ok = MagicMock(status_code=200, content=b"%PDF-1.4 fake pdf content")
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=4)
+
+        async with EUParliamentClient(pdf_delay=0, limiter=limiter) as client:
+            client._client.get = AsyncMock(side_effect=[throttled, ok])
+            result = await client.download_pdf("https://example.com/throttled.pdf")
+
+        stats = limiter.get_stats()
+        assert result == b"%PDF-1.4 fake pdf content"
+        assert stats["throttles"] == 1
+        assert stats["successes"] == 1
+        assert stats["in_flight"] == 0
+
     @pytest.mark.asyncio
     async def test_declarations_404_returns_empty(self):
         """fetch_declarations_page should return empty on 404."""
@@ -357,6 +357,143 @@ class TestFeaturePipelineAggregateByWeek:
         result = pipeline._aggregate_by_week(disclosures, min_politicians=1)
         assert result[0]['avg_disclosure_delay'] == 10
 
+    def test_aggregate_by_week_full_aggregation(self, pipeline):
+        """Test every field of one group built from mixed-format rows."""
+        disclosures = [
+            {
+                'asset_ticker': 'AAPL',
+                'transaction_date': '2025-01-06',
+                'disclosure_date': '2025-01-10',
+                'transaction_type': 'purchase',
+                'amount_range_min': 1000,
+                'amount_range_max': 5000,
+                'politician_id': 'pol-1',
+                'politician': {'party': 'D', 'chamber': 'House'},
+            },
+            {
+                'asset_ticker': 'aapl',
+                'transaction_date': '2025-01-08T10:00:00Z',
+                'disclosure_date': '2025-01-07T00:00:00Z',  # Before the trade: ignored
+                'transaction_type': 'Sale (Partial)',
+                'amount_range_min': 15001,
+                'amount_range_max': None,  # Falls back to the minimum
+                'politician_id': 'pol-2',
+                'politician': {'party': 'D', 'chamber': 'house'},
+            },
+            {
+                'asset_ticker': 'AAPL',
+                'transaction_date': '2025-01-07T00:00:00+00:00',
+                'disclosure_date': '2025-01-17T00:00:00+00:00',
+                'transaction_type': 'exchange',
+                'politician_id': 'pol-3',
+                'politician': {'party': 'R', 'chamber': 'Senate'},
+            },
+        ]
+
+        result = pipeline._aggregate_by_week(disclosures, min_politicians=1)
+
+        assert result == [{
+            'ticker': 'AAPL',
+            'week_start': '2025-01-06',
+            'politician_count': 3,
+            'buy_count': 1,
+            'sell_count': 1,
+            'buy_sell_ratio': 1.0,
+            'buy_volume': 3000.0,
+            'sell_volume': 15001.0,
+            'net_volume': -12001.0,
+            'total_volume': 18001.0,
+            'bipartisan': True,
+            # A set filled in row order, as the row-by-row aggregation returned it
+            'parties': list({'D', 'R'}),
+            'party_alignment': pytest.approx(2 / 3),
+            'committee_relevance': 0.5,
+            'avg_disclosure_delay': 7.0,
+            'disclosure_count': 3,
+        }]
+
+    def test_aggregate_by_week_uses_local_calendar_week(self, pipeline):
+        """Test weeks follow each timestamp's own date, in first-seen order."""
+        disclosures = [
+            {'asset_ticker': 'MSFT', 'transaction_date': '2025-01-06', 'politician_id': 'pol-1'},
+            # Sunday evening in New York, already Monday in UTC
+            {'asset_ticker': 'AAPL', 'transaction_date': '2025-01-05T23:30:00-05:00', 'politician_id': 'pol-1'},
+            {'asset_ticker': 'AAPL', 'transaction_date': '2025-01-06T00:00:00Z', 'politician_id': 'pol-1'},
+        ]
+
+        result = pipeline._aggregate_by_week(disclosures, min_politicians=1)
+
+        assert [(a['ticker'], a['week_start']) for a in result] == [
+            ('MSFT', '2025-01-06'),
+            ('AAPL', '2024-12-30'),
+            ('AAPL', '2025-01-06'),
+        ]
+        # No party, chamber or disclosure date data: neutral defaults
+        assert all(a['parties'] == [] and a['party_alignment'] == 0.5 for a in result)
+        assert all(a['committee_relevance'] == 0.5 and a['avg_disclosure_delay'] == 30 for a in result)
+
+
+    def test_aggregate_by_week_parties_in_set_order(self, pipeline):
+        """Test parties list the group's set of parties, filled in row order."""
+        disclosures = [
+            {'asset_ticker': 'AAPL', 'transaction_date': '2025-01-06', 'politician_id': f'pol-{i}',
+             'politician': {'party': party}}
+            for i, party in enumerate(['R', 'I', 'R', 'D', 'Independent'])
+        ]
+
+        result = pipeline._aggregate_by_week(disclosures, min_politicians=1)
+
+        assert result[0]['parties'] == list({'R', 'I', 'D', 'Independent'})
+        assert result[0]['bipartisan'] is True
+
+    @pytest.mark.parametrize('transaction_date, error', [
+        ('not-a-date', ValueError),
+        ('', ValueError),
+        (None, AttributeError),
+    ])
+    def test_aggregate_by_week_raises_on_bad_transaction_date(self, pipeline, transaction_date, error):
+        """Test an unreadable transaction date fails the aggregation."""
+        disclosures = [
+            {'asset_ticker': 'AAPL', 'transaction_date': '2025-01-06', 'politician_id': 'pol-1'},
+            {'asset_ticker': 'AAPL', 'transaction_date': transaction_date, 'politician_id': 'pol-2'},
+        ]
+
+        with pytest.raises(error):
+            pipeline._aggregate_by_week(disclosures, min_politicians=1)
+
+    def test_aggregate_by_week_raises_on_bad_disclosure_date(self, pipeline):
+        """Test an unreadable disclosure date fails when both dates are given."""
+        disclosures = [
+            {'asset_ticker': 'AAPL', 'transaction_date': '2025-01-06',
+             'disclosure_date': '01/10/2025', 'politician_id': 'pol-1'},
+        ]
+
+        with pytest.raises(ValueError):
+            pipeline._aggregate_by_week(disclosures, min_politicians=1)
+
+    def test_aggregate_by_week_raises_on_mixed_timezones(self, pipeline):
+        """Test a naive date against an offset-aware one fails as a subtraction did."""
+        disclosures = [
+            {'asset_ticker': 'AAPL', 'transaction_date': '2025-01-06T00:00:00Z',
+             'disclosure_date': '2025-01-10', 'politician_id': 'pol-1'},
+        ]
+
+        with pytest.raises(TypeError):
+            pipeline._aggregate_by_week(disclosures, min_politicians=1)
+
+    def test_aggregate_by_week_ignores_dates_of_dropped_rows(self, pipeline):
+        """Test rows without a usable ticker are dropped before their dates are read."""
+        disclosures = [
+            {'asset_ticker': 'AAPL', 'transaction_date': '2025-01-06', 'politician_id': 'pol-1'},
+            {'asset_ticker': '', 'transaction_date': 'not-a-date', 'politician_id': 'pol-2'},
+            {'asset_ticker': 'AAPL', 'transaction_date': '2025-01-07', 'disclosure_date': None,
+             'politician_id': 'pol-3'},
+        ]
+
+        result = pipeline._aggregate_by_week(disclosures, min_politicians=1)
+
+        assert [(a['ticker'], a['disclosure_count']) for a in result] == [('AAPL', 2)]
+
 
 class TestFeaturePipelineFetchDisclosures:
     """Tests for FeaturePipeline._fetch_disclosures method."""
@@ -381,6 +518,7 @@ class TestFeaturePipelineFetchDisclosures:
         mock_table.not_.is_.return_value = mock_table
         mock_table.gte.return_value = mock_table
         mock_table.lte.return_value = mock_table
+        mock_table.order.return_value = mock_table
         mock_table.range.return_value = mock_table
         mock_table.execute.return_value = MagicMock(data=[])
 
@@ -403,6 +541,7 @@ class TestFeaturePipelineFetchDisclosures:
         mock_table.not_.is_.return_value = mock_table
         mock_table.gte.return_value = mock_table
         mock_table.lte.return_value = mock_table
+        mock_table.order.return_value = mock_table
         mock_table.range.return_value = mock_table
         mock_table.execute.return_value = MagicMock(data=sample_data)
 
@@ -410,6 +549,7 @@ class TestFeaturePipelineFetchDisclosures:
 
         # First call returns data, second call would return empty to stop pagination
         assert result == sample_data
+        mock_table.order.assert_called_with('id')
 
 
 class TestFeaturePipelinePrepareTrainingData:
@@ -1026,6 +1166,22 @@ class TestAddStockReturnsWithYfinance:
             })
         return pd.concat(data, axis=1)
 
+    @pytest.mark.asyncio
+    async def test_add_stock_returns_reads_prices_off_the_event_loop(self, pipeline):
+        """get_prices() (disk reads, yfinance downloads) runs in a worker thread."""
+        import threading
+
+        threads = []
+
+        def fake_get_prices(tickers, start, end):
+            threads.append(threading.current_thread())
+            return {}
+
+        with patch("app.services.feature_pipeline.get_prices", side_effect=fake_get_prices):
+            await pipeline._add_stock_returns([{'ticker': 'AAPL', 'week_start': '2025-01-06'}])
+
+        assert threads and threads[0] is not threading.main_thread()
+
     @pytest.mark.asyncio
     async def test_add_stock_returns_success(self, pipeline):
         """Test successful stock returns fetching with yfinance (lines 278-360)."""
@@ -1072,7 +1228,7 @@ class TestAddStockReturnsWithYfinance:
 
         with patch("yfinance.download") as mock_download:
             # Mock different calls for different batches
-            def mock_download_fn(tickers, start, end, progress, group_by):
+            def mock_download_fn(tickers, start, end, progress, group_by, auto_adjust):
                 # Return a multi-index dataframe for multiple tickers
                 if len(tickers) > 1:
                     data = {}
@@ -1101,6 +1257,21 @@ class TestAddStockReturnsWithYfinance:
             assert mock_download.call_count == 2
             assert len(result) == 150
 
+    @pytest.mark.asyncio
+    async def test_add_stock_returns_reuses_stored_prices(self, pipeline):
+        """Test a second run reads prices from the local store instead of downloading."""
+        dates = pd.date_range('2024-12-15', '2025-02-15', freq='D')
+
+        with patch("yfinance.download") as mock_download:
+            mock_download.side_effect = lambda tickers, **kwargs: self._build_multi_ticker_mock(tickers, dates)
+
+            first = await pipeline._add_stock_returns([{'ticker': 'AAPL', 'week_start': '2025-01-06'}])
+            second = await pipeline._add_stock_returns([{'ticker': 'AAPL', 'week_start': '2025-01-06'}])
+
+        assert mock_download.call_count == 1
+        assert first[0]['forward_return_7d'] is not None
+        assert second == first
+
     @pytest.mark.asyncio
     async def test_add_stock_returns_missing_ticker_data(self, pipeline):
         """Test handling when ticker has no price data (lines 311-314)."""
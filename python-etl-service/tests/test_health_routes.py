@@ -40,3 +40,12 @@ class TestHealthRoutes:
         response = client.get("/health")
 
         assert "application/json" in response.headers["content-type"]
+
+    def test_supabase_pool_metrics(self, client):
+        """GET /health/supabase-pool returns pool metrics."""
+        response = client.get("/health/supabase-pool")
+        data = response.json()
+
+        assert response.status_code == 200
+        assert "hit_rate" in data
+        assert "open_connections" in data
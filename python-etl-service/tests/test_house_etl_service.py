@@ -11,6 +11,8 @@ Tests the core ETL functionality for US House financial disclosures:
 - Main ETL function
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime
@@ -777,6 +779,54 @@ class TestExtractIndexFile:
         assert result is None
 
 
+class TestStreamingIndex:
+    """Tests for iter_index_lines and iter_disclosure_index."""
+
+    def test_iter_index_lines_reads_from_file(self, tmp_path):
+        """iter_index_lines yields the index lines from a ZIP on disk."""
+        from app.services.house_etl import HouseDisclosureScraper
+        import zipfile
+
+        zip_path = tmp_path / "2024FD.ZIP"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("2024FD.txt", "Header\r\nRow 1\r\nRow 2")
+
+        lines = list(HouseDisclosureScraper.iter_index_lines(zip_path, 2024))
+
+        assert lines == ["Header\r\n", "Row 1\r\n", "Row 2"]
+
+    def test_iter_index_lines_missing_file(self, tmp_path):
+        """iter_index_lines raises KeyError when the index file is missing."""
+        from app.services.house_etl import HouseDisclosureScraper
+        import zipfile
+
+        zip_path = tmp_path / "2024FD.ZIP"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("other.txt", "Some content")
+
+        with pytest.raises(KeyError):
+            list(HouseDisclosureScraper.iter_index_lines(zip_path, 2024))
+
+    def test_iter_disclosure_index_is_lazy(self):
+        """iter_disclosure_index parses records only as they are consumed."""
+        from app.services.house_etl import HouseDisclosureScraper
+
+        consumed = []
+
+        def lines():
+            yield "Prefix\tLast\tFirst\tSuffix\tFilingType\tStateDst\tYear\tFilingDate\tDocID\r\n"
+            for i in range(3):
+                consumed.append(i)
+                yield f"Hon.\tDoe{i}\tJane\t\tP\tCA01\t2024\t1/15/2024\t2001000{i}\r\n"
+
+        records = HouseDisclosureScraper.iter_disclosure_index(lines(), 2024)
+        first = next(records)
+
+        assert first["doc_id"] == "20010000"
+        assert consumed == [0]
+        assert [r["doc_id"] for r in records] == ["20010001", "20010002"]
+
+
 # =============================================================================
 # Fetch PDF Rate Limit and Retry Tests
 # =============================================================================
@@ -897,6 +947,167 @@ class TestFetchPdfRateLimiting:
 # Run House ETL Tests
 # =============================================================================
 
+class TestConcurrentPdfPipeline:
+    """Tests for the concurrent House PDF pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_pdf_with_limiter_skips_fixed_delay(self):
+        """fetch_pdf with a limiter does not wait on the rate limiter delay."""
+        from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+        from app.services.house_etl import HouseDisclosureScraper, RateLimiter
+        import app.services.house_etl as house_etl
+
+        house_etl.rate_limiter = RateLimiter()
+        house_etl.rate_limiter.wait = AsyncMock()
+        limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=4)
+
+        mock_client = AsyncMock()
+        mock_client.get.return_value = MagicMock(status_code=200, content=b"%PDF-1.4")
+
+        result = await HouseDisclosureScraper.fetch_pdf(
+            mock_client, "https://example.com/test.pdf", limiter=limiter
+        )
+
+        assert result == b"%PDF-1.4"
+        house_etl.rate_limiter.wait.assert_not_called()
+        assert limiter.get_stats()["successes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_pdf_with_limiter_shrinks_on_throttle(self):
+        """A 429 response halves the limiter's concurrency limit."""
+        from app.lib.adaptive_concurrency import AdaptiveConcurrencyLimiter
+        from app.services.house_etl import HouseDisclosureScraper, RateLimiter
+        import app.services.house_etl as house_etl
+
+        house_etl.rate_limiter = RateLimiter()
+        limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=4)
+
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = [
+            MagicMock(status_code=429, headers={"Retry-After": "0"}),
+            MagicMock(status_code=200, content=b"%PDF-1.4"),
+        ]
+
+        result = await HouseDisclosureScraper.fetch_pdf(
+            mock_client, "https://example.com/test.pdf", max_retries=2, limiter=limiter
+        )
+
+        assert result == b"%PDF-1.4"
+        assert limiter.get_stats()["decreases"] == 1
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_process_ptr_pdfs_downloads_concurrently(self):
+        """process_ptr_pdfs overlaps downloads and reports progress for every PDF."""
+        from app.lib.politician import politician_key
+        from app.services.house_etl import JOB_STATUS, process_ptr_pdfs
+
+        job_id = "test-concurrent-pdfs"
+        JOB_STATUS[job_id] = {"status": "running", "progress": 0, "message": ""}
+        disclosures = [
+            {
+                "doc_id": f"doc-{i}",
+                "pdf_url": f"https://example.com/{i}.pdf",
+                "politician_name": f"Member {i}",
+                "first_name": "Member",
+                "last_name": str(i),
+                "party": "D",
+            }
+            for i in range(6)
+        ]
+        resolved = []
+
+        def fake_resolve(supabase, descriptors, index=None):
+            assert index is not None  # the shared politician index is consulted
+            resolved.extend(d["disclosure"]["doc_id"] for d in descriptors)
+            return {politician_key(d): "pol-1" for d in descriptors}
+
+        active = 0
+        peak = 0
+
+        async def fake_fetch(client, url, limiter=None, doc_id=None):
+            nonlocal active, peak
+            async with limiter.slot():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+            if url.endswith("5.pdf"):
+                return None  # failed download still counts toward progress
+            return b"%PDF"
+
+        try:
+            with patch("app.services.house_etl.HouseDisclosureScraper.fetch_pdf", side_effect=fake_fetch), \
+                 patch("app.services.house_etl.parse_ptr_pdf", new=AsyncMock(return_value=[{"asset_name": "Apple"}])), \
+                 patch("app.lib.database.upload_transaction_to_supabase", return_value="txn-1"), \
+                 patch("app.lib.politician.find_or_create_politicians", side_effect=fake_resolve), \
+                 patch("app.services.house_etl.PDF_CONCURRENCY_INITIAL", 3):
+                uploaded, politicians, stats = await process_ptr_pdfs(
+                    job_id, MagicMock(), MagicMock(), disclosures,
+                )
+
+            assert peak > 1
+            assert uploaded == 5
+            assert politicians == {"pol-1"}
+            # The filer whose PDF failed to download is never resolved
+            assert sorted(resolved) == [f"doc-{i}" for i in range(5)]
+            assert JOB_STATUS[job_id]["progress"] == 6
+            assert stats["limit"] >= 3
+        finally:
+            del JOB_STATUS[job_id]
+
+    @pytest.mark.asyncio
+    async def test_process_ptr_pdfs_resolves_only_filers_with_transactions(self):
+        """Empty filings never create a politician and each filer is resolved once."""
+        from app.lib.politician import politician_key
+        from app.services.house_etl import JOB_STATUS, process_ptr_pdfs
+
+        job_id = "test-lazy-politicians"
+        JOB_STATUS[job_id] = {"status": "running", "progress": 0, "message": ""}
+        disclosures = [
+            {
+                "doc_id": f"doc-{i}",
+                "pdf_url": f"https://example.com/{i}.pdf",
+                "politician_name": name,
+                "first_name": name.split()[0],
+                "last_name": name.split()[1],
+            }
+            for i, name in enumerate(["Jane Doe", "Jane Doe", "John Roe", "Empty Filer"])
+        ]
+        resolve = MagicMock(
+            side_effect=lambda supabase, descriptors, index=None: {
+                politician_key(d): f"pol-{d['disclosure']['last_name']}" for d in descriptors
+            }
+        )
+
+        async def fake_parse(pdf_bytes, disclosure):
+            return [] if disclosure["doc_id"] == "doc-3" else [{"asset_name": "Apple"}]
+
+        try:
+            with patch("app.services.house_etl.HouseDisclosureScraper.fetch_pdf",
+                       new=AsyncMock(return_value=b"%PDF")), \
+                 patch("app.services.house_etl.parse_ptr_pdf", new=fake_parse), \
+                 patch("app.lib.database.upload_transaction_to_supabase", return_value="txn-1"), \
+                 patch("app.lib.politician.find_or_create_politicians", new=resolve):
+                uploaded, politicians, _ = await process_ptr_pdfs(
+                    job_id, MagicMock(), MagicMock(), disclosures,
+                )
+
+            assert uploaded == 3
+            assert politicians == {"pol-Doe", "pol-Roe"}
+            names = [
+                d["disclosure"]["politician_name"]
+                for call in resolve.call_args_list
+                for d in call.args[1]
+            ]
+            assert "Empty Filer" not in names
+            assert sorted(set(names)) == ["Jane Doe", "John Roe"]
+            assert names.count("John Roe") == 1
+            assert JOB_STATUS[job_id]["progress"] == 4
+        finally:
+            del JOB_STATUS[job_id]
+
+
 class TestRunHouseETL:
     """Tests for the main run_house_etl function."""
 
@@ -936,42 +1147,22 @@ class TestRunHouseETL:
             assert "Missing credentials" in JOB_STATUS[job_id]["message"]
 
     @pytest.mark.asyncio
-    async def test_run_house_etl_zip_download_failure(self, setup_job_status):
-        """run_house_etl handles ZIP download failure."""
-        from app.services.house_etl import run_house_etl, JOB_STATUS, HouseDisclosureScraper
-
-        job_id = setup_job_status
-
-        with patch('app.services.house_etl.get_supabase') as mock_get_supabase, \
-             patch.object(HouseDisclosureScraper, 'fetch_zip_content', new_callable=AsyncMock) as mock_fetch:
-
-            mock_get_supabase.return_value = MagicMock()
-            mock_fetch.return_value = None
-
-            await run_house_etl(job_id, year=2024, limit=1)
-
-            assert JOB_STATUS[job_id]["status"] == "failed"
-            assert "ZIP" in JOB_STATUS[job_id]["message"]
-
-    @pytest.mark.asyncio
-    async def test_run_house_etl_index_extraction_failure(self, setup_job_status):
-        """run_house_etl handles index file extraction failure."""
-        from app.services.house_etl import run_house_etl, JOB_STATUS, HouseDisclosureScraper
+    async def test_run_house_etl_index_unavailable(self, setup_job_status):
+        """run_house_etl fails when the ZIP index can't be fetched or read."""
+        from app.services.house_etl import run_house_etl, JOB_STATUS
 
         job_id = setup_job_status
 
         with patch('app.services.house_etl.get_supabase') as mock_get_supabase, \
-             patch.object(HouseDisclosureScraper, 'fetch_zip_content', new_callable=AsyncMock) as mock_fetch, \
-             patch.object(HouseDisclosureScraper, 'extract_index_file') as mock_extract:
+             patch('app.services.house_etl.iter_house_index', new_callable=AsyncMock) as mock_index:
 
             mock_get_supabase.return_value = MagicMock()
-            mock_fetch.return_value = b"fake zip content"
-            mock_extract.return_value = None
+            mock_index.return_value = None
 
             await run_house_etl(job_id, year=2024, limit=1)
 
             assert JOB_STATUS[job_id]["status"] == "failed"
-            assert "index" in JOB_STATUS[job_id]["message"].lower()
+            assert "ZIP index" in JOB_STATUS[job_id]["message"]
 
     @pytest.mark.asyncio
     async def test_run_house_etl_exception_handling(self, setup_job_status):
@@ -993,6 +1184,139 @@ class TestRunHouseETL:
                 assert JOB_STATUS[job_id]["completed_at"] is not None
 
 
+# =============================================================================
+# Incremental Mode Tests
+# =============================================================================
+
+class TestIncrementalHouseETL:
+    """Tests for incremental House runs."""
+
+    @pytest.fixture
+    def setup_job_status(self):
+        """Set up initial job status."""
+        from app.services.house_etl import JOB_STATUS
+        from datetime import datetime, timezone
+
+        job_id = "test-incremental"
+        JOB_STATUS[job_id] = {
+            "status": "pending",
+            "message": "",
+            "progress": 0,
+            "total": 0,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "completed_at": None,
+        }
+        yield job_id
+        JOB_STATUS.pop(job_id, None)
+
+    def test_fetch_ingested_doc_ids_pages(self):
+        """fetch_ingested_doc_ids() pages through the year's PTR rows."""
+        from app.services.house_etl import fetch_ingested_doc_ids
+
+        supabase = MagicMock()
+        query = MagicMock()
+        query.select.return_value = query
+        query.like.return_value = query
+        query.not_.is_.return_value = query
+        query.order.return_value = query
+        query.range.return_value = query
+        query.execute.side_effect = [
+            MagicMock(data=[{"source_document_id": "1"}, {"source_document_id": "1"}]),
+            MagicMock(data=[{"source_document_id": 2}]),
+        ]
+        supabase.table.return_value = query
+
+        result = fetch_ingested_doc_ids(supabase, 2024, page_size=2)
+
+        assert result == {"1", "2"}
+        query.like.assert_called_with(
+            "source_url", "https://disclosures-clerk.house.gov/public_disc/ptr-pdfs/2024/%.pdf"
+        )
+        query.range.assert_any_call(2, 3)
+        # Offsets are only stable over a fixed row order
+        query.order.assert_called_with("id")
+
+    def test_fetch_ingested_doc_ids_failure_returns_none(self):
+        """A failed lookup returns None rather than an empty set."""
+        from app.services.house_etl import fetch_ingested_doc_ids
+
+        supabase = MagicMock()
+        supabase.table.side_effect = Exception("timeout")
+
+        assert fetch_ingested_doc_ids(supabase, 2024) is None
+
+    def _run_patches(self, ingested):
+        disclosures = [
+            {"filing_type": "P", "doc_id": doc_id, "pdf_url": f"https://example.com/{doc_id}.pdf",
+             "politician_name": "Jane Doe", "first_name": "Jane", "last_name": "Doe"}
+            for doc_id in ("100", "101", "102")
+        ]
+        process = AsyncMock(return_value=(0, set(), {}))
+        patches = [
+            patch("app.services.house_etl.get_supabase", return_value=MagicMock()),
+            patch("app.services.house_etl.fetch_member_party_map", new=AsyncMock(return_value={})),
+            patch("app.services.house_etl.iter_house_index", new=AsyncMock(return_value=iter(disclosures))),
+            patch("app.services.house_etl.fetch_ingested_doc_ids", return_value=ingested),
+            patch("app.services.house_etl.process_ptr_pdfs", new=process),
+            patch("app.lib.job_logger.log_job_execution"),
+            patch("app.services.house_etl.refresh_materialized_views"),
+        ]
+        return patches, process
+
+    @pytest.mark.asyncio
+    async def test_incremental_skips_ingested(self, setup_job_status):
+        """Only doc_ids missing from the database are processed."""
+        from contextlib import ExitStack
+        from app.services.house_etl import run_house_etl, JOB_STATUS
+
+        job_id = setup_job_status
+        patches, process = self._run_patches({"100", "102"})
+        with ExitStack() as stack:
+            for p in patches:
+                stack.enter_context(p)
+            await run_house_etl(job_id, year=2024, incremental=True)
+
+        to_process = process.await_args.args[3]
+        assert [d["doc_id"] for d in to_process] == ["101"]
+        assert JOB_STATUS[job_id]["skipped_existing"] == 2
+        assert "2 already ingested" in JOB_STATUS[job_id]["message"]
+
+    @pytest.mark.asyncio
+    async def test_update_mode_ignores_incremental(self, setup_job_status):
+        """update_mode re-parses everything even when incremental is set."""
+        from contextlib import ExitStack
+        from app.services.house_etl import run_house_etl, JOB_STATUS
+
+        job_id = setup_job_status
+        patches, process = self._run_patches({"100", "101", "102"})
+        with ExitStack() as stack:
+            for p in patches:
+                stack.enter_context(p)
+            await run_house_etl(job_id, year=2024, update_mode=True, incremental=True)
+
+        assert len(process.await_args.args[3]) == 3
+        assert JOB_STATUS[job_id]["skipped_existing"] == 0
+
+    @pytest.mark.asyncio
+    async def test_party_resolved_before_processing(self, setup_job_status):
+        """Filers get their party from the legislators map before PDFs are processed."""
+        from contextlib import ExitStack
+        from app.services.house_etl import run_house_etl
+
+        job_id = setup_job_status
+        patches, process = self._run_patches(set())
+        with ExitStack() as stack:
+            for p in patches:
+                stack.enter_context(p)
+            stack.enter_context(
+                patch("app.services.house_etl.resolve_party", return_value="Democratic")
+            )
+            await run_house_etl(job_id, year=2024)
+
+        to_process = process.await_args.args[3]
+        assert [d["party"] for d in to_process] == ["Democratic"] * 3
+
+
 # =============================================================================
 # Additional Edge Case Tests
 # =============================================================================
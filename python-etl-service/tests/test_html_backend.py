@@ -0,0 +1,125 @@
+"""
+Tests for the pluggable HTML parsing backend (app/lib/html_backend.py).
+
+Tests:
+- text_content() - Matches BeautifulSoup's get_text()
+- parse_document() - Empty documents, XML declarations
+- Backend parity - parse_ptr_page_html() and parse_declarations_html()
+  return the same output with lxml and bs4 over the saved-page corpus
+"""
+
+from pathlib import Path
+
+import pytest
+from unittest.mock import patch
+
+CORPUS = Path(__file__).parent / "fixtures" / "html"
+
+
+# =============================================================================
+# text_content() Tests
+# =============================================================================
+
+class TestTextContent:
+    """Tests for text_content()."""
+
+    @pytest.mark.parametrize("html", [
+        "<td> Apple <!-- note --> Inc. </td>",
+        "<td>AAPL<script>track('x')</script><style>.a{}</style> Common&nbsp;Stock</td>",
+        "<td><a href='/q'>MSFT</a><br><div class='muted'><em>Rate:</em> 4.0%</div></td>",
+        "<td>  </td>",
+    ])
+    def test_matches_get_text(self, html):
+        """Stripped and unstripped text equal BeautifulSoup's get_text()."""
+        from bs4 import BeautifulSoup
+        from app.lib.html_backend import parse_document, text_content
+
+        page = f"<html><body><table><tr>{html}</tr></table></body></html>"
+        td = parse_document(page).find(".//td")
+        expected = BeautifulSoup(page, "html.parser").find("td")
+
+        assert text_content(td) == expected.get_text()
+        assert text_content(td, strip=True) == expected.get_text(strip=True)
+
+
+# =============================================================================
+# parse_document() Tests
+# =============================================================================
+
+class TestParseDocument:
+    """Tests for parse_document()."""
+
+    @pytest.mark.parametrize("html", ["", "   \n"])
+    def test_empty_document(self, html):
+        """An empty page parses to None instead of raising."""
+        from app.lib.html_backend import parse_document
+
+        assert parse_document(html) is None
+
+    def test_xml_declaration(self):
+        """A str page with an XML encoding declaration still parses."""
+        from app.lib.html_backend import parse_document, text_content
+
+        doc = parse_document('<?xml version="1.0" encoding="utf-8"?><html><body><h1>Gimén</h1></body></html>')
+
+        assert text_content(doc.find(".//h1")) == "Gimén"
+
+
+# =============================================================================
+# Backend Parity Tests
+# =============================================================================
+
+def _parse_with(backend, parse, html):
+    with patch("app.lib.html_backend.HTML_PARSER_BACKEND", backend):
+        return parse(html)
+
+
+class TestBackendParity:
+    """Both backends give identical output."""
+
+    @pytest.mark.parametrize("page", sorted(p.name for p in CORPUS.glob("*ptr*.html")))
+    def test_ptr_pages(self, page):
+        """parse_ptr_page_html() output doesn't depend on the backend."""
+        from app.services.senate_etl import parse_ptr_page_html
+
+        html = (CORPUS / page).read_text()
+        lxml_result = _parse_with("lxml", parse_ptr_page_html, html)
+
+        assert lxml_result
+        assert lxml_result == _parse_with("bs4", parse_ptr_page_html, html)
+
+    @pytest.mark.parametrize("page", sorted(p.name for p in CORPUS.glob("*declarations*.html")))
+    def test_declarations_pages(self, page):
+        """parse_declarations_html() output doesn't depend on the backend."""
+        from app.services.eu_parliament_client import parse_declarations_html
+
+        def parse(html):
+            return parse_declarations_html(html, "256810")
+
+        html = (CORPUS / page).read_text()
+        lxml_result = _parse_with("lxml", parse, html)
+
+        assert lxml_result
+        assert lxml_result == _parse_with("bs4", parse, html)
+
+    @pytest.mark.parametrize("html", [
+        "",
+        "<html><body><p>No table here</p></body></html>",
+        "<table><tr><th>Date</th></tr><tr><td>1</td><td>01/02/2024</td><td>Self</td>"
+        "<td>--</td><td>Bond</td><td>Other</td><td>Purchase</td><td>$1,001 - $15,000</td></tr></table>",
+    ])
+    def test_ptr_edge_cases(self, html):
+        """Pages without a table or without thead/tbody parse the same way."""
+        from app.services.senate_etl import parse_ptr_page_html
+
+        assert _parse_with("lxml", parse_ptr_page_html, html) == _parse_with("bs4", parse_ptr_page_html, html)
+
+    def test_bs4_backend_selectable(self):
+        """HTML_PARSER_BACKEND=bs4 bypasses lxml."""
+        from app.services.senate_etl import parse_ptr_page_html
+
+        with patch("app.lib.html_backend.HTML_PARSER_BACKEND", "bs4"), \
+             patch("app.services.senate_etl._extract_ptr_page_lxml") as mock_lxml:
+            parse_ptr_page_html((CORPUS / "senate_ptr_small.html").read_text())
+
+        mock_lxml.assert_not_called()
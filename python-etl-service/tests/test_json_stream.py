@@ -0,0 +1,76 @@
+"""
+Tests for incremental JSON array parsing (app/lib/json_stream.py).
+
+Tests:
+- iter_json_array() - Same values as json.loads() however the text is
+  chunked, malformed and non-array documents
+"""
+
+import json
+
+import pytest
+
+DOCUMENT = json.dumps([
+    {"Name": "Nancy Pelosi", "Ticker": "AAPL", "Traded": "2026-01-30", "Trade_Size_USD": "1001.0"},
+    {"Name": "Dan Crenshaw", "Ticker": None, "Description": "Fund \"A\", class [B] é", "Nested": {"k": [1, 2.5, -3e2]}},
+    [], {}, "text", 12345, -0.5, True, False, None,
+], indent=1)
+
+
+async def _chunks(text, size):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+async def _collect(text, size):
+    from app.lib.json_stream import iter_json_array
+
+    return [element async for element in iter_json_array(_chunks(text, size))]
+
+
+# =============================================================================
+# iter_json_array() Tests
+# =============================================================================
+
+class TestIterJsonArray:
+    """Tests for iter_json_array()."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(DOCUMENT)])
+    async def test_matches_json_loads(self, size):
+        """Every chunking of the document yields the json.loads() elements."""
+        assert await _collect(DOCUMENT, size) == json.loads(DOCUMENT)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", ["[]", " \n[ ]\n", "﻿[]"])
+    async def test_empty_array(self, text):
+        """An empty array yields nothing."""
+        assert await _collect(text, 1) == []
+
+    @pytest.mark.asyncio
+    async def test_stops_at_closing_bracket(self):
+        """Elements are yielded before the rest of the body is read."""
+        from app.lib.json_stream import iter_json_array
+
+        async def body():
+            yield '[{"a": 1}, '
+            raise AssertionError("read past the first element")
+
+        records = iter_json_array(body())
+        assert await records.__anext__() == {"a": 1}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", [
+        '{"items": []}',
+        "",
+        '[{"a": 1}',
+        '[{"a": 1} {"b": 2}]',
+        '[{"a": }]',
+        "[1, 2",
+    ])
+    async def test_malformed(self, text):
+        """Non-array, truncated and malformed documents raise JSONStreamError."""
+        from app.lib.json_stream import JSONStreamError
+
+        with pytest.raises(JSONStreamError):
+            await _collect(text, 3)
@@ -0,0 +1,169 @@
+"""
+Tests for the parsed-result cache (app/lib/parse_cache.py).
+
+Tests:
+- ParseCache - Storage keyed by (sha256, version, kind), purge, stats
+- parse_ptr_pdf() - Cached tables/transactions skip extraction
+- /etl/parse-cache endpoints and the CLI
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+
+SHA = "a" * 64
+TABLES = [[["Apple Inc. (AAPL) [ST]", "P 01/15/2025", "$1,001 - $15,000"]]]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from app.lib.parse_cache import ParseCache
+
+    cache = ParseCache(str(tmp_path / "parse"))
+    yield cache
+    cache.close()
+
+
+# =============================================================================
+# ParseCache Tests
+# =============================================================================
+
+class TestParseCache:
+    """Tests for ParseCache."""
+
+    def test_round_trip(self, cache):
+        """put() then get() returns the stored result under the current version."""
+        cache.put(SHA, "tables", TABLES)
+
+        assert cache.get(SHA, "tables") == TABLES
+        assert cache.get("b" * 64, "tables") is None
+
+    def test_versions_are_isolated(self, cache):
+        """A result stored under another version is not returned."""
+        cache.put(SHA, "tables", TABLES, version="pdf_utils-0")
+
+        assert cache.get(SHA, "tables") is None
+        assert cache.get(SHA, "tables", version="pdf_utils-0") == TABLES
+
+    def test_purge_version(self, cache):
+        """purge() deletes only the given version."""
+        cache.put(SHA, "tables", TABLES, version="old")
+        cache.put(SHA, "tables", TABLES)
+
+        assert cache.purge("old") == 1
+        assert cache.get(SHA, "tables", version="old") is None
+        assert cache.get(SHA, "tables") == TABLES
+
+    def test_stats(self, cache):
+        """get_stats() reports hit rates per kind and entries per version."""
+        from app.lib.parse_cache import TABLES_VERSION
+
+        cache.put(SHA, "tables", TABLES)
+        cache.get(SHA, "tables")
+        cache.get("b" * 64, "tables")
+
+        stats = cache.get_stats()
+        assert stats["kinds"]["tables"]["hit_rate"] == 0.5
+        assert stats["entries"] == {TABLES_VERSION: {"tables": 1}}
+
+
+# =============================================================================
+# parse_ptr_pdf Tests
+# =============================================================================
+
+class TestParsePtrPdfCaching:
+    """parse_ptr_pdf() consults the parse cache."""
+
+    DISCLOSURE = {
+        "politician_name": "Nancy Pelosi",
+        "doc_id": "20012345",
+        "filing_type": "P",
+        "filing_date": "2025-01-20",
+    }
+
+    @pytest.mark.asyncio
+    async def test_second_parse_skips_extraction(self):
+        """A repeat parse of the same PDF neither extracts nor re-parses."""
+        from app.services.house_etl import parse_ptr_pdf
+
+        mock_extract = AsyncMock(return_value=TABLES)
+        with patch("app.services.house_etl.extract_tables", new=mock_extract):
+            first = await parse_ptr_pdf(b"%PDF-doc", self.DISCLOSURE)
+            with patch("app.services.house_etl.parse_transaction_from_row") as mock_parse:
+                second = await parse_ptr_pdf(b"%PDF-doc", self.DISCLOSURE)
+
+        assert len(first) == 1
+        assert second == first
+        assert mock_extract.await_count == 1
+        mock_parse.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hit_restamps_disclosure_fields(self):
+        """Cached transactions take politician/doc fields from the current disclosure."""
+        from app.services.house_etl import parse_ptr_pdf
+
+        with patch("app.services.house_etl.extract_tables", new=AsyncMock(return_value=TABLES)):
+            await parse_ptr_pdf(b"%PDF-doc", self.DISCLOSURE)
+            result = await parse_ptr_pdf(b"%PDF-doc", {**self.DISCLOSURE, "politician_name": "Nancy P. Pelosi"})
+
+        assert result[0]["politician_name"] == "Nancy P. Pelosi"
+
+    @pytest.mark.asyncio
+    async def test_parser_bump_reuses_tables(self):
+        """A new parser version re-parses from cached tables without re-extracting."""
+        from app.lib import parse_cache
+        from app.services.house_etl import parse_ptr_pdf
+
+        mock_extract = AsyncMock(return_value=TABLES)
+        with patch("app.services.house_etl.extract_tables", new=mock_extract):
+            await parse_ptr_pdf(b"%PDF-doc", self.DISCLOSURE)
+            with patch.dict(parse_cache.KIND_VERSIONS, {"house_transactions": "bumped"}):
+                result = await parse_ptr_pdf(b"%PDF-doc", self.DISCLOSURE)
+
+        assert len(result) == 1
+        assert mock_extract.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_extraction_not_cached(self):
+        """A failed (empty) extraction is retried on the next run."""
+        from app.services.house_etl import parse_ptr_pdf
+
+        mock_extract = AsyncMock(return_value=[])
+        with patch("app.services.house_etl.extract_tables", new=mock_extract):
+            await parse_ptr_pdf(b"%PDF-doc", self.DISCLOSURE)
+            await parse_ptr_pdf(b"%PDF-doc", self.DISCLOSURE)
+
+        assert mock_extract.await_count == 2
+
+
+# =============================================================================
+# Endpoint / CLI Tests
+# =============================================================================
+
+class TestParseCacheMaintenance:
+    """Tests for the parse cache endpoints and CLI."""
+
+    def test_stats_and_purge_endpoints(self):
+        """GET reports stats; DELETE purges a version."""
+        from fastapi.testclient import TestClient
+        from app.lib.parse_cache import get_parse_cache
+        from app.main import app
+
+        get_parse_cache().put(SHA, "tables", TABLES, version="old")
+        client = TestClient(app)
+
+        stats = client.get("/etl/parse-cache").json()
+        assert stats["entries"] == {"old": {"tables": 1}}
+
+        response = client.delete("/etl/parse-cache/old")
+        assert response.json() == {"version": "old", "deleted": 1}
+
+    def test_cli_purge(self, capsys):
+        """`python -m app.lib.parse_cache purge <version>` deletes entries."""
+        from app.lib.parse_cache import get_parse_cache, main
+
+        get_parse_cache().put(SHA, "tables", TABLES, version="old")
+        main(["purge", "old"])
+
+        assert "Deleted 1 entries" in capsys.readouterr().out
+        assert get_parse_cache().get(SHA, "tables", version="old") is None
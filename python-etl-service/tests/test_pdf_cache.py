@@ -0,0 +1,174 @@
+"""
+Tests for the content-addressed PDF cache (app/lib/pdf_cache.py).
+
+Tests:
+- PDFCache - Storage, integrity checks, aliases, LRU eviction
+- load_cached_pdf() / store_cached_pdf() - Async helpers
+- Download paths that consult the cache (House, EU, Senate)
+"""
+
+import hashlib
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+PDF_A = b"%PDF-1.4 first document" + b"a" * 100
+PDF_B = b"%PDF-1.4 second document" + b"b" * 100
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from app.lib.pdf_cache import PDFCache
+
+    cache = PDFCache(str(tmp_path / "cache"), max_bytes=10_000)
+    yield cache
+    cache.close()
+
+
+# =============================================================================
+# PDFCache Tests
+# =============================================================================
+
+class TestPDFCache:
+    """Tests for PDFCache."""
+
+    def test_round_trip_by_url(self, cache):
+        """put() then get() returns the same bytes under their sha256."""
+        sha = cache.put(PDF_A, "https://example.com/a.pdf")
+
+        assert sha == hashlib.sha256(PDF_A).hexdigest()
+        assert cache.get("https://example.com/a.pdf") == PDF_A
+        assert cache.get("https://example.com/other.pdf") is None
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["objects"]) == (1, 1, 1)
+
+    def test_doc_id_alias(self, cache):
+        """A doc_id finds the PDF even when the URL changed."""
+        cache.put(PDF_A, "http://example.com/a.pdf", doc_id="20012345")
+
+        assert cache.get("https://example.com/a.pdf", doc_id="20012345") == PDF_A
+        # The new URL is now an alias too
+        assert cache.get("https://example.com/a.pdf") == PDF_A
+
+    def test_identical_content_stored_once(self, cache):
+        """Two URLs serving the same bytes share one object."""
+        cache.put(PDF_A, "https://example.com/a.pdf")
+        cache.put(PDF_A, "https://mirror.example.com/a.pdf")
+
+        assert cache.get_stats()["objects"] == 1
+
+    def test_corrupt_object_is_a_miss(self, cache):
+        """An object whose bytes no longer match its hash is dropped."""
+        sha = cache.put(PDF_A, "https://example.com/a.pdf")
+        cache._object_path(sha).write_bytes(b"%PDF-tampered")
+
+        assert cache.get("https://example.com/a.pdf") is None
+        assert cache.get_stats()["corrupt"] == 1
+        assert not cache._object_path(sha).exists()
+
+    def test_lru_eviction(self, cache):
+        """Exceeding max_bytes evicts the least recently used object."""
+        cache.max_bytes = len(PDF_A) + len(PDF_B) - 1
+        with patch("app.lib.pdf_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put(PDF_A, "https://example.com/a.pdf")
+            cache.put(PDF_B, "https://example.com/b.pdf")  # evicts a
+            cache.get("https://example.com/b.pdf")
+
+        assert cache.get("https://example.com/a.pdf") is None
+        assert cache.get("https://example.com/b.pdf") == PDF_B
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """A new PDFCache over the same directory sees earlier entries."""
+        from app.lib.pdf_cache import PDFCache
+
+        first = PDFCache(str(tmp_path / "cache"))
+        first.put(PDF_A, "https://example.com/a.pdf")
+        first.close()
+
+        second = PDFCache(str(tmp_path / "cache"))
+        assert second.get("https://example.com/a.pdf") == PDF_A
+        second.close()
+
+
+# =============================================================================
+# Async Helper Tests
+# =============================================================================
+
+class TestCacheHelpers:
+    """Tests for load_cached_pdf() and store_cached_pdf()."""
+
+    @pytest.mark.asyncio
+    async def test_store_then_load(self):
+        """store_cached_pdf() makes the PDF available to load_cached_pdf()."""
+        from app.lib.pdf_cache import load_cached_pdf, store_cached_pdf
+
+        await store_cached_pdf(PDF_A, "https://example.com/a.pdf")
+
+        assert await load_cached_pdf("https://example.com/a.pdf") == PDF_A
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        """With caching disabled, nothing is stored or returned."""
+        from app.lib.pdf_cache import load_cached_pdf, store_cached_pdf
+
+        with patch("app.lib.pdf_cache.PDF_CACHE_ENABLED", False):
+            await store_cached_pdf(PDF_A, "https://example.com/a.pdf")
+            assert await load_cached_pdf("https://example.com/a.pdf") is None
+
+
+# =============================================================================
+# Download Path Tests
+# =============================================================================
+
+def _pdf_client(content=PDF_A):
+    client = MagicMock()
+    client.get = AsyncMock(return_value=MagicMock(status_code=200, content=content, headers={}))
+    return client
+
+
+class TestDownloadsUseCache:
+    """Download helpers hit the network once per PDF."""
+
+    @pytest.mark.asyncio
+    async def test_house_fetch_pdf(self):
+        """HouseDisclosureScraper.fetch_pdf() serves repeat downloads from disk."""
+        from app.services.house_etl import HouseDisclosureScraper
+
+        client = _pdf_client()
+        with patch("app.services.house_etl.rate_limiter") as mock_limiter:
+            mock_limiter.wait = AsyncMock()
+            first = await HouseDisclosureScraper.fetch_pdf(client, "https://example.com/1.pdf", doc_id="1")
+            # Same doc_id behind a different URL is still a hit
+            second = await HouseDisclosureScraper.fetch_pdf(client, "https://example.com/x.pdf", doc_id="1")
+
+        assert first == second == PDF_A
+        assert client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_eu_download_pdf(self):
+        """EUParliamentClient.download_pdf() serves repeat downloads from disk."""
+        from app.services.eu_parliament_client import EUParliamentClient
+
+        eu = EUParliamentClient(pdf_delay=0)
+        eu._client = _pdf_client()
+
+        assert await eu.download_pdf("https://example.com/dpi.pdf") == PDF_A
+        assert await eu.download_pdf("https://example.com/dpi.pdf") == PDF_A
+        assert eu._client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_senate_download_pdf(self):
+        """download_senate_pdf() serves repeat downloads from disk."""
+        from app.services.senate_etl import download_senate_pdf
+
+        client = _pdf_client()
+        with patch("app.services.senate_etl.rate_limiter") as mock_limiter:
+            mock_limiter.wait = AsyncMock()
+            await download_senate_pdf(client, "https://example.com/s.pdf")
+            result = await download_senate_pdf(client, "https://example.com/s.pdf")
+
+        assert result == PDF_A
+        assert client.get.await_count == 1
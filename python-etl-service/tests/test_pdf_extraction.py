@@ -0,0 +1,117 @@
+"""
+Tests for the process-pool PDF extraction engine (app/lib/pdf_extraction.py).
+
+Tests:
+- PDFExtractionService - Extraction in worker processes, timeouts, recycling
+- Thread mode (max_workers=0)
+- get_pdf_extraction_service() / shutdown_pdf_extraction_service()
+"""
+
+import os
+import time
+
+import pytest
+
+
+# Module-level so worker processes can unpickle them
+def _worker_pid(pdf_bytes):
+    return os.getpid()
+
+
+def _hang(pdf_bytes):
+    time.sleep(30)
+    return "never"
+
+
+@pytest.fixture
+def service():
+    from app.lib.pdf_extraction import PDFExtractionService
+
+    svc = PDFExtractionService(max_workers=1, timeout=60, max_docs_per_worker=50)
+    yield svc
+    svc.shutdown()
+
+
+# =============================================================================
+# PDFExtractionService Tests
+# =============================================================================
+
+class TestPDFExtractionService:
+    """Tests for PDFExtractionService."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self, service):
+        """Extraction runs outside the calling process."""
+        pid = await service._run(_worker_pid, b"%PDF", None)
+
+        assert pid is not None
+        assert pid != os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_invalid_pdf_returns_defaults(self, service):
+        """pdf_utils' error handling carries over: bad input yields []/None."""
+        assert await service.extract_tables(b"not a pdf") == []
+        assert await service.extract_text(b"not a pdf") is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_restarts_pool(self, service):
+        """A hung document returns the default and the workers are replaced."""
+        await service._run(_worker_pid, b"%PDF", None)  # warm up the pool
+        service.timeout = 0.5
+
+        start = time.perf_counter()
+        assert await service._run(_hang, b"%PDF", "timed out") == "timed out"
+        assert time.perf_counter() - start < 10
+
+        stats = service.get_stats()
+        assert stats["timeouts"] == 1
+        assert stats["pool_restarts"] == 1
+
+        service.timeout = 60
+        assert await service._run(_worker_pid, b"%PDF", None) is not None
+
+    @pytest.mark.asyncio
+    async def test_workers_recycled(self):
+        """Each worker process is replaced after max_docs_per_worker documents."""
+        from app.lib.pdf_extraction import PDFExtractionService
+
+        svc = PDFExtractionService(max_workers=1, timeout=60, max_docs_per_worker=1)
+        try:
+            first = await svc._run(_worker_pid, b"%PDF", None)
+            second = await svc._run(_worker_pid, b"%PDF", None)
+        finally:
+            svc.shutdown()
+
+        assert first != second
+
+    @pytest.mark.asyncio
+    async def test_thread_mode(self):
+        """max_workers=0 extracts in a thread of this process."""
+        from app.lib.pdf_extraction import PDFExtractionService
+
+        svc = PDFExtractionService(max_workers=0)
+
+        assert await svc._run(_worker_pid, b"%PDF", None) == os.getpid()
+        assert svc.get_stats()["running"] is False
+
+
+# =============================================================================
+# Global Instance Tests
+# =============================================================================
+
+class TestGlobalPDFExtractionService:
+    """Tests for get_pdf_extraction_service() and shutdown_pdf_extraction_service()."""
+
+    def test_singleton_and_shutdown(self):
+        """The global service is shared until shut down."""
+        from app.lib.pdf_extraction import (
+            get_pdf_extraction_service,
+            shutdown_pdf_extraction_service,
+        )
+
+        first = get_pdf_extraction_service()
+        assert get_pdf_extraction_service() is first
+
+        shutdown_pdf_extraction_service()
+        assert get_pdf_extraction_service() is not first
+        shutdown_pdf_extraction_service()
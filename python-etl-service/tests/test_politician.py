@@ -630,3 +630,154 @@ class TestFindOrCreatePolitician:
         assert politician_data["state_or_country"] == "Finland"
         assert politician_data["role"] == "MEP"
         assert politician_data["party"] == "EPP"
+
+
+# =============================================================================
+# find_or_create_politicians() Tests
+# =============================================================================
+
+class TestFindOrCreatePoliticians:
+    """Tests for find_or_create_politicians() batch resolver."""
+
+    @staticmethod
+    def _mock_supabase(existing_by_column=None, created=None):
+        """Mock client answering in_() and or_(ilike) queries from existing_by_column."""
+        import re
+
+        existing_by_column = existing_by_column or {}
+        client = MagicMock()
+        table_mock = MagicMock()
+
+        def respond(rows):
+            query = MagicMock()
+            query.execute.return_value = MagicMock(data=rows)
+            return query
+
+        def ilike(value, pattern):
+            regex = re.escape(pattern).replace(r"\*", ".*").replace("_", ".")
+            return re.fullmatch(regex, value or "", re.IGNORECASE) is not None
+
+        def select(columns):
+            select_mock = MagicMock()
+
+            def in_(column, values):
+                return respond([r for r in existing_by_column.get(column, []) if r[column] in values])
+
+            def or_(filters):
+                rows = []
+                for column, pattern in re.findall(r'(\w+)\.ilike\."([^"]*)"', filters):
+                    rows.extend(
+                        r for r in existing_by_column.get(column, [])
+                        if ilike(r[column], pattern) and r not in rows
+                    )
+                return respond(rows)
+
+            select_mock.in_.side_effect = in_
+            select_mock.or_.side_effect = or_
+            return select_mock
+
+        table_mock.select.side_effect = select
+        table_mock.insert.return_value.execute.return_value = MagicMock(data=created or [])
+        client.table.return_value = table_mock
+        return client, table_mock
+
+    def test_resolves_existing_and_bulk_creates_missing(self):
+        """Existing politicians come from in_() queries; the rest are inserted at once."""
+        from app.lib.politician import find_or_create_politicians, politician_key
+
+        pelosi = {
+            "id": "pol-pelosi", "bioguide_id": "P000197", "name": "Nancy Pelosi",
+            "first_name": "Nancy", "last_name": "Pelosi", "role": "Representative", "party": "D",
+        }
+        client, table_mock = self._mock_supabase(
+            existing_by_column={"bioguide_id": [pelosi]},
+            created=[{"id": "new-1"}, {"id": "new-2"}],
+        )
+        descriptors = [
+            {"name": "Nancy Pelosi", "bioguide_id": "P000197"},
+            {"name": "Nancy Pelosi", "bioguide_id": "P000197"},  # duplicate
+            {"name": "Mika AALTOLA", "chamber": "eu_parliament", "state": "Finland"},
+            {"name": "Bas EICKHOUT", "chamber": "eu_parliament", "state": "Netherlands"},
+            {"name": "Unknown"},
+        ]
+
+        result = find_or_create_politicians(client, descriptors)
+
+        assert result[politician_key(descriptors[0])] == "pol-pelosi"
+        assert result[politician_key(descriptors[2])] == "new-1"
+        assert result[politician_key(descriptors[3])] == "new-2"
+        assert result[politician_key(descriptors[4])] is None
+        table_mock.insert.assert_called_once()
+        inserted = table_mock.insert.call_args[0][0]
+        assert [r["name"] for r in inserted] == ["Mika AALTOLA", "Bas EICKHOUT"]
+        assert all(r["role"] == "MEP" for r in inserted)
+
+    def test_matches_house_disclosures_by_last_name(self):
+        """Legacy disclosure descriptors match on last name, role and first-name prefix."""
+        from app.lib.politician import find_or_create_politicians, politician_key
+
+        existing = {
+            "id": "pol-smith", "name": "Jane Smith", "first_name": "Jane",
+            "last_name": "Smith", "role": "Representative", "party": "R",
+        }
+        client, table_mock = self._mock_supabase(existing_by_column={"last_name": [existing]})
+        disclosure = {
+            "politician_name": "Hon. Jane A. Smith", "first_name": "Jane A.",
+            "last_name": "Smith", "state_district": "CA12",
+        }
+
+        result = find_or_create_politicians(client, [{"disclosure": disclosure}])
+
+        assert result == {politician_key({"disclosure": disclosure}): "pol-smith"}
+        table_mock.insert.assert_not_called()
+
+    def test_matches_names_case_insensitively(self):
+        """A stored row differing from the filer only in case is matched, not duplicated."""
+        from app.lib.politician import find_or_create_politicians, politician_key
+
+        existing = {
+            "id": "pol-pelosi", "name": "Nancy Pelosi", "full_name": "Nancy Pelosi",
+            "first_name": "Nancy", "last_name": "Pelosi", "role": "Representative", "party": "D",
+        }
+        client, table_mock = self._mock_supabase(
+            existing_by_column={"last_name": [existing], "name": [existing]}
+        )
+        by_last_name = {"first_name": "NANCY", "last_name": "PELOSI", "name": "NANCY PELOSI"}
+        by_name = {"name": "nancy pelosi", "chamber": "house"}
+
+        result = find_or_create_politicians(client, [by_last_name, by_name])
+
+        assert result[politician_key(by_last_name)] == "pol-pelosi"
+        assert result[politician_key(by_name)] == "pol-pelosi"
+        table_mock.insert.assert_not_called()
+
+    def test_matches_full_name_substring(self):
+        """Like the single-record path, a name contained in a stored full name matches."""
+        from app.lib.politician import find_or_create_politicians, politician_key
+
+        existing = {
+            "id": "pol-doe", "name": "Hon. Jane Q. Doe", "full_name": "Jane Q. Doe",
+            "first_name": "Jane", "last_name": "Doe", "role": "MEP", "party": None,
+        }
+        client, table_mock = self._mock_supabase(existing_by_column={"full_name": [existing]})
+        descriptor = {"name": "jane q. doe", "chamber": "eu_parliament"}
+
+        result = find_or_create_politicians(client, [descriptor])
+
+        assert result == {politician_key(descriptor): "pol-doe"}
+        table_mock.insert.assert_not_called()
+
+    def test_falls_back_to_single_inserts_when_bulk_insert_fails(self):
+        """A failed bulk insert retries each politician through find_or_create_politician()."""
+        from unittest.mock import patch
+        from app.lib.politician import find_or_create_politicians, politician_key
+
+        client, table_mock = self._mock_supabase()
+        table_mock.insert.return_value.execute.side_effect = Exception("duplicate key")
+        descriptors = [{"name": "Jane Doe", "chamber": "senate"}]
+
+        with patch("app.lib.politician.find_or_create_politician", return_value="pol-1") as mock_single:
+            result = find_or_create_politicians(client, descriptors)
+
+        assert result == {politician_key(descriptors[0]): "pol-1"}
+        mock_single.assert_called_once()
@@ -0,0 +1,223 @@
+"""
+Tests for the in-memory politician index (app/lib/politician_index.py).
+
+Tests:
+- PoliticianIndex - Loading, lookups, write-through, TTL reloads
+- find_or_create_politician(index=...) - Lookups answered from memory
+- get_politician_index() / reset_politician_index() - Global instance
+"""
+
+from unittest.mock import MagicMock, patch
+
+
+POLITICIANS = [
+    {
+        "id": "pol-pelosi",
+        "name": "Nancy Pelosi",
+        "full_name": "Nancy Pelosi",
+        "first_name": "Nancy",
+        "last_name": "Pelosi",
+        "role": "Representative",
+        "party": "D",
+        "bioguide_id": "P000197",
+    },
+    {
+        "id": "pol-warren",
+        "name": "Elizabeth Warren",
+        "full_name": "Elizabeth Ann Warren",
+        "first_name": "Elizabeth",
+        "last_name": "Warren",
+        "role": "Senator",
+        "party": None,
+        "bioguide_id": None,
+    },
+]
+
+
+def _mock_supabase(rows=None):
+    """Supabase client whose politicians load returns `rows` in one page."""
+    client = MagicMock()
+    table = MagicMock()
+    table.select.return_value.range.return_value.execute.return_value = MagicMock(
+        data=list(rows if rows is not None else POLITICIANS)
+    )
+    table.insert.return_value.execute.return_value = MagicMock(data=[{"id": "pol-new"}])
+    client.table.return_value = table
+    return client, table
+
+
+# =============================================================================
+# PoliticianIndex Tests
+# =============================================================================
+
+class TestPoliticianIndex:
+    """Tests for PoliticianIndex."""
+
+    def test_loads_once(self):
+        """lookup() loads the table on first use and reuses it afterwards."""
+        from app.lib.politician_index import PoliticianIndex
+
+        client, table = _mock_supabase()
+        index = PoliticianIndex()
+
+        index.lookup(client, "Representative", bioguide_id="P000197")
+        index.lookup(client, "Senator", name="Elizabeth Warren")
+
+        assert table.select.call_count == 1
+        assert len(index) == 2
+
+    def test_lookup_by_bioguide(self):
+        """bioguide_id matches regardless of role."""
+        from app.lib.politician_index import PoliticianIndex
+
+        client, _ = _mock_supabase()
+        record = PoliticianIndex().lookup(client, "Senator", bioguide_id="P000197")
+
+        assert record["id"] == "pol-pelosi"
+
+    def test_lookup_by_first_last_role(self):
+        """first/last lookup matches last name and first-name prefix, case-insensitively."""
+        from app.lib.politician_index import PoliticianIndex
+
+        client, _ = _mock_supabase()
+        index = PoliticianIndex()
+
+        record = index.lookup(
+            client, "Representative", first_name="NANCY P.", last_name="pelosi",
+            match_first_last=True,
+        )
+        assert record["id"] == "pol-pelosi"
+        assert index.lookup(
+            client, "Senator", first_name="Nancy", last_name="Pelosi", match_first_last=True,
+        ) is None
+
+    def test_lookup_by_full_name(self):
+        """Full names match name/full_name exactly or as a substring."""
+        from app.lib.politician_index import PoliticianIndex
+
+        client, _ = _mock_supabase()
+        index = PoliticianIndex()
+
+        assert index.lookup(client, "Senator", name="elizabeth warren")["id"] == "pol-warren"
+        assert index.lookup(client, "Senator", name="Ann Warren")["id"] == "pol-warren"
+        assert index.lookup(client, "Senator", name="Mitch McConnell") is None
+
+    def test_add_writes_through(self):
+        """add() makes new politicians visible and merges updates."""
+        from app.lib.politician_index import PoliticianIndex
+
+        client, _ = _mock_supabase()
+        index = PoliticianIndex()
+        index.ensure_loaded(client)
+
+        index.add({"id": "pol-new", "name": "Jane Doe", "role": "MEP"})
+        index.update("pol-warren", {"party": "D"})
+
+        assert index.lookup(client, "MEP", name="Jane Doe")["id"] == "pol-new"
+        assert index.lookup(client, "Senator", name="Elizabeth Warren")["party"] == "D"
+
+    def test_reloads_after_ttl(self):
+        """An expired index is reloaded on the next lookup."""
+        from app.lib.politician_index import PoliticianIndex
+
+        client, table = _mock_supabase()
+        index = PoliticianIndex(ttl=60)
+
+        with patch("app.lib.politician_index.time.monotonic", return_value=1000.0):
+            index.lookup(client, "Senator", name="Warren")
+        with patch("app.lib.politician_index.time.monotonic", return_value=1100.0):
+            index.lookup(client, "Senator", name="Warren")
+
+        assert table.select.call_count == 2
+
+    def test_load_failure_degrades_to_misses(self):
+        """A failed load leaves an empty index instead of raising."""
+        from app.lib.politician_index import PoliticianIndex
+
+        client = MagicMock()
+        client.table.side_effect = Exception("connection refused")
+        index = PoliticianIndex()
+
+        assert index.lookup(client, "Senator", name="Warren") is None
+        assert index.get_metrics()["load_failures"] == 1
+
+
+# =============================================================================
+# find_or_create_politician(index=...) Tests
+# =============================================================================
+
+class TestFindOrCreateWithIndex:
+    """Tests for find_or_create_politician() with an index."""
+
+    def test_hit_skips_database_queries(self):
+        """An index hit returns without querying the politicians table again."""
+        from app.lib.politician import find_or_create_politician
+        from app.lib.politician_index import PoliticianIndex
+
+        client, table = _mock_supabase()
+        index = PoliticianIndex()
+
+        for _ in range(3):
+            result = find_or_create_politician(
+                client, first_name="Nancy", last_name="Pelosi", chamber="house", index=index,
+            )
+
+        assert result == "pol-pelosi"
+        assert table.select.call_count == 1  # the index load only
+        table.insert.assert_not_called()
+
+    def test_hit_enriches_missing_party(self):
+        """A hit on a politician without a party writes the party through."""
+        from app.lib.politician import find_or_create_politician
+        from app.lib.politician_index import PoliticianIndex
+
+        client, table = _mock_supabase()
+        index = PoliticianIndex()
+
+        find_or_create_politician(
+            client, name="Elizabeth Warren", chamber="senate", party="D", index=index,
+        )
+
+        table.update.assert_called_once_with({"party": "D"})
+        assert index.lookup(client, "Senator", name="Elizabeth Warren")["party"] == "D"
+
+    def test_created_politician_is_indexed(self):
+        """A politician created on a miss is found in memory next time."""
+        from app.lib.politician import find_or_create_politician
+        from app.lib.politician_index import PoliticianIndex
+
+        client, table = _mock_supabase(rows=[])
+        # Database lookups on the miss path find nothing
+        chain = MagicMock()
+        chain.execute.return_value = MagicMock(data=[])
+        chain.ilike.return_value = chain
+        chain.eq.return_value = chain
+        chain.or_.return_value = chain
+        chain.limit.return_value = chain
+        chain.range.return_value.execute.return_value = MagicMock(data=[])
+        table.select.return_value = chain
+        index = PoliticianIndex()
+
+        first = find_or_create_politician(client, name="Jane Doe", chamber="eu_parliament", index=index)
+        second = find_or_create_politician(client, name="Jane Doe", chamber="eu_parliament", index=index)
+
+        assert first == second == "pol-new"
+        table.insert.assert_called_once()
+
+
+# =============================================================================
+# Global Instance Tests
+# =============================================================================
+
+class TestGlobalPoliticianIndex:
+    """Tests for get_politician_index() and reset_politician_index()."""
+
+    def test_singleton_and_reset(self):
+        """get_politician_index() is shared until reset_politician_index()."""
+        from app.lib.politician_index import get_politician_index, reset_politician_index
+
+        first = get_politician_index()
+        assert get_politician_index() is first
+
+        reset_politician_index()
+        assert get_politician_index() is not first
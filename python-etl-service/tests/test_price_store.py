@@ -0,0 +1,253 @@
+"""
+Tests for the local price store (app/lib/price_store.py).
+
+Tests:
+- PriceStore - Gap-only downloads, batching, coverage, persistence, re-adjusted history
+- download_prices() - yfinance response handling
+- get_prices() - Global store, disabling
+"""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+
+def _prices(tickers, start, end, scale=1.0):
+    """Weekday OHLCV frames whose close is the date's ordinal times `scale`."""
+    days = pd.bdate_range(start, end)
+    closes = [d.toordinal() * scale for d in days]
+    return {
+        ticker: pd.DataFrame(
+            {"Open": closes, "High": closes, "Low": closes, "Close": closes, "Volume": 1000.0},
+            index=days,
+        )
+        for ticker in tickers
+        if ticker != "NODATA"
+    }
+
+
+@pytest.fixture
+def downloads():
+    """Patch the yfinance downloader with a fake that records its calls."""
+    calls = []
+    fake = {"scale": 1.0, "fail": False}
+
+    def download(tickers, start, end):
+        calls.append((list(tickers), start, end))
+        if fake["fail"]:
+            return None
+        return _prices(tickers, start, end, fake["scale"])
+
+    with patch("app.lib.price_store.download_prices", side_effect=download):
+        yield calls, fake
+
+
+@pytest.fixture
+def store(tmp_path):
+    from app.lib.price_store import PriceStore
+
+    return PriceStore(str(tmp_path / "prices"))
+
+
+# =============================================================================
+# PriceStore Tests
+# =============================================================================
+
+class TestPriceStore:
+    """Tests for PriceStore."""
+
+    def test_second_request_is_served_locally(self, store, downloads):
+        """A covered range is read from disk, weekends included."""
+        calls, _ = downloads
+
+        first = store.get_prices(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 3, 31))
+        second = store.get_prices(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 3, 31))
+
+        assert calls == [(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 3, 31))]
+        pd.testing.assert_frame_equal(first["AAPL"], second["AAPL"])
+        assert list(second["AAPL"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert second["AAPL"].index[0] == pd.Timestamp("2024-01-01")
+        assert second["AAPL"].index[-1] == pd.Timestamp("2024-03-29")
+
+    def test_downloads_only_missing_tail(self, store, downloads):
+        """Extending the range fetches the new dates, plus a few stored days to compare."""
+        calls, _ = downloads
+        store.get_prices(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 3, 31))
+
+        prices = store.get_prices(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 4, 30))
+
+        assert calls[1] == (["AAPL", "MSFT"], date(2024, 3, 25), date(2024, 4, 30))
+        assert len(prices["AAPL"]) == len(pd.bdate_range("2024-01-01", "2024-04-30"))
+        assert prices["AAPL"].index.is_unique
+
+    def test_downloads_only_missing_head(self, store, downloads):
+        """Reaching back before stored history overlaps a few stored days after the gap."""
+        calls, _ = downloads
+        store.get_prices(["AAPL"], date(2024, 3, 1), date(2024, 3, 31))
+
+        prices = store.get_prices(["AAPL"], date(2024, 1, 1), date(2024, 3, 31))
+
+        assert calls[1] == (["AAPL"], date(2024, 1, 1), date(2024, 3, 7))
+        assert len(prices["AAPL"]) == len(pd.bdate_range("2024-01-01", "2024-03-31"))
+        assert prices["AAPL"].index.is_unique
+
+    def test_batches_tickers(self, store, downloads):
+        """Tickers missing the same range share requests of up to 100."""
+        calls, _ = downloads
+
+        store.get_prices([f"T{i}" for i in range(150)], date(2024, 1, 1), date(2024, 1, 31))
+
+        assert [len(tickers) for tickers, _, _ in calls] == [100, 50]
+
+    def test_persists_across_instances(self, store, downloads):
+        """Stored rows and coverage survive reopening the directory."""
+        from app.lib.price_store import PriceStore
+
+        calls, _ = downloads
+        store.get_prices(["AAPL"], date(2024, 1, 1), date(2024, 1, 31))
+
+        reopened = PriceStore(str(store.directory))
+        prices = reopened.get_prices(["AAPL"], date(2024, 1, 10), date(2024, 1, 20))
+
+        assert len(calls) == 1
+        assert prices["AAPL"].index[0] == pd.Timestamp("2024-01-10")
+        assert prices["AAPL"].index[-1] == pd.Timestamp("2024-01-19")
+
+    def test_today_is_not_marked_covered(self, store, downloads):
+        """Today's bar is still forming, so it is fetched again next time."""
+        calls, _ = downloads
+        today = date.today()
+
+        store.get_prices(["AAPL"], today - timedelta(days=30), today + timedelta(days=10))
+        store.get_prices(["AAPL"], today - timedelta(days=30), today + timedelta(days=10))
+
+        assert calls[0][2] == today  # Never asks for the future
+        assert store.coverage("AAPL") == [(today - timedelta(days=30), today - timedelta(days=1))]
+        assert len(calls) == 2 and calls[1][2] == today
+
+    def test_failed_download_is_retried(self, store, downloads):
+        """Nothing is marked covered when the request fails."""
+        calls, fake = downloads
+        fake["fail"] = True
+
+        assert store.get_prices(["AAPL"], date(2024, 1, 1), date(2024, 1, 31)) == {}
+
+        fake["fail"] = False
+        prices = store.get_prices(["AAPL"], date(2024, 1, 1), date(2024, 1, 31))
+
+        assert len(calls) == 2
+        assert "AAPL" in prices
+
+    def test_ticker_without_rows_covered_when_batch_works(self, store, downloads):
+        """A ticker with no data in a working batch is not asked for again."""
+        calls, _ = downloads
+
+        store.get_prices(["AAPL", "NODATA"], date(2024, 1, 1), date(2024, 1, 31))
+        prices = store.get_prices(["AAPL", "NODATA"], date(2024, 1, 1), date(2024, 1, 31))
+
+        assert len(calls) == 1
+        assert list(prices) == ["AAPL"]
+
+    def test_readjusted_history_is_refetched(self, store, downloads):
+        """If stored closes no longer match upstream, the whole range is refetched."""
+        calls, fake = downloads
+        store.get_prices(["AAPL"], date(2024, 1, 1), date(2024, 3, 31))
+
+        fake["scale"] = 0.5  # 2:1 split adjusts every historical close
+        prices = store.get_prices(["AAPL"], date(2024, 1, 1), date(2024, 4, 30))
+
+        assert calls[2] == (["AAPL"], date(2024, 1, 1), date(2024, 3, 31))
+        expected = [d.toordinal() * 0.5 for d in pd.bdate_range("2024-01-01", "2024-04-30")]
+        assert prices["AAPL"]["Close"].tolist() == expected
+        assert store.coverage("AAPL") == [(date(2024, 1, 1), date(2024, 4, 30))]
+
+    def test_readjusted_history_detected_when_reaching_back(self, store, downloads):
+        """Older rows on a new adjustment basis don't get stitched onto stored ones."""
+        calls, fake = downloads
+        store.get_prices(["AAPL"], date(2024, 3, 1), date(2024, 3, 31))
+
+        fake["scale"] = 0.5
+        prices = store.get_prices(["AAPL"], date(2024, 1, 1), date(2024, 3, 31))
+
+        assert calls[2] == (["AAPL"], date(2024, 3, 1), date(2024, 3, 31))
+        expected = [d.toordinal() * 0.5 for d in pd.bdate_range("2024-01-01", "2024-03-31")]
+        assert prices["AAPL"]["Close"].tolist() == expected
+
+
+# =============================================================================
+# download_prices() Tests
+# =============================================================================
+
+class TestDownloadPrices:
+    """Tests for download_prices()."""
+
+    def test_splits_multi_ticker_response(self):
+        """Each ticker with rows gets its own OHLCV frame; end is inclusive."""
+        from app.lib.price_store import download_prices
+
+        frames = _prices(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 1, 5))
+        frames["MSFT"].loc[:, :] = float("nan")  # yfinance pads failed tickers with NaN
+        data = pd.concat(frames, axis=1)
+
+        with patch("yfinance.download", return_value=data) as mock_download:
+            result = download_prices(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 1, 5))
+
+        assert mock_download.call_args.kwargs["end"] == "2024-01-06"
+        assert mock_download.call_args.kwargs["auto_adjust"] is True
+        assert list(result) == ["AAPL"]
+        assert len(result["AAPL"]) == 5
+
+    def test_single_ticker_flat_columns(self):
+        """A flat single-ticker response is used as is, missing columns as NaN."""
+        from app.lib.price_store import download_prices
+
+        dates = pd.date_range("2024-01-01", "2024-01-05")
+        data = pd.DataFrame({"Close": [1.0, 2.0, 3.0, 4.0, 5.0]}, index=dates)
+
+        with patch("yfinance.download", return_value=data):
+            result = download_prices(["AAPL"], date(2024, 1, 1), date(2024, 1, 5))
+
+        assert result["AAPL"]["Close"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert result["AAPL"]["Open"].isna().all()
+
+    def test_request_failure(self):
+        """A failed request returns None so nothing is marked covered."""
+        from app.lib.price_store import download_prices
+
+        with patch("yfinance.download", side_effect=Exception("Network error")):
+            assert download_prices(["AAPL"], date(2024, 1, 1), date(2024, 1, 5)) is None
+
+
+# =============================================================================
+# get_prices() Tests
+# =============================================================================
+
+class TestGetPrices:
+    """Tests for the module-level get_prices()."""
+
+    def test_uses_global_store(self, downloads):
+        """Repeated calls share one store."""
+        from app.lib.price_store import get_price_store, get_prices
+
+        calls, _ = downloads
+        get_prices(["AAPL"], date(2024, 1, 1), date(2024, 1, 31))
+        get_prices(["AAPL"], date(2024, 1, 1), date(2024, 1, 31))
+
+        assert get_price_store() is get_price_store()
+        assert len(calls) == 1
+
+    def test_disabled(self, downloads, monkeypatch):
+        """PRICE_STORE_ENABLED=false downloads every time."""
+        from app.lib import price_store
+
+        monkeypatch.setattr(price_store, "PRICE_STORE_ENABLED", False)
+        calls, _ = downloads
+
+        price_store.get_prices(["AAPL"], date(2024, 1, 1), date(2024, 1, 31))
+        prices = price_store.get_prices(["AAPL"], date(2024, 1, 1), date(2024, 1, 31))
+
+        assert price_store.get_price_store() is None
+        assert len(calls) == 2
+        assert "AAPL" in prices
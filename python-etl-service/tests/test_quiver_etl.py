@@ -5,12 +5,16 @@ Tests cover:
 - QuiverQuantETLService registration and attributes
 - API data fetching with auth
 - Date filtering by lookback_days
+- Streaming the bulk response (stream_disclosures)
 - Field mapping (Name, Ticker, Trade_Size_USD, etc.)
 - Transaction type mapping
 - Validation logic
 - Error handling for missing API key
 """
 
+import json
+
+import httpx
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 from datetime import datetime, timedelta, timezone
@@ -23,6 +27,7 @@ from app.services.quiver_etl import (
     _map_role,
 )
 from app.lib.registry import ETLRegistry
+from app.lib.json_stream import JSONStreamError
 
 
 # =============================================================================
@@ -271,6 +276,109 @@ class TestFetchDisclosures:
                 await service.fetch_disclosures(lookback_days=30)
 
 
+# =============================================================================
+# stream_disclosures() Tests
+# =============================================================================
+
+def _mock_transport_client(status_code=200, body=b"", requests=None):
+    """Patch target for httpx.AsyncClient serving one canned response."""
+    real_client = httpx.AsyncClient
+
+    def handler(request):
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(status_code, content=body)
+
+    def factory(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    return factory
+
+
+class TestStreamDisclosures:
+    """Tests for stream_disclosures method."""
+
+    @pytest.mark.asyncio
+    async def test_streams_records_in_window(self):
+        service = QuiverQuantETLService()
+        service.api_key = "test-key"
+
+        old_date = (datetime.now(timezone.utc) - timedelta(days=60)).strftime("%Y-%m-%d")
+        body = json.dumps([
+            _qq_record(Name="Recent Trader"),
+            _qq_record(Traded=old_date, Name="Old Trader"),
+            _qq_record(Traded=None, Name="Undated Trader"),
+        ]).encode()
+        requests = []
+
+        with patch(
+            "app.services.quiver_etl.httpx.AsyncClient",
+            side_effect=_mock_transport_client(body=body, requests=requests),
+        ):
+            records = [r async for r in service.stream_disclosures(lookback_days=30)]
+
+        assert [r["Name"] for r in records] == ["Recent Trader"]
+        assert requests[0].headers["Authorization"] == "Bearer test-key"
+
+    @pytest.mark.asyncio
+    async def test_raises_on_401(self):
+        service = QuiverQuantETLService()
+        service.api_key = "bad-key"
+
+        with patch(
+            "app.services.quiver_etl.httpx.AsyncClient",
+            side_effect=_mock_transport_client(status_code=401),
+        ):
+            with pytest.raises(ValueError, match="invalid or expired"):
+                [r async for r in service.stream_disclosures()]
+
+    @pytest.mark.asyncio
+    async def test_non_array_response_raises(self):
+        service = QuiverQuantETLService()
+        service.api_key = "test-key"
+
+        with patch(
+            "app.services.quiver_etl.httpx.AsyncClient",
+            side_effect=_mock_transport_client(body=b'{"error": "rate limited"}'),
+        ):
+            with pytest.raises(JSONStreamError):
+                [r async for r in service.stream_disclosures()]
+
+    @pytest.mark.asyncio
+    async def test_truncated_archive_fails_the_job(self):
+        service = QuiverQuantETLService()
+        service.api_key = "test-key"
+        body = json.dumps([_qq_record(), _qq_record(Name="Second Trader")]).encode()[:-40]
+
+        with patch(
+            "app.services.quiver_etl.httpx.AsyncClient",
+            side_effect=_mock_transport_client(body=body),
+        ), patch.object(service, "upload_batch", new_callable=AsyncMock, return_value=(1, 0, 0)):
+            result = await service.run(job_id="test-truncated", lookback_days=7)
+
+        assert not result.is_success
+        assert any("JSON array" in e for e in result.errors)
+        assert service.get_job_status("test-truncated").status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_pipelined_run_uses_stream(self):
+        service = QuiverQuantETLService()
+        service.api_key = "test-key"
+
+        async def stream(**kwargs):
+            yield _qq_record()
+
+        with patch.object(service, "stream_disclosures", side_effect=stream) as mock_stream, \
+             patch.object(service, "fetch_disclosures", new_callable=AsyncMock) as mock_fetch, \
+             patch.object(service, "upload_batch", new_callable=AsyncMock, return_value=(1, 0, 0)):
+            result = await service.run(job_id="test-stream", lookback_days=7)
+
+        mock_stream.assert_called_once()
+        assert mock_stream.call_args.kwargs["lookback_days"] == 7
+        mock_fetch.assert_not_called()
+        assert result.records_processed == 1
+
+
 # =============================================================================
 # parse_disclosure() Tests
 # =============================================================================
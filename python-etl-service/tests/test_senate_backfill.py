@@ -2,10 +2,10 @@
 Tests for Senate PTR Historical Backfill service (app/services/senate_backfill.py).
 
 Tests the year-by-year backfill orchestrator:
-- Source URL dedup from database
+- Source URL dedup from database and the persisted URL index
 - Completed year detection for resumability
 - Per-year backfill logic (discovery, dedup, matching, processing)
-- Full run orchestration (sequential years, skip completed, error handling)
+- Full run orchestration (concurrent years, skip completed, error handling)
 - Concurrent run guard in the API endpoint
 """
 
@@ -81,6 +81,72 @@ class TestGetExistingSenateSourceUrls:
 
         assert len(urls) == 1050
 
+    def test_since_filters_by_created_at(self):
+        """With since, only rows created at or after it are fetched."""
+        from app.services.senate_backfill import get_existing_senate_source_urls
+
+        mock_supabase = MagicMock()
+        like = mock_supabase.table.return_value.select.return_value.like.return_value
+        like.gte.return_value.range.return_value.execute.return_value = MagicMock(
+            data=[{"source_url": "https://efdsearch.senate.gov/search/view/ptr/new/"}]
+        )
+
+        urls = get_existing_senate_source_urls(mock_supabase, since="2026-01-01T00:00:00+00:00")
+
+        like.gte.assert_called_once_with("created_at", "2026-01-01T00:00:00+00:00")
+        assert urls == {"https://efdsearch.senate.gov/search/view/ptr/new/"}
+
+
+# =============================================================================
+# TestLoadSenateUrlIndex
+# =============================================================================
+
+class TestLoadSenateUrlIndex:
+    """Tests for load_senate_url_index."""
+
+    def test_first_load_scans_everything(self):
+        """An empty index is built from a full scan and gets a watermark."""
+        from app.services.senate_backfill import load_senate_url_index
+
+        with patch("app.services.senate_backfill.get_existing_senate_source_urls",
+                   return_value={"https://efd/ptr/a/"}) as mock_scan:
+            index = load_senate_url_index(MagicMock())
+
+        assert mock_scan.call_args.kwargs["since"] is None
+        assert "https://efd/ptr/a/" in index
+        assert index.synced_at is not None
+
+    def test_restart_fetches_only_new_rows(self):
+        """A later load asks only for rows created since the last sync."""
+        from app.lib.url_index import reset_url_indexes
+        from app.services.senate_backfill import load_senate_url_index
+
+        with patch("app.services.senate_backfill.get_existing_senate_source_urls",
+                   return_value={"https://efd/ptr/a/"}):
+            synced_at = load_senate_url_index(MagicMock()).synced_at
+
+        # Simulate a process restart: the index is reopened from disk
+        reset_url_indexes()
+
+        with patch("app.services.senate_backfill.get_existing_senate_source_urls",
+                   return_value={"https://efd/ptr/b/"}) as mock_scan:
+            index = load_senate_url_index(MagicMock())
+
+        assert mock_scan.call_args.kwargs["since"] == synced_at
+        assert {"https://efd/ptr/a/", "https://efd/ptr/b/"} <= set(index)
+
+    def test_disabled_index_falls_back_to_set(self, monkeypatch):
+        """Without the index, a full scan into an in-memory set is used."""
+        from app.lib import url_index
+        from app.services.senate_backfill import load_senate_url_index
+
+        monkeypatch.setattr(url_index, "URL_INDEX_ENABLED", False)
+        with patch("app.services.senate_backfill.get_existing_senate_source_urls",
+                   return_value={"https://efd/ptr/a/"}):
+            urls = load_senate_url_index(MagicMock())
+
+        assert urls == {"https://efd/ptr/a/"}
+
 
 # =============================================================================
 # TestGetCompletedBackfillYears
@@ -229,6 +295,7 @@ class TestBackfillYear:
         mock_search.assert_awaited_once_with(
             start_date="01/01/2018",
             end_date="12/31/2018",
+            pool=None,
         )
 
     @pytest.mark.asyncio
@@ -256,6 +323,30 @@ class TestBackfillYear:
 
         mock_match.assert_called_once_with(raw, senators)
 
+    @pytest.mark.asyncio
+    async def test_adds_imported_urls_to_existing(self, mock_job_status, senators):
+        """URLs the database now holds for the year are added to existing_urls."""
+        from app.services.senate_backfill import backfill_year
+
+        existing_urls = set()
+        disclosure = {"source_url": "https://efdsearch.senate.gov/search/view/ptr/new/", "is_paper": False}
+
+        with patch("app.services.senate_backfill.search_all_ptr_disclosures_playwright",
+                   new_callable=AsyncMock, return_value=[disclosure]), \
+             patch("app.services.senate_backfill._match_disclosures_to_senators", return_value=[disclosure]), \
+             patch("app.services.senate_backfill.process_disclosures_playwright",
+                   new_callable=AsyncMock, return_value=(1, 0)), \
+             patch("app.services.senate_backfill.get_existing_senate_source_urls",
+                   return_value={disclosure["source_url"]}) as mock_scan, \
+             patch("app.services.senate_backfill.log_job_execution"):
+            await backfill_year(
+                year=2020, senators=senators, supabase=MagicMock(),
+                existing_urls=existing_urls, job_id=mock_job_status, idx=1, total=1,
+            )
+
+        assert existing_urls == {disclosure["source_url"]}
+        assert mock_scan.call_args.kwargs["since"] is not None
+
     @pytest.mark.asyncio
     async def test_filters_paper_filings(self, mock_job_status, senators):
         """backfill_year filters out paper filings."""
@@ -379,6 +470,79 @@ class TestRunSenateBackfill:
         assert year_calls == [2020, 2021, 2022]
         assert JOB_STATUS[mock_job_status]["status"] == "completed"
 
+    @pytest.mark.asyncio
+    async def test_runs_years_concurrently(self, mock_job_status):
+        """Up to year_concurrency years run at once, started in order."""
+        import asyncio
+        from app.services.senate_backfill import run_senate_backfill
+        from app.services.house_etl import JOB_STATUS
+
+        started = []
+        active = 0
+        peak = 0
+
+        async def mock_backfill_year(year, **kwargs):
+            nonlocal active, peak
+            started.append(year)
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"year": year, "discovered": 1, "skipped_existing": 0,
+                    "skipped_paper": 0, "processed": 1, "transactions": 1, "errors": 0}
+
+        browser_pool = MagicMock()
+        browser_pool.__aenter__ = AsyncMock(return_value=browser_pool)
+        browser_pool.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("app.services.senate_backfill.get_supabase", return_value=MagicMock()), \
+             patch("app.services.senate_backfill.fetch_senators_from_xml",
+                   new_callable=AsyncMock, return_value=[{"last_name": "Smith"}]), \
+             patch("app.services.senate_backfill.upsert_senator_to_db", return_value="uuid"), \
+             patch("app.services.senate_backfill.get_existing_senate_source_urls", return_value=set()), \
+             patch("app.services.senate_backfill.get_completed_backfill_years", return_value={2021}), \
+             patch("app.services.senate_backfill.senate_browser_pool", return_value=browser_pool), \
+             patch("app.services.senate_backfill.backfill_year", side_effect=mock_backfill_year), \
+             patch("app.services.senate_backfill.YEAR_COOLDOWN_SECONDS", 0):
+            await run_senate_backfill(
+                job_id=mock_job_status, start_year=2020, end_year=2024, year_concurrency=2,
+            )
+
+        assert started == [2020, 2022, 2023, 2024]
+        assert peak == 2
+        assert JOB_STATUS[mock_job_status]["progress"] == 5
+        assert "4 years processed, 1 skipped" in JOB_STATUS[mock_job_status]["message"]
+
+    @pytest.mark.asyncio
+    async def test_years_share_one_browser_pool(self, mock_job_status):
+        """Every year runs on the same browser pool, closed once at the end."""
+        from app.services.senate_backfill import run_senate_backfill
+
+        pools = []
+
+        async def mock_backfill_year(year, pool=None, **kwargs):
+            pools.append(pool)
+            return {"year": year, "discovered": 0, "skipped_existing": 0,
+                    "skipped_paper": 0, "processed": 0, "transactions": 0, "errors": 0}
+
+        browser_pool = MagicMock()
+        browser_pool.__aenter__ = AsyncMock(return_value=browser_pool)
+        browser_pool.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("app.services.senate_backfill.get_supabase", return_value=MagicMock()), \
+             patch("app.services.senate_backfill.fetch_senators_from_xml",
+                   new_callable=AsyncMock, return_value=[{"last_name": "Smith"}]), \
+             patch("app.services.senate_backfill.upsert_senator_to_db", return_value="uuid"), \
+             patch("app.services.senate_backfill.get_existing_senate_source_urls", return_value=set()), \
+             patch("app.services.senate_backfill.get_completed_backfill_years", return_value=set()), \
+             patch("app.services.senate_backfill.senate_browser_pool", return_value=browser_pool), \
+             patch("app.services.senate_backfill.backfill_year", side_effect=mock_backfill_year), \
+             patch("app.services.senate_backfill.asyncio.sleep", new_callable=AsyncMock):
+            await run_senate_backfill(job_id=mock_job_status, start_year=2020, end_year=2022)
+
+        assert pools == [browser_pool] * 3
+        browser_pool.__aexit__.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_skips_completed_years(self, mock_job_status):
         """run_senate_backfill skips years already completed."""
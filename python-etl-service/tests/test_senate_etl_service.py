@@ -47,7 +47,7 @@ class TestFetchSenatorsFromXml:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = mock_xml
+        mock_response.content = mock_xml.encode()
 
         with patch("app.services.senate_etl.httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
@@ -66,6 +66,31 @@ class TestFetchSenatorsFromXml:
             assert senators[0]["bioguide_id"] == "S000123"
             assert senators[0]["full_name"] == "John Smith"
 
+    @pytest.mark.asyncio
+    async def test_callers_get_their_own_senators(self):
+        """Annotating returned senators doesn't touch the cached feed."""
+        from app.services.senate_etl import fetch_senators_from_xml
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b"""<contact_information><member>
+<first_name>John</first_name><last_name>Smith</last_name><party>D</party>
+<state>NY</state><bioguide_id>S000123</bioguide_id></member></contact_information>"""
+
+        with patch("app.services.senate_etl.httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.get.return_value = mock_response
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client_class.return_value = mock_client
+
+            first = await fetch_senators_from_xml()
+            first[0]["politician_id"] = "pol-1"
+            second = await fetch_senators_from_xml()
+
+        assert "politician_id" not in second[0]
+
     @pytest.mark.asyncio
     async def test_handles_http_error(self):
         """fetch_senators_from_xml returns empty list on HTTP error."""
@@ -127,7 +152,7 @@ class TestFetchSenatorsFromXml:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = mock_xml
+        mock_response.content = mock_xml.encode()
 
         with patch("app.services.senate_etl.httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
@@ -1180,6 +1205,7 @@ class TestProcessSenateDisclosure:
     @pytest.mark.asyncio
     async def test_finds_politician_when_not_in_disclosure(self, mock_client, mock_supabase):
         """process_senate_disclosure finds politician when not in disclosure."""
+        from app.lib.politician_index import get_politician_index
         from app.services.senate_etl import process_senate_disclosure
 
         disclosure = {
@@ -1198,7 +1224,10 @@ class TestProcessSenateDisclosure:
                     with patch("app.services.senate_etl.upload_transaction_to_supabase", return_value=True):
                         result = await process_senate_disclosure(mock_client, mock_supabase, disclosure)
 
-        mock_find.assert_called_once_with(mock_supabase, name="John Smith", chamber="senate", party=None)
+        mock_find.assert_called_once_with(
+            mock_supabase, name="John Smith", chamber="senate", party=None,
+            index=get_politician_index(),
+        )
         assert result == 1
 
     @pytest.mark.asyncio
@@ -1785,6 +1814,7 @@ class TestSearchPtrsWithFallbackDateParams:
             limit=None,
             start_date="01/01/2019",
             end_date="12/31/2019",
+            pool=None,
         )
 
 
@@ -1836,6 +1866,172 @@ class TestProcessDisclosuresWithFallback:
         mock_pw.assert_awaited_once()
 
 
+class TestProcessDisclosuresHttp:
+    """Tests for process_disclosures_http over the session pool."""
+
+    def _pool(self, fetch):
+        pool = MagicMock()
+        pool.size = 3
+        pool.fetch_ptr_page = AsyncMock(side_effect=fetch)
+        pool.get_stats.return_value = {}
+        pool.__aenter__ = AsyncMock(return_value=pool)
+        pool.__aexit__ = AsyncMock(return_value=None)
+        return pool
+
+    @pytest.mark.asyncio
+    async def test_uploads_transactions_from_all_pages(self):
+        """Every electronic disclosure is fetched and its transactions uploaded."""
+        from app.services.senate_etl import process_disclosures_http
+
+        disclosures = [
+            {"source_url": f"https://efd/ptr/{i}/", "politician_id": "pol-1"} for i in range(5)
+        ] + [{"source_url": "https://efd/paper/", "is_paper": True}]
+        pool = self._pool(lambda url: [{"asset_name": "Apple"}, {"asset_name": "Tesla"}])
+
+        with patch("app.services.senate_http_client.EFDSessionPool", return_value=pool), \
+             patch("app.services.senate_etl.upload_transaction_to_supabase", return_value="txn-id"):
+            total, errors = await process_disclosures_http(disclosures, MagicMock())
+
+        assert (total, errors) == (10, 0)
+        assert pool.fetch_ptr_page.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted(self):
+        """A failing page counts as an error without stopping the others."""
+        from app.services.senate_etl import process_disclosures_http
+
+        def fetch(url):
+            if url.endswith("/1/"):
+                raise ValueError("bad HTML")
+            return [{"asset_name": "Apple"}]
+
+        disclosures = [{"source_url": f"https://efd/ptr/{i}/", "politician_id": "pol-1"} for i in range(3)]
+        with patch("app.services.senate_http_client.EFDSessionPool", return_value=self._pool(fetch)), \
+             patch("app.services.senate_etl.upload_transaction_to_supabase", return_value="txn-id"):
+            total, errors = await process_disclosures_http(disclosures, MagicMock())
+
+        assert (total, errors) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_page_give_up_does_not_stop_run(self):
+        """EFDPageError on one page is counted as an error, not a block."""
+        from app.services.senate_etl import process_disclosures_http
+        from app.services.senate_http_client import EFDPageError
+
+        def fetch(url):
+            if url.endswith("/1/"):
+                raise EFDPageError(f"Giving up on {url}")
+            return [{"asset_name": "Apple"}]
+
+        disclosures = [{"source_url": f"https://efd/ptr/{i}/", "politician_id": "pol-1"} for i in range(3)]
+        with patch("app.services.senate_http_client.EFDSessionPool", return_value=self._pool(fetch)), \
+             patch("app.services.senate_etl.upload_transaction_to_supabase", return_value="txn-id"):
+            total, errors = await process_disclosures_http(disclosures, MagicMock())
+
+        assert (total, errors) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_all_sessions_blocked_reraises(self):
+        """EFDBlockedError from the pool propagates for the Playwright fallback."""
+        from app.services.senate_etl import process_disclosures_http
+        from app.services.senate_http_client import EFDBlockedError
+
+        pool = self._pool(EFDBlockedError("All EFD sessions blocked"))
+        disclosures = [{"source_url": f"https://efd/ptr/{i}/", "politician_id": "pol-1"} for i in range(3)]
+
+        with patch("app.services.senate_http_client.EFDSessionPool", return_value=pool):
+            with pytest.raises(EFDBlockedError):
+                await process_disclosures_http(disclosures, MagicMock())
+
+        pool.__aexit__.assert_awaited_once()
+
+
+class TestProcessDisclosuresPlaywright:
+    """Tests for process_disclosures_playwright over a browser pool."""
+
+    def _pool(self, size=2):
+        from contextlib import asynccontextmanager
+
+        pool = MagicMock()
+        pool.size = size
+        pool.get_stats.return_value = {}
+        pool.active = 0
+        pool.peak = 0
+
+        @asynccontextmanager
+        async def page():
+            pool.active += 1
+            pool.peak = max(pool.peak, pool.active)
+            fake_page = MagicMock(url="https://efdsearch.senate.gov/search/view/ptr/x/")
+            fake_page.wait_for_timeout = AsyncMock()
+            try:
+                yield fake_page
+            finally:
+                pool.active -= 1
+
+        pool.page = page
+        return pool
+
+    @pytest.mark.asyncio
+    async def test_pages_navigated_concurrently(self):
+        """Disclosures are spread over every pooled page and all uploaded."""
+        import asyncio
+        from app.services.senate_etl import process_disclosures_playwright
+
+        async def parse(page, url):
+            await asyncio.sleep(0.01)
+            return [{"asset_name": "Apple"}]
+
+        pool = self._pool(size=3)
+        disclosures = [
+            {"source_url": f"https://efd/ptr/{i}/", "politician_id": "pol-1"} for i in range(6)
+        ] + [{"source_url": "https://efd/paper/", "is_paper": True}]
+
+        with patch("app.services.senate_etl.parse_ptr_page_playwright", side_effect=parse) as mock_parse, \
+             patch("app.services.senate_etl.upload_transaction_to_supabase", return_value="txn-id"):
+            total, errors = await process_disclosures_playwright(disclosures, MagicMock(), pool=pool)
+
+        assert (total, errors) == (6, 0)
+        assert mock_parse.await_count == 6
+        assert pool.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_session_retried_on_fresh_page(self):
+        """A page bounced to the agreement page is retried once."""
+        from app.services.senate_etl import process_disclosures_playwright
+
+        calls = []
+
+        async def parse(page, url):
+            calls.append(url)
+            if len(calls) == 1:
+                page.url = "https://efdsearch.senate.gov/search/home/"
+                return []
+            return [{"asset_name": "Apple"}]
+
+        disclosures = [{"source_url": "https://efd/ptr/1/", "politician_id": "pol-1"}]
+        with patch("app.services.senate_etl.parse_ptr_page_playwright", side_effect=parse), \
+             patch("app.services.senate_etl.upload_transaction_to_supabase", return_value="txn-id"):
+            total, errors = await process_disclosures_playwright(disclosures, MagicMock(), pool=self._pool(size=1))
+
+        assert (total, errors) == (1, 0)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_creates_pool_when_none_given(self):
+        """Without a pool, one is created and closed around the run."""
+        from app.services.senate_etl import process_disclosures_playwright
+
+        pool = self._pool()
+        pool.__aenter__ = AsyncMock(return_value=pool)
+        pool.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("app.services.senate_etl.senate_browser_pool", return_value=pool):
+            assert await process_disclosures_playwright([], MagicMock()) == (0, 0)
+
+        pool.__aexit__.assert_awaited_once()
+
+
 # =============================================================================
 # Updated run_senate_etl Tests (with fallback)
 # =============================================================================
@@ -2,7 +2,7 @@
 Tests for Senate HTTP client (app/services/senate_http_client.py).
 
 Tests the HTTP CSRF session flow, DataTables JSON search,
-PTR page fetching, and WAF detection.
+PTR page fetching, WAF detection, persisted sessions and the session pool.
 """
 
 import pytest
@@ -492,6 +492,30 @@ class TestSenateEFDClientPTRFetch:
         with pytest.raises(EFDBlockedError, match="403"):
             await client.fetch_ptr_page("https://efdsearch.senate.gov/search/view/ptr/abc/")
 
+    @pytest.mark.asyncio
+    async def test_fetch_ptr_page_redirect_is_session_expiry(self):
+        """A redirect to /home/ is also an EFDSessionError (re-establishable)."""
+        from app.services.senate_http_client import EFDSessionError
+
+        client = self._setup_client()
+        client._client.get = AsyncMock(return_value=_mock_response(
+            200, text="<html>Agreement</html>", url="https://efdsearch.senate.gov/search/home/"
+        ))
+
+        with pytest.raises(EFDSessionError):
+            await client.fetch_ptr_page("https://efdsearch.senate.gov/search/view/ptr/abc/")
+
+    @pytest.mark.asyncio
+    async def test_fetch_ptr_page_detects_throttling(self):
+        """fetch_ptr_page raises EFDThrottledError on 429/503."""
+        from app.services.senate_http_client import EFDThrottledError
+
+        client = self._setup_client()
+        client._client.get = AsyncMock(return_value=_mock_response(429, "Too Many Requests"))
+
+        with pytest.raises(EFDThrottledError, match="429"):
+            await client.fetch_ptr_page("https://efdsearch.senate.gov/search/view/ptr/abc/")
+
 
 # =============================================================================
 # WAF Detection Tests
@@ -568,3 +592,247 @@ class TestContextManager:
                 assert client._client is not None
 
             assert client._client is None
+
+
+# =============================================================================
+# Persisted Session Tests
+# =============================================================================
+
+class _FakeEFD:
+    """Minimal EFD server: /search/ needs a sessionid granted by the agreement POST."""
+
+    def __init__(self):
+        self.valid_sessions = set()
+        self.agreement_posts = 0
+
+    def handler(self, request):
+        path = request.url.path
+        cookies = request.headers.get("cookie", "")
+        session = next(
+            (c.split("=", 1)[1] for c in cookies.split("; ") if c.startswith("sessionid=")), None
+        )
+        if request.method == "POST" and path == "/search/home/":
+            self.agreement_posts += 1
+            sid = f"sid-{self.agreement_posts}"
+            self.valid_sessions.add(sid)
+            return httpx.Response(
+                302, headers=[("location", "/search/"), ("set-cookie", f"sessionid={sid}; Path=/")]
+            )
+        if path == "/search/" and session in self.valid_sessions:
+            return httpx.Response(200, text="<html>Search</html>")
+        if path == "/search/":
+            return httpx.Response(302, headers={"location": "/search/home/"})
+        return httpx.Response(
+            200, text="<html>Agreement</html>", headers={"set-cookie": "csrftoken=tok; Path=/"}
+        )
+
+    def client(self, session_key="efd-0"):
+        from app.services.senate_http_client import SenateEFDClient
+
+        client = SenateEFDClient(session_key=session_key)
+        client._client = httpx.AsyncClient(
+            base_url="https://efdsearch.senate.gov",
+            transport=httpx.MockTransport(self.handler),
+            follow_redirects=True,
+        )
+        return client
+
+
+class TestPersistedSession:
+    """Established sessions are stored and reused across clients."""
+
+    @pytest.mark.asyncio
+    async def test_second_client_reuses_session(self):
+        """A later client adopts the stored session without another agreement POST."""
+        server = _FakeEFD()
+
+        first = server.client()
+        await first.establish_session()
+        second = server.client()
+
+        assert await second.restore_session() is True
+        assert second._session_established
+        assert server.agreement_posts == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_session_is_discarded(self):
+        """A stored session the server no longer accepts is dropped."""
+        from app.lib.session_store import get_session_store
+
+        server = _FakeEFD()
+        await server.client().establish_session()
+        server.valid_sessions.clear()
+
+        client = server.client()
+
+        assert await client.restore_session() is False
+        assert get_session_store().load("efd-0") is None
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self):
+        """Sessions are stored per key."""
+        server = _FakeEFD()
+        await server.client("efd-0").establish_session()
+
+        assert await server.client("efd-1").restore_session() is False
+
+    @pytest.mark.asyncio
+    async def test_no_key_disables_persistence(self):
+        """session_key=None never reads or writes the store."""
+        from app.lib.session_store import get_session_store
+
+        server = _FakeEFD()
+        await server.client(session_key=None).establish_session()
+
+        assert not list(get_session_store().directory.iterdir())
+
+
+# =============================================================================
+# Session Pool Tests
+# =============================================================================
+
+def _fake_session(fetch=None, establish=None):
+    """A stand-in for an established SenateEFDClient."""
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(side_effect=establish, return_value=session)
+    session.__aexit__ = AsyncMock()
+    session.establish_session = AsyncMock()
+    session.forget_session = AsyncMock()
+    session.fetch_ptr_page = AsyncMock(side_effect=fetch, return_value=[{"asset_name": "Apple"}])
+    return session
+
+
+class TestEFDSessionPool:
+    """Tests for EFDSessionPool."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_run_concurrently_across_sessions(self):
+        """Concurrent fetches are spread over the pool's sessions."""
+        import asyncio
+        from app.services.senate_http_client import EFDSessionPool
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_fetch(url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [{"asset_name": url}]
+
+        sessions = [_fake_session(fetch=slow_fetch) for _ in range(3)]
+        with patch("app.services.senate_http_client.SenateEFDClient", side_effect=sessions):
+            async with EFDSessionPool(size=3) as pool:
+                pool.limiter._limit = 3.0
+                results = await asyncio.gather(*(pool.fetch_ptr_page(f"u{i}") for i in range(9)))
+
+        assert [r[0]["asset_name"] for r in results] == [f"u{i}" for i in range(9)]
+        assert peak == 3
+        assert all(s.fetch_ptr_page.await_count > 0 for s in sessions)
+        assert all(s.__aexit__.await_count == 1 for s in sessions)
+
+    @pytest.mark.asyncio
+    async def test_expired_session_is_reestablished(self):
+        """An EFDSessionError re-runs the CSRF flow and retries."""
+        from app.services.senate_http_client import EFDSessionExpiredError, EFDSessionPool
+
+        session = _fake_session()
+        session.fetch_ptr_page.side_effect = [EFDSessionExpiredError("expired"), [{"asset_name": "Apple"}]]
+        with patch("app.services.senate_http_client.SenateEFDClient", return_value=session):
+            async with EFDSessionPool(size=1) as pool:
+                result = await pool.fetch_ptr_page("u")
+
+        assert result == [{"asset_name": "Apple"}]
+        session.establish_session.assert_awaited_once()
+        assert pool.get_stats()["reestablished"] == 1
+
+    @pytest.mark.asyncio
+    async def test_blocked_session_is_retired(self):
+        """An EFDBlockedError retires the session and retries on another."""
+        from app.services.senate_http_client import EFDBlockedError, EFDSessionPool
+
+        blocked = _fake_session(fetch=EFDBlockedError("HTTP 403"))
+        healthy = _fake_session()
+        with patch("app.services.senate_http_client.SenateEFDClient", side_effect=[blocked, healthy]):
+            async with EFDSessionPool(size=2) as pool:
+                first = await pool.fetch_ptr_page("u1")
+                second = await pool.fetch_ptr_page("u2")
+
+                assert pool.live_sessions == 1
+
+        assert first == second == [{"asset_name": "Apple"}]
+        blocked.forget_session.assert_awaited_once()
+        blocked.__aexit__.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_all_sessions_blocked_raises(self):
+        """Once every session is retired, fetches raise EFDBlockedError."""
+        from app.services.senate_http_client import EFDBlockedError, EFDSessionPool
+
+        sessions = [_fake_session(fetch=EFDBlockedError("HTTP 403")) for _ in range(2)]
+        with patch("app.services.senate_http_client.SenateEFDClient", side_effect=sessions):
+            async with EFDSessionPool(size=2) as pool:
+                with pytest.raises(EFDBlockedError, match="All EFD sessions blocked"):
+                    await pool.fetch_ptr_page("u")
+
+    @pytest.mark.asyncio
+    async def test_failing_page_with_live_sessions_raises_page_error(self):
+        """Exhausting attempts on one page while sessions remain is not a block."""
+        from app.services.senate_http_client import (
+            EFDBlockedError,
+            EFDPageError,
+            EFDSessionPool,
+            EFDThrottledError,
+        )
+
+        session = _fake_session(fetch=EFDThrottledError("HTTP 503"))
+        with patch("app.services.senate_http_client.SenateEFDClient", return_value=session), \
+             patch("app.services.senate_http_client.EFD_THROTTLE_BACKOFF", 0):
+            async with EFDSessionPool(size=1) as pool:
+                with pytest.raises(EFDPageError, match="Giving up on u") as exc_info:
+                    await pool.fetch_ptr_page("u")
+
+                assert pool.live_sessions == 1
+
+        assert not isinstance(exc_info.value, EFDBlockedError)
+
+    @pytest.mark.asyncio
+    async def test_throttling_shrinks_limit(self):
+        """A throttled fetch lowers the shared limit and is retried."""
+        from app.services.senate_http_client import EFDSessionPool, EFDThrottledError
+
+        session = _fake_session()
+        session.fetch_ptr_page.side_effect = [EFDThrottledError("HTTP 429"), [{"asset_name": "Apple"}]]
+        with patch("app.services.senate_http_client.SenateEFDClient", return_value=session), \
+             patch("app.services.senate_http_client.EFD_THROTTLE_BACKOFF", 0):
+            async with EFDSessionPool(size=4) as pool:
+                result = await pool.fetch_ptr_page("u")
+
+        assert result == [{"asset_name": "Apple"}]
+        assert pool.get_stats()["limiter"]["decreases"] == 1
+
+    @pytest.mark.asyncio
+    async def test_partial_establishment(self):
+        """The pool runs with the sessions that could be established."""
+        from app.services.senate_http_client import EFDSessionError, EFDSessionPool
+
+        failed = _fake_session(establish=EFDSessionError("No CSRF"))
+        healthy = _fake_session()
+        with patch("app.services.senate_http_client.SenateEFDClient", side_effect=[failed, healthy]):
+            async with EFDSessionPool(size=2) as pool:
+                assert pool.live_sessions == 1
+
+        failed.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_sessions_raises(self):
+        """If no session can be established the first error is raised."""
+        from app.services.senate_http_client import EFDBlockedError, EFDSessionPool
+
+        with patch("app.services.senate_http_client.SenateEFDClient",
+                   side_effect=lambda **kwargs: _fake_session(establish=EFDBlockedError("HTTP 403"))):
+            with pytest.raises(EFDBlockedError):
+                async with EFDSessionPool(size=2):
+                    pass
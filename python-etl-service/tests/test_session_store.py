@@ -0,0 +1,57 @@
+"""
+Tests for the on-disk session store (app/lib/session_store.py).
+"""
+
+import stat
+
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture
+def store(tmp_path):
+    from app.lib.session_store import SessionStore
+
+    return SessionStore(str(tmp_path / "sessions"))
+
+
+class TestSessionStore:
+    """Tests for SessionStore."""
+
+    def test_round_trip(self, store):
+        """save() then load() returns the stored state."""
+        store.save("efd-0", {"csrf_token": "abc", "cookies": []}, ttl=60)
+
+        assert store.load("efd-0") == {"csrf_token": "abc", "cookies": []}
+        assert store.load("efd-1") is None
+
+    def test_expired_entry_is_deleted(self, store):
+        """An entry past its expiry is dropped on read."""
+        with patch("app.lib.session_store.time.time", return_value=1000.0):
+            store.save("efd-0", {"csrf_token": "abc"}, ttl=60)
+
+        with patch("app.lib.session_store.time.time", return_value=1061.0):
+            assert store.load("efd-0") is None
+        assert not store._path("efd-0").exists()
+
+    def test_file_is_owner_only(self, store):
+        """Stored sessions are readable by the owner only."""
+        store.save("efd-0", {"csrf_token": "abc"}, ttl=60)
+
+        mode = stat.S_IMODE(store._path("efd-0").stat().st_mode)
+        assert mode == 0o600
+
+    def test_discard(self, store):
+        """discard() removes an entry; discarding a missing key is a no-op."""
+        store.save("efd-0", {"csrf_token": "abc"}, ttl=60)
+        store.discard("efd-0")
+        store.discard("efd-0")
+
+        assert store.load("efd-0") is None
+
+    def test_disabled(self):
+        """With the store disabled, get_session_store() returns None."""
+        from app.lib.session_store import get_session_store
+
+        with patch("app.lib.session_store.SESSION_STORE_ENABLED", False):
+            assert get_session_store() is None
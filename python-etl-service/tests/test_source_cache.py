@@ -0,0 +1,374 @@
+"""
+Tests for the conditional-GET source cache (app/lib/source_cache.py).
+
+Tests:
+- SourceCache.fetch() - Revalidation, freshness window, stale-on-error, streaming
+- SourceCache.get_parsed() - Shared parsed results
+- SourceCache.iter_parsed() - Records cached as JSON lines
+- fetch_house_index() - One download shared by every House index consumer
+- iter_house_index() - Lazy records from the cached ZIP
+"""
+
+import io
+import zipfile
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+URL = "https://example.com/index.json"
+
+
+def _response(status_code=200, content=b"", headers=None):
+    return MagicMock(status_code=status_code, content=content, headers=headers or {})
+
+
+def _client(*responses):
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=list(responses))
+    return client
+
+
+def _transport_client(*bodies, headers=None):
+    """A real AsyncClient whose transport serves `bodies` in order."""
+    requests = []
+    bodies = list(bodies)
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=bodies.pop(0), headers=headers)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from app.lib.source_cache import SourceCache
+
+    return SourceCache(str(tmp_path / "sources"), revalidate_after=0)
+
+
+# =============================================================================
+# fetch() Tests
+# =============================================================================
+
+class TestFetch:
+    """Tests for SourceCache.fetch()."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_body(self, cache):
+        """A 304 answer to If-None-Match returns the stored body."""
+        client = _client(
+            _response(content=b"v1", headers={"ETag": '"abc"'}),
+            _response(status_code=304),
+        )
+
+        first = await cache.fetch(URL, client=client)
+        second = await cache.fetch(URL, client=client)
+
+        assert first == second == (b"v1", '"abc"')
+        assert client.get.await_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+        assert cache.get_stats()["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_body_replaces_entry(self, cache):
+        """A 200 with new content replaces the stored body and fingerprint."""
+        client = _client(
+            _response(content=b"v1", headers={"ETag": '"1"'}),
+            _response(content=b"v2", headers={"ETag": '"2"'}),
+        )
+
+        await cache.fetch(URL, client=client)
+
+        assert await cache.fetch(URL, client=client) == (b"v2", '"2"')
+
+    @pytest.mark.asyncio
+    async def test_freshness_window_skips_network(self, cache):
+        """Within revalidate_after seconds the source isn't contacted."""
+        cache.revalidate_after = 300
+        client = _client(_response(content=b"v1"))
+
+        await cache.fetch(URL, client=client)
+        body, _ = await cache.fetch(URL, client=client)
+
+        assert body == b"v1"
+        assert client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_copy_served_on_error(self, cache):
+        """When the source is down the last good body is returned."""
+        client = _client(_response(content=b"v1"), _response(status_code=503))
+
+        await cache.fetch(URL, client=client)
+        body, _ = await cache.fetch(URL, client=client)
+
+        assert body == b"v1"
+        assert cache.get_stats()["stale_served"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_without_copy_returns_none(self, cache):
+        """A failed first fetch returns None."""
+        client = _client(Exception("connection refused"))
+
+        assert await cache.fetch(URL, client=client) is None
+
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, cache):
+        """A new SourceCache over the same directory revalidates the stored copy."""
+        from app.lib.source_cache import SourceCache
+
+        await cache.fetch(URL, client=_client(_response(content=b"v1", headers={"ETag": '"abc"'})))
+
+        other = SourceCache(str(cache.directory), revalidate_after=0)
+        result = await other.fetch(URL, client=_client(_response(status_code=304)))
+
+        assert result == (b"v1", '"abc"')
+
+    @pytest.mark.asyncio
+    async def test_stream_returns_stored_path(self, cache):
+        """stream=True writes the body to disk and returns its path."""
+        client, _ = _transport_client(b"v1" * 100_000, headers={"ETag": '"abc"'})
+
+        path, fingerprint = await cache.fetch(URL, client=client, stream=True)
+
+        assert path.read_bytes() == b"v1" * 100_000
+        assert fingerprint == '"abc"'
+        assert not list(cache.directory.glob("*.part"))
+
+    @pytest.mark.asyncio
+    async def test_stream_not_modified(self, cache):
+        """A streamed entry revalidates like a buffered one."""
+        client, _ = _transport_client(b"v1", headers={"ETag": '"abc"'})
+        await cache.fetch(URL, client=client, stream=True)
+
+        def handler(request):
+            assert request.headers["If-None-Match"] == '"abc"'
+            return httpx.Response(304)
+
+        revalidating = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        path, _ = await cache.fetch(URL, client=revalidating, stream=True)
+
+        assert path.read_bytes() == b"v1"
+        assert cache.get_stats()["not_modified"] == 1
+
+
+# =============================================================================
+# get_parsed() Tests
+# =============================================================================
+
+class TestGetParsed:
+    """Tests for SourceCache.get_parsed()."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_body_not_reparsed(self, cache):
+        """A 304 reuses the parsed result without calling the parser."""
+        client = _client(_response(content=b'{"a": 1}', headers={"ETag": '"1"'}), _response(status_code=304))
+        parse = MagicMock(return_value={"a": 1})
+
+        await cache.get_parsed(URL, parse, client=client)
+        result = await cache.get_parsed(URL, parse, client=client)
+
+        assert result == {"a": 1}
+        assert parse.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_callers_get_copies_without_memo(self, cache):
+        """With memory_entries=0, mutating a result doesn't affect other callers."""
+        cache.revalidate_after = 300
+        cache.memory_entries = 0
+        client = _client(_response(content=b"x"))
+
+        first = await cache.get_parsed(URL, lambda body: [{"n": 1}], client=client)
+        first[0]["n"] = 99
+        second = await cache.get_parsed(URL, lambda body: [{"n": 1}], client=client)
+
+        assert second == [{"n": 1}]
+        assert cache.get_stats()["parsed_in_memory"] == 0
+
+    @pytest.mark.asyncio
+    async def test_memo_results_are_shared_by_default(self, cache):
+        """Callers share one parsed result instead of re-reading it from disk."""
+        cache.revalidate_after = 300
+        client = _client(_response(content=b"x"))
+
+        first = await cache.get_parsed(URL, lambda body: [{"n": 1}], client=client)
+        second = await cache.get_parsed(URL, lambda body: [{"n": 1}], client=client)
+
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_memo_is_bounded(self, cache):
+        """Only memory_entries parsed results stay in memory."""
+        cache.memory_entries = 1
+        client = _client(_response(content=b"a"), _response(content=b"b"))
+
+        await cache.get_parsed(URL, lambda body: [1], client=client)
+        await cache.get_parsed(URL + "?b", lambda body: [2], client=client)
+
+        assert cache.get_stats()["parsed_in_memory"] == 1
+
+    @pytest.mark.asyncio
+    async def test_parse_error_returns_none(self, cache):
+        """A parser exception yields None rather than raising."""
+        def parse(body):
+            raise ValueError("bad body")
+
+        assert await cache.get_parsed(URL, parse, client=_client(_response(content=b"x"))) is None
+
+
+# =============================================================================
+# iter_parsed() Tests
+# =============================================================================
+
+class TestIterParsed:
+    """Tests for SourceCache.iter_parsed()."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_body_not_reparsed(self, cache):
+        """A 304 reads the records back from disk without calling the parser."""
+        client = _client(_response(content=b"x", headers={"ETag": '"1"'}), _response(status_code=304))
+        parse = MagicMock(side_effect=lambda body: iter([{"n": 1}, {"n": 2}]))
+
+        first = list(await cache.iter_parsed(URL, parse, client=client))
+        second = list(await cache.iter_parsed(URL, parse, client=client))
+
+        assert first == second == [{"n": 1}, {"n": 2}]
+        assert parse.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_records_written_as_json_lines(self, cache):
+        """Each record is one line after the fingerprint header."""
+        client = _client(_response(content=b"x", headers={"ETag": '"1"'}))
+
+        await cache.iter_parsed(URL, lambda body: ({"n": n} for n in range(3)), client=client)
+
+        (path,) = cache.directory.glob("*.parsed.jsonl")
+        assert path.read_text().splitlines() == ['{"fingerprint": "\\"1\\""}', '{"n": 0}', '{"n": 1}', '{"n": 2}']
+
+    @pytest.mark.asyncio
+    async def test_changed_body_reparsed(self, cache):
+        """A new fingerprint replaces the cached records."""
+        client = _client(
+            _response(content=b"1", headers={"ETag": '"1"'}),
+            _response(content=b"2", headers={"ETag": '"2"'}),
+        )
+
+        def parse(body):
+            return iter([{"body": body.decode()}])
+
+        await cache.iter_parsed(URL, parse, client=client)
+
+        assert list(await cache.iter_parsed(URL, parse, client=client)) == [{"body": "2"}]
+
+    @pytest.mark.asyncio
+    async def test_unusable_body_returns_none(self, cache):
+        """A parser returning None marks the source as unavailable."""
+        client = _client(_response(content=b"x"))
+
+        assert await cache.iter_parsed(URL, lambda body: None, client=client) is None
+
+    @pytest.mark.asyncio
+    async def test_error_mid_parse_leaves_no_partial_file(self, cache):
+        """A parser failing part-way returns None and keeps no records."""
+        def parse(body):
+            yield {"n": 1}
+            raise ValueError("truncated")
+
+        client = _client(_response(content=b"x"))
+
+        assert await cache.iter_parsed(URL, parse, client=client) is None
+        assert not list(cache.directory.glob("*.parsed.jsonl"))
+        assert not list(cache.directory.glob("*.part"))
+
+
+# =============================================================================
+# fetch_house_index() Tests
+# =============================================================================
+
+def _index_zip(year=2024):
+    content = (
+        "Prefix\tLast\tFirst\tSuffix\tFilingType\tStateDst\tYear\tFilingDate\tDocID\n"
+        f"Hon.\tPelosi\tNancy\t\tP\tCA11\t{year}\t1/15/{year}\t20012345\n"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr(f"{year}FD.txt", content)
+    return buffer.getvalue()
+
+
+class TestFetchHouseIndex:
+    """Tests for fetch_house_index()."""
+
+    @pytest.mark.asyncio
+    async def test_consumers_share_one_download(self):
+        """The ETL, validation and backfill read the index from one download."""
+        from app.services.house_etl import fetch_house_index
+        from app.services.source_document_backfill import SourceDocumentBackfillService
+        from app.services.source_validation import SourceValidationService
+
+        client, requests = _transport_client(_index_zip())
+        with patch("app.lib.source_cache.httpx.AsyncClient") as mock_client_cls, \
+             patch("app.services.source_validation.get_supabase"), \
+             patch("app.services.source_document_backfill.get_supabase"):
+            mock_client_cls.return_value.__aenter__.return_value = client
+
+            records = await fetch_house_index(2024)
+            validation = await SourceValidationService()._fetch_house_index(2024)
+            backfill = await SourceDocumentBackfillService()._fetch_house_index(2024)
+
+        assert records[0]["doc_id"] == "20012345"
+        assert validation == backfill == records
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_zip_without_index_returns_none(self):
+        """A ZIP missing the {year}FD.txt index is reported as unavailable."""
+        from app.services.house_etl import fetch_house_index
+
+        client, _ = _transport_client(_index_zip(year=2023))
+
+        assert await fetch_house_index(2024, client=client) is None
+
+    @pytest.mark.asyncio
+    async def test_unchanged_index_not_reparsed(self):
+        """Consumers read the cached records instead of re-parsing the ZIP."""
+        from app.lib.source_cache import get_source_cache
+        from app.services.house_etl import HouseDisclosureScraper, fetch_house_index
+
+        client, requests = _transport_client(_index_zip(2024))
+
+        await fetch_house_index(2024, client=client)
+        with patch.object(HouseDisclosureScraper, "iter_disclosure_index") as mock_parse:
+            records = await fetch_house_index(2024, client=client)
+
+        assert records[0]["doc_id"] == "20012345"
+        mock_parse.assert_not_called()
+        assert get_source_cache().get_stats()["parsed_in_memory"] == 0
+        assert len(requests) == 1
+
+
+class TestIterHouseIndex:
+    """Tests for iter_house_index()."""
+
+    @pytest.mark.asyncio
+    async def test_yields_records_lazily(self):
+        """Records come from a generator over the cached records, not a list."""
+        import types
+        from app.services.house_etl import iter_house_index
+
+        client, _ = _transport_client(_index_zip(2024))
+
+        records = await iter_house_index(2024, client=client)
+
+        assert isinstance(records, types.GeneratorType)
+        assert [r["doc_id"] for r in records] == ["20012345"]
+
+    @pytest.mark.asyncio
+    async def test_missing_index_returns_none(self):
+        """A ZIP without {year}FD.txt is reported before iteration starts."""
+        from app.services.house_etl import iter_house_index
+
+        client, _ = _transport_client(_index_zip(year=2023))
+
+        assert await iter_house_index(2024, client=client) is None
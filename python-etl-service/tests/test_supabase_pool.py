@@ -0,0 +1,191 @@
+"""
+Tests for the Supabase client pool (app/lib/supabase_pool.py).
+
+Tests:
+- SupabaseClientPool - Client reuse, health checks, metrics
+- get_client_pool() / reset_client_pool() - Global instance
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def _make_pool(**kwargs):
+    from app.lib.supabase_pool import SupabaseClientPool
+
+    factory = MagicMock(side_effect=lambda *a, **kw: MagicMock())
+    return SupabaseClientPool(client_factory=factory, **kwargs), factory
+
+
+# =============================================================================
+# SupabaseClientPool Tests
+# =============================================================================
+
+class TestSupabaseClientPool:
+    """Tests for SupabaseClientPool."""
+
+    def test_reuses_client_for_same_credentials(self):
+        """get_client() builds one client per credential and reuses it."""
+        pool, factory = _make_pool()
+
+        first = pool.get_client("https://a.supabase.co", "key")
+        second = pool.get_client("https://a.supabase.co", "key")
+
+        assert first is second
+        assert factory.call_count == 1
+
+    def test_separate_clients_per_credential(self):
+        """Different credentials get different clients."""
+        pool, factory = _make_pool()
+
+        a = pool.get_client("https://a.supabase.co", "key")
+        b = pool.get_client("https://b.supabase.co", "key")
+
+        assert a is not b
+        assert factory.call_count == 2
+
+    def test_passes_bounded_http_client(self):
+        """Clients are built with an httpx client honoring max_connections."""
+        pool, factory = _make_pool(max_connections=7)
+
+        pool.get_client("https://a.supabase.co", "key")
+
+        options = factory.call_args.kwargs["options"]
+        pooled_http = options.httpx_client
+        assert pooled_http._transport._pool._max_connections == 7
+        pool.close()
+
+    def test_metrics_track_hits(self):
+        """get_metrics() reports requests, hits and hit rate."""
+        pool, _ = _make_pool()
+
+        for _ in range(4):
+            pool.get_client("https://a.supabase.co", "key")
+
+        metrics = pool.get_metrics()
+        assert metrics["requests"] == 4
+        assert metrics["hits"] == 3
+        assert metrics["clients_created"] == 1
+        assert metrics["clients"] == 1
+        assert metrics["hit_rate"] == 0.75
+
+    def test_stale_client_is_probed(self):
+        """A client older than the health check interval is probed on use."""
+        pool, _ = _make_pool(health_check_interval=0)
+
+        client = pool.get_client("https://a.supabase.co", "key")
+        again = pool.get_client("https://a.supabase.co", "key")
+
+        assert again is client
+        client.table.assert_called_with("politicians")
+        assert pool.get_metrics()["health_checks"] == 1
+
+    def test_unhealthy_client_is_rebuilt(self):
+        """A client failing its probe is replaced with a new one."""
+        pool, factory = _make_pool(health_check_interval=0)
+
+        client = pool.get_client("https://a.supabase.co", "key")
+        client.table.side_effect = Exception("connection refused")
+
+        replacement = pool.get_client("https://a.supabase.co", "key")
+
+        assert replacement is not client
+        assert factory.call_count == 2
+        metrics = pool.get_metrics()
+        assert metrics["health_check_failures"] == 1
+        assert metrics["clients_recycled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_probe_runs_off_the_event_loop(self):
+        """On the event loop, get_client() returns at once and probes in the pool."""
+        pool, _ = _make_pool(health_check_interval=0)
+        client = pool.get_client("https://a.supabase.co", "key")
+        probe_threads = []
+        client.table.side_effect = (
+            lambda *a: probe_threads.append(threading.current_thread()) or MagicMock()
+        )
+
+        again = pool.get_client("https://a.supabase.co", "key")
+        for _ in range(100):
+            if pool.get_metrics()["health_checks"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert again is client
+        assert probe_threads and probe_threads[0] is not threading.current_thread()
+        assert pool.get_metrics()["health_check_failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_background_probe_failure_rebuilds_client(self):
+        """A client failing a background probe is replaced for later callers."""
+        pool, factory = _make_pool(health_check_interval=0)
+        client = pool.get_client("https://a.supabase.co", "key")
+        client.table.side_effect = Exception("connection refused")
+
+        pool.get_client("https://a.supabase.co", "key")
+        for _ in range(100):
+            if factory.call_count == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert factory.call_count == 2
+        assert pool.get_metrics()["clients_recycled"] == 1
+
+    def test_check_health_evicts_failed_clients(self):
+        """check_health() probes all clients and drops failing ones."""
+        pool, _ = _make_pool()
+
+        good = pool.get_client("https://good.supabase.co", "key")
+        bad = pool.get_client("https://bad.supabase.co", "key")
+        bad.table.side_effect = Exception("timeout")
+
+        results = pool.check_health()
+
+        assert results == {
+            "https://good.supabase.co": True,
+            "https://bad.supabase.co": False,
+        }
+        assert pool.get_metrics()["clients"] == 1
+        assert pool.get_client("https://good.supabase.co", "key") is good
+
+    def test_close_clears_clients(self):
+        """close() drops every pooled client."""
+        pool, _ = _make_pool()
+        pool.get_client("https://a.supabase.co", "key")
+
+        pool.close()
+
+        assert pool.get_metrics()["clients"] == 0
+
+
+# =============================================================================
+# Global Pool Tests
+# =============================================================================
+
+class TestGlobalPool:
+    """Tests for the global pool accessors."""
+
+    def test_get_client_pool_is_singleton(self):
+        """get_client_pool() returns the same instance until reset."""
+        from app.lib.supabase_pool import get_client_pool, reset_client_pool
+
+        pool = get_client_pool()
+        assert get_client_pool() is pool
+
+        reset_client_pool()
+        assert get_client_pool() is not pool
+
+    def test_committee_enrichment_uses_pool(self, monkeypatch):
+        """committee_enrichment.get_supabase() is served from the pool."""
+        monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+        monkeypatch.setenv("SUPABASE_KEY", "anon-key")
+
+        with patch("app.lib.database.create_client") as mock_create:
+            mock_create.return_value = MagicMock()
+
+            from app.services.committee_enrichment import get_supabase
+            assert get_supabase() is get_supabase()
+            mock_create.assert_called_once()
@@ -1,9 +1,13 @@
 """Tests for UK Parliament ETL Service."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.uk_parliament_etl import (
+    DEFAULT_PAGE_SIZE,
+    UKParliamentAPI,
     UKParliamentETLService,
     CATEGORY_MAP,
 )
@@ -401,6 +405,75 @@ class TestFetchMPList:
         assert len(mps) == 0
 
 
+# =============================================================================
+# Test: UKParliamentAPI
+# =============================================================================
+
+
+def _response(status_code, data=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.json.return_value = data or {}
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+class TestUKParliamentAPI:
+    """Test the pooled API client: page size, fallback and throttling."""
+
+    @pytest.mark.asyncio
+    async def test_requests_large_pages(self):
+        mock_client = _mock_httpx_client(SAMPLE_INTERESTS_RESPONSE)
+
+        with patch(
+            "app.services.uk_parliament_etl.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            async with UKParliamentAPI(page_size=100) as api:
+                pages = [p async for p in api.paginate("https://api/x", {"MemberId": 1})]
+
+        assert len(pages) == 1
+        assert mock_client.get.call_args.kwargs["params"]["take"] == 100
+
+    @pytest.mark.asyncio
+    async def test_rejected_page_size_falls_back(self):
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=[
+            _response(400),
+            _response(200, SAMPLE_INTERESTS_RESPONSE),
+        ])
+
+        with patch(
+            "app.services.uk_parliament_etl.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            async with UKParliamentAPI(page_size=100) as api:
+                pages = [p async for p in api.paginate("https://api/x", {})]
+
+        takes = [c.kwargs["params"]["take"] for c in mock_client.get.call_args_list]
+        assert takes == [100, DEFAULT_PAGE_SIZE]
+        assert api.page_size == DEFAULT_PAGE_SIZE
+        assert len(pages[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_throttled_request_retried(self):
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=[
+            _response(429),
+            _response(200, SAMPLE_INTERESTS_RESPONSE),
+        ])
+
+        with patch(
+            "app.services.uk_parliament_etl.httpx.AsyncClient",
+            return_value=mock_client,
+        ), patch("app.services.uk_parliament_etl.BACKOFF_BASE_SECONDS", 0):
+            async with UKParliamentAPI() as api:
+                resp = await api.get("https://api/x", {})
+
+        assert resp.status_code == 200
+        assert api.limiter.get_stats()["throttles"] == 1
+
+
 # =============================================================================
 # Test: _fetch_mp_interests()
 # =============================================================================
@@ -1015,3 +1088,209 @@ class TestRunIncremental:
         status = service.get_job_status("test-job")
         assert status.status == "completed"
         assert "Completed" in status.message
+
+    @pytest.mark.asyncio
+    async def test_mps_fetched_concurrently_over_shared_client(self):
+        service = UKParliamentETLService()
+        mp_list = [{**SAMPLE_MP, "id": i, "name": f"MP {i}"} for i in range(8)]
+        clients = set()
+        active = 0
+        peak = 0
+
+        async def fetch_interests(mp_id, api=None):
+            nonlocal active, peak
+            clients.add(id(api))
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return []
+
+        with (
+            patch("app.services.uk_parliament_etl.MP_WORKERS", 3),
+            patch.object(
+                service,
+                "_fetch_mp_list",
+                new_callable=AsyncMock,
+                return_value=mp_list,
+            ),
+            patch.object(service, "_fetch_mp_interests", side_effect=fetch_interests),
+            patch.object(service, "on_start", new_callable=AsyncMock),
+            patch.object(service, "on_complete", new_callable=AsyncMock),
+            patch(
+                "app.services.uk_parliament_etl.get_supabase"
+            ) as mock_sb,
+            patch(
+                "app.services.uk_parliament_etl.find_or_create_politician",
+                return_value="pol-uuid",
+            ),
+        ):
+            mock_sb.return_value = MagicMock()
+            await service.run("test-job")
+
+        status = service.get_job_status("test-job")
+        assert status.progress == 8
+        assert peak == 3
+        assert len(clients) == 1
+
+    @pytest.mark.asyncio
+    async def test_mp_failure_stops_other_workers(self):
+        service = UKParliamentETLService()
+        mp_list = [{**SAMPLE_MP, "id": i, "name": f"MP {i}"} for i in range(8)]
+        fetched = []
+
+        async def fetch_interests(mp_id, api=None):
+            fetched.append(mp_id)
+            await asyncio.sleep(0.01)
+            return []
+
+        def find_politician(supabase, name=None, **kwargs):
+            if name == "MP 1":
+                raise RuntimeError("database down")
+            return "pol-uuid"
+
+        with (
+            patch("app.services.uk_parliament_etl.MP_WORKERS", 2),
+            patch.object(
+                service,
+                "_fetch_mp_list",
+                new_callable=AsyncMock,
+                return_value=mp_list,
+            ),
+            patch.object(service, "_fetch_mp_interests", side_effect=fetch_interests),
+            patch.object(service, "on_start", new_callable=AsyncMock),
+            patch.object(service, "on_complete", new_callable=AsyncMock),
+            patch(
+                "app.services.uk_parliament_etl.get_supabase"
+            ) as mock_sb,
+            patch(
+                "app.services.uk_parliament_etl.find_or_create_politician",
+                side_effect=find_politician,
+            ),
+        ):
+            mock_sb.return_value = MagicMock()
+            await service.run("test-job")
+            fetched_at_failure = list(fetched)
+            await asyncio.sleep(0.05)
+
+        assert service.get_job_status("test-job").status == "failed"
+        assert fetched == fetched_at_failure
+        assert len(fetched) < len(mp_list)
+
+
+# =============================================================================
+# Test: incremental sync with per-MP watermarks
+# =============================================================================
+
+
+class TestIncrementalSync:
+    """Test incremental runs against the per-MP watermark store."""
+
+    @staticmethod
+    def _new_payment():
+        """The sample employment interest with a second, newer payment."""
+        import copy
+
+        employment = copy.deepcopy(SAMPLE_INTERESTS_RESPONSE["items"][0])
+        employment["childInterests"].append({
+            "id": 20001,
+            "summary": "Payment of GBP 900",
+            "registrationDate": "2026-03-02",
+            "publishedDate": "2026-03-10",
+            "fields": [{"name": "Value", "value": "900.00", "typeInfo": {"currencyCode": "GBP"}}],
+        })
+        return employment
+
+    async def _run(self, service, interests, **kwargs):
+        uploaded = []
+
+        async def upload(disclosure, update_mode=False):
+            uploaded.append(disclosure["doc_id"])
+            return "disc-id"
+
+        with (
+            patch.object(
+                service,
+                "_fetch_mp_list",
+                new_callable=AsyncMock,
+                return_value=[SAMPLE_MP],
+            ),
+            patch.object(
+                service,
+                "_fetch_mp_interests",
+                new_callable=AsyncMock,
+                return_value=interests,
+            ),
+            patch.object(service, "upload_disclosure", side_effect=upload),
+            patch.object(service, "on_start", new_callable=AsyncMock),
+            patch.object(service, "on_complete", new_callable=AsyncMock),
+            patch(
+                "app.services.uk_parliament_etl.get_supabase"
+            ) as mock_sb,
+            patch(
+                "app.services.uk_parliament_etl.find_or_create_politician",
+                return_value="pol-uuid",
+            ) as mock_politician,
+        ):
+            mock_sb.return_value = MagicMock()
+            result = await service.run("test-job", **kwargs)
+        return result, uploaded, mock_politician
+
+    @pytest.mark.asyncio
+    async def test_unchanged_mp_skipped(self):
+        service = UKParliamentETLService()
+        interests = SAMPLE_INTERESTS_RESPONSE["items"]
+
+        first, first_uploads, _ = await self._run(service, interests, incremental=True)
+        second, second_uploads, mock_politician = await self._run(service, interests, incremental=True)
+
+        assert sorted(first_uploads) == ["14466", "5000"]
+        assert first.metadata["mps_changed"] == 1
+        assert second_uploads == []
+        assert second.metadata["mps_skipped"] == 1
+        assert second.metadata["mps_changed"] == 0
+        mock_politician.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_only_new_interests_uploaded(self):
+        from app.lib.watermark_store import reset_watermark_stores
+
+        service = UKParliamentETLService()
+        await self._run(service, SAMPLE_INTERESTS_RESPONSE["items"], incremental=True)
+
+        # The watermark store is reopened from disk, as after a restart
+        reset_watermark_stores()
+
+        interests = [self._new_payment(), SAMPLE_INTERESTS_RESPONSE["items"][1]]
+        result, uploaded, _ = await self._run(service, interests, incremental=True)
+
+        assert uploaded == ["20001"]
+        assert result.metadata["mps_changed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_run_ignores_watermarks(self):
+        service = UKParliamentETLService()
+        interests = SAMPLE_INTERESTS_RESPONSE["items"]
+
+        await self._run(service, interests, incremental=True)
+        result, uploaded, _ = await self._run(service, interests)
+
+        assert sorted(uploaded) == ["14466", "5000"]
+        assert result.metadata["incremental"] is False
+
+    @pytest.mark.asyncio
+    async def test_watermark_not_advanced_after_failed_upload(self):
+        from app.lib.watermark_store import get_watermark_store
+        from app.services.uk_parliament_etl import WATERMARK_STORE_NAME
+
+        service = UKParliamentETLService()
+
+        with patch.object(
+            service, "validate_disclosure", new_callable=AsyncMock, side_effect=Exception("db down")
+        ):
+            result, _, _ = await self._run(
+                service, SAMPLE_INTERESTS_RESPONSE["items"], incremental=True
+            )
+
+        assert result.records_failed == 2
+        assert get_watermark_store(WATERMARK_STORE_NAME).get(str(SAMPLE_MP["id"])) is None
@@ -0,0 +1,95 @@
+"""
+Tests for the persistent URL index (app/lib/url_index.py).
+
+Tests:
+- UrlIndex - Set semantics, bulk updates, sync watermark, persistence
+- get_url_index() - Named global instances, disabling
+"""
+
+import pytest
+
+
+@pytest.fixture
+def index(tmp_path):
+    from app.lib.url_index import UrlIndex
+
+    index = UrlIndex(str(tmp_path / "urls.db"))
+    yield index
+    index.close()
+
+
+# =============================================================================
+# UrlIndex Tests
+# =============================================================================
+
+class TestUrlIndex:
+    """Tests for UrlIndex."""
+
+    def test_set_semantics(self, index):
+        """Membership, add, discard and len behave like a set."""
+        index.add("https://a/")
+        index.add("https://a/")
+        index.add("https://b/")
+        index.discard("https://b/")
+        index.discard("https://missing/")
+
+        assert "https://a/" in index
+        assert "https://b/" not in index
+        assert len(index) == 1
+        assert set(index) == {"https://a/"}
+
+    def test_update_counts_new_urls(self, index):
+        """update() adds in bulk and reports only URLs not already present."""
+        assert index.update(["https://a/", "https://b/"]) == 2
+        assert index.update(["https://b/", "https://c/"]) == 1
+
+        index |= {"https://d/"}
+
+        assert len(index) == 4
+
+    def test_persists_across_instances(self, index):
+        """URLs and the sync watermark survive reopening the file."""
+        from app.lib.url_index import UrlIndex
+
+        index.update(["https://a/"])
+        index.synced_at = "2026-01-01T00:00:00+00:00"
+
+        reopened = UrlIndex(str(index.path))
+        try:
+            assert "https://a/" in reopened
+            assert reopened.synced_at == "2026-01-01T00:00:00+00:00"
+        finally:
+            reopened.close()
+
+    def test_clear_forces_full_rescan(self, index):
+        """clear() drops the URLs and the watermark."""
+        index.update(["https://a/"])
+        index.synced_at = "2026-01-01T00:00:00+00:00"
+
+        index.clear()
+
+        assert len(index) == 0
+        assert index.synced_at is None
+
+
+# =============================================================================
+# get_url_index() Tests
+# =============================================================================
+
+class TestGetUrlIndex:
+    """Tests for get_url_index()."""
+
+    def test_same_instance_per_name(self):
+        """Each name maps to one shared index."""
+        from app.lib.url_index import get_url_index
+
+        assert get_url_index("senate") is get_url_index("senate")
+        assert get_url_index("senate") is not get_url_index("house")
+
+    def test_disabled(self, monkeypatch):
+        """URL_INDEX_ENABLED=false returns None."""
+        from app.lib import url_index
+
+        monkeypatch.setattr(url_index, "URL_INDEX_ENABLED", False)
+
+        assert url_index.get_url_index("senate") is None
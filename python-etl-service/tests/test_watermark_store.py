@@ -0,0 +1,88 @@
+"""
+Tests for the persistent watermark store (app/lib/watermark_store.py).
+
+Tests:
+- WatermarkStore - Get/set, bulk load, persistence, clearing
+- get_watermark_store() - Named global instances, disabling
+"""
+
+import pytest
+
+
+@pytest.fixture
+def store(tmp_path):
+    from app.lib.watermark_store import WatermarkStore
+
+    store = WatermarkStore(str(tmp_path / "watermarks.db"))
+    yield store
+    store.close()
+
+
+# =============================================================================
+# WatermarkStore Tests
+# =============================================================================
+
+class TestWatermarkStore:
+    """Tests for WatermarkStore."""
+
+    def test_get_set(self, store):
+        """set() replaces a key's watermark; unknown keys return None."""
+        store.set("4514", {"max_id": 1, "latest": "2024-01-01"})
+        store.set("4514", {"max_id": 2, "latest": "2024-02-01"})
+
+        assert store.get("4514") == {"max_id": 2, "latest": "2024-02-01"}
+        assert store.get("9999") is None
+        assert len(store) == 1
+
+    def test_get_all(self, store):
+        """get_all() returns every watermark in one call."""
+        store.set("1", {"max_id": 1})
+        store.set("2", {"max_id": 2})
+
+        assert store.get_all() == {"1": {"max_id": 1}, "2": {"max_id": 2}}
+
+    def test_persists_across_instances(self, store):
+        """Watermarks survive reopening the file."""
+        from app.lib.watermark_store import WatermarkStore
+
+        store.set("1", {"max_id": 7})
+
+        reopened = WatermarkStore(str(store.path))
+        try:
+            assert reopened.get("1") == {"max_id": 7}
+        finally:
+            reopened.close()
+
+    def test_delete_and_clear(self, store):
+        """delete() forgets one key, clear() forgets all of them."""
+        store.set("1", {"max_id": 1})
+        store.set("2", {"max_id": 2})
+
+        store.delete("1")
+        assert store.get_all() == {"2": {"max_id": 2}}
+
+        store.clear()
+        assert len(store) == 0
+
+
+# =============================================================================
+# get_watermark_store() Tests
+# =============================================================================
+
+class TestGetWatermarkStore:
+    """Tests for get_watermark_store()."""
+
+    def test_same_instance_per_name(self):
+        """Each name maps to one shared store."""
+        from app.lib.watermark_store import get_watermark_store
+
+        assert get_watermark_store("uk") is get_watermark_store("uk")
+        assert get_watermark_store("uk") is not get_watermark_store("eu")
+
+    def test_disabled(self, monkeypatch):
+        """WATERMARK_STORE_ENABLED=false returns None."""
+        from app.lib import watermark_store
+
+        monkeypatch.setattr(watermark_store, "WATERMARK_STORE_ENABLED", False)
+
+        assert watermark_store.get_watermark_store("uk") is None
@@ -0,0 +1,140 @@
+"""
+Tests for the bounded worker pool (app/lib/worker_pool.py).
+
+Tests:
+- for_each_concurrently() - Ordering, concurrency bound, cancellation on error
+- run_stage() - Stop sentinels, batching
+- run_together() - Cancelled coroutines are awaited before an error propagates
+"""
+
+import asyncio
+
+import pytest
+
+
+class TestForEachConcurrently:
+    """Tests for for_each_concurrently()."""
+
+    @pytest.mark.asyncio
+    async def test_handles_every_item_within_bound(self):
+        """Every item is handled once, with at most `workers` in flight."""
+        from app.lib.worker_pool import for_each_concurrently
+
+        active = 0
+        peak = 0
+        started = []
+
+        async def handle(i, item):
+            nonlocal active, peak
+            started.append((i, item))
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await for_each_concurrently(["a", "b", "c", "d", "e"], handle, workers=2)
+
+        assert started == list(enumerate(["a", "b", "c", "d", "e"]))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_items(self):
+        """An empty list returns without calling the handler."""
+        from app.lib.worker_pool import for_each_concurrently
+
+        async def handle(i, item):
+            raise AssertionError("not called")
+
+        await for_each_concurrently([], handle, workers=4)
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_remaining_workers(self):
+        """A failing handler stops the other workers before the error propagates."""
+        from app.lib.worker_pool import for_each_concurrently
+
+        handled = []
+        cancelled = []
+
+        async def handle(i, item):
+            if item == "bad":
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+            handled.append(item)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await for_each_concurrently(["slow", "bad", "never"], handle, workers=2)
+
+        assert cancelled == ["slow"]
+        await asyncio.sleep(0.1)
+        assert handled == []
+
+
+class TestRunStage:
+    """Tests for run_stage()."""
+
+    @pytest.mark.asyncio
+    async def test_forwards_one_sentinel_per_downstream_worker(self):
+        """Every item is handled and each downstream worker gets a stop sentinel."""
+        from app.lib.worker_pool import STAGE_DONE, run_stage
+
+        inbox: asyncio.Queue = asyncio.Queue()
+        outbox: asyncio.Queue = asyncio.Queue()
+        for item in (1, 2, 3, STAGE_DONE, STAGE_DONE):
+            inbox.put_nowait(item)
+
+        async def double(item):
+            await outbox.put(item * 2)
+
+        await run_stage(double, inbox, outbox, downstream_workers=3, workers=2)
+
+        items = [outbox.get_nowait() for _ in range(outbox.qsize())]
+        assert sorted(i for i in items if i is not STAGE_DONE) == [2, 4, 6]
+        assert items.count(STAGE_DONE) == 3
+
+    @pytest.mark.asyncio
+    async def test_batches_waiting_items(self):
+        """With batch_size, the handler gets the items already queued, up to the limit."""
+        from app.lib.worker_pool import STAGE_DONE, run_stage
+
+        inbox: asyncio.Queue = asyncio.Queue()
+        for item in (1, 2, 3, 4, 5, STAGE_DONE):
+            inbox.put_nowait(item)
+        batches = []
+
+        async def handle(batch):
+            batches.append(batch)
+
+        await run_stage(handle, inbox, None, 0, workers=1, batch_size=2)
+
+        assert batches == [[1, 2], [3, 4], [5]]
+
+
+class TestRunTogether:
+    """Tests for run_together()."""
+
+    @pytest.mark.asyncio
+    async def test_error_awaits_cancelled_coroutines(self):
+        """The other coroutines have finished unwinding when the error propagates."""
+        from app.lib.worker_pool import run_together
+
+        cleaned_up = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            finally:
+                await asyncio.sleep(0)
+                cleaned_up.append("slow")
+
+        async def failing():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await run_together(slow(), failing())
+
+        assert cleaned_up == ["slow"]
@@ -64,7 +64,7 @@ defmodule Server.Application do
       job_name: "US House Disclosures (ETL)",
       source: "house",
       schedule: "0 */6 * * *",
-      params: %{year: :current_year, limit: 100}
+      params: %{year: :current_year, limit: 100, incremental: true}
     },
     %{
       job_id: "politician-trading-senate",
@@ -78,7 +78,7 @@ defmodule Server.Application do
       job_name: "EU Parliament Declarations",
       source: "eu_parliament",
       schedule: "0 */6 * * *",
-      params: %{}
+      params: %{incremental: true}
     },
     %{
       job_id: "politician-trading-california",
@@ -92,7 +92,7 @@ defmodule Server.Application do
       job_name: "UK Parliament Register of Interests",
       source: "uk_parliament",
       schedule: "0 */6 * * *",
-      params: %{}
+      params: %{incremental: true}
     }
   ]
 